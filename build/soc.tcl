@@ -0,0 +1,2 @@
+source "soc_route.tcl"
+source "soc_bitstream.tcl"
\ No newline at end of file
@@ -0,0 +1,3172 @@
+/* Machine-generated using Migen */
+module soc(
+	inout ps_clk,
+	inout ps_por_b,
+	inout ps_srst_b,
+	input [31:0] ddr_dq,
+	input [3:0] ddr_dm,
+	input [3:0] ddr_dqs_n,
+	input [3:0] ddr_dqs_p,
+	input [14:0] ddr_a,
+	input [2:0] ddr_ba,
+	input ddr_cas_n,
+	input ddr_vrn,
+	input ddr_vrp,
+	input ddr_ras_n,
+	input ddr_we_n,
+	input ddr_odt,
+	input ddr_cke,
+	input ddr_cs_n,
+	input ddr_clk_n,
+	input ddr_clk_p,
+	input ddr_reset_n
+);
+
+reg ps7_fpga_idle_n = 1'd0;
+reg [3:0] ps7_ddr_arb = 4'd0;
+wire [53:0] ps7_mio;
+wire sys_clk;
+wire sys_rst;
+wire ps7_spi_can1;
+wire ps7_spi_uart1;
+wire ps7_spi_spi1;
+wire ps7_spi_i2c1;
+wire ps7_spi_sdio1;
+wire ps7_spi_enet1_wake;
+wire ps7_spi_enet1;
+wire ps7_spi_usb1;
+wire ps7_spi_can0;
+wire ps7_spi_uart0;
+wire ps7_spi_spi0;
+wire ps7_spi_i2c0;
+wire ps7_spi_sdio0;
+wire ps7_spi_enet0_wake;
+wire ps7_spi_enet0;
+wire ps7_spi_usb0;
+wire ps7_spi_gpio;
+wire ps7_spi_cti;
+wire ps7_spi_qspi;
+wire ps7_spi_smc;
+wire [7:0] ps7_spi_dmac;
+wire ps7_spi_dmac_abort;
+reg [15:0] ps7_interrupt = 16'd0;
+reg ps7_core_core0_nirq = 1'd0;
+reg ps7_core_core0_nfiq = 1'd0;
+reg ps7_core_core1_nirq = 1'd0;
+reg ps7_core_core1_nfiq = 1'd0;
+wire [11:0] ps7_bus_m_axi_gp0_aw_id;
+wire [31:0] ps7_bus_m_axi_gp0_aw_addr;
+wire [7:0] ps7_bus_m_axi_gp0_aw_len;
+wire [2:0] ps7_bus_m_axi_gp0_aw_size;
+wire [1:0] ps7_bus_m_axi_gp0_aw_burst;
+wire [1:0] ps7_bus_m_axi_gp0_aw_lock;
+wire [3:0] ps7_bus_m_axi_gp0_aw_cache;
+wire [2:0] ps7_bus_m_axi_gp0_aw_prot;
+wire [3:0] ps7_bus_m_axi_gp0_aw_qos;
+wire ps7_bus_m_axi_gp0_aw_valid;
+reg ps7_bus_m_axi_gp0_aw_ready = 1'd0;
+wire [11:0] ps7_bus_m_axi_gp0_w_id;
+wire [31:0] ps7_bus_m_axi_gp0_w_data;
+wire [3:0] ps7_bus_m_axi_gp0_w_strb;
+wire ps7_bus_m_axi_gp0_w_last;
+wire ps7_bus_m_axi_gp0_w_valid;
+reg ps7_bus_m_axi_gp0_w_ready = 1'd0;
+reg [11:0] ps7_bus_m_axi_gp0_b_id = 12'd0;
+reg [1:0] ps7_bus_m_axi_gp0_b_resp = 2'd0;
+reg ps7_bus_m_axi_gp0_b_valid = 1'd0;
+wire ps7_bus_m_axi_gp0_b_ready;
+wire [11:0] ps7_bus_m_axi_gp0_ar_id;
+wire [31:0] ps7_bus_m_axi_gp0_ar_addr;
+wire [7:0] ps7_bus_m_axi_gp0_ar_len;
+wire [2:0] ps7_bus_m_axi_gp0_ar_size;
+wire [1:0] ps7_bus_m_axi_gp0_ar_burst;
+wire [1:0] ps7_bus_m_axi_gp0_ar_lock;
+wire [3:0] ps7_bus_m_axi_gp0_ar_cache;
+wire [2:0] ps7_bus_m_axi_gp0_ar_prot;
+wire [3:0] ps7_bus_m_axi_gp0_ar_qos;
+wire ps7_bus_m_axi_gp0_ar_valid;
+reg ps7_bus_m_axi_gp0_ar_ready = 1'd0;
+reg [11:0] ps7_bus_m_axi_gp0_r_id = 12'd0;
+reg [31:0] ps7_bus_m_axi_gp0_r_data = 32'd0;
+reg [1:0] ps7_bus_m_axi_gp0_r_resp = 2'd0;
+reg ps7_bus_m_axi_gp0_r_last = 1'd0;
+reg ps7_bus_m_axi_gp0_r_valid = 1'd0;
+wire ps7_bus_m_axi_gp0_r_ready;
+wire ps7_m_axi_gp0_aclk;
+wire ps7_m_axi_gp0_areset_n;
+wire [11:0] ps7_bus_m_axi_gp1_aw_id;
+wire [31:0] ps7_bus_m_axi_gp1_aw_addr;
+wire [7:0] ps7_bus_m_axi_gp1_aw_len;
+wire [2:0] ps7_bus_m_axi_gp1_aw_size;
+wire [1:0] ps7_bus_m_axi_gp1_aw_burst;
+wire [1:0] ps7_bus_m_axi_gp1_aw_lock;
+wire [3:0] ps7_bus_m_axi_gp1_aw_cache;
+wire [2:0] ps7_bus_m_axi_gp1_aw_prot;
+wire [3:0] ps7_bus_m_axi_gp1_aw_qos;
+wire ps7_bus_m_axi_gp1_aw_valid;
+wire ps7_bus_m_axi_gp1_aw_ready;
+wire [11:0] ps7_bus_m_axi_gp1_w_id;
+wire [31:0] ps7_bus_m_axi_gp1_w_data;
+wire [3:0] ps7_bus_m_axi_gp1_w_strb;
+wire ps7_bus_m_axi_gp1_w_last;
+wire ps7_bus_m_axi_gp1_w_valid;
+wire ps7_bus_m_axi_gp1_w_ready;
+wire [11:0] ps7_bus_m_axi_gp1_b_id;
+wire [1:0] ps7_bus_m_axi_gp1_b_resp;
+wire ps7_bus_m_axi_gp1_b_valid;
+wire ps7_bus_m_axi_gp1_b_ready;
+wire [11:0] ps7_bus_m_axi_gp1_ar_id;
+wire [31:0] ps7_bus_m_axi_gp1_ar_addr;
+wire [7:0] ps7_bus_m_axi_gp1_ar_len;
+wire [2:0] ps7_bus_m_axi_gp1_ar_size;
+wire [1:0] ps7_bus_m_axi_gp1_ar_burst;
+wire [1:0] ps7_bus_m_axi_gp1_ar_lock;
+wire [3:0] ps7_bus_m_axi_gp1_ar_cache;
+wire [2:0] ps7_bus_m_axi_gp1_ar_prot;
+wire [3:0] ps7_bus_m_axi_gp1_ar_qos;
+wire ps7_bus_m_axi_gp1_ar_valid;
+wire ps7_bus_m_axi_gp1_ar_ready;
+wire [11:0] ps7_bus_m_axi_gp1_r_id;
+wire [31:0] ps7_bus_m_axi_gp1_r_data;
+wire [1:0] ps7_bus_m_axi_gp1_r_resp;
+wire ps7_bus_m_axi_gp1_r_last;
+wire ps7_bus_m_axi_gp1_r_valid;
+wire ps7_bus_m_axi_gp1_r_ready;
+wire ps7_m_axi_gp1_aclk;
+wire ps7_m_axi_gp1_areset_n;
+reg [5:0] ps7_bus_s_axi_gp0_aw_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_gp0_aw_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_gp0_aw_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_gp0_aw_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_gp0_aw_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_gp0_aw_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_gp0_aw_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_gp0_aw_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_gp0_aw_qos = 4'd0;
+reg ps7_bus_s_axi_gp0_aw_valid = 1'd0;
+wire ps7_bus_s_axi_gp0_aw_ready;
+reg [5:0] ps7_bus_s_axi_gp0_w_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_gp0_w_data = 32'd0;
+reg [3:0] ps7_bus_s_axi_gp0_w_strb = 4'd0;
+reg ps7_bus_s_axi_gp0_w_last = 1'd0;
+reg ps7_bus_s_axi_gp0_w_valid = 1'd0;
+wire ps7_bus_s_axi_gp0_w_ready;
+wire [5:0] ps7_bus_s_axi_gp0_b_id;
+wire [1:0] ps7_bus_s_axi_gp0_b_resp;
+wire ps7_bus_s_axi_gp0_b_valid;
+reg ps7_bus_s_axi_gp0_b_ready = 1'd0;
+reg [5:0] ps7_bus_s_axi_gp0_ar_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_gp0_ar_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_gp0_ar_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_gp0_ar_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_gp0_ar_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_gp0_ar_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_gp0_ar_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_gp0_ar_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_gp0_ar_qos = 4'd0;
+reg ps7_bus_s_axi_gp0_ar_valid = 1'd0;
+wire ps7_bus_s_axi_gp0_ar_ready;
+wire [5:0] ps7_bus_s_axi_gp0_r_id;
+wire [31:0] ps7_bus_s_axi_gp0_r_data;
+wire [1:0] ps7_bus_s_axi_gp0_r_resp;
+wire ps7_bus_s_axi_gp0_r_last;
+wire ps7_bus_s_axi_gp0_r_valid;
+reg ps7_bus_s_axi_gp0_r_ready = 1'd0;
+wire [5:0] ps7_shim_s_axi_gp0_aw_id;
+wire [31:0] ps7_shim_s_axi_gp0_aw_addr;
+wire [7:0] ps7_shim_s_axi_gp0_aw_len;
+wire [2:0] ps7_shim_s_axi_gp0_aw_size;
+wire [1:0] ps7_shim_s_axi_gp0_aw_burst;
+wire [1:0] ps7_shim_s_axi_gp0_aw_lock;
+wire [3:0] ps7_shim_s_axi_gp0_aw_cache;
+wire [2:0] ps7_shim_s_axi_gp0_aw_prot;
+wire [3:0] ps7_shim_s_axi_gp0_aw_qos;
+wire ps7_shim_s_axi_gp0_aw_valid;
+wire ps7_shim_s_axi_gp0_aw_ready;
+wire [5:0] ps7_shim_s_axi_gp0_w_id;
+wire [31:0] ps7_shim_s_axi_gp0_w_data;
+wire [3:0] ps7_shim_s_axi_gp0_w_strb;
+wire ps7_shim_s_axi_gp0_w_last;
+wire ps7_shim_s_axi_gp0_w_valid;
+wire ps7_shim_s_axi_gp0_w_ready;
+wire [5:0] ps7_shim_s_axi_gp0_b_id;
+wire [1:0] ps7_shim_s_axi_gp0_b_resp;
+wire ps7_shim_s_axi_gp0_b_valid;
+wire ps7_shim_s_axi_gp0_b_ready;
+wire [5:0] ps7_shim_s_axi_gp0_ar_id;
+wire [31:0] ps7_shim_s_axi_gp0_ar_addr;
+wire [7:0] ps7_shim_s_axi_gp0_ar_len;
+wire [2:0] ps7_shim_s_axi_gp0_ar_size;
+wire [1:0] ps7_shim_s_axi_gp0_ar_burst;
+wire [1:0] ps7_shim_s_axi_gp0_ar_lock;
+wire [3:0] ps7_shim_s_axi_gp0_ar_cache;
+wire [2:0] ps7_shim_s_axi_gp0_ar_prot;
+wire [3:0] ps7_shim_s_axi_gp0_ar_qos;
+wire ps7_shim_s_axi_gp0_ar_valid;
+wire ps7_shim_s_axi_gp0_ar_ready;
+wire [5:0] ps7_shim_s_axi_gp0_r_id;
+wire [31:0] ps7_shim_s_axi_gp0_r_data;
+wire [1:0] ps7_shim_s_axi_gp0_r_resp;
+wire ps7_shim_s_axi_gp0_r_last;
+wire ps7_shim_s_axi_gp0_r_valid;
+wire ps7_shim_s_axi_gp0_r_ready;
+reg [5:0] ps7_axiwrshim0_m_axi_i_aw_id = 6'd0;
+reg [31:0] ps7_axiwrshim0_m_axi_i_aw_addr = 32'd0;
+reg [7:0] ps7_axiwrshim0_m_axi_i_aw_len = 8'd0;
+reg [2:0] ps7_axiwrshim0_m_axi_i_aw_size = 3'd0;
+reg [1:0] ps7_axiwrshim0_m_axi_i_aw_burst = 2'd0;
+reg [1:0] ps7_axiwrshim0_m_axi_i_aw_lock = 2'd0;
+reg [3:0] ps7_axiwrshim0_m_axi_i_aw_cache = 4'd0;
+reg [2:0] ps7_axiwrshim0_m_axi_i_aw_prot = 3'd0;
+reg [3:0] ps7_axiwrshim0_m_axi_i_aw_qos = 4'd0;
+reg ps7_axiwrshim0_m_axi_i_aw_valid = 1'd0;
+reg ps7_axiwrshim0_m_axi_i_aw_ready;
+reg [5:0] ps7_axiwrshim0_m_axi_i_w_id = 6'd0;
+reg [31:0] ps7_axiwrshim0_m_axi_i_w_data = 32'd0;
+reg [3:0] ps7_axiwrshim0_m_axi_i_w_strb = 4'd0;
+reg ps7_axiwrshim0_m_axi_i_w_last = 1'd0;
+reg ps7_axiwrshim0_m_axi_i_w_valid = 1'd0;
+reg ps7_axiwrshim0_m_axi_i_w_ready;
+wire [5:0] ps7_axiwrshim0_m_axi_i_b_id;
+wire [1:0] ps7_axiwrshim0_m_axi_i_b_resp;
+wire ps7_axiwrshim0_m_axi_i_b_valid;
+reg ps7_axiwrshim0_m_axi_i_b_ready = 1'd0;
+reg [5:0] ps7_axiwrshim0_m_axi_i_ar_id = 6'd0;
+reg [31:0] ps7_axiwrshim0_m_axi_i_ar_addr = 32'd0;
+reg [7:0] ps7_axiwrshim0_m_axi_i_ar_len = 8'd0;
+reg [2:0] ps7_axiwrshim0_m_axi_i_ar_size = 3'd0;
+reg [1:0] ps7_axiwrshim0_m_axi_i_ar_burst = 2'd0;
+reg [1:0] ps7_axiwrshim0_m_axi_i_ar_lock = 2'd0;
+reg [3:0] ps7_axiwrshim0_m_axi_i_ar_cache = 4'd0;
+reg [2:0] ps7_axiwrshim0_m_axi_i_ar_prot = 3'd0;
+reg [3:0] ps7_axiwrshim0_m_axi_i_ar_qos = 4'd0;
+reg ps7_axiwrshim0_m_axi_i_ar_valid = 1'd0;
+wire ps7_axiwrshim0_m_axi_i_ar_ready;
+wire [5:0] ps7_axiwrshim0_m_axi_i_r_id;
+wire [31:0] ps7_axiwrshim0_m_axi_i_r_data;
+wire [1:0] ps7_axiwrshim0_m_axi_i_r_resp;
+wire ps7_axiwrshim0_m_axi_i_r_last;
+wire ps7_axiwrshim0_m_axi_i_r_valid;
+reg ps7_axiwrshim0_m_axi_i_r_ready = 1'd0;
+reg [5:0] ps7_axiwrshim0_m_axi_o_aw_id;
+reg [31:0] ps7_axiwrshim0_m_axi_o_aw_addr;
+reg [7:0] ps7_axiwrshim0_m_axi_o_aw_len;
+reg [2:0] ps7_axiwrshim0_m_axi_o_aw_size;
+reg [1:0] ps7_axiwrshim0_m_axi_o_aw_burst;
+reg [1:0] ps7_axiwrshim0_m_axi_o_aw_lock;
+reg [3:0] ps7_axiwrshim0_m_axi_o_aw_cache;
+reg [2:0] ps7_axiwrshim0_m_axi_o_aw_prot;
+reg [3:0] ps7_axiwrshim0_m_axi_o_aw_qos;
+reg ps7_axiwrshim0_m_axi_o_aw_valid;
+reg ps7_axiwrshim0_m_axi_o_aw_ready = 1'd0;
+reg [5:0] ps7_axiwrshim0_m_axi_o_w_id;
+reg [31:0] ps7_axiwrshim0_m_axi_o_w_data;
+reg [3:0] ps7_axiwrshim0_m_axi_o_w_strb;
+reg ps7_axiwrshim0_m_axi_o_w_last;
+reg ps7_axiwrshim0_m_axi_o_w_valid;
+reg ps7_axiwrshim0_m_axi_o_w_ready = 1'd0;
+reg [5:0] ps7_axiwrshim0_m_axi_o_b_id = 6'd0;
+reg [1:0] ps7_axiwrshim0_m_axi_o_b_resp = 2'd0;
+reg ps7_axiwrshim0_m_axi_o_b_valid = 1'd0;
+wire ps7_axiwrshim0_m_axi_o_b_ready;
+wire [5:0] ps7_axiwrshim0_m_axi_o_ar_id;
+wire [31:0] ps7_axiwrshim0_m_axi_o_ar_addr;
+wire [7:0] ps7_axiwrshim0_m_axi_o_ar_len;
+wire [2:0] ps7_axiwrshim0_m_axi_o_ar_size;
+wire [1:0] ps7_axiwrshim0_m_axi_o_ar_burst;
+wire [1:0] ps7_axiwrshim0_m_axi_o_ar_lock;
+wire [3:0] ps7_axiwrshim0_m_axi_o_ar_cache;
+wire [2:0] ps7_axiwrshim0_m_axi_o_ar_prot;
+wire [3:0] ps7_axiwrshim0_m_axi_o_ar_qos;
+wire ps7_axiwrshim0_m_axi_o_ar_valid;
+reg ps7_axiwrshim0_m_axi_o_ar_ready = 1'd0;
+reg [5:0] ps7_axiwrshim0_m_axi_o_r_id = 6'd0;
+reg [31:0] ps7_axiwrshim0_m_axi_o_r_data = 32'd0;
+reg [1:0] ps7_axiwrshim0_m_axi_o_r_resp = 2'd0;
+reg ps7_axiwrshim0_m_axi_o_r_last = 1'd0;
+reg ps7_axiwrshim0_m_axi_o_r_valid = 1'd0;
+wire ps7_axiwrshim0_m_axi_o_r_ready;
+wire ps7_axiwrshim0_wlast_consumed;
+reg ps7_axiwrshim0_wlast_detect = 1'd1;
+wire ps7_axiwrshim0_first_beat_detect;
+reg ps7_axiwrshim0_stall_awvalid = 1'd0;
+reg ps7_axiwrshim0_store_first_beat = 1'd0;
+wire ps7_axiwrshim0_awcmd_en;
+reg [1:0] ps7_axiwrshim0_addr_ofs;
+reg [2:0] ps7_axiwrshim0_awsize;
+wire ps7_axiwrshim0_start_wr;
+reg ps7_axiwrshim0_previous_cmd_done = 1'd1;
+reg ps7_axiwrshim0_burst_still_active = 1'd0;
+wire ps7_axiwrshim0_wdata_en;
+wire ps7_s_axi_gp0_aclk;
+wire ps7_s_axi_gp0_areset_n;
+reg [5:0] ps7_bus_s_axi_gp1_aw_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_gp1_aw_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_gp1_aw_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_gp1_aw_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_gp1_aw_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_gp1_aw_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_gp1_aw_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_gp1_aw_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_gp1_aw_qos = 4'd0;
+reg ps7_bus_s_axi_gp1_aw_valid = 1'd0;
+wire ps7_bus_s_axi_gp1_aw_ready;
+reg [5:0] ps7_bus_s_axi_gp1_w_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_gp1_w_data = 32'd0;
+reg [3:0] ps7_bus_s_axi_gp1_w_strb = 4'd0;
+reg ps7_bus_s_axi_gp1_w_last = 1'd0;
+reg ps7_bus_s_axi_gp1_w_valid = 1'd0;
+wire ps7_bus_s_axi_gp1_w_ready;
+wire [5:0] ps7_bus_s_axi_gp1_b_id;
+wire [1:0] ps7_bus_s_axi_gp1_b_resp;
+wire ps7_bus_s_axi_gp1_b_valid;
+reg ps7_bus_s_axi_gp1_b_ready = 1'd0;
+reg [5:0] ps7_bus_s_axi_gp1_ar_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_gp1_ar_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_gp1_ar_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_gp1_ar_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_gp1_ar_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_gp1_ar_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_gp1_ar_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_gp1_ar_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_gp1_ar_qos = 4'd0;
+reg ps7_bus_s_axi_gp1_ar_valid = 1'd0;
+wire ps7_bus_s_axi_gp1_ar_ready;
+wire [5:0] ps7_bus_s_axi_gp1_r_id;
+wire [31:0] ps7_bus_s_axi_gp1_r_data;
+wire [1:0] ps7_bus_s_axi_gp1_r_resp;
+wire ps7_bus_s_axi_gp1_r_last;
+wire ps7_bus_s_axi_gp1_r_valid;
+reg ps7_bus_s_axi_gp1_r_ready = 1'd0;
+wire [5:0] ps7_shim_s_axi_gp1_aw_id;
+wire [31:0] ps7_shim_s_axi_gp1_aw_addr;
+wire [7:0] ps7_shim_s_axi_gp1_aw_len;
+wire [2:0] ps7_shim_s_axi_gp1_aw_size;
+wire [1:0] ps7_shim_s_axi_gp1_aw_burst;
+wire [1:0] ps7_shim_s_axi_gp1_aw_lock;
+wire [3:0] ps7_shim_s_axi_gp1_aw_cache;
+wire [2:0] ps7_shim_s_axi_gp1_aw_prot;
+wire [3:0] ps7_shim_s_axi_gp1_aw_qos;
+wire ps7_shim_s_axi_gp1_aw_valid;
+wire ps7_shim_s_axi_gp1_aw_ready;
+wire [5:0] ps7_shim_s_axi_gp1_w_id;
+wire [31:0] ps7_shim_s_axi_gp1_w_data;
+wire [3:0] ps7_shim_s_axi_gp1_w_strb;
+wire ps7_shim_s_axi_gp1_w_last;
+wire ps7_shim_s_axi_gp1_w_valid;
+wire ps7_shim_s_axi_gp1_w_ready;
+wire [5:0] ps7_shim_s_axi_gp1_b_id;
+wire [1:0] ps7_shim_s_axi_gp1_b_resp;
+wire ps7_shim_s_axi_gp1_b_valid;
+wire ps7_shim_s_axi_gp1_b_ready;
+wire [5:0] ps7_shim_s_axi_gp1_ar_id;
+wire [31:0] ps7_shim_s_axi_gp1_ar_addr;
+wire [7:0] ps7_shim_s_axi_gp1_ar_len;
+wire [2:0] ps7_shim_s_axi_gp1_ar_size;
+wire [1:0] ps7_shim_s_axi_gp1_ar_burst;
+wire [1:0] ps7_shim_s_axi_gp1_ar_lock;
+wire [3:0] ps7_shim_s_axi_gp1_ar_cache;
+wire [2:0] ps7_shim_s_axi_gp1_ar_prot;
+wire [3:0] ps7_shim_s_axi_gp1_ar_qos;
+wire ps7_shim_s_axi_gp1_ar_valid;
+wire ps7_shim_s_axi_gp1_ar_ready;
+wire [5:0] ps7_shim_s_axi_gp1_r_id;
+wire [31:0] ps7_shim_s_axi_gp1_r_data;
+wire [1:0] ps7_shim_s_axi_gp1_r_resp;
+wire ps7_shim_s_axi_gp1_r_last;
+wire ps7_shim_s_axi_gp1_r_valid;
+wire ps7_shim_s_axi_gp1_r_ready;
+reg [5:0] ps7_axiwrshim1_m_axi_i_aw_id = 6'd0;
+reg [31:0] ps7_axiwrshim1_m_axi_i_aw_addr = 32'd0;
+reg [7:0] ps7_axiwrshim1_m_axi_i_aw_len = 8'd0;
+reg [2:0] ps7_axiwrshim1_m_axi_i_aw_size = 3'd0;
+reg [1:0] ps7_axiwrshim1_m_axi_i_aw_burst = 2'd0;
+reg [1:0] ps7_axiwrshim1_m_axi_i_aw_lock = 2'd0;
+reg [3:0] ps7_axiwrshim1_m_axi_i_aw_cache = 4'd0;
+reg [2:0] ps7_axiwrshim1_m_axi_i_aw_prot = 3'd0;
+reg [3:0] ps7_axiwrshim1_m_axi_i_aw_qos = 4'd0;
+reg ps7_axiwrshim1_m_axi_i_aw_valid = 1'd0;
+reg ps7_axiwrshim1_m_axi_i_aw_ready;
+reg [5:0] ps7_axiwrshim1_m_axi_i_w_id = 6'd0;
+reg [31:0] ps7_axiwrshim1_m_axi_i_w_data = 32'd0;
+reg [3:0] ps7_axiwrshim1_m_axi_i_w_strb = 4'd0;
+reg ps7_axiwrshim1_m_axi_i_w_last = 1'd0;
+reg ps7_axiwrshim1_m_axi_i_w_valid = 1'd0;
+reg ps7_axiwrshim1_m_axi_i_w_ready;
+wire [5:0] ps7_axiwrshim1_m_axi_i_b_id;
+wire [1:0] ps7_axiwrshim1_m_axi_i_b_resp;
+wire ps7_axiwrshim1_m_axi_i_b_valid;
+reg ps7_axiwrshim1_m_axi_i_b_ready = 1'd0;
+reg [5:0] ps7_axiwrshim1_m_axi_i_ar_id = 6'd0;
+reg [31:0] ps7_axiwrshim1_m_axi_i_ar_addr = 32'd0;
+reg [7:0] ps7_axiwrshim1_m_axi_i_ar_len = 8'd0;
+reg [2:0] ps7_axiwrshim1_m_axi_i_ar_size = 3'd0;
+reg [1:0] ps7_axiwrshim1_m_axi_i_ar_burst = 2'd0;
+reg [1:0] ps7_axiwrshim1_m_axi_i_ar_lock = 2'd0;
+reg [3:0] ps7_axiwrshim1_m_axi_i_ar_cache = 4'd0;
+reg [2:0] ps7_axiwrshim1_m_axi_i_ar_prot = 3'd0;
+reg [3:0] ps7_axiwrshim1_m_axi_i_ar_qos = 4'd0;
+reg ps7_axiwrshim1_m_axi_i_ar_valid = 1'd0;
+wire ps7_axiwrshim1_m_axi_i_ar_ready;
+wire [5:0] ps7_axiwrshim1_m_axi_i_r_id;
+wire [31:0] ps7_axiwrshim1_m_axi_i_r_data;
+wire [1:0] ps7_axiwrshim1_m_axi_i_r_resp;
+wire ps7_axiwrshim1_m_axi_i_r_last;
+wire ps7_axiwrshim1_m_axi_i_r_valid;
+reg ps7_axiwrshim1_m_axi_i_r_ready = 1'd0;
+reg [5:0] ps7_axiwrshim1_m_axi_o_aw_id;
+reg [31:0] ps7_axiwrshim1_m_axi_o_aw_addr;
+reg [7:0] ps7_axiwrshim1_m_axi_o_aw_len;
+reg [2:0] ps7_axiwrshim1_m_axi_o_aw_size;
+reg [1:0] ps7_axiwrshim1_m_axi_o_aw_burst;
+reg [1:0] ps7_axiwrshim1_m_axi_o_aw_lock;
+reg [3:0] ps7_axiwrshim1_m_axi_o_aw_cache;
+reg [2:0] ps7_axiwrshim1_m_axi_o_aw_prot;
+reg [3:0] ps7_axiwrshim1_m_axi_o_aw_qos;
+reg ps7_axiwrshim1_m_axi_o_aw_valid;
+reg ps7_axiwrshim1_m_axi_o_aw_ready = 1'd0;
+reg [5:0] ps7_axiwrshim1_m_axi_o_w_id;
+reg [31:0] ps7_axiwrshim1_m_axi_o_w_data;
+reg [3:0] ps7_axiwrshim1_m_axi_o_w_strb;
+reg ps7_axiwrshim1_m_axi_o_w_last;
+reg ps7_axiwrshim1_m_axi_o_w_valid;
+reg ps7_axiwrshim1_m_axi_o_w_ready = 1'd0;
+reg [5:0] ps7_axiwrshim1_m_axi_o_b_id = 6'd0;
+reg [1:0] ps7_axiwrshim1_m_axi_o_b_resp = 2'd0;
+reg ps7_axiwrshim1_m_axi_o_b_valid = 1'd0;
+wire ps7_axiwrshim1_m_axi_o_b_ready;
+wire [5:0] ps7_axiwrshim1_m_axi_o_ar_id;
+wire [31:0] ps7_axiwrshim1_m_axi_o_ar_addr;
+wire [7:0] ps7_axiwrshim1_m_axi_o_ar_len;
+wire [2:0] ps7_axiwrshim1_m_axi_o_ar_size;
+wire [1:0] ps7_axiwrshim1_m_axi_o_ar_burst;
+wire [1:0] ps7_axiwrshim1_m_axi_o_ar_lock;
+wire [3:0] ps7_axiwrshim1_m_axi_o_ar_cache;
+wire [2:0] ps7_axiwrshim1_m_axi_o_ar_prot;
+wire [3:0] ps7_axiwrshim1_m_axi_o_ar_qos;
+wire ps7_axiwrshim1_m_axi_o_ar_valid;
+reg ps7_axiwrshim1_m_axi_o_ar_ready = 1'd0;
+reg [5:0] ps7_axiwrshim1_m_axi_o_r_id = 6'd0;
+reg [31:0] ps7_axiwrshim1_m_axi_o_r_data = 32'd0;
+reg [1:0] ps7_axiwrshim1_m_axi_o_r_resp = 2'd0;
+reg ps7_axiwrshim1_m_axi_o_r_last = 1'd0;
+reg ps7_axiwrshim1_m_axi_o_r_valid = 1'd0;
+wire ps7_axiwrshim1_m_axi_o_r_ready;
+wire ps7_axiwrshim1_wlast_consumed;
+reg ps7_axiwrshim1_wlast_detect = 1'd1;
+wire ps7_axiwrshim1_first_beat_detect;
+reg ps7_axiwrshim1_stall_awvalid = 1'd0;
+reg ps7_axiwrshim1_store_first_beat = 1'd0;
+wire ps7_axiwrshim1_awcmd_en;
+reg [1:0] ps7_axiwrshim1_addr_ofs;
+reg [2:0] ps7_axiwrshim1_awsize;
+wire ps7_axiwrshim1_start_wr;
+reg ps7_axiwrshim1_previous_cmd_done = 1'd1;
+reg ps7_axiwrshim1_burst_still_active = 1'd0;
+wire ps7_axiwrshim1_wdata_en;
+wire ps7_s_axi_gp1_aclk;
+wire ps7_s_axi_gp1_areset_n;
+reg [2:0] ps7_bus_s_axi_acp_aw_id = 3'd0;
+reg [31:0] ps7_bus_s_axi_acp_aw_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_acp_aw_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_acp_aw_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_acp_aw_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_acp_aw_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_acp_aw_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_acp_aw_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_acp_aw_qos = 4'd0;
+reg ps7_bus_s_axi_acp_aw_valid = 1'd0;
+wire ps7_bus_s_axi_acp_aw_ready;
+reg [2:0] ps7_bus_s_axi_acp_w_id = 3'd0;
+reg [63:0] ps7_bus_s_axi_acp_w_data = 64'd0;
+reg [7:0] ps7_bus_s_axi_acp_w_strb = 8'd0;
+reg ps7_bus_s_axi_acp_w_last = 1'd0;
+reg ps7_bus_s_axi_acp_w_valid = 1'd0;
+wire ps7_bus_s_axi_acp_w_ready;
+wire [2:0] ps7_bus_s_axi_acp_b_id;
+wire [1:0] ps7_bus_s_axi_acp_b_resp;
+wire ps7_bus_s_axi_acp_b_valid;
+reg ps7_bus_s_axi_acp_b_ready = 1'd0;
+reg [2:0] ps7_bus_s_axi_acp_ar_id = 3'd0;
+reg [31:0] ps7_bus_s_axi_acp_ar_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_acp_ar_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_acp_ar_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_acp_ar_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_acp_ar_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_acp_ar_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_acp_ar_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_acp_ar_qos = 4'd0;
+reg ps7_bus_s_axi_acp_ar_valid = 1'd0;
+wire ps7_bus_s_axi_acp_ar_ready;
+wire [2:0] ps7_bus_s_axi_acp_r_id;
+wire [63:0] ps7_bus_s_axi_acp_r_data;
+wire [1:0] ps7_bus_s_axi_acp_r_resp;
+wire ps7_bus_s_axi_acp_r_last;
+wire ps7_bus_s_axi_acp_r_valid;
+reg ps7_bus_s_axi_acp_r_ready = 1'd0;
+reg [4:0] ps7_s_axi_acp_awuser = 5'd0;
+reg [4:0] ps7_s_axi_acp_aruser = 5'd0;
+wire ps7_s_axi_acp_aclk;
+wire ps7_s_axi_acp_areset_n;
+reg [5:0] ps7_bus_s_axi_hp0_aw_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_hp0_aw_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_hp0_aw_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_hp0_aw_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_hp0_aw_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_hp0_aw_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_hp0_aw_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_hp0_aw_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_hp0_aw_qos = 4'd0;
+reg ps7_bus_s_axi_hp0_aw_valid = 1'd0;
+wire ps7_bus_s_axi_hp0_aw_ready;
+reg [5:0] ps7_bus_s_axi_hp0_w_id = 6'd0;
+reg [63:0] ps7_bus_s_axi_hp0_w_data = 64'd0;
+reg [7:0] ps7_bus_s_axi_hp0_w_strb = 8'd0;
+reg ps7_bus_s_axi_hp0_w_last = 1'd0;
+reg ps7_bus_s_axi_hp0_w_valid = 1'd0;
+wire ps7_bus_s_axi_hp0_w_ready;
+wire [5:0] ps7_bus_s_axi_hp0_b_id;
+wire [1:0] ps7_bus_s_axi_hp0_b_resp;
+wire ps7_bus_s_axi_hp0_b_valid;
+reg ps7_bus_s_axi_hp0_b_ready = 1'd0;
+reg [5:0] ps7_bus_s_axi_hp0_ar_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_hp0_ar_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_hp0_ar_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_hp0_ar_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_hp0_ar_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_hp0_ar_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_hp0_ar_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_hp0_ar_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_hp0_ar_qos = 4'd0;
+reg ps7_bus_s_axi_hp0_ar_valid = 1'd0;
+wire ps7_bus_s_axi_hp0_ar_ready;
+wire [5:0] ps7_bus_s_axi_hp0_r_id;
+wire [63:0] ps7_bus_s_axi_hp0_r_data;
+wire [1:0] ps7_bus_s_axi_hp0_r_resp;
+wire ps7_bus_s_axi_hp0_r_last;
+wire ps7_bus_s_axi_hp0_r_valid;
+reg ps7_bus_s_axi_hp0_r_ready = 1'd0;
+wire [7:0] ps7_s_axi_hp0_wcount;
+reg ps7_s_axi_hp0_wrissuecap1_en = 1'd0;
+wire [5:0] ps7_s_axi_hp0_wacount;
+wire [7:0] ps7_s_axi_hp0_rcount;
+wire [2:0] ps7_s_axi_hp0_racount;
+reg ps7_s_axi_hp0_rdissuecap1_en = 1'd0;
+wire ps7_s_axi_hp0_aclk;
+wire ps7_s_axi_hp0_areset_n;
+reg [5:0] ps7_bus_s_axi_hp1_aw_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_hp1_aw_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_hp1_aw_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_hp1_aw_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_hp1_aw_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_hp1_aw_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_hp1_aw_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_hp1_aw_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_hp1_aw_qos = 4'd0;
+reg ps7_bus_s_axi_hp1_aw_valid = 1'd0;
+wire ps7_bus_s_axi_hp1_aw_ready;
+reg [5:0] ps7_bus_s_axi_hp1_w_id = 6'd0;
+reg [63:0] ps7_bus_s_axi_hp1_w_data = 64'd0;
+reg [7:0] ps7_bus_s_axi_hp1_w_strb = 8'd0;
+reg ps7_bus_s_axi_hp1_w_last = 1'd0;
+reg ps7_bus_s_axi_hp1_w_valid = 1'd0;
+wire ps7_bus_s_axi_hp1_w_ready;
+wire [5:0] ps7_bus_s_axi_hp1_b_id;
+wire [1:0] ps7_bus_s_axi_hp1_b_resp;
+wire ps7_bus_s_axi_hp1_b_valid;
+reg ps7_bus_s_axi_hp1_b_ready = 1'd0;
+reg [5:0] ps7_bus_s_axi_hp1_ar_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_hp1_ar_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_hp1_ar_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_hp1_ar_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_hp1_ar_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_hp1_ar_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_hp1_ar_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_hp1_ar_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_hp1_ar_qos = 4'd0;
+reg ps7_bus_s_axi_hp1_ar_valid = 1'd0;
+wire ps7_bus_s_axi_hp1_ar_ready;
+wire [5:0] ps7_bus_s_axi_hp1_r_id;
+wire [63:0] ps7_bus_s_axi_hp1_r_data;
+wire [1:0] ps7_bus_s_axi_hp1_r_resp;
+wire ps7_bus_s_axi_hp1_r_last;
+wire ps7_bus_s_axi_hp1_r_valid;
+reg ps7_bus_s_axi_hp1_r_ready = 1'd0;
+wire [7:0] ps7_s_axi_hp1_wcount;
+reg ps7_s_axi_hp1_wrissuecap1_en = 1'd0;
+wire [5:0] ps7_s_axi_hp1_wacount;
+wire [7:0] ps7_s_axi_hp1_rcount;
+wire [2:0] ps7_s_axi_hp1_racount;
+reg ps7_s_axi_hp1_rdissuecap1_en = 1'd0;
+wire ps7_s_axi_hp1_aclk;
+wire ps7_s_axi_hp1_areset_n;
+reg [5:0] ps7_bus_s_axi_hp2_aw_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_hp2_aw_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_hp2_aw_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_hp2_aw_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_hp2_aw_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_hp2_aw_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_hp2_aw_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_hp2_aw_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_hp2_aw_qos = 4'd0;
+reg ps7_bus_s_axi_hp2_aw_valid = 1'd0;
+wire ps7_bus_s_axi_hp2_aw_ready;
+reg [5:0] ps7_bus_s_axi_hp2_w_id = 6'd0;
+reg [63:0] ps7_bus_s_axi_hp2_w_data = 64'd0;
+reg [7:0] ps7_bus_s_axi_hp2_w_strb = 8'd0;
+reg ps7_bus_s_axi_hp2_w_last = 1'd0;
+reg ps7_bus_s_axi_hp2_w_valid = 1'd0;
+wire ps7_bus_s_axi_hp2_w_ready;
+wire [5:0] ps7_bus_s_axi_hp2_b_id;
+wire [1:0] ps7_bus_s_axi_hp2_b_resp;
+wire ps7_bus_s_axi_hp2_b_valid;
+reg ps7_bus_s_axi_hp2_b_ready = 1'd0;
+reg [5:0] ps7_bus_s_axi_hp2_ar_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_hp2_ar_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_hp2_ar_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_hp2_ar_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_hp2_ar_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_hp2_ar_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_hp2_ar_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_hp2_ar_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_hp2_ar_qos = 4'd0;
+reg ps7_bus_s_axi_hp2_ar_valid = 1'd0;
+wire ps7_bus_s_axi_hp2_ar_ready;
+wire [5:0] ps7_bus_s_axi_hp2_r_id;
+wire [63:0] ps7_bus_s_axi_hp2_r_data;
+wire [1:0] ps7_bus_s_axi_hp2_r_resp;
+wire ps7_bus_s_axi_hp2_r_last;
+wire ps7_bus_s_axi_hp2_r_valid;
+reg ps7_bus_s_axi_hp2_r_ready = 1'd0;
+wire [7:0] ps7_s_axi_hp2_wcount;
+reg ps7_s_axi_hp2_wrissuecap1_en = 1'd0;
+wire [5:0] ps7_s_axi_hp2_wacount;
+wire [7:0] ps7_s_axi_hp2_rcount;
+wire [2:0] ps7_s_axi_hp2_racount;
+reg ps7_s_axi_hp2_rdissuecap1_en = 1'd0;
+wire ps7_s_axi_hp2_aclk;
+wire ps7_s_axi_hp2_areset_n;
+reg [5:0] ps7_bus_s_axi_hp3_aw_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_hp3_aw_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_hp3_aw_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_hp3_aw_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_hp3_aw_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_hp3_aw_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_hp3_aw_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_hp3_aw_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_hp3_aw_qos = 4'd0;
+reg ps7_bus_s_axi_hp3_aw_valid = 1'd0;
+wire ps7_bus_s_axi_hp3_aw_ready;
+reg [5:0] ps7_bus_s_axi_hp3_w_id = 6'd0;
+reg [63:0] ps7_bus_s_axi_hp3_w_data = 64'd0;
+reg [7:0] ps7_bus_s_axi_hp3_w_strb = 8'd0;
+reg ps7_bus_s_axi_hp3_w_last = 1'd0;
+reg ps7_bus_s_axi_hp3_w_valid = 1'd0;
+wire ps7_bus_s_axi_hp3_w_ready;
+wire [5:0] ps7_bus_s_axi_hp3_b_id;
+wire [1:0] ps7_bus_s_axi_hp3_b_resp;
+wire ps7_bus_s_axi_hp3_b_valid;
+reg ps7_bus_s_axi_hp3_b_ready = 1'd0;
+reg [5:0] ps7_bus_s_axi_hp3_ar_id = 6'd0;
+reg [31:0] ps7_bus_s_axi_hp3_ar_addr = 32'd0;
+reg [7:0] ps7_bus_s_axi_hp3_ar_len = 8'd0;
+reg [2:0] ps7_bus_s_axi_hp3_ar_size = 3'd0;
+reg [1:0] ps7_bus_s_axi_hp3_ar_burst = 2'd0;
+reg [1:0] ps7_bus_s_axi_hp3_ar_lock = 2'd0;
+reg [3:0] ps7_bus_s_axi_hp3_ar_cache = 4'd0;
+reg [2:0] ps7_bus_s_axi_hp3_ar_prot = 3'd0;
+reg [3:0] ps7_bus_s_axi_hp3_ar_qos = 4'd0;
+reg ps7_bus_s_axi_hp3_ar_valid = 1'd0;
+wire ps7_bus_s_axi_hp3_ar_ready;
+wire [5:0] ps7_bus_s_axi_hp3_r_id;
+wire [63:0] ps7_bus_s_axi_hp3_r_data;
+wire [1:0] ps7_bus_s_axi_hp3_r_resp;
+wire ps7_bus_s_axi_hp3_r_last;
+wire ps7_bus_s_axi_hp3_r_valid;
+reg ps7_bus_s_axi_hp3_r_ready = 1'd0;
+wire [7:0] ps7_s_axi_hp3_wcount;
+reg ps7_s_axi_hp3_wrissuecap1_en = 1'd0;
+wire [5:0] ps7_s_axi_hp3_wacount;
+wire [7:0] ps7_s_axi_hp3_rcount;
+wire [2:0] ps7_s_axi_hp3_racount;
+reg ps7_s_axi_hp3_rdissuecap1_en = 1'd0;
+wire ps7_s_axi_hp3_aclk;
+wire ps7_s_axi_hp3_areset_n;
+reg ps7_bus_dma0_da_ready = 1'd0;
+wire [1:0] ps7_bus_dma0_da_type;
+wire ps7_bus_dma0_da_valid;
+reg ps7_bus_dma0_dr_last = 1'd0;
+wire ps7_bus_dma0_dr_ready;
+reg [1:0] ps7_bus_dma0_dr_type = 2'd0;
+reg ps7_bus_dma0_dr_valid = 1'd0;
+wire ps7_dma0_aclk;
+wire ps7_dma0_rst_n;
+reg ps7_bus_dma1_da_ready = 1'd0;
+wire [1:0] ps7_bus_dma1_da_type;
+wire ps7_bus_dma1_da_valid;
+reg ps7_bus_dma1_dr_last = 1'd0;
+wire ps7_bus_dma1_dr_ready;
+reg [1:0] ps7_bus_dma1_dr_type = 2'd0;
+reg ps7_bus_dma1_dr_valid = 1'd0;
+wire ps7_dma1_aclk;
+wire ps7_dma1_rst_n;
+reg ps7_bus_dma2_da_ready = 1'd0;
+wire [1:0] ps7_bus_dma2_da_type;
+wire ps7_bus_dma2_da_valid;
+reg ps7_bus_dma2_dr_last = 1'd0;
+wire ps7_bus_dma2_dr_ready;
+reg [1:0] ps7_bus_dma2_dr_type = 2'd0;
+reg ps7_bus_dma2_dr_valid = 1'd0;
+wire ps7_dma2_aclk;
+wire ps7_dma2_rst_n;
+reg ps7_bus_dma3_da_ready = 1'd0;
+wire [1:0] ps7_bus_dma3_da_type;
+wire ps7_bus_dma3_da_valid;
+reg ps7_bus_dma3_dr_last = 1'd0;
+wire ps7_bus_dma3_dr_ready;
+reg [1:0] ps7_bus_dma3_dr_type = 2'd0;
+reg ps7_bus_dma3_dr_valid = 1'd0;
+wire ps7_dma3_aclk;
+wire ps7_dma3_rst_n;
+reg ps7_enet0_enet_gmii_rx_clk = 1'd0;
+reg ps7_enet0_enet_gmii_crs = 1'd0;
+reg ps7_enet0_enet_gmii_col = 1'd0;
+reg [7:0] ps7_enet0_enet_gmii_rxd = 8'd0;
+reg ps7_enet0_enet_gmii_rx_dv = 1'd0;
+reg ps7_enet0_enet_gmii_rx_er = 1'd0;
+reg ps7_enet0_enet_gmii_tx_clk = 1'd0;
+wire [7:0] ps7_enet0_enet_gmii_txd;
+wire ps7_enet0_enet_gmii_tx_en;
+wire ps7_enet0_enet_gmii_tx_er;
+wire ps7_enet0_enet_mdio_mdc;
+reg ps7_enet0_enet_mdio_i = 1'd0;
+wire ps7_enet0_enet_mdio_o;
+wire ps7_enet0_enet_mdio_t_n;
+wire ps7_enet0_enet_ptp_sync_frame_tx;
+wire ps7_enet0_enet_ptp_delay_req_tx;
+wire ps7_enet0_enet_ptp_pdelay_req_tx;
+wire ps7_enet0_enet_ptp_pdelay_resp_tx;
+wire ps7_enet0_enet_ptp_sync_frame_rx;
+wire ps7_enet0_enet_ptp_delay_req_rx;
+wire ps7_enet0_enet_ptp_pdelay_req_rx;
+wire ps7_enet0_enet_ptp_pdelay_resp_rx;
+wire ps7_enet0_enet_sof_rx;
+wire ps7_enet0_enet_sof_tx;
+reg ps7_enet0_enet_ext_intin = 1'd0;
+reg ps7_enet1_enet_gmii_rx_clk = 1'd0;
+reg ps7_enet1_enet_gmii_crs = 1'd0;
+reg ps7_enet1_enet_gmii_col = 1'd0;
+reg [7:0] ps7_enet1_enet_gmii_rxd = 8'd0;
+reg ps7_enet1_enet_gmii_rx_dv = 1'd0;
+reg ps7_enet1_enet_gmii_rx_er = 1'd0;
+reg ps7_enet1_enet_gmii_tx_clk = 1'd0;
+wire [7:0] ps7_enet1_enet_gmii_txd;
+wire ps7_enet1_enet_gmii_tx_en;
+wire ps7_enet1_enet_gmii_tx_er;
+wire ps7_enet1_enet_mdio_mdc;
+reg ps7_enet1_enet_mdio_i = 1'd0;
+wire ps7_enet1_enet_mdio_o;
+wire ps7_enet1_enet_mdio_t_n;
+wire ps7_enet1_enet_ptp_sync_frame_tx;
+wire ps7_enet1_enet_ptp_delay_req_tx;
+wire ps7_enet1_enet_ptp_pdelay_req_tx;
+wire ps7_enet1_enet_ptp_pdelay_resp_tx;
+wire ps7_enet1_enet_ptp_sync_frame_rx;
+wire ps7_enet1_enet_ptp_delay_req_rx;
+wire ps7_enet1_enet_ptp_pdelay_req_rx;
+wire ps7_enet1_enet_ptp_pdelay_resp_rx;
+wire ps7_enet1_enet_sof_rx;
+wire ps7_enet1_enet_sof_tx;
+reg ps7_enet1_enet_ext_intin = 1'd0;
+wire [2:0] ps7_ttc0_wave_o;
+reg [2:0] ps7_ttc0_clk_i = 3'd0;
+wire [2:0] ps7_ttc1_wave_o;
+reg [2:0] ps7_ttc1_clk_i = 3'd0;
+reg ps7_wdt_clk_i = 1'd0;
+wire ps7_wdt_rst_o;
+reg ps7_spi0_sclk_i = 1'd0;
+wire ps7_spi0_sclk_o;
+wire ps7_spi0_sclk_t_n;
+reg ps7_spi0_m_i = 1'd0;
+wire ps7_spi0_m_o;
+wire ps7_spi0_m_t_n;
+reg ps7_spi0_s_i = 1'd0;
+wire ps7_spi0_s_o;
+wire ps7_spi0_s_t_n;
+reg ps7_spi0_ss_i_n = 1'd0;
+wire ps7_spi0_ss_t_n;
+wire [2:0] ps7_spi0_ss_o_n;
+reg ps7_spi1_sclk_i = 1'd0;
+wire ps7_spi1_sclk_o;
+wire ps7_spi1_sclk_t_n;
+reg ps7_spi1_m_i = 1'd0;
+wire ps7_spi1_m_o;
+wire ps7_spi1_m_t_n;
+reg ps7_spi1_s_i = 1'd0;
+wire ps7_spi1_s_o;
+wire ps7_spi1_s_t_n;
+reg ps7_spi1_ss_i_n = 1'd0;
+wire ps7_spi1_ss_t_n;
+wire [2:0] ps7_spi1_ss_o_n;
+reg ps7_i2c0_scl_i = 1'd0;
+wire ps7_i2c0_scl_o;
+wire ps7_i2c0_scl_t_n;
+reg ps7_i2c0_sda_i = 1'd0;
+wire ps7_i2c0_sda_o;
+wire ps7_i2c0_sda_t_n;
+reg ps7_i2c1_scl_i = 1'd0;
+wire ps7_i2c1_scl_o;
+wire ps7_i2c1_scl_t_n;
+reg ps7_i2c1_sda_i = 1'd0;
+wire ps7_i2c1_sda_o;
+wire ps7_i2c1_sda_t_n;
+wire ps7_can0_phy_tx;
+reg ps7_can0_phy_rx = 1'd0;
+wire ps7_can1_phy_tx;
+reg ps7_can1_phy_rx = 1'd0;
+wire ps7_uart0_tx;
+reg ps7_uart0_rx = 1'd0;
+reg ps7_uart0_cts_n = 1'd0;
+wire ps7_uart0_rts_n;
+reg ps7_uart0_dsr_n = 1'd0;
+reg ps7_uart0_dcd_n = 1'd0;
+reg ps7_uart0_ri_n = 1'd0;
+wire ps7_uart0_dtr_n;
+wire ps7_uart1_tx;
+reg ps7_uart1_rx = 1'd0;
+reg ps7_uart1_cts_n = 1'd0;
+wire ps7_uart1_rts_n;
+reg ps7_uart1_dsr_n = 1'd0;
+reg ps7_uart1_dcd_n = 1'd0;
+reg ps7_uart1_ri_n = 1'd0;
+wire ps7_uart1_dtr_n;
+wire ps7_sdio0_clk;
+reg ps7_sdio0_clk_fb = 1'd0;
+reg ps7_sdio0_cmd_i = 1'd0;
+wire ps7_sdio0_cmd_o;
+wire ps7_sdio0_cmd_t_n;
+reg [3:0] ps7_sdio0_data_i = 4'd0;
+wire [3:0] ps7_sdio0_data_o;
+wire [3:0] ps7_sdio0_data_t_n;
+reg ps7_sdio0_cd_n = 1'd0;
+reg ps7_sdio0_wp = 1'd0;
+wire ps7_sdio0_led;
+wire ps7_sdio0_buspow;
+wire [2:0] ps7_sdio0_busvolt;
+wire ps7_sdio1_clk;
+reg ps7_sdio1_clk_fb = 1'd0;
+reg ps7_sdio1_cmd_i = 1'd0;
+wire ps7_sdio1_cmd_o;
+wire ps7_sdio1_cmd_t_n;
+reg [3:0] ps7_sdio1_data_i = 4'd0;
+wire [3:0] ps7_sdio1_data_o;
+wire [3:0] ps7_sdio1_data_t_n;
+reg ps7_sdio1_cd_n = 1'd0;
+reg ps7_sdio1_wp = 1'd0;
+wire ps7_sdio1_led;
+wire ps7_sdio1_buspow;
+wire [2:0] ps7_sdio1_busvolt;
+reg [63:0] ps7_gpio_i = 64'd0;
+wire [63:0] ps7_gpio_o;
+wire [63:0] ps7_gpio_t_n;
+wire [1:0] ps7_usb0_port_indctl;
+reg ps7_usb0_vbus_pwrfault = 1'd0;
+wire ps7_usb0_vbus_pwrselect;
+wire [1:0] ps7_usb1_port_indctl;
+reg ps7_usb1_vbus_pwrfault = 1'd0;
+wire ps7_usb1_vbus_pwrselect;
+reg ps7_sram_intin = 1'd0;
+reg ps7_event_i = 1'd0;
+wire ps7_event_o;
+wire [1:0] ps7_event_standbywfe;
+wire [1:0] ps7_event_standbywfi;
+reg ps7_trace_clk = 1'd0;
+wire ps7_trace_ctl;
+wire [31:0] ps7_trace_data;
+reg ps7_pjtag_tck = 1'd0;
+reg ps7_pjtag_tms = 1'd0;
+reg ps7_pjtag_td_i = 1'd0;
+wire ps7_pjtag_td_o;
+wire ps7_pjtag_td_t_n;
+wire [14:0] ps7_ddr_a;
+wire [2:0] ps7_ddr_ba;
+wire ps7_ddr_cas_n;
+wire ps7_ddr_cke;
+wire ps7_ddr_ck_n;
+wire ps7_ddr_ck_p;
+wire ps7_ddr_cs_n;
+wire [3:0] ps7_ddr_dm;
+wire [31:0] ps7_ddr_dq;
+wire [3:0] ps7_ddr_dqs_n;
+wire [3:0] ps7_ddr_dqs_p;
+wire ps7_ddr_drst_n;
+wire ps7_ddr_odt;
+wire ps7_ddr_ras_n;
+wire ps7_ddr_vrn;
+wire ps7_ddr_vrp;
+wire ps7_ddr_we_n;
+wire ps7_ps_clk;
+wire ps7_ps_por_b;
+wire ps7_ps_srst_b;
+wire [53:0] ps7_pads;
+wire [72:0] ps7_ports;
+wire [72:0] ps7_self;
+wire [3:0] ps7_fclk_clk;
+wire [3:0] ps7_fclk_clktrig_n;
+wire [3:0] ps7_fclk_reset_n;
+reg [31:0] ps7_ftmd_tracein_data = 32'd0;
+reg ps7_ftmd_tracein_valid = 1'd0;
+reg ps7_ftmd_tracein_clock = 1'd0;
+reg ps7_ftmd_tracein_atid = 1'd0;
+reg [3:0] ps7_ftmt_f2p_trig = 4'd0;
+wire [3:0] ps7_ftmt_f2p_trigack;
+reg [31:0] ps7_ftmt_f2p_debug = 32'd0;
+wire [3:0] ps7_ftmt_p2f_trig;
+reg [3:0] ps7_ftmt_p2f_trigack = 4'd0;
+wire [31:0] ps7_ftmt_p2f_debug;
+wire [28:0] ps7_irq_p2f;
+reg [19:0] ps7_irq_f2p;
+reg [13:0] adr = 14'd0;
+reg we = 1'd0;
+reg [7:0] dat_w = 8'd0;
+wire [7:0] dat_r;
+wire [11:0] aw_id;
+wire [31:0] aw_addr;
+wire [7:0] aw_len;
+wire [2:0] aw_size;
+wire [1:0] aw_burst;
+wire [1:0] aw_lock;
+wire [3:0] aw_cache;
+wire [2:0] aw_prot;
+wire [3:0] aw_qos;
+wire aw_valid;
+reg aw_ready;
+wire [11:0] w_id;
+wire [31:0] w_data;
+wire [3:0] w_strb;
+wire w_last;
+wire w_valid;
+reg w_ready;
+wire [11:0] b_id;
+wire [1:0] b_resp;
+reg b_valid;
+wire b_ready;
+wire [11:0] ar_id;
+wire [31:0] ar_addr;
+wire [7:0] ar_len;
+wire [2:0] ar_size;
+wire [1:0] ar_burst;
+wire [1:0] ar_lock;
+wire [3:0] ar_cache;
+wire [2:0] ar_prot;
+wire [3:0] ar_qos;
+wire ar_valid;
+reg ar_ready;
+wire [11:0] r_id;
+reg [31:0] r_data = 32'd0;
+wire [1:0] r_resp;
+wire r_last;
+reg r_valid;
+wire r_ready;
+reg [11:0] id_ = 12'd0;
+reg pending = 1'd0;
+reg [2:0] state = 3'd0;
+reg [2:0] next_state;
+reg [13:0] adr_t_next_value0;
+reg adr_t_next_value_ce0;
+reg [11:0] id__t_next_value1;
+reg id__t_next_value_ce1;
+reg pending_f_next_value;
+reg pending_f_next_value_ce;
+reg we_t_next_value2;
+reg we_t_next_value_ce2;
+wire [13:0] bus_adr;
+wire bus_we;
+wire [7:0] bus_dat_w;
+reg [7:0] bus_dat_r = 8'd0;
+wire async_reset;
+wire rst_meta;
+
+// synthesis translate_off
+reg dummy_s;
+initial dummy_s <= 1'd0;
+// synthesis translate_on
+
+assign ps7_m_axi_gp0_aclk = sys_clk;
+assign ps7_m_axi_gp1_aclk = sys_clk;
+assign ps7_s_axi_gp0_aclk = sys_clk;
+assign ps7_s_axi_gp1_aclk = sys_clk;
+assign ps7_s_axi_acp_aclk = sys_clk;
+assign ps7_s_axi_hp0_aclk = sys_clk;
+assign ps7_s_axi_hp1_aclk = sys_clk;
+assign ps7_s_axi_hp2_aclk = sys_clk;
+assign ps7_s_axi_hp3_aclk = sys_clk;
+assign ps7_dma0_aclk = sys_clk;
+assign ps7_dma1_aclk = sys_clk;
+assign ps7_dma2_aclk = sys_clk;
+assign ps7_dma3_aclk = sys_clk;
+assign ps7_ports = {ddr_reset_n, ddr_clk_p, ddr_clk_n, ddr_cs_n, ddr_cke, ddr_odt, ddr_we_n, ddr_ras_n, ddr_vrp, ddr_vrn, ddr_cas_n, ddr_ba, ddr_a, ddr_dqs_p, ddr_dqs_n, ddr_dm, ddr_dq};
+assign ps7_fclk_clktrig_n = 1'd0;
+
+// synthesis translate_off
+reg dummy_d;
+// synthesis translate_on
+always @(*) begin
+	ps7_irq_f2p <= 20'd0;
+	ps7_irq_f2p[15:0] <= ps7_interrupt;
+	ps7_irq_f2p[19:16] <= {ps7_core_core1_nfiq, ps7_core_core0_nfiq, ps7_core_core1_nirq, ps7_core_core0_nirq};
+// synthesis translate_off
+	dummy_d <= dummy_s;
+// synthesis translate_on
+end
+assign {ps7_spi_dmac_abort, ps7_spi_dmac, ps7_spi_smc, ps7_spi_qspi, ps7_spi_cti, ps7_spi_gpio, ps7_spi_usb0, ps7_spi_enet0, ps7_spi_enet0_wake, ps7_spi_sdio0, ps7_spi_i2c0, ps7_spi_spi0, ps7_spi_uart0, ps7_spi_can0, ps7_spi_usb1, ps7_spi_enet1, ps7_spi_enet1_wake, ps7_spi_sdio1, ps7_spi_i2c1, ps7_spi_spi1, ps7_spi_uart1, ps7_spi_can1} = ps7_irq_p2f;
+assign ps7_axiwrshim0_first_beat_detect = (ps7_axiwrshim0_wlast_detect & ps7_axiwrshim0_m_axi_i_w_valid);
+assign ps7_axiwrshim0_awcmd_en = ((ps7_axiwrshim0_first_beat_detect & (~ps7_axiwrshim0_stall_awvalid)) | ps7_axiwrshim0_store_first_beat);
+
+// synthesis translate_off
+reg dummy_d_1;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_addr_ofs <= 2'd0;
+	ps7_axiwrshim0_awsize <= 3'd0;
+	case (ps7_axiwrshim0_m_axi_i_w_strb)
+		1'd1: begin
+			ps7_axiwrshim0_awsize <= 1'd0;
+			ps7_axiwrshim0_addr_ofs <= 1'd0;
+		end
+		2'd2: begin
+			ps7_axiwrshim0_awsize <= 1'd0;
+			ps7_axiwrshim0_addr_ofs <= 1'd1;
+		end
+		2'd3: begin
+			ps7_axiwrshim0_awsize <= 1'd1;
+			ps7_axiwrshim0_addr_ofs <= 1'd0;
+		end
+		3'd4: begin
+			ps7_axiwrshim0_awsize <= 1'd0;
+			ps7_axiwrshim0_addr_ofs <= 2'd2;
+		end
+		4'd8: begin
+			ps7_axiwrshim0_awsize <= 1'd0;
+			ps7_axiwrshim0_addr_ofs <= 2'd3;
+		end
+		4'd12: begin
+			ps7_axiwrshim0_awsize <= 1'd1;
+			ps7_axiwrshim0_addr_ofs <= 2'd2;
+		end
+		default: begin
+			ps7_axiwrshim0_awsize <= ps7_axiwrshim0_m_axi_i_aw_size;
+			ps7_axiwrshim0_addr_ofs <= 1'd0;
+		end
+	endcase
+// synthesis translate_off
+	dummy_d_1 <= dummy_s;
+// synthesis translate_on
+end
+assign ps7_axiwrshim0_start_wr = ((ps7_axiwrshim0_wlast_detect & ps7_axiwrshim0_m_axi_i_w_valid) & ps7_axiwrshim0_previous_cmd_done);
+assign ps7_axiwrshim0_wlast_consumed = ((ps7_axiwrshim0_m_axi_i_w_valid & ps7_axiwrshim0_m_axi_o_w_ready) & ps7_axiwrshim0_m_axi_i_w_last);
+assign ps7_axiwrshim0_wdata_en = (ps7_axiwrshim0_burst_still_active | ps7_axiwrshim0_start_wr);
+
+// synthesis translate_off
+reg dummy_d_2;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_id <= 6'd0;
+	ps7_axiwrshim0_m_axi_o_aw_id <= ps7_axiwrshim0_m_axi_i_aw_id;
+	ps7_axiwrshim0_m_axi_o_aw_id <= ps7_axiwrshim0_m_axi_i_aw_id;
+// synthesis translate_off
+	dummy_d_2 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_3;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_len <= 8'd0;
+	ps7_axiwrshim0_m_axi_o_aw_len <= ps7_axiwrshim0_m_axi_i_aw_len;
+	ps7_axiwrshim0_m_axi_o_aw_len <= ps7_axiwrshim0_m_axi_i_aw_len;
+// synthesis translate_off
+	dummy_d_3 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_4;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_burst <= 2'd0;
+	ps7_axiwrshim0_m_axi_o_aw_burst <= ps7_axiwrshim0_m_axi_i_aw_burst;
+	ps7_axiwrshim0_m_axi_o_aw_burst <= ps7_axiwrshim0_m_axi_i_aw_burst;
+// synthesis translate_off
+	dummy_d_4 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_5;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_lock <= 2'd0;
+	ps7_axiwrshim0_m_axi_o_aw_lock <= ps7_axiwrshim0_m_axi_i_aw_lock;
+	ps7_axiwrshim0_m_axi_o_aw_lock <= ps7_axiwrshim0_m_axi_i_aw_lock;
+// synthesis translate_off
+	dummy_d_5 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_6;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_cache <= 4'd0;
+	ps7_axiwrshim0_m_axi_o_aw_cache <= ps7_axiwrshim0_m_axi_i_aw_cache;
+	ps7_axiwrshim0_m_axi_o_aw_cache <= ps7_axiwrshim0_m_axi_i_aw_cache;
+// synthesis translate_off
+	dummy_d_6 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_7;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_prot <= 3'd0;
+	ps7_axiwrshim0_m_axi_o_aw_prot <= ps7_axiwrshim0_m_axi_i_aw_prot;
+	ps7_axiwrshim0_m_axi_o_aw_prot <= ps7_axiwrshim0_m_axi_i_aw_prot;
+// synthesis translate_off
+	dummy_d_7 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_8;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_qos <= 4'd0;
+	ps7_axiwrshim0_m_axi_o_aw_qos <= ps7_axiwrshim0_m_axi_i_aw_qos;
+	ps7_axiwrshim0_m_axi_o_aw_qos <= ps7_axiwrshim0_m_axi_i_aw_qos;
+// synthesis translate_off
+	dummy_d_8 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_9;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_valid <= 1'd0;
+	ps7_axiwrshim0_m_axi_o_aw_valid <= (ps7_axiwrshim0_m_axi_i_aw_valid & ps7_axiwrshim0_awcmd_en);
+	ps7_axiwrshim0_m_axi_o_aw_valid <= ps7_axiwrshim0_m_axi_i_aw_valid;
+// synthesis translate_off
+	dummy_d_9 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_10;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_i_aw_ready <= 1'd0;
+	ps7_axiwrshim0_m_axi_i_aw_ready <= (ps7_axiwrshim0_m_axi_o_aw_ready & ps7_axiwrshim0_awcmd_en);
+	ps7_axiwrshim0_m_axi_i_aw_ready <= ps7_axiwrshim0_m_axi_o_aw_ready;
+// synthesis translate_off
+	dummy_d_10 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_11;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_w_id <= 6'd0;
+	ps7_axiwrshim0_m_axi_o_w_id <= ps7_axiwrshim0_m_axi_i_w_id;
+	ps7_axiwrshim0_m_axi_o_w_id <= ps7_axiwrshim0_m_axi_i_w_id;
+// synthesis translate_off
+	dummy_d_11 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_12;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_w_data <= 32'd0;
+	ps7_axiwrshim0_m_axi_o_w_data <= ps7_axiwrshim0_m_axi_i_w_data;
+	ps7_axiwrshim0_m_axi_o_w_data <= ps7_axiwrshim0_m_axi_i_w_data;
+// synthesis translate_off
+	dummy_d_12 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_13;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_w_strb <= 4'd0;
+	ps7_axiwrshim0_m_axi_o_w_strb <= ps7_axiwrshim0_m_axi_i_w_strb;
+	ps7_axiwrshim0_m_axi_o_w_strb <= ps7_axiwrshim0_m_axi_i_w_strb;
+// synthesis translate_off
+	dummy_d_13 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_14;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_w_last <= 1'd0;
+	ps7_axiwrshim0_m_axi_o_w_last <= ps7_axiwrshim0_m_axi_i_w_last;
+	ps7_axiwrshim0_m_axi_o_w_last <= ps7_axiwrshim0_m_axi_i_w_last;
+// synthesis translate_off
+	dummy_d_14 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_15;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_w_valid <= 1'd0;
+	ps7_axiwrshim0_m_axi_o_w_valid <= (ps7_axiwrshim0_m_axi_i_w_valid & ps7_axiwrshim0_wdata_en);
+	ps7_axiwrshim0_m_axi_o_w_valid <= ps7_axiwrshim0_m_axi_i_w_valid;
+// synthesis translate_off
+	dummy_d_15 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_16;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_i_w_ready <= 1'd0;
+	ps7_axiwrshim0_m_axi_i_w_ready <= (ps7_axiwrshim0_m_axi_o_w_ready & ps7_axiwrshim0_wdata_en);
+	ps7_axiwrshim0_m_axi_i_w_ready <= ps7_axiwrshim0_m_axi_o_w_ready;
+// synthesis translate_off
+	dummy_d_16 <= dummy_s;
+// synthesis translate_on
+end
+assign ps7_axiwrshim0_m_axi_i_b_id = ps7_axiwrshim0_m_axi_o_b_id;
+assign ps7_axiwrshim0_m_axi_i_b_resp = ps7_axiwrshim0_m_axi_o_b_resp;
+assign ps7_axiwrshim0_m_axi_i_b_valid = ps7_axiwrshim0_m_axi_o_b_valid;
+assign ps7_axiwrshim0_m_axi_o_b_ready = ps7_axiwrshim0_m_axi_i_b_ready;
+assign ps7_axiwrshim0_m_axi_o_ar_id = ps7_axiwrshim0_m_axi_i_ar_id;
+assign ps7_axiwrshim0_m_axi_o_ar_addr = ps7_axiwrshim0_m_axi_i_ar_addr;
+assign ps7_axiwrshim0_m_axi_o_ar_len = ps7_axiwrshim0_m_axi_i_ar_len;
+assign ps7_axiwrshim0_m_axi_o_ar_size = ps7_axiwrshim0_m_axi_i_ar_size;
+assign ps7_axiwrshim0_m_axi_o_ar_burst = ps7_axiwrshim0_m_axi_i_ar_burst;
+assign ps7_axiwrshim0_m_axi_o_ar_lock = ps7_axiwrshim0_m_axi_i_ar_lock;
+assign ps7_axiwrshim0_m_axi_o_ar_cache = ps7_axiwrshim0_m_axi_i_ar_cache;
+assign ps7_axiwrshim0_m_axi_o_ar_prot = ps7_axiwrshim0_m_axi_i_ar_prot;
+assign ps7_axiwrshim0_m_axi_o_ar_qos = ps7_axiwrshim0_m_axi_i_ar_qos;
+assign ps7_axiwrshim0_m_axi_o_ar_valid = ps7_axiwrshim0_m_axi_i_ar_valid;
+assign ps7_axiwrshim0_m_axi_i_ar_ready = ps7_axiwrshim0_m_axi_o_ar_ready;
+assign ps7_axiwrshim0_m_axi_i_r_id = ps7_axiwrshim0_m_axi_o_r_id;
+assign ps7_axiwrshim0_m_axi_i_r_data = ps7_axiwrshim0_m_axi_o_r_data;
+assign ps7_axiwrshim0_m_axi_i_r_resp = ps7_axiwrshim0_m_axi_o_r_resp;
+assign ps7_axiwrshim0_m_axi_i_r_last = ps7_axiwrshim0_m_axi_o_r_last;
+assign ps7_axiwrshim0_m_axi_i_r_valid = ps7_axiwrshim0_m_axi_o_r_valid;
+assign ps7_axiwrshim0_m_axi_o_r_ready = ps7_axiwrshim0_m_axi_i_r_ready;
+
+// synthesis translate_off
+reg dummy_d_17;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_addr <= 32'd0;
+	ps7_axiwrshim0_m_axi_o_aw_addr <= ps7_axiwrshim0_m_axi_i_aw_addr;
+	ps7_axiwrshim0_m_axi_o_aw_addr <= {ps7_axiwrshim0_m_axi_i_aw_addr[31:2], ps7_axiwrshim0_addr_ofs};
+// synthesis translate_off
+	dummy_d_17 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_18;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim0_m_axi_o_aw_size <= 3'd0;
+	ps7_axiwrshim0_m_axi_o_aw_size <= ps7_axiwrshim0_m_axi_i_aw_size;
+	ps7_axiwrshim0_m_axi_o_aw_size <= ps7_axiwrshim0_awsize;
+// synthesis translate_off
+	dummy_d_18 <= dummy_s;
+// synthesis translate_on
+end
+assign ps7_shim_s_axi_gp0_aw_id = ps7_bus_s_axi_gp0_aw_id;
+assign ps7_shim_s_axi_gp0_aw_addr = ps7_bus_s_axi_gp0_aw_addr;
+assign ps7_shim_s_axi_gp0_aw_len = ps7_bus_s_axi_gp0_aw_len;
+assign ps7_shim_s_axi_gp0_aw_size = ps7_bus_s_axi_gp0_aw_size;
+assign ps7_shim_s_axi_gp0_aw_burst = ps7_bus_s_axi_gp0_aw_burst;
+assign ps7_shim_s_axi_gp0_aw_lock = ps7_bus_s_axi_gp0_aw_lock;
+assign ps7_shim_s_axi_gp0_aw_cache = ps7_bus_s_axi_gp0_aw_cache;
+assign ps7_shim_s_axi_gp0_aw_prot = ps7_bus_s_axi_gp0_aw_prot;
+assign ps7_shim_s_axi_gp0_aw_qos = ps7_bus_s_axi_gp0_aw_qos;
+assign ps7_shim_s_axi_gp0_aw_valid = ps7_bus_s_axi_gp0_aw_valid;
+assign ps7_bus_s_axi_gp0_aw_ready = ps7_shim_s_axi_gp0_aw_ready;
+assign ps7_shim_s_axi_gp0_w_id = ps7_bus_s_axi_gp0_w_id;
+assign ps7_shim_s_axi_gp0_w_data = ps7_bus_s_axi_gp0_w_data;
+assign ps7_shim_s_axi_gp0_w_strb = ps7_bus_s_axi_gp0_w_strb;
+assign ps7_shim_s_axi_gp0_w_last = ps7_bus_s_axi_gp0_w_last;
+assign ps7_shim_s_axi_gp0_w_valid = ps7_bus_s_axi_gp0_w_valid;
+assign ps7_bus_s_axi_gp0_w_ready = ps7_shim_s_axi_gp0_w_ready;
+assign ps7_bus_s_axi_gp0_b_id = ps7_shim_s_axi_gp0_b_id;
+assign ps7_bus_s_axi_gp0_b_resp = ps7_shim_s_axi_gp0_b_resp;
+assign ps7_bus_s_axi_gp0_b_valid = ps7_shim_s_axi_gp0_b_valid;
+assign ps7_shim_s_axi_gp0_b_ready = ps7_bus_s_axi_gp0_b_ready;
+assign ps7_shim_s_axi_gp0_ar_id = ps7_bus_s_axi_gp0_ar_id;
+assign ps7_shim_s_axi_gp0_ar_addr = ps7_bus_s_axi_gp0_ar_addr;
+assign ps7_shim_s_axi_gp0_ar_len = ps7_bus_s_axi_gp0_ar_len;
+assign ps7_shim_s_axi_gp0_ar_size = ps7_bus_s_axi_gp0_ar_size;
+assign ps7_shim_s_axi_gp0_ar_burst = ps7_bus_s_axi_gp0_ar_burst;
+assign ps7_shim_s_axi_gp0_ar_lock = ps7_bus_s_axi_gp0_ar_lock;
+assign ps7_shim_s_axi_gp0_ar_cache = ps7_bus_s_axi_gp0_ar_cache;
+assign ps7_shim_s_axi_gp0_ar_prot = ps7_bus_s_axi_gp0_ar_prot;
+assign ps7_shim_s_axi_gp0_ar_qos = ps7_bus_s_axi_gp0_ar_qos;
+assign ps7_shim_s_axi_gp0_ar_valid = ps7_bus_s_axi_gp0_ar_valid;
+assign ps7_bus_s_axi_gp0_ar_ready = ps7_shim_s_axi_gp0_ar_ready;
+assign ps7_bus_s_axi_gp0_r_id = ps7_shim_s_axi_gp0_r_id;
+assign ps7_bus_s_axi_gp0_r_data = ps7_shim_s_axi_gp0_r_data;
+assign ps7_bus_s_axi_gp0_r_resp = ps7_shim_s_axi_gp0_r_resp;
+assign ps7_bus_s_axi_gp0_r_last = ps7_shim_s_axi_gp0_r_last;
+assign ps7_bus_s_axi_gp0_r_valid = ps7_shim_s_axi_gp0_r_valid;
+assign ps7_shim_s_axi_gp0_r_ready = ps7_bus_s_axi_gp0_r_ready;
+assign ps7_axiwrshim1_first_beat_detect = (ps7_axiwrshim1_wlast_detect & ps7_axiwrshim1_m_axi_i_w_valid);
+assign ps7_axiwrshim1_awcmd_en = ((ps7_axiwrshim1_first_beat_detect & (~ps7_axiwrshim1_stall_awvalid)) | ps7_axiwrshim1_store_first_beat);
+
+// synthesis translate_off
+reg dummy_d_19;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_addr_ofs <= 2'd0;
+	ps7_axiwrshim1_awsize <= 3'd0;
+	case (ps7_axiwrshim1_m_axi_i_w_strb)
+		1'd1: begin
+			ps7_axiwrshim1_awsize <= 1'd0;
+			ps7_axiwrshim1_addr_ofs <= 1'd0;
+		end
+		2'd2: begin
+			ps7_axiwrshim1_awsize <= 1'd0;
+			ps7_axiwrshim1_addr_ofs <= 1'd1;
+		end
+		2'd3: begin
+			ps7_axiwrshim1_awsize <= 1'd1;
+			ps7_axiwrshim1_addr_ofs <= 1'd0;
+		end
+		3'd4: begin
+			ps7_axiwrshim1_awsize <= 1'd0;
+			ps7_axiwrshim1_addr_ofs <= 2'd2;
+		end
+		4'd8: begin
+			ps7_axiwrshim1_awsize <= 1'd0;
+			ps7_axiwrshim1_addr_ofs <= 2'd3;
+		end
+		4'd12: begin
+			ps7_axiwrshim1_awsize <= 1'd1;
+			ps7_axiwrshim1_addr_ofs <= 2'd2;
+		end
+		default: begin
+			ps7_axiwrshim1_awsize <= ps7_axiwrshim1_m_axi_i_aw_size;
+			ps7_axiwrshim1_addr_ofs <= 1'd0;
+		end
+	endcase
+// synthesis translate_off
+	dummy_d_19 <= dummy_s;
+// synthesis translate_on
+end
+assign ps7_axiwrshim1_start_wr = ((ps7_axiwrshim1_wlast_detect & ps7_axiwrshim1_m_axi_i_w_valid) & ps7_axiwrshim1_previous_cmd_done);
+assign ps7_axiwrshim1_wlast_consumed = ((ps7_axiwrshim1_m_axi_i_w_valid & ps7_axiwrshim1_m_axi_o_w_ready) & ps7_axiwrshim1_m_axi_i_w_last);
+assign ps7_axiwrshim1_wdata_en = (ps7_axiwrshim1_burst_still_active | ps7_axiwrshim1_start_wr);
+
+// synthesis translate_off
+reg dummy_d_20;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_id <= 6'd0;
+	ps7_axiwrshim1_m_axi_o_aw_id <= ps7_axiwrshim1_m_axi_i_aw_id;
+	ps7_axiwrshim1_m_axi_o_aw_id <= ps7_axiwrshim1_m_axi_i_aw_id;
+// synthesis translate_off
+	dummy_d_20 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_21;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_len <= 8'd0;
+	ps7_axiwrshim1_m_axi_o_aw_len <= ps7_axiwrshim1_m_axi_i_aw_len;
+	ps7_axiwrshim1_m_axi_o_aw_len <= ps7_axiwrshim1_m_axi_i_aw_len;
+// synthesis translate_off
+	dummy_d_21 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_22;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_burst <= 2'd0;
+	ps7_axiwrshim1_m_axi_o_aw_burst <= ps7_axiwrshim1_m_axi_i_aw_burst;
+	ps7_axiwrshim1_m_axi_o_aw_burst <= ps7_axiwrshim1_m_axi_i_aw_burst;
+// synthesis translate_off
+	dummy_d_22 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_23;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_lock <= 2'd0;
+	ps7_axiwrshim1_m_axi_o_aw_lock <= ps7_axiwrshim1_m_axi_i_aw_lock;
+	ps7_axiwrshim1_m_axi_o_aw_lock <= ps7_axiwrshim1_m_axi_i_aw_lock;
+// synthesis translate_off
+	dummy_d_23 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_24;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_cache <= 4'd0;
+	ps7_axiwrshim1_m_axi_o_aw_cache <= ps7_axiwrshim1_m_axi_i_aw_cache;
+	ps7_axiwrshim1_m_axi_o_aw_cache <= ps7_axiwrshim1_m_axi_i_aw_cache;
+// synthesis translate_off
+	dummy_d_24 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_25;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_prot <= 3'd0;
+	ps7_axiwrshim1_m_axi_o_aw_prot <= ps7_axiwrshim1_m_axi_i_aw_prot;
+	ps7_axiwrshim1_m_axi_o_aw_prot <= ps7_axiwrshim1_m_axi_i_aw_prot;
+// synthesis translate_off
+	dummy_d_25 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_26;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_qos <= 4'd0;
+	ps7_axiwrshim1_m_axi_o_aw_qos <= ps7_axiwrshim1_m_axi_i_aw_qos;
+	ps7_axiwrshim1_m_axi_o_aw_qos <= ps7_axiwrshim1_m_axi_i_aw_qos;
+// synthesis translate_off
+	dummy_d_26 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_27;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_valid <= 1'd0;
+	ps7_axiwrshim1_m_axi_o_aw_valid <= (ps7_axiwrshim1_m_axi_i_aw_valid & ps7_axiwrshim1_awcmd_en);
+	ps7_axiwrshim1_m_axi_o_aw_valid <= ps7_axiwrshim1_m_axi_i_aw_valid;
+// synthesis translate_off
+	dummy_d_27 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_28;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_i_aw_ready <= 1'd0;
+	ps7_axiwrshim1_m_axi_i_aw_ready <= (ps7_axiwrshim1_m_axi_o_aw_ready & ps7_axiwrshim1_awcmd_en);
+	ps7_axiwrshim1_m_axi_i_aw_ready <= ps7_axiwrshim1_m_axi_o_aw_ready;
+// synthesis translate_off
+	dummy_d_28 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_29;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_w_id <= 6'd0;
+	ps7_axiwrshim1_m_axi_o_w_id <= ps7_axiwrshim1_m_axi_i_w_id;
+	ps7_axiwrshim1_m_axi_o_w_id <= ps7_axiwrshim1_m_axi_i_w_id;
+// synthesis translate_off
+	dummy_d_29 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_30;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_w_data <= 32'd0;
+	ps7_axiwrshim1_m_axi_o_w_data <= ps7_axiwrshim1_m_axi_i_w_data;
+	ps7_axiwrshim1_m_axi_o_w_data <= ps7_axiwrshim1_m_axi_i_w_data;
+// synthesis translate_off
+	dummy_d_30 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_31;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_w_strb <= 4'd0;
+	ps7_axiwrshim1_m_axi_o_w_strb <= ps7_axiwrshim1_m_axi_i_w_strb;
+	ps7_axiwrshim1_m_axi_o_w_strb <= ps7_axiwrshim1_m_axi_i_w_strb;
+// synthesis translate_off
+	dummy_d_31 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_32;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_w_last <= 1'd0;
+	ps7_axiwrshim1_m_axi_o_w_last <= ps7_axiwrshim1_m_axi_i_w_last;
+	ps7_axiwrshim1_m_axi_o_w_last <= ps7_axiwrshim1_m_axi_i_w_last;
+// synthesis translate_off
+	dummy_d_32 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_33;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_w_valid <= 1'd0;
+	ps7_axiwrshim1_m_axi_o_w_valid <= (ps7_axiwrshim1_m_axi_i_w_valid & ps7_axiwrshim1_wdata_en);
+	ps7_axiwrshim1_m_axi_o_w_valid <= ps7_axiwrshim1_m_axi_i_w_valid;
+// synthesis translate_off
+	dummy_d_33 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_34;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_i_w_ready <= 1'd0;
+	ps7_axiwrshim1_m_axi_i_w_ready <= (ps7_axiwrshim1_m_axi_o_w_ready & ps7_axiwrshim1_wdata_en);
+	ps7_axiwrshim1_m_axi_i_w_ready <= ps7_axiwrshim1_m_axi_o_w_ready;
+// synthesis translate_off
+	dummy_d_34 <= dummy_s;
+// synthesis translate_on
+end
+assign ps7_axiwrshim1_m_axi_i_b_id = ps7_axiwrshim1_m_axi_o_b_id;
+assign ps7_axiwrshim1_m_axi_i_b_resp = ps7_axiwrshim1_m_axi_o_b_resp;
+assign ps7_axiwrshim1_m_axi_i_b_valid = ps7_axiwrshim1_m_axi_o_b_valid;
+assign ps7_axiwrshim1_m_axi_o_b_ready = ps7_axiwrshim1_m_axi_i_b_ready;
+assign ps7_axiwrshim1_m_axi_o_ar_id = ps7_axiwrshim1_m_axi_i_ar_id;
+assign ps7_axiwrshim1_m_axi_o_ar_addr = ps7_axiwrshim1_m_axi_i_ar_addr;
+assign ps7_axiwrshim1_m_axi_o_ar_len = ps7_axiwrshim1_m_axi_i_ar_len;
+assign ps7_axiwrshim1_m_axi_o_ar_size = ps7_axiwrshim1_m_axi_i_ar_size;
+assign ps7_axiwrshim1_m_axi_o_ar_burst = ps7_axiwrshim1_m_axi_i_ar_burst;
+assign ps7_axiwrshim1_m_axi_o_ar_lock = ps7_axiwrshim1_m_axi_i_ar_lock;
+assign ps7_axiwrshim1_m_axi_o_ar_cache = ps7_axiwrshim1_m_axi_i_ar_cache;
+assign ps7_axiwrshim1_m_axi_o_ar_prot = ps7_axiwrshim1_m_axi_i_ar_prot;
+assign ps7_axiwrshim1_m_axi_o_ar_qos = ps7_axiwrshim1_m_axi_i_ar_qos;
+assign ps7_axiwrshim1_m_axi_o_ar_valid = ps7_axiwrshim1_m_axi_i_ar_valid;
+assign ps7_axiwrshim1_m_axi_i_ar_ready = ps7_axiwrshim1_m_axi_o_ar_ready;
+assign ps7_axiwrshim1_m_axi_i_r_id = ps7_axiwrshim1_m_axi_o_r_id;
+assign ps7_axiwrshim1_m_axi_i_r_data = ps7_axiwrshim1_m_axi_o_r_data;
+assign ps7_axiwrshim1_m_axi_i_r_resp = ps7_axiwrshim1_m_axi_o_r_resp;
+assign ps7_axiwrshim1_m_axi_i_r_last = ps7_axiwrshim1_m_axi_o_r_last;
+assign ps7_axiwrshim1_m_axi_i_r_valid = ps7_axiwrshim1_m_axi_o_r_valid;
+assign ps7_axiwrshim1_m_axi_o_r_ready = ps7_axiwrshim1_m_axi_i_r_ready;
+
+// synthesis translate_off
+reg dummy_d_35;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_addr <= 32'd0;
+	ps7_axiwrshim1_m_axi_o_aw_addr <= ps7_axiwrshim1_m_axi_i_aw_addr;
+	ps7_axiwrshim1_m_axi_o_aw_addr <= {ps7_axiwrshim1_m_axi_i_aw_addr[31:2], ps7_axiwrshim1_addr_ofs};
+// synthesis translate_off
+	dummy_d_35 <= dummy_s;
+// synthesis translate_on
+end
+
+// synthesis translate_off
+reg dummy_d_36;
+// synthesis translate_on
+always @(*) begin
+	ps7_axiwrshim1_m_axi_o_aw_size <= 3'd0;
+	ps7_axiwrshim1_m_axi_o_aw_size <= ps7_axiwrshim1_m_axi_i_aw_size;
+	ps7_axiwrshim1_m_axi_o_aw_size <= ps7_axiwrshim1_awsize;
+// synthesis translate_off
+	dummy_d_36 <= dummy_s;
+// synthesis translate_on
+end
+assign ps7_shim_s_axi_gp1_aw_id = ps7_bus_s_axi_gp1_aw_id;
+assign ps7_shim_s_axi_gp1_aw_addr = ps7_bus_s_axi_gp1_aw_addr;
+assign ps7_shim_s_axi_gp1_aw_len = ps7_bus_s_axi_gp1_aw_len;
+assign ps7_shim_s_axi_gp1_aw_size = ps7_bus_s_axi_gp1_aw_size;
+assign ps7_shim_s_axi_gp1_aw_burst = ps7_bus_s_axi_gp1_aw_burst;
+assign ps7_shim_s_axi_gp1_aw_lock = ps7_bus_s_axi_gp1_aw_lock;
+assign ps7_shim_s_axi_gp1_aw_cache = ps7_bus_s_axi_gp1_aw_cache;
+assign ps7_shim_s_axi_gp1_aw_prot = ps7_bus_s_axi_gp1_aw_prot;
+assign ps7_shim_s_axi_gp1_aw_qos = ps7_bus_s_axi_gp1_aw_qos;
+assign ps7_shim_s_axi_gp1_aw_valid = ps7_bus_s_axi_gp1_aw_valid;
+assign ps7_bus_s_axi_gp1_aw_ready = ps7_shim_s_axi_gp1_aw_ready;
+assign ps7_shim_s_axi_gp1_w_id = ps7_bus_s_axi_gp1_w_id;
+assign ps7_shim_s_axi_gp1_w_data = ps7_bus_s_axi_gp1_w_data;
+assign ps7_shim_s_axi_gp1_w_strb = ps7_bus_s_axi_gp1_w_strb;
+assign ps7_shim_s_axi_gp1_w_last = ps7_bus_s_axi_gp1_w_last;
+assign ps7_shim_s_axi_gp1_w_valid = ps7_bus_s_axi_gp1_w_valid;
+assign ps7_bus_s_axi_gp1_w_ready = ps7_shim_s_axi_gp1_w_ready;
+assign ps7_bus_s_axi_gp1_b_id = ps7_shim_s_axi_gp1_b_id;
+assign ps7_bus_s_axi_gp1_b_resp = ps7_shim_s_axi_gp1_b_resp;
+assign ps7_bus_s_axi_gp1_b_valid = ps7_shim_s_axi_gp1_b_valid;
+assign ps7_shim_s_axi_gp1_b_ready = ps7_bus_s_axi_gp1_b_ready;
+assign ps7_shim_s_axi_gp1_ar_id = ps7_bus_s_axi_gp1_ar_id;
+assign ps7_shim_s_axi_gp1_ar_addr = ps7_bus_s_axi_gp1_ar_addr;
+assign ps7_shim_s_axi_gp1_ar_len = ps7_bus_s_axi_gp1_ar_len;
+assign ps7_shim_s_axi_gp1_ar_size = ps7_bus_s_axi_gp1_ar_size;
+assign ps7_shim_s_axi_gp1_ar_burst = ps7_bus_s_axi_gp1_ar_burst;
+assign ps7_shim_s_axi_gp1_ar_lock = ps7_bus_s_axi_gp1_ar_lock;
+assign ps7_shim_s_axi_gp1_ar_cache = ps7_bus_s_axi_gp1_ar_cache;
+assign ps7_shim_s_axi_gp1_ar_prot = ps7_bus_s_axi_gp1_ar_prot;
+assign ps7_shim_s_axi_gp1_ar_qos = ps7_bus_s_axi_gp1_ar_qos;
+assign ps7_shim_s_axi_gp1_ar_valid = ps7_bus_s_axi_gp1_ar_valid;
+assign ps7_bus_s_axi_gp1_ar_ready = ps7_shim_s_axi_gp1_ar_ready;
+assign ps7_bus_s_axi_gp1_r_id = ps7_shim_s_axi_gp1_r_id;
+assign ps7_bus_s_axi_gp1_r_data = ps7_shim_s_axi_gp1_r_data;
+assign ps7_bus_s_axi_gp1_r_resp = ps7_shim_s_axi_gp1_r_resp;
+assign ps7_bus_s_axi_gp1_r_last = ps7_shim_s_axi_gp1_r_last;
+assign ps7_bus_s_axi_gp1_r_valid = ps7_shim_s_axi_gp1_r_valid;
+assign ps7_shim_s_axi_gp1_r_ready = ps7_bus_s_axi_gp1_r_ready;
+assign r_id = id_;
+assign b_id = id_;
+assign r_resp = 1'd0;
+assign b_resp = 1'd0;
+assign r_last = 1'd1;
+
+// synthesis translate_off
+reg dummy_d_37;
+// synthesis translate_on
+always @(*) begin
+	aw_ready <= 1'd0;
+	w_ready <= 1'd0;
+	b_valid <= 1'd0;
+	ar_ready <= 1'd0;
+	r_valid <= 1'd0;
+	next_state <= 3'd0;
+	adr_t_next_value0 <= 14'd0;
+	adr_t_next_value_ce0 <= 1'd0;
+	id__t_next_value1 <= 12'd0;
+	id__t_next_value_ce1 <= 1'd0;
+	pending_f_next_value <= 1'd0;
+	pending_f_next_value_ce <= 1'd0;
+	we_t_next_value2 <= 1'd0;
+	we_t_next_value_ce2 <= 1'd0;
+	next_state <= state;
+	case (state)
+		1'd1: begin
+			if (w_valid) begin
+				w_ready <= 1'd1;
+				we_t_next_value2 <= 1'd1;
+				we_t_next_value_ce2 <= 1'd1;
+				next_state <= 2'd2;
+			end
+		end
+		2'd2: begin
+			b_valid <= 1'd1;
+			if (b_ready) begin
+				next_state <= 1'd0;
+			end
+		end
+		2'd3: begin
+			if ((~pending)) begin
+				next_state <= 3'd4;
+			end
+		end
+		3'd4: begin
+			r_valid <= 1'd1;
+			if (r_ready) begin
+				next_state <= 1'd0;
+			end
+		end
+		default: begin
+			aw_ready <= 1'd1;
+			ar_ready <= 1'd1;
+			if (aw_valid) begin
+				ar_ready <= 1'd0;
+				adr_t_next_value0 <= aw_addr[31:2];
+				adr_t_next_value_ce0 <= 1'd1;
+				id__t_next_value1 <= aw_id;
+				id__t_next_value_ce1 <= 1'd1;
+				next_state <= 1'd1;
+			end else begin
+				if (ar_valid) begin
+					adr_t_next_value0 <= ar_addr[31:2];
+					adr_t_next_value_ce0 <= 1'd1;
+					id__t_next_value1 <= ar_id;
+					id__t_next_value_ce1 <= 1'd1;
+					pending_f_next_value <= 1'd1;
+					pending_f_next_value_ce <= 1'd1;
+					next_state <= 2'd3;
+				end
+			end
+		end
+	endcase
+// synthesis translate_off
+	dummy_d_37 <= dummy_s;
+// synthesis translate_on
+end
+assign bus_adr = adr;
+assign bus_we = we;
+assign bus_dat_w = dat_w;
+assign dat_r = bus_dat_r;
+assign aw_id = ps7_bus_m_axi_gp1_aw_id;
+assign aw_addr = ps7_bus_m_axi_gp1_aw_addr;
+assign aw_len = ps7_bus_m_axi_gp1_aw_len;
+assign aw_size = ps7_bus_m_axi_gp1_aw_size;
+assign aw_burst = ps7_bus_m_axi_gp1_aw_burst;
+assign aw_lock = ps7_bus_m_axi_gp1_aw_lock;
+assign aw_cache = ps7_bus_m_axi_gp1_aw_cache;
+assign aw_prot = ps7_bus_m_axi_gp1_aw_prot;
+assign aw_qos = ps7_bus_m_axi_gp1_aw_qos;
+assign aw_valid = ps7_bus_m_axi_gp1_aw_valid;
+assign ps7_bus_m_axi_gp1_aw_ready = aw_ready;
+assign w_id = ps7_bus_m_axi_gp1_w_id;
+assign w_data = ps7_bus_m_axi_gp1_w_data;
+assign w_strb = ps7_bus_m_axi_gp1_w_strb;
+assign w_last = ps7_bus_m_axi_gp1_w_last;
+assign w_valid = ps7_bus_m_axi_gp1_w_valid;
+assign ps7_bus_m_axi_gp1_w_ready = w_ready;
+assign ps7_bus_m_axi_gp1_b_id = b_id;
+assign ps7_bus_m_axi_gp1_b_resp = b_resp;
+assign ps7_bus_m_axi_gp1_b_valid = b_valid;
+assign b_ready = ps7_bus_m_axi_gp1_b_ready;
+assign ar_id = ps7_bus_m_axi_gp1_ar_id;
+assign ar_addr = ps7_bus_m_axi_gp1_ar_addr;
+assign ar_len = ps7_bus_m_axi_gp1_ar_len;
+assign ar_size = ps7_bus_m_axi_gp1_ar_size;
+assign ar_burst = ps7_bus_m_axi_gp1_ar_burst;
+assign ar_lock = ps7_bus_m_axi_gp1_ar_lock;
+assign ar_cache = ps7_bus_m_axi_gp1_ar_cache;
+assign ar_prot = ps7_bus_m_axi_gp1_ar_prot;
+assign ar_qos = ps7_bus_m_axi_gp1_ar_qos;
+assign ar_valid = ps7_bus_m_axi_gp1_ar_valid;
+assign ps7_bus_m_axi_gp1_ar_ready = ar_ready;
+assign ps7_bus_m_axi_gp1_r_id = r_id;
+assign ps7_bus_m_axi_gp1_r_data = r_data;
+assign ps7_bus_m_axi_gp1_r_resp = r_resp;
+assign ps7_bus_m_axi_gp1_r_last = r_last;
+assign ps7_bus_m_axi_gp1_r_valid = r_valid;
+assign r_ready = ps7_bus_m_axi_gp1_r_ready;
+assign async_reset = (~ps7_fclk_reset_n[0]);
+
+always @(posedge sys_clk) begin
+	if (ps7_axiwrshim0_wlast_consumed) begin
+		ps7_axiwrshim0_wlast_detect <= 1'd1;
+	end else begin
+		if ((ps7_axiwrshim0_m_axi_i_w_valid & ps7_axiwrshim0_m_axi_o_w_ready)) begin
+			ps7_axiwrshim0_wlast_detect <= 1'd0;
+		end
+	end
+	if (((ps7_axiwrshim0_m_axi_i_aw_valid & ps7_axiwrshim0_m_axi_o_aw_ready) & (~ps7_axiwrshim0_m_axi_o_w_ready))) begin
+		ps7_axiwrshim0_stall_awvalid <= 1'd1;
+	end else begin
+		if (ps7_axiwrshim0_m_axi_o_w_ready) begin
+			ps7_axiwrshim0_stall_awvalid <= 1'd0;
+		end
+	end
+	if ((ps7_axiwrshim0_first_beat_detect & (~ps7_axiwrshim0_m_axi_o_aw_ready))) begin
+		ps7_axiwrshim0_store_first_beat <= 1'd1;
+	end else begin
+		if (ps7_axiwrshim0_m_axi_o_aw_ready) begin
+			ps7_axiwrshim0_store_first_beat <= 1'd0;
+		end
+	end
+	if ((ps7_axiwrshim0_start_wr & (~ps7_axiwrshim0_wlast_consumed))) begin
+		ps7_axiwrshim0_burst_still_active <= 1'd1;
+	end else begin
+		if (ps7_axiwrshim0_wlast_consumed) begin
+			ps7_axiwrshim0_burst_still_active <= 1'd0;
+		end
+	end
+	if ((ps7_axiwrshim0_m_axi_i_aw_valid & ps7_axiwrshim0_m_axi_o_aw_ready)) begin
+		ps7_axiwrshim0_previous_cmd_done <= 1'd1;
+	end else begin
+		if (ps7_axiwrshim0_m_axi_i_aw_valid) begin
+			ps7_axiwrshim0_previous_cmd_done <= 1'd0;
+		end
+	end
+	if (ps7_axiwrshim1_wlast_consumed) begin
+		ps7_axiwrshim1_wlast_detect <= 1'd1;
+	end else begin
+		if ((ps7_axiwrshim1_m_axi_i_w_valid & ps7_axiwrshim1_m_axi_o_w_ready)) begin
+			ps7_axiwrshim1_wlast_detect <= 1'd0;
+		end
+	end
+	if (((ps7_axiwrshim1_m_axi_i_aw_valid & ps7_axiwrshim1_m_axi_o_aw_ready) & (~ps7_axiwrshim1_m_axi_o_w_ready))) begin
+		ps7_axiwrshim1_stall_awvalid <= 1'd1;
+	end else begin
+		if (ps7_axiwrshim1_m_axi_o_w_ready) begin
+			ps7_axiwrshim1_stall_awvalid <= 1'd0;
+		end
+	end
+	if ((ps7_axiwrshim1_first_beat_detect & (~ps7_axiwrshim1_m_axi_o_aw_ready))) begin
+		ps7_axiwrshim1_store_first_beat <= 1'd1;
+	end else begin
+		if (ps7_axiwrshim1_m_axi_o_aw_ready) begin
+			ps7_axiwrshim1_store_first_beat <= 1'd0;
+		end
+	end
+	if ((ps7_axiwrshim1_start_wr & (~ps7_axiwrshim1_wlast_consumed))) begin
+		ps7_axiwrshim1_burst_still_active <= 1'd1;
+	end else begin
+		if (ps7_axiwrshim1_wlast_consumed) begin
+			ps7_axiwrshim1_burst_still_active <= 1'd0;
+		end
+	end
+	if ((ps7_axiwrshim1_m_axi_i_aw_valid & ps7_axiwrshim1_m_axi_o_aw_ready)) begin
+		ps7_axiwrshim1_previous_cmd_done <= 1'd1;
+	end else begin
+		if (ps7_axiwrshim1_m_axi_i_aw_valid) begin
+			ps7_axiwrshim1_previous_cmd_done <= 1'd0;
+		end
+	end
+	pending <= 1'd0;
+	r_data <= dat_r;
+	we <= 1'd0;
+	dat_w <= w_data;
+	state <= next_state;
+	if (adr_t_next_value_ce0) begin
+		adr <= adr_t_next_value0;
+	end
+	if (id__t_next_value_ce1) begin
+		id_ <= id__t_next_value1;
+	end
+	if (pending_f_next_value_ce) begin
+		pending <= pending_f_next_value;
+	end
+	if (we_t_next_value_ce2) begin
+		we <= we_t_next_value2;
+	end
+	bus_dat_r <= 1'd0;
+	if ((bus_adr[13:9] == 1'd0)) begin
+	end
+	if (sys_rst) begin
+		ps7_axiwrshim0_wlast_detect <= 1'd1;
+		ps7_axiwrshim0_stall_awvalid <= 1'd0;
+		ps7_axiwrshim0_store_first_beat <= 1'd0;
+		ps7_axiwrshim0_previous_cmd_done <= 1'd1;
+		ps7_axiwrshim0_burst_still_active <= 1'd0;
+		ps7_axiwrshim1_wlast_detect <= 1'd1;
+		ps7_axiwrshim1_stall_awvalid <= 1'd0;
+		ps7_axiwrshim1_store_first_beat <= 1'd0;
+		ps7_axiwrshim1_previous_cmd_done <= 1'd1;
+		ps7_axiwrshim1_burst_still_active <= 1'd0;
+		adr <= 14'd0;
+		we <= 1'd0;
+		dat_w <= 8'd0;
+		r_data <= 32'd0;
+		state <= 3'd0;
+		bus_dat_r <= 8'd0;
+	end
+end
+
+BIBUF BIBUF(
+	.IO(ps7_self[0]),
+	.PAD(ps7_ports[0])
+);
+
+BIBUF BIBUF_1(
+	.IO(ps7_self[1]),
+	.PAD(ps7_ports[1])
+);
+
+BIBUF BIBUF_2(
+	.IO(ps7_self[2]),
+	.PAD(ps7_ports[2])
+);
+
+BIBUF BIBUF_3(
+	.IO(ps7_self[3]),
+	.PAD(ps7_ports[3])
+);
+
+BIBUF BIBUF_4(
+	.IO(ps7_self[4]),
+	.PAD(ps7_ports[4])
+);
+
+BIBUF BIBUF_5(
+	.IO(ps7_self[5]),
+	.PAD(ps7_ports[5])
+);
+
+BIBUF BIBUF_6(
+	.IO(ps7_self[6]),
+	.PAD(ps7_ports[6])
+);
+
+BIBUF BIBUF_7(
+	.IO(ps7_self[7]),
+	.PAD(ps7_ports[7])
+);
+
+BIBUF BIBUF_8(
+	.IO(ps7_self[8]),
+	.PAD(ps7_ports[8])
+);
+
+BIBUF BIBUF_9(
+	.IO(ps7_self[9]),
+	.PAD(ps7_ports[9])
+);
+
+BIBUF BIBUF_10(
+	.IO(ps7_self[10]),
+	.PAD(ps7_ports[10])
+);
+
+BIBUF BIBUF_11(
+	.IO(ps7_self[11]),
+	.PAD(ps7_ports[11])
+);
+
+BIBUF BIBUF_12(
+	.IO(ps7_self[12]),
+	.PAD(ps7_ports[12])
+);
+
+BIBUF BIBUF_13(
+	.IO(ps7_self[13]),
+	.PAD(ps7_ports[13])
+);
+
+BIBUF BIBUF_14(
+	.IO(ps7_self[14]),
+	.PAD(ps7_ports[14])
+);
+
+BIBUF BIBUF_15(
+	.IO(ps7_self[15]),
+	.PAD(ps7_ports[15])
+);
+
+BIBUF BIBUF_16(
+	.IO(ps7_self[16]),
+	.PAD(ps7_ports[16])
+);
+
+BIBUF BIBUF_17(
+	.IO(ps7_self[17]),
+	.PAD(ps7_ports[17])
+);
+
+BIBUF BIBUF_18(
+	.IO(ps7_self[18]),
+	.PAD(ps7_ports[18])
+);
+
+BIBUF BIBUF_19(
+	.IO(ps7_self[19]),
+	.PAD(ps7_ports[19])
+);
+
+BIBUF BIBUF_20(
+	.IO(ps7_self[20]),
+	.PAD(ps7_ports[20])
+);
+
+BIBUF BIBUF_21(
+	.IO(ps7_self[21]),
+	.PAD(ps7_ports[21])
+);
+
+BIBUF BIBUF_22(
+	.IO(ps7_self[22]),
+	.PAD(ps7_ports[22])
+);
+
+BIBUF BIBUF_23(
+	.IO(ps7_self[23]),
+	.PAD(ps7_ports[23])
+);
+
+BIBUF BIBUF_24(
+	.IO(ps7_self[24]),
+	.PAD(ps7_ports[24])
+);
+
+BIBUF BIBUF_25(
+	.IO(ps7_self[25]),
+	.PAD(ps7_ports[25])
+);
+
+BIBUF BIBUF_26(
+	.IO(ps7_self[26]),
+	.PAD(ps7_ports[26])
+);
+
+BIBUF BIBUF_27(
+	.IO(ps7_self[27]),
+	.PAD(ps7_ports[27])
+);
+
+BIBUF BIBUF_28(
+	.IO(ps7_self[28]),
+	.PAD(ps7_ports[28])
+);
+
+BIBUF BIBUF_29(
+	.IO(ps7_self[29]),
+	.PAD(ps7_ports[29])
+);
+
+BIBUF BIBUF_30(
+	.IO(ps7_self[30]),
+	.PAD(ps7_ports[30])
+);
+
+BIBUF BIBUF_31(
+	.IO(ps7_self[31]),
+	.PAD(ps7_ports[31])
+);
+
+BIBUF BIBUF_32(
+	.IO(ps7_self[32]),
+	.PAD(ps7_ports[32])
+);
+
+BIBUF BIBUF_33(
+	.IO(ps7_self[33]),
+	.PAD(ps7_ports[33])
+);
+
+BIBUF BIBUF_34(
+	.IO(ps7_self[34]),
+	.PAD(ps7_ports[34])
+);
+
+BIBUF BIBUF_35(
+	.IO(ps7_self[35]),
+	.PAD(ps7_ports[35])
+);
+
+BIBUF BIBUF_36(
+	.IO(ps7_self[36]),
+	.PAD(ps7_ports[36])
+);
+
+BIBUF BIBUF_37(
+	.IO(ps7_self[37]),
+	.PAD(ps7_ports[37])
+);
+
+BIBUF BIBUF_38(
+	.IO(ps7_self[38]),
+	.PAD(ps7_ports[38])
+);
+
+BIBUF BIBUF_39(
+	.IO(ps7_self[39]),
+	.PAD(ps7_ports[39])
+);
+
+BIBUF BIBUF_40(
+	.IO(ps7_self[40]),
+	.PAD(ps7_ports[40])
+);
+
+BIBUF BIBUF_41(
+	.IO(ps7_self[41]),
+	.PAD(ps7_ports[41])
+);
+
+BIBUF BIBUF_42(
+	.IO(ps7_self[42]),
+	.PAD(ps7_ports[42])
+);
+
+BIBUF BIBUF_43(
+	.IO(ps7_self[43]),
+	.PAD(ps7_ports[43])
+);
+
+BIBUF BIBUF_44(
+	.IO(ps7_self[44]),
+	.PAD(ps7_ports[44])
+);
+
+BIBUF BIBUF_45(
+	.IO(ps7_self[45]),
+	.PAD(ps7_ports[45])
+);
+
+BIBUF BIBUF_46(
+	.IO(ps7_self[46]),
+	.PAD(ps7_ports[46])
+);
+
+BIBUF BIBUF_47(
+	.IO(ps7_self[47]),
+	.PAD(ps7_ports[47])
+);
+
+BIBUF BIBUF_48(
+	.IO(ps7_self[48]),
+	.PAD(ps7_ports[48])
+);
+
+BIBUF BIBUF_49(
+	.IO(ps7_self[49]),
+	.PAD(ps7_ports[49])
+);
+
+BIBUF BIBUF_50(
+	.IO(ps7_self[50]),
+	.PAD(ps7_ports[50])
+);
+
+BIBUF BIBUF_51(
+	.IO(ps7_self[51]),
+	.PAD(ps7_ports[51])
+);
+
+BIBUF BIBUF_52(
+	.IO(ps7_self[52]),
+	.PAD(ps7_ports[52])
+);
+
+BIBUF BIBUF_53(
+	.IO(ps7_self[53]),
+	.PAD(ps7_ports[53])
+);
+
+BIBUF BIBUF_54(
+	.IO(ps7_self[54]),
+	.PAD(ps7_ports[54])
+);
+
+BIBUF BIBUF_55(
+	.IO(ps7_self[55]),
+	.PAD(ps7_ports[55])
+);
+
+BIBUF BIBUF_56(
+	.IO(ps7_self[56]),
+	.PAD(ps7_ports[56])
+);
+
+BIBUF BIBUF_57(
+	.IO(ps7_self[57]),
+	.PAD(ps7_ports[57])
+);
+
+BIBUF BIBUF_58(
+	.IO(ps7_self[58]),
+	.PAD(ps7_ports[58])
+);
+
+BIBUF BIBUF_59(
+	.IO(ps7_self[59]),
+	.PAD(ps7_ports[59])
+);
+
+BIBUF BIBUF_60(
+	.IO(ps7_self[60]),
+	.PAD(ps7_ports[60])
+);
+
+BIBUF BIBUF_61(
+	.IO(ps7_self[61]),
+	.PAD(ps7_ports[61])
+);
+
+BIBUF BIBUF_62(
+	.IO(ps7_self[62]),
+	.PAD(ps7_ports[62])
+);
+
+BIBUF BIBUF_63(
+	.IO(ps7_self[63]),
+	.PAD(ps7_ports[63])
+);
+
+BIBUF BIBUF_64(
+	.IO(ps7_self[64]),
+	.PAD(ps7_ports[64])
+);
+
+BIBUF BIBUF_65(
+	.IO(ps7_self[65]),
+	.PAD(ps7_ports[65])
+);
+
+BIBUF BIBUF_66(
+	.IO(ps7_self[66]),
+	.PAD(ps7_ports[66])
+);
+
+BIBUF BIBUF_67(
+	.IO(ps7_self[67]),
+	.PAD(ps7_ports[67])
+);
+
+BIBUF BIBUF_68(
+	.IO(ps7_self[68]),
+	.PAD(ps7_ports[68])
+);
+
+BIBUF BIBUF_69(
+	.IO(ps7_self[69]),
+	.PAD(ps7_ports[69])
+);
+
+BIBUF BIBUF_70(
+	.IO(ps7_self[70]),
+	.PAD(ps7_ports[70])
+);
+
+BIBUF BIBUF_71(
+	.IO(ps7_self[71]),
+	.PAD(ps7_ports[71])
+);
+
+BIBUF BIBUF_72(
+	.IO(ps7_self[72]),
+	.PAD(ps7_ports[72])
+);
+
+BIBUF BIBUF_73(
+	.IO(ps7_ps_clk),
+	.PAD(ps_clk)
+);
+
+BIBUF BIBUF_74(
+	.IO(ps7_ps_por_b),
+	.PAD(ps_por_b)
+);
+
+BIBUF BIBUF_75(
+	.IO(ps7_ps_srst_b),
+	.PAD(ps_srst_b)
+);
+
+BIBUF BIBUF_76(
+	.IO(ps7_pads[0]),
+	.PAD(ps7_mio[0])
+);
+
+BIBUF BIBUF_77(
+	.IO(ps7_pads[1]),
+	.PAD(ps7_mio[1])
+);
+
+BIBUF BIBUF_78(
+	.IO(ps7_pads[2]),
+	.PAD(ps7_mio[2])
+);
+
+BIBUF BIBUF_79(
+	.IO(ps7_pads[3]),
+	.PAD(ps7_mio[3])
+);
+
+BIBUF BIBUF_80(
+	.IO(ps7_pads[4]),
+	.PAD(ps7_mio[4])
+);
+
+BIBUF BIBUF_81(
+	.IO(ps7_pads[5]),
+	.PAD(ps7_mio[5])
+);
+
+BIBUF BIBUF_82(
+	.IO(ps7_pads[6]),
+	.PAD(ps7_mio[6])
+);
+
+BIBUF BIBUF_83(
+	.IO(ps7_pads[7]),
+	.PAD(ps7_mio[7])
+);
+
+BIBUF BIBUF_84(
+	.IO(ps7_pads[8]),
+	.PAD(ps7_mio[8])
+);
+
+BIBUF BIBUF_85(
+	.IO(ps7_pads[9]),
+	.PAD(ps7_mio[9])
+);
+
+BIBUF BIBUF_86(
+	.IO(ps7_pads[10]),
+	.PAD(ps7_mio[10])
+);
+
+BIBUF BIBUF_87(
+	.IO(ps7_pads[11]),
+	.PAD(ps7_mio[11])
+);
+
+BIBUF BIBUF_88(
+	.IO(ps7_pads[12]),
+	.PAD(ps7_mio[12])
+);
+
+BIBUF BIBUF_89(
+	.IO(ps7_pads[13]),
+	.PAD(ps7_mio[13])
+);
+
+BIBUF BIBUF_90(
+	.IO(ps7_pads[14]),
+	.PAD(ps7_mio[14])
+);
+
+BIBUF BIBUF_91(
+	.IO(ps7_pads[15]),
+	.PAD(ps7_mio[15])
+);
+
+BIBUF BIBUF_92(
+	.IO(ps7_pads[16]),
+	.PAD(ps7_mio[16])
+);
+
+BIBUF BIBUF_93(
+	.IO(ps7_pads[17]),
+	.PAD(ps7_mio[17])
+);
+
+BIBUF BIBUF_94(
+	.IO(ps7_pads[18]),
+	.PAD(ps7_mio[18])
+);
+
+BIBUF BIBUF_95(
+	.IO(ps7_pads[19]),
+	.PAD(ps7_mio[19])
+);
+
+BIBUF BIBUF_96(
+	.IO(ps7_pads[20]),
+	.PAD(ps7_mio[20])
+);
+
+BIBUF BIBUF_97(
+	.IO(ps7_pads[21]),
+	.PAD(ps7_mio[21])
+);
+
+BIBUF BIBUF_98(
+	.IO(ps7_pads[22]),
+	.PAD(ps7_mio[22])
+);
+
+BIBUF BIBUF_99(
+	.IO(ps7_pads[23]),
+	.PAD(ps7_mio[23])
+);
+
+BIBUF BIBUF_100(
+	.IO(ps7_pads[24]),
+	.PAD(ps7_mio[24])
+);
+
+BIBUF BIBUF_101(
+	.IO(ps7_pads[25]),
+	.PAD(ps7_mio[25])
+);
+
+BIBUF BIBUF_102(
+	.IO(ps7_pads[26]),
+	.PAD(ps7_mio[26])
+);
+
+BIBUF BIBUF_103(
+	.IO(ps7_pads[27]),
+	.PAD(ps7_mio[27])
+);
+
+BIBUF BIBUF_104(
+	.IO(ps7_pads[28]),
+	.PAD(ps7_mio[28])
+);
+
+BIBUF BIBUF_105(
+	.IO(ps7_pads[29]),
+	.PAD(ps7_mio[29])
+);
+
+BIBUF BIBUF_106(
+	.IO(ps7_pads[30]),
+	.PAD(ps7_mio[30])
+);
+
+BIBUF BIBUF_107(
+	.IO(ps7_pads[31]),
+	.PAD(ps7_mio[31])
+);
+
+BIBUF BIBUF_108(
+	.IO(ps7_pads[32]),
+	.PAD(ps7_mio[32])
+);
+
+BIBUF BIBUF_109(
+	.IO(ps7_pads[33]),
+	.PAD(ps7_mio[33])
+);
+
+BIBUF BIBUF_110(
+	.IO(ps7_pads[34]),
+	.PAD(ps7_mio[34])
+);
+
+BIBUF BIBUF_111(
+	.IO(ps7_pads[35]),
+	.PAD(ps7_mio[35])
+);
+
+BIBUF BIBUF_112(
+	.IO(ps7_pads[36]),
+	.PAD(ps7_mio[36])
+);
+
+BIBUF BIBUF_113(
+	.IO(ps7_pads[37]),
+	.PAD(ps7_mio[37])
+);
+
+BIBUF BIBUF_114(
+	.IO(ps7_pads[38]),
+	.PAD(ps7_mio[38])
+);
+
+BIBUF BIBUF_115(
+	.IO(ps7_pads[39]),
+	.PAD(ps7_mio[39])
+);
+
+BIBUF BIBUF_116(
+	.IO(ps7_pads[40]),
+	.PAD(ps7_mio[40])
+);
+
+BIBUF BIBUF_117(
+	.IO(ps7_pads[41]),
+	.PAD(ps7_mio[41])
+);
+
+BIBUF BIBUF_118(
+	.IO(ps7_pads[42]),
+	.PAD(ps7_mio[42])
+);
+
+BIBUF BIBUF_119(
+	.IO(ps7_pads[43]),
+	.PAD(ps7_mio[43])
+);
+
+BIBUF BIBUF_120(
+	.IO(ps7_pads[44]),
+	.PAD(ps7_mio[44])
+);
+
+BIBUF BIBUF_121(
+	.IO(ps7_pads[45]),
+	.PAD(ps7_mio[45])
+);
+
+BIBUF BIBUF_122(
+	.IO(ps7_pads[46]),
+	.PAD(ps7_mio[46])
+);
+
+BIBUF BIBUF_123(
+	.IO(ps7_pads[47]),
+	.PAD(ps7_mio[47])
+);
+
+BIBUF BIBUF_124(
+	.IO(ps7_pads[48]),
+	.PAD(ps7_mio[48])
+);
+
+BIBUF BIBUF_125(
+	.IO(ps7_pads[49]),
+	.PAD(ps7_mio[49])
+);
+
+BIBUF BIBUF_126(
+	.IO(ps7_pads[50]),
+	.PAD(ps7_mio[50])
+);
+
+BIBUF BIBUF_127(
+	.IO(ps7_pads[51]),
+	.PAD(ps7_mio[51])
+);
+
+BIBUF BIBUF_128(
+	.IO(ps7_pads[52]),
+	.PAD(ps7_mio[52])
+);
+
+BIBUF BIBUF_129(
+	.IO(ps7_pads[53]),
+	.PAD(ps7_mio[53])
+);
+
+BUFG BUFG(
+	.I(ps7_fclk_clk[0]),
+	.O(sys_clk)
+);
+
+PS7 PS7(
+	.DDRARB(ps7_ddr_arb),
+	.DMA0ACLK(ps7_dma0_aclk),
+	.DMA0DAREADY(ps7_bus_dma0_da_ready),
+	.DMA0DRLAST(ps7_bus_dma0_dr_last),
+	.DMA0DRTYPE(ps7_bus_dma0_dr_type),
+	.DMA0DRVALID(ps7_bus_dma0_dr_valid),
+	.DMA1ACLK(ps7_dma1_aclk),
+	.DMA1DAREADY(ps7_bus_dma1_da_ready),
+	.DMA1DRLAST(ps7_bus_dma1_dr_last),
+	.DMA1DRTYPE(ps7_bus_dma1_dr_type),
+	.DMA1DRVALID(ps7_bus_dma1_dr_valid),
+	.DMA2ACLK(ps7_dma2_aclk),
+	.DMA2DAREADY(ps7_bus_dma2_da_ready),
+	.DMA2DRLAST(ps7_bus_dma2_dr_last),
+	.DMA2DRTYPE(ps7_bus_dma2_dr_type),
+	.DMA2DRVALID(ps7_bus_dma2_dr_valid),
+	.DMA3ACLK(ps7_dma3_aclk),
+	.DMA3DAREADY(ps7_bus_dma3_da_ready),
+	.DMA3DRLAST(ps7_bus_dma3_dr_last),
+	.DMA3DRTYPE(ps7_bus_dma3_dr_type),
+	.DMA3DRVALID(ps7_bus_dma3_dr_valid),
+	.EMIOCAN0PHYRX(ps7_can0_phy_rx),
+	.EMIOCAN1PHYRX(ps7_can1_phy_rx),
+	.EMIOENET0EXTINTIN(ps7_enet0_enet_ext_intin),
+	.EMIOENET0GMIICOL(ps7_enet0_enet_gmii_col),
+	.EMIOENET0GMIICRS(ps7_enet0_enet_gmii_crs),
+	.EMIOENET0GMIIRXCLK(ps7_enet0_enet_gmii_rx_clk),
+	.EMIOENET0GMIIRXD(ps7_enet0_enet_gmii_rxd),
+	.EMIOENET0GMIIRXDV(ps7_enet0_enet_gmii_rx_dv),
+	.EMIOENET0GMIIRXER(ps7_enet0_enet_gmii_rx_er),
+	.EMIOENET0GMIITXCLK(ps7_enet0_enet_gmii_tx_clk),
+	.EMIOENET0MDIOI(ps7_enet0_enet_mdio_i),
+	.EMIOENET1EXTINTIN(ps7_enet1_enet_ext_intin),
+	.EMIOENET1GMIICOL(ps7_enet1_enet_gmii_col),
+	.EMIOENET1GMIICRS(ps7_enet1_enet_gmii_crs),
+	.EMIOENET1GMIIRXCLK(ps7_enet1_enet_gmii_rx_clk),
+	.EMIOENET1GMIIRXD(ps7_enet1_enet_gmii_rxd),
+	.EMIOENET1GMIIRXDV(ps7_enet1_enet_gmii_rx_dv),
+	.EMIOENET1GMIIRXER(ps7_enet1_enet_gmii_rx_er),
+	.EMIOENET1GMIITXCLK(ps7_enet1_enet_gmii_tx_clk),
+	.EMIOENET1MDIOI(ps7_enet1_enet_mdio_i),
+	.EMIOGPIOI(ps7_gpio_i),
+	.EMIOI2C0SCLI(ps7_i2c0_scl_i),
+	.EMIOI2C0SDAI(ps7_i2c0_sda_i),
+	.EMIOI2C1SCLI(ps7_i2c1_scl_i),
+	.EMIOI2C1SDAI(ps7_i2c1_sda_i),
+	.EMIOPJTAGTCK(ps7_pjtag_tck),
+	.EMIOPJTAGTDI(ps7_pjtag_td_i),
+	.EMIOPJTAGTMS(ps7_pjtag_tms),
+	.EMIOSDIO0CDN(ps7_sdio0_cd_n),
+	.EMIOSDIO0CLKFB(ps7_sdio0_clk_fb),
+	.EMIOSDIO0CMDI(ps7_sdio0_cmd_i),
+	.EMIOSDIO0DATAI(ps7_sdio0_data_i),
+	.EMIOSDIO0WP(ps7_sdio0_wp),
+	.EMIOSDIO1CDN(ps7_sdio1_cd_n),
+	.EMIOSDIO1CLKFB(ps7_sdio1_clk_fb),
+	.EMIOSDIO1CMDI(ps7_sdio1_cmd_i),
+	.EMIOSDIO1DATAI(ps7_sdio1_data_i),
+	.EMIOSDIO1WP(ps7_sdio1_wp),
+	.EMIOSPI0MI(ps7_spi0_m_i),
+	.EMIOSPI0SCLKI(ps7_spi0_sclk_i),
+	.EMIOSPI0SI(ps7_spi0_s_i),
+	.EMIOSPI0SSIN(ps7_spi0_ss_i_n),
+	.EMIOSPI1MI(ps7_spi1_m_i),
+	.EMIOSPI1SCLKI(ps7_spi1_sclk_i),
+	.EMIOSPI1SI(ps7_spi1_s_i),
+	.EMIOSPI1SSIN(ps7_spi1_ss_i_n),
+	.EMIOSRAMINTIN(ps7_sram_intin),
+	.EMIOTRACECLK(ps7_trace_clk),
+	.EMIOTTC0CLKI(ps7_ttc0_clk_i),
+	.EMIOTTC1CLKI(ps7_ttc1_clk_i),
+	.EMIOUART0CTSN(ps7_uart0_cts_n),
+	.EMIOUART0DCDN(ps7_uart0_dcd_n),
+	.EMIOUART0DSRN(ps7_uart0_dsr_n),
+	.EMIOUART0RIN(ps7_uart0_ri_n),
+	.EMIOUART0RX(ps7_uart0_rx),
+	.EMIOUART1CTSN(ps7_uart1_cts_n),
+	.EMIOUART1DCDN(ps7_uart1_dcd_n),
+	.EMIOUART1DSRN(ps7_uart1_dsr_n),
+	.EMIOUART1RIN(ps7_uart1_ri_n),
+	.EMIOUART1RX(ps7_uart1_rx),
+	.EMIOUSB0VBUSPWRFAULT(ps7_usb0_vbus_pwrfault),
+	.EMIOUSB1VBUSPWRFAULT(ps7_usb1_vbus_pwrfault),
+	.EMIOWDTCLKI(ps7_wdt_clk_i),
+	.EVENTEVENTI(ps7_event_i),
+	.FCLKCLKTRIGN(ps7_fclk_clktrig_n),
+	.FPGAIDLEN(ps7_fpga_idle_n),
+	.FTMDTRACEINATID(ps7_ftmd_tracein_atid),
+	.FTMDTRACEINCLOCK(ps7_ftmd_tracein_clock),
+	.FTMDTRACEINDATA(ps7_ftmd_tracein_data),
+	.FTMDTRACEINVALID(ps7_ftmd_tracein_valid),
+	.FTMTF2PDEBUG(ps7_ftmt_f2p_debug),
+	.FTMTF2PTRIG(ps7_ftmt_f2p_trig),
+	.FTMTP2FTRIGACK(ps7_ftmt_p2f_trigack),
+	.IRQF2P(ps7_irq_f2p),
+	.MAXIGP0ARREADY(ps7_bus_m_axi_gp0_ar_ready),
+	.MAXIGP0AWREADY(ps7_bus_m_axi_gp0_aw_ready),
+	.MAXIGP0BID(ps7_bus_m_axi_gp0_b_id),
+	.MAXIGP0BRESP(ps7_bus_m_axi_gp0_b_resp),
+	.MAXIGP0BVALID(ps7_bus_m_axi_gp0_b_valid),
+	.MAXIGP0RDATA(ps7_bus_m_axi_gp0_r_data),
+	.MAXIGP0RID(ps7_bus_m_axi_gp0_r_id),
+	.MAXIGP0RLAST(ps7_bus_m_axi_gp0_r_last),
+	.MAXIGP0RRESP(ps7_bus_m_axi_gp0_r_resp),
+	.MAXIGP0RVALID(ps7_bus_m_axi_gp0_r_valid),
+	.MAXIGP0WREADY(ps7_bus_m_axi_gp0_w_ready),
+	.MAXIGP1ARREADY(ps7_bus_m_axi_gp1_ar_ready),
+	.MAXIGP1AWREADY(ps7_bus_m_axi_gp1_aw_ready),
+	.MAXIGP1BID(ps7_bus_m_axi_gp1_b_id),
+	.MAXIGP1BRESP(ps7_bus_m_axi_gp1_b_resp),
+	.MAXIGP1BVALID(ps7_bus_m_axi_gp1_b_valid),
+	.MAXIGP1RDATA(ps7_bus_m_axi_gp1_r_data),
+	.MAXIGP1RID(ps7_bus_m_axi_gp1_r_id),
+	.MAXIGP1RLAST(ps7_bus_m_axi_gp1_r_last),
+	.MAXIGP1RRESP(ps7_bus_m_axi_gp1_r_resp),
+	.MAXIGP1RVALID(ps7_bus_m_axi_gp1_r_valid),
+	.MAXIGP1WREADY(ps7_bus_m_axi_gp1_w_ready),
+	.SAXIACPARADDR(ps7_bus_s_axi_acp_ar_addr),
+	.SAXIACPARBURST(ps7_bus_s_axi_acp_ar_burst),
+	.SAXIACPARCACHE(ps7_bus_s_axi_acp_ar_cache),
+	.SAXIACPARID(ps7_bus_s_axi_acp_ar_id),
+	.SAXIACPARLEN(ps7_bus_s_axi_acp_ar_len),
+	.SAXIACPARLOCK(ps7_bus_s_axi_acp_ar_lock),
+	.SAXIACPARPROT(ps7_bus_s_axi_acp_ar_prot),
+	.SAXIACPARQOS(ps7_bus_s_axi_acp_ar_qos),
+	.SAXIACPARSIZE(ps7_bus_s_axi_acp_ar_size[1:0]),
+	.SAXIACPARUSER(ps7_s_axi_acp_aruser),
+	.SAXIACPARVALID(ps7_bus_s_axi_acp_ar_valid),
+	.SAXIACPAWADDR(ps7_bus_s_axi_acp_aw_addr),
+	.SAXIACPAWBURST(ps7_bus_s_axi_acp_aw_burst),
+	.SAXIACPAWCACHE(ps7_bus_s_axi_acp_aw_cache),
+	.SAXIACPAWID(ps7_bus_s_axi_acp_aw_id),
+	.SAXIACPAWLEN(ps7_bus_s_axi_acp_aw_len),
+	.SAXIACPAWLOCK(ps7_bus_s_axi_acp_aw_lock),
+	.SAXIACPAWPROT(ps7_bus_s_axi_acp_aw_prot),
+	.SAXIACPAWQOS(ps7_bus_s_axi_acp_aw_qos),
+	.SAXIACPAWSIZE(ps7_bus_s_axi_acp_aw_size[1:0]),
+	.SAXIACPAWUSER(ps7_s_axi_acp_awuser),
+	.SAXIACPAWVALID(ps7_bus_s_axi_acp_aw_valid),
+	.SAXIACPBREADY(ps7_bus_s_axi_acp_b_ready),
+	.SAXIACPRREADY(ps7_bus_s_axi_acp_r_ready),
+	.SAXIACPWDATA(ps7_bus_s_axi_acp_w_data),
+	.SAXIACPWID(ps7_bus_s_axi_acp_w_id),
+	.SAXIACPWLAST(ps7_bus_s_axi_acp_w_last),
+	.SAXIACPWSTRB(ps7_bus_s_axi_acp_w_strb),
+	.SAXIACPWVALID(ps7_bus_s_axi_acp_w_valid),
+	.SAXIGP0ARADDR(ps7_shim_s_axi_gp0_ar_addr),
+	.SAXIGP0ARBURST(ps7_shim_s_axi_gp0_ar_burst),
+	.SAXIGP0ARCACHE(ps7_shim_s_axi_gp0_ar_cache),
+	.SAXIGP0ARID(ps7_shim_s_axi_gp0_ar_id),
+	.SAXIGP0ARLEN(ps7_shim_s_axi_gp0_ar_len),
+	.SAXIGP0ARLOCK(ps7_shim_s_axi_gp0_ar_lock),
+	.SAXIGP0ARPROT(ps7_shim_s_axi_gp0_ar_prot),
+	.SAXIGP0ARQOS(ps7_shim_s_axi_gp0_ar_qos),
+	.SAXIGP0ARSIZE(ps7_shim_s_axi_gp0_ar_size[1:0]),
+	.SAXIGP0ARVALID(ps7_shim_s_axi_gp0_ar_valid),
+	.SAXIGP0AWADDR(ps7_shim_s_axi_gp0_aw_addr),
+	.SAXIGP0AWBURST(ps7_shim_s_axi_gp0_aw_burst),
+	.SAXIGP0AWCACHE(ps7_shim_s_axi_gp0_aw_cache),
+	.SAXIGP0AWID(ps7_shim_s_axi_gp0_aw_id),
+	.SAXIGP0AWLEN(ps7_shim_s_axi_gp0_aw_len),
+	.SAXIGP0AWLOCK(ps7_shim_s_axi_gp0_aw_lock),
+	.SAXIGP0AWPROT(ps7_shim_s_axi_gp0_aw_prot),
+	.SAXIGP0AWQOS(ps7_shim_s_axi_gp0_aw_qos),
+	.SAXIGP0AWSIZE(ps7_shim_s_axi_gp0_aw_size[1:0]),
+	.SAXIGP0AWVALID(ps7_shim_s_axi_gp0_aw_valid),
+	.SAXIGP0BREADY(ps7_shim_s_axi_gp0_b_ready),
+	.SAXIGP0RREADY(ps7_shim_s_axi_gp0_r_ready),
+	.SAXIGP0WDATA(ps7_shim_s_axi_gp0_w_data),
+	.SAXIGP0WID(ps7_shim_s_axi_gp0_w_id),
+	.SAXIGP0WLAST(ps7_shim_s_axi_gp0_w_last),
+	.SAXIGP0WSTRB(ps7_shim_s_axi_gp0_w_strb),
+	.SAXIGP0WVALID(ps7_shim_s_axi_gp0_w_valid),
+	.SAXIGP1ARADDR(ps7_shim_s_axi_gp1_ar_addr),
+	.SAXIGP1ARBURST(ps7_shim_s_axi_gp1_ar_burst),
+	.SAXIGP1ARCACHE(ps7_shim_s_axi_gp1_ar_cache),
+	.SAXIGP1ARID(ps7_shim_s_axi_gp1_ar_id),
+	.SAXIGP1ARLEN(ps7_shim_s_axi_gp1_ar_len),
+	.SAXIGP1ARLOCK(ps7_shim_s_axi_gp1_ar_lock),
+	.SAXIGP1ARPROT(ps7_shim_s_axi_gp1_ar_prot),
+	.SAXIGP1ARQOS(ps7_shim_s_axi_gp1_ar_qos),
+	.SAXIGP1ARSIZE(ps7_shim_s_axi_gp1_ar_size[1:0]),
+	.SAXIGP1ARVALID(ps7_shim_s_axi_gp1_ar_valid),
+	.SAXIGP1AWADDR(ps7_shim_s_axi_gp1_aw_addr),
+	.SAXIGP1AWBURST(ps7_shim_s_axi_gp1_aw_burst),
+	.SAXIGP1AWCACHE(ps7_shim_s_axi_gp1_aw_cache),
+	.SAXIGP1AWID(ps7_shim_s_axi_gp1_aw_id),
+	.SAXIGP1AWLEN(ps7_shim_s_axi_gp1_aw_len),
+	.SAXIGP1AWLOCK(ps7_shim_s_axi_gp1_aw_lock),
+	.SAXIGP1AWPROT(ps7_shim_s_axi_gp1_aw_prot),
+	.SAXIGP1AWQOS(ps7_shim_s_axi_gp1_aw_qos),
+	.SAXIGP1AWSIZE(ps7_shim_s_axi_gp1_aw_size[1:0]),
+	.SAXIGP1AWVALID(ps7_shim_s_axi_gp1_aw_valid),
+	.SAXIGP1BREADY(ps7_shim_s_axi_gp1_b_ready),
+	.SAXIGP1RREADY(ps7_shim_s_axi_gp1_r_ready),
+	.SAXIGP1WDATA(ps7_shim_s_axi_gp1_w_data),
+	.SAXIGP1WID(ps7_shim_s_axi_gp1_w_id),
+	.SAXIGP1WLAST(ps7_shim_s_axi_gp1_w_last),
+	.SAXIGP1WSTRB(ps7_shim_s_axi_gp1_w_strb),
+	.SAXIGP1WVALID(ps7_shim_s_axi_gp1_w_valid),
+	.SAXIHP0ARADDR(ps7_bus_s_axi_hp0_ar_addr),
+	.SAXIHP0ARBURST(ps7_bus_s_axi_hp0_ar_burst),
+	.SAXIHP0ARCACHE(ps7_bus_s_axi_hp0_ar_cache),
+	.SAXIHP0ARID(ps7_bus_s_axi_hp0_ar_id),
+	.SAXIHP0ARLEN(ps7_bus_s_axi_hp0_ar_len),
+	.SAXIHP0ARLOCK(ps7_bus_s_axi_hp0_ar_lock),
+	.SAXIHP0ARPROT(ps7_bus_s_axi_hp0_ar_prot),
+	.SAXIHP0ARQOS(ps7_bus_s_axi_hp0_ar_qos),
+	.SAXIHP0ARSIZE(ps7_bus_s_axi_hp0_ar_size),
+	.SAXIHP0ARVALID(ps7_bus_s_axi_hp0_ar_valid),
+	.SAXIHP0AWADDR(ps7_bus_s_axi_hp0_aw_addr),
+	.SAXIHP0AWBURST(ps7_bus_s_axi_hp0_aw_burst),
+	.SAXIHP0AWCACHE(ps7_bus_s_axi_hp0_aw_cache),
+	.SAXIHP0AWID(ps7_bus_s_axi_hp0_aw_id),
+	.SAXIHP0AWLEN(ps7_bus_s_axi_hp0_aw_len),
+	.SAXIHP0AWLOCK(ps7_bus_s_axi_hp0_aw_lock),
+	.SAXIHP0AWPROT(ps7_bus_s_axi_hp0_aw_prot),
+	.SAXIHP0AWQOS(ps7_bus_s_axi_hp0_aw_qos),
+	.SAXIHP0AWSIZE(ps7_bus_s_axi_hp0_aw_size),
+	.SAXIHP0AWVALID(ps7_bus_s_axi_hp0_aw_valid),
+	.SAXIHP0BREADY(ps7_bus_s_axi_hp0_b_ready),
+	.SAXIHP0RDISSUECAP1EN(ps7_s_axi_hp0_rdissuecap1_en),
+	.SAXIHP0RREADY(ps7_bus_s_axi_hp0_r_ready),
+	.SAXIHP0WDATA(ps7_bus_s_axi_hp0_w_data),
+	.SAXIHP0WID(ps7_bus_s_axi_hp0_w_id),
+	.SAXIHP0WLAST(ps7_bus_s_axi_hp0_w_last),
+	.SAXIHP0WRISSUECAP1EN(ps7_s_axi_hp0_wrissuecap1_en),
+	.SAXIHP0WSTRB(ps7_bus_s_axi_hp0_w_strb),
+	.SAXIHP0WVALID(ps7_bus_s_axi_hp0_w_valid),
+	.SAXIHP1ARADDR(ps7_bus_s_axi_hp1_ar_addr),
+	.SAXIHP1ARBURST(ps7_bus_s_axi_hp1_ar_burst),
+	.SAXIHP1ARCACHE(ps7_bus_s_axi_hp1_ar_cache),
+	.SAXIHP1ARID(ps7_bus_s_axi_hp1_ar_id),
+	.SAXIHP1ARLEN(ps7_bus_s_axi_hp1_ar_len),
+	.SAXIHP1ARLOCK(ps7_bus_s_axi_hp1_ar_lock),
+	.SAXIHP1ARPROT(ps7_bus_s_axi_hp1_ar_prot),
+	.SAXIHP1ARQOS(ps7_bus_s_axi_hp1_ar_qos),
+	.SAXIHP1ARSIZE(ps7_bus_s_axi_hp1_ar_size),
+	.SAXIHP1ARVALID(ps7_bus_s_axi_hp1_ar_valid),
+	.SAXIHP1AWADDR(ps7_bus_s_axi_hp1_aw_addr),
+	.SAXIHP1AWBURST(ps7_bus_s_axi_hp1_aw_burst),
+	.SAXIHP1AWCACHE(ps7_bus_s_axi_hp1_aw_cache),
+	.SAXIHP1AWID(ps7_bus_s_axi_hp1_aw_id),
+	.SAXIHP1AWLEN(ps7_bus_s_axi_hp1_aw_len),
+	.SAXIHP1AWLOCK(ps7_bus_s_axi_hp1_aw_lock),
+	.SAXIHP1AWPROT(ps7_bus_s_axi_hp1_aw_prot),
+	.SAXIHP1AWQOS(ps7_bus_s_axi_hp1_aw_qos),
+	.SAXIHP1AWSIZE(ps7_bus_s_axi_hp1_aw_size),
+	.SAXIHP1AWVALID(ps7_bus_s_axi_hp1_aw_valid),
+	.SAXIHP1BREADY(ps7_bus_s_axi_hp1_b_ready),
+	.SAXIHP1RDISSUECAP1EN(ps7_s_axi_hp1_rdissuecap1_en),
+	.SAXIHP1RREADY(ps7_bus_s_axi_hp1_r_ready),
+	.SAXIHP1WDATA(ps7_bus_s_axi_hp1_w_data),
+	.SAXIHP1WID(ps7_bus_s_axi_hp1_w_id),
+	.SAXIHP1WLAST(ps7_bus_s_axi_hp1_w_last),
+	.SAXIHP1WRISSUECAP1EN(ps7_s_axi_hp1_wrissuecap1_en),
+	.SAXIHP1WSTRB(ps7_bus_s_axi_hp1_w_strb),
+	.SAXIHP1WVALID(ps7_bus_s_axi_hp1_w_valid),
+	.SAXIHP2ARADDR(ps7_bus_s_axi_hp2_ar_addr),
+	.SAXIHP2ARBURST(ps7_bus_s_axi_hp2_ar_burst),
+	.SAXIHP2ARCACHE(ps7_bus_s_axi_hp2_ar_cache),
+	.SAXIHP2ARID(ps7_bus_s_axi_hp2_ar_id),
+	.SAXIHP2ARLEN(ps7_bus_s_axi_hp2_ar_len),
+	.SAXIHP2ARLOCK(ps7_bus_s_axi_hp2_ar_lock),
+	.SAXIHP2ARPROT(ps7_bus_s_axi_hp2_ar_prot),
+	.SAXIHP2ARQOS(ps7_bus_s_axi_hp2_ar_qos),
+	.SAXIHP2ARSIZE(ps7_bus_s_axi_hp2_ar_size),
+	.SAXIHP2ARVALID(ps7_bus_s_axi_hp2_ar_valid),
+	.SAXIHP2AWADDR(ps7_bus_s_axi_hp2_aw_addr),
+	.SAXIHP2AWBURST(ps7_bus_s_axi_hp2_aw_burst),
+	.SAXIHP2AWCACHE(ps7_bus_s_axi_hp2_aw_cache),
+	.SAXIHP2AWID(ps7_bus_s_axi_hp2_aw_id),
+	.SAXIHP2AWLEN(ps7_bus_s_axi_hp2_aw_len),
+	.SAXIHP2AWLOCK(ps7_bus_s_axi_hp2_aw_lock),
+	.SAXIHP2AWPROT(ps7_bus_s_axi_hp2_aw_prot),
+	.SAXIHP2AWQOS(ps7_bus_s_axi_hp2_aw_qos),
+	.SAXIHP2AWSIZE(ps7_bus_s_axi_hp2_aw_size),
+	.SAXIHP2AWVALID(ps7_bus_s_axi_hp2_aw_valid),
+	.SAXIHP2BREADY(ps7_bus_s_axi_hp2_b_ready),
+	.SAXIHP2RDISSUECAP1EN(ps7_s_axi_hp2_rdissuecap1_en),
+	.SAXIHP2RREADY(ps7_bus_s_axi_hp2_r_ready),
+	.SAXIHP2WDATA(ps7_bus_s_axi_hp2_w_data),
+	.SAXIHP2WID(ps7_bus_s_axi_hp2_w_id),
+	.SAXIHP2WLAST(ps7_bus_s_axi_hp2_w_last),
+	.SAXIHP2WRISSUECAP1EN(ps7_s_axi_hp2_wrissuecap1_en),
+	.SAXIHP2WSTRB(ps7_bus_s_axi_hp2_w_strb),
+	.SAXIHP2WVALID(ps7_bus_s_axi_hp2_w_valid),
+	.SAXIHP3ARADDR(ps7_bus_s_axi_hp3_ar_addr),
+	.SAXIHP3ARBURST(ps7_bus_s_axi_hp3_ar_burst),
+	.SAXIHP3ARCACHE(ps7_bus_s_axi_hp3_ar_cache),
+	.SAXIHP3ARID(ps7_bus_s_axi_hp3_ar_id),
+	.SAXIHP3ARLEN(ps7_bus_s_axi_hp3_ar_len),
+	.SAXIHP3ARLOCK(ps7_bus_s_axi_hp3_ar_lock),
+	.SAXIHP3ARPROT(ps7_bus_s_axi_hp3_ar_prot),
+	.SAXIHP3ARQOS(ps7_bus_s_axi_hp3_ar_qos),
+	.SAXIHP3ARSIZE(ps7_bus_s_axi_hp3_ar_size),
+	.SAXIHP3ARVALID(ps7_bus_s_axi_hp3_ar_valid),
+	.SAXIHP3AWADDR(ps7_bus_s_axi_hp3_aw_addr),
+	.SAXIHP3AWBURST(ps7_bus_s_axi_hp3_aw_burst),
+	.SAXIHP3AWCACHE(ps7_bus_s_axi_hp3_aw_cache),
+	.SAXIHP3AWID(ps7_bus_s_axi_hp3_aw_id),
+	.SAXIHP3AWLEN(ps7_bus_s_axi_hp3_aw_len),
+	.SAXIHP3AWLOCK(ps7_bus_s_axi_hp3_aw_lock),
+	.SAXIHP3AWPROT(ps7_bus_s_axi_hp3_aw_prot),
+	.SAXIHP3AWQOS(ps7_bus_s_axi_hp3_aw_qos),
+	.SAXIHP3AWSIZE(ps7_bus_s_axi_hp3_aw_size),
+	.SAXIHP3AWVALID(ps7_bus_s_axi_hp3_aw_valid),
+	.SAXIHP3BREADY(ps7_bus_s_axi_hp3_b_ready),
+	.SAXIHP3RDISSUECAP1EN(ps7_s_axi_hp3_rdissuecap1_en),
+	.SAXIHP3RREADY(ps7_bus_s_axi_hp3_r_ready),
+	.SAXIHP3WDATA(ps7_bus_s_axi_hp3_w_data),
+	.SAXIHP3WID(ps7_bus_s_axi_hp3_w_id),
+	.SAXIHP3WLAST(ps7_bus_s_axi_hp3_w_last),
+	.SAXIHP3WRISSUECAP1EN(ps7_s_axi_hp3_wrissuecap1_en),
+	.SAXIHP3WSTRB(ps7_bus_s_axi_hp3_w_strb),
+	.SAXIHP3WVALID(ps7_bus_s_axi_hp3_w_valid),
+	.DDRA(ps7_ddr_a),
+	.DDRBA(ps7_ddr_ba),
+	.DDRCASB(ps7_ddr_cas_n),
+	.DDRCKE(ps7_ddr_cke),
+	.DDRCKN(ps7_ddr_ck_n),
+	.DDRCKP(ps7_ddr_ck_p),
+	.DDRCSB(ps7_ddr_cs_n),
+	.DDRDM(ps7_ddr_dm),
+	.DDRDQ(ps7_ddr_dq),
+	.DDRDQSN(ps7_ddr_dqs_n),
+	.DDRDQSP(ps7_ddr_dqs_p),
+	.DDRDRSTB(ps7_ddr_drst_n),
+	.DDRODT(ps7_ddr_odt),
+	.DDRRASB(ps7_ddr_ras_n),
+	.DDRVRN(ps7_ddr_vrn),
+	.DDRVRP(ps7_ddr_vrp),
+	.DDRWEB(ps7_ddr_we_n),
+	.MIO(ps7_pads),
+	.PSCLK(ps7_ps_clk),
+	.PSPORB(ps7_ps_por_b),
+	.PSSRSTB(ps7_ps_srst_b),
+	.DMA0DATYPE(ps7_bus_dma0_da_type),
+	.DMA0DAVALID(ps7_bus_dma0_da_valid),
+	.DMA0DRREADY(ps7_bus_dma0_dr_ready),
+	.DMA0RSTN(ps7_dma0_rst_n),
+	.DMA1DATYPE(ps7_bus_dma1_da_type),
+	.DMA1DAVALID(ps7_bus_dma1_da_valid),
+	.DMA1DRREADY(ps7_bus_dma1_dr_ready),
+	.DMA1RSTN(ps7_dma1_rst_n),
+	.DMA2DATYPE(ps7_bus_dma2_da_type),
+	.DMA2DAVALID(ps7_bus_dma2_da_valid),
+	.DMA2DRREADY(ps7_bus_dma2_dr_ready),
+	.DMA2RSTN(ps7_dma2_rst_n),
+	.DMA3DATYPE(ps7_bus_dma3_da_type),
+	.DMA3DAVALID(ps7_bus_dma3_da_valid),
+	.DMA3DRREADY(ps7_bus_dma3_dr_ready),
+	.DMA3RSTN(ps7_dma3_rst_n),
+	.EMIOCAN0PHYTX(ps7_can0_phy_tx),
+	.EMIOCAN1PHYTX(ps7_can1_phy_tx),
+	.EMIOENET0GMIITXD(ps7_enet0_enet_gmii_txd),
+	.EMIOENET0GMIITXEN(ps7_enet0_enet_gmii_tx_en),
+	.EMIOENET0GMIITXER(ps7_enet0_enet_gmii_tx_er),
+	.EMIOENET0MDIOMDC(ps7_enet0_enet_mdio_mdc),
+	.EMIOENET0MDIOO(ps7_enet0_enet_mdio_o),
+	.EMIOENET0MDIOTN(ps7_enet0_enet_mdio_t_n),
+	.EMIOENET0PTPDELAYREQRX(ps7_enet0_enet_ptp_delay_req_rx),
+	.EMIOENET0PTPDELAYREQTX(ps7_enet0_enet_ptp_delay_req_tx),
+	.EMIOENET0PTPPDELAYREQRX(ps7_enet0_enet_ptp_pdelay_req_rx),
+	.EMIOENET0PTPPDELAYREQTX(ps7_enet0_enet_ptp_pdelay_req_tx),
+	.EMIOENET0PTPPDELAYRESPRX(ps7_enet0_enet_ptp_pdelay_resp_rx),
+	.EMIOENET0PTPPDELAYRESPTX(ps7_enet0_enet_ptp_pdelay_resp_tx),
+	.EMIOENET0PTPSYNCFRAMERX(ps7_enet0_enet_ptp_sync_frame_rx),
+	.EMIOENET0PTPSYNCFRAMETX(ps7_enet0_enet_ptp_sync_frame_tx),
+	.EMIOENET0SOFRX(ps7_enet0_enet_sof_rx),
+	.EMIOENET0SOFTX(ps7_enet0_enet_sof_tx),
+	.EMIOENET1GMIITXD(ps7_enet1_enet_gmii_txd),
+	.EMIOENET1GMIITXEN(ps7_enet1_enet_gmii_tx_en),
+	.EMIOENET1GMIITXER(ps7_enet1_enet_gmii_tx_er),
+	.EMIOENET1MDIOMDC(ps7_enet1_enet_mdio_mdc),
+	.EMIOENET1MDIOO(ps7_enet1_enet_mdio_o),
+	.EMIOENET1MDIOTN(ps7_enet1_enet_mdio_t_n),
+	.EMIOENET1PTPDELAYREQRX(ps7_enet1_enet_ptp_delay_req_rx),
+	.EMIOENET1PTPDELAYREQTX(ps7_enet1_enet_ptp_delay_req_tx),
+	.EMIOENET1PTPPDELAYREQRX(ps7_enet1_enet_ptp_pdelay_req_rx),
+	.EMIOENET1PTPPDELAYREQTX(ps7_enet1_enet_ptp_pdelay_req_tx),
+	.EMIOENET1PTPPDELAYRESPRX(ps7_enet1_enet_ptp_pdelay_resp_rx),
+	.EMIOENET1PTPPDELAYRESPTX(ps7_enet1_enet_ptp_pdelay_resp_tx),
+	.EMIOENET1PTPSYNCFRAMERX(ps7_enet1_enet_ptp_sync_frame_rx),
+	.EMIOENET1PTPSYNCFRAMETX(ps7_enet1_enet_ptp_sync_frame_tx),
+	.EMIOENET1SOFRX(ps7_enet1_enet_sof_rx),
+	.EMIOENET1SOFTX(ps7_enet1_enet_sof_tx),
+	.EMIOGPIOO(ps7_gpio_o),
+	.EMIOGPIOTN(ps7_gpio_t_n),
+	.EMIOI2C0SCLO(ps7_i2c0_scl_o),
+	.EMIOI2C0SCLTN(ps7_i2c0_scl_t_n),
+	.EMIOI2C0SDAO(ps7_i2c0_sda_o),
+	.EMIOI2C0SDATN(ps7_i2c0_sda_t_n),
+	.EMIOI2C1SCLO(ps7_i2c1_scl_o),
+	.EMIOI2C1SCLTN(ps7_i2c1_scl_t_n),
+	.EMIOI2C1SDAO(ps7_i2c1_sda_o),
+	.EMIOI2C1SDATN(ps7_i2c1_sda_t_n),
+	.EMIOPJTAGTDO(ps7_pjtag_td_o),
+	.EMIOPJTAGTDTN(ps7_pjtag_td_t_n),
+	.EMIOSDIO0BUSPOW(ps7_sdio0_buspow),
+	.EMIOSDIO0BUSVOLT(ps7_sdio0_busvolt),
+	.EMIOSDIO0CLK(ps7_sdio0_clk),
+	.EMIOSDIO0CMDO(ps7_sdio0_cmd_o),
+	.EMIOSDIO0CMDTN(ps7_sdio0_cmd_t_n),
+	.EMIOSDIO0DATAO(ps7_sdio0_data_o),
+	.EMIOSDIO0DATATN(ps7_sdio0_data_t_n),
+	.EMIOSDIO0LED(ps7_sdio0_led),
+	.EMIOSDIO1BUSPOW(ps7_sdio1_buspow),
+	.EMIOSDIO1BUSVOLT(ps7_sdio1_busvolt),
+	.EMIOSDIO1CLK(ps7_sdio1_clk),
+	.EMIOSDIO1CMDO(ps7_sdio1_cmd_o),
+	.EMIOSDIO1CMDTN(ps7_sdio1_cmd_t_n),
+	.EMIOSDIO1DATAO(ps7_sdio1_data_o),
+	.EMIOSDIO1DATATN(ps7_sdio1_data_t_n),
+	.EMIOSDIO1LED(ps7_sdio1_led),
+	.EMIOSPI0MO(ps7_spi0_m_o),
+	.EMIOSPI0MOTN(ps7_spi0_m_t_n),
+	.EMIOSPI0SCLKO(ps7_spi0_sclk_o),
+	.EMIOSPI0SCLKTN(ps7_spi0_sclk_t_n),
+	.EMIOSPI0SO(ps7_spi0_s_o),
+	.EMIOSPI0SSNTN(ps7_spi0_ss_t_n),
+	.EMIOSPI0SSON(ps7_spi0_ss_o_n),
+	.EMIOSPI0STN(ps7_spi0_s_t_n),
+	.EMIOSPI1MO(ps7_spi1_m_o),
+	.EMIOSPI1MOTN(ps7_spi1_m_t_n),
+	.EMIOSPI1SCLKO(ps7_spi1_sclk_o),
+	.EMIOSPI1SCLKTN(ps7_spi1_sclk_t_n),
+	.EMIOSPI1SO(ps7_spi1_s_o),
+	.EMIOSPI1SSNTN(ps7_spi1_ss_t_n),
+	.EMIOSPI1SSON(ps7_spi1_ss_o_n),
+	.EMIOSPI1STN(ps7_spi1_s_t_n),
+	.EMIOTRACECTL(ps7_trace_ctl),
+	.EMIOTRACEDATA(ps7_trace_data),
+	.EMIOTTC0WAVEO(ps7_ttc0_wave_o),
+	.EMIOTTC1WAVEO(ps7_ttc1_wave_o),
+	.EMIOUART0DTRN(ps7_uart0_dtr_n),
+	.EMIOUART0RTSN(ps7_uart0_rts_n),
+	.EMIOUART0TX(ps7_uart0_tx),
+	.EMIOUART1DTRN(ps7_uart1_dtr_n),
+	.EMIOUART1RTSN(ps7_uart1_rts_n),
+	.EMIOUART1TX(ps7_uart1_tx),
+	.EMIOUSB0PORTINDCTL(ps7_usb0_port_indctl),
+	.EMIOUSB0VBUSPWRSELECT(ps7_usb0_vbus_pwrselect),
+	.EMIOUSB1PORTINDCTL(ps7_usb1_port_indctl),
+	.EMIOUSB1VBUSPWRSELECT(ps7_usb1_vbus_pwrselect),
+	.EMIOWDTRSTO(ps7_wdt_rst_o),
+	.EVENTEVENTO(ps7_event_o),
+	.EVENTSTANDBYWFE(ps7_event_standbywfe),
+	.EVENTSTANDBYWFI(ps7_event_standbywfi),
+	.FCLKCLK(ps7_fclk_clk),
+	.FCLKRESETN(ps7_fclk_reset_n),
+	.FTMTF2PTRIGACK(ps7_ftmt_f2p_trigack),
+	.FTMTP2FDEBUG(ps7_ftmt_p2f_debug),
+	.FTMTP2FTRIG(ps7_ftmt_p2f_trig),
+	.IRQP2F(ps7_irq_p2f),
+	.MAXIGP0ACLK(ps7_m_axi_gp0_aclk),
+	.MAXIGP0ARADDR(ps7_bus_m_axi_gp0_ar_addr),
+	.MAXIGP0ARBURST(ps7_bus_m_axi_gp0_ar_burst),
+	.MAXIGP0ARCACHE(ps7_bus_m_axi_gp0_ar_cache),
+	.MAXIGP0ARESETN(ps7_m_axi_gp0_areset_n),
+	.MAXIGP0ARID(ps7_bus_m_axi_gp0_ar_id),
+	.MAXIGP0ARLEN(ps7_bus_m_axi_gp0_ar_len),
+	.MAXIGP0ARLOCK(ps7_bus_m_axi_gp0_ar_lock),
+	.MAXIGP0ARPROT(ps7_bus_m_axi_gp0_ar_prot),
+	.MAXIGP0ARQOS(ps7_bus_m_axi_gp0_ar_qos),
+	.MAXIGP0ARSIZE(ps7_bus_m_axi_gp0_ar_size[1:0]),
+	.MAXIGP0ARVALID(ps7_bus_m_axi_gp0_ar_valid),
+	.MAXIGP0AWADDR(ps7_bus_m_axi_gp0_aw_addr),
+	.MAXIGP0AWBURST(ps7_bus_m_axi_gp0_aw_burst),
+	.MAXIGP0AWCACHE(ps7_bus_m_axi_gp0_aw_cache),
+	.MAXIGP0AWID(ps7_bus_m_axi_gp0_aw_id),
+	.MAXIGP0AWLEN(ps7_bus_m_axi_gp0_aw_len),
+	.MAXIGP0AWLOCK(ps7_bus_m_axi_gp0_aw_lock),
+	.MAXIGP0AWPROT(ps7_bus_m_axi_gp0_aw_prot),
+	.MAXIGP0AWQOS(ps7_bus_m_axi_gp0_aw_qos),
+	.MAXIGP0AWSIZE(ps7_bus_m_axi_gp0_aw_size[1:0]),
+	.MAXIGP0AWVALID(ps7_bus_m_axi_gp0_aw_valid),
+	.MAXIGP0BREADY(ps7_bus_m_axi_gp0_b_ready),
+	.MAXIGP0RREADY(ps7_bus_m_axi_gp0_r_ready),
+	.MAXIGP0WDATA(ps7_bus_m_axi_gp0_w_data),
+	.MAXIGP0WID(ps7_bus_m_axi_gp0_w_id),
+	.MAXIGP0WLAST(ps7_bus_m_axi_gp0_w_last),
+	.MAXIGP0WSTRB(ps7_bus_m_axi_gp0_w_strb),
+	.MAXIGP0WVALID(ps7_bus_m_axi_gp0_w_valid),
+	.MAXIGP1ACLK(ps7_m_axi_gp1_aclk),
+	.MAXIGP1ARADDR(ps7_bus_m_axi_gp1_ar_addr),
+	.MAXIGP1ARBURST(ps7_bus_m_axi_gp1_ar_burst),
+	.MAXIGP1ARCACHE(ps7_bus_m_axi_gp1_ar_cache),
+	.MAXIGP1ARESETN(ps7_m_axi_gp1_areset_n),
+	.MAXIGP1ARID(ps7_bus_m_axi_gp1_ar_id),
+	.MAXIGP1ARLEN(ps7_bus_m_axi_gp1_ar_len),
+	.MAXIGP1ARLOCK(ps7_bus_m_axi_gp1_ar_lock),
+	.MAXIGP1ARPROT(ps7_bus_m_axi_gp1_ar_prot),
+	.MAXIGP1ARQOS(ps7_bus_m_axi_gp1_ar_qos),
+	.MAXIGP1ARSIZE(ps7_bus_m_axi_gp1_ar_size[1:0]),
+	.MAXIGP1ARVALID(ps7_bus_m_axi_gp1_ar_valid),
+	.MAXIGP1AWADDR(ps7_bus_m_axi_gp1_aw_addr),
+	.MAXIGP1AWBURST(ps7_bus_m_axi_gp1_aw_burst),
+	.MAXIGP1AWCACHE(ps7_bus_m_axi_gp1_aw_cache),
+	.MAXIGP1AWID(ps7_bus_m_axi_gp1_aw_id),
+	.MAXIGP1AWLEN(ps7_bus_m_axi_gp1_aw_len),
+	.MAXIGP1AWLOCK(ps7_bus_m_axi_gp1_aw_lock),
+	.MAXIGP1AWPROT(ps7_bus_m_axi_gp1_aw_prot),
+	.MAXIGP1AWQOS(ps7_bus_m_axi_gp1_aw_qos),
+	.MAXIGP1AWSIZE(ps7_bus_m_axi_gp1_aw_size[1:0]),
+	.MAXIGP1AWVALID(ps7_bus_m_axi_gp1_aw_valid),
+	.MAXIGP1BREADY(ps7_bus_m_axi_gp1_b_ready),
+	.MAXIGP1RREADY(ps7_bus_m_axi_gp1_r_ready),
+	.MAXIGP1WDATA(ps7_bus_m_axi_gp1_w_data),
+	.MAXIGP1WID(ps7_bus_m_axi_gp1_w_id),
+	.MAXIGP1WLAST(ps7_bus_m_axi_gp1_w_last),
+	.MAXIGP1WSTRB(ps7_bus_m_axi_gp1_w_strb),
+	.MAXIGP1WVALID(ps7_bus_m_axi_gp1_w_valid),
+	.SAXIACPACLK(ps7_s_axi_acp_aclk),
+	.SAXIACPARESETN(ps7_s_axi_acp_areset_n),
+	.SAXIACPARREADY(ps7_bus_s_axi_acp_ar_ready),
+	.SAXIACPAWREADY(ps7_bus_s_axi_acp_aw_ready),
+	.SAXIACPBID(ps7_bus_s_axi_acp_b_id),
+	.SAXIACPBRESP(ps7_bus_s_axi_acp_b_resp),
+	.SAXIACPBVALID(ps7_bus_s_axi_acp_b_valid),
+	.SAXIACPRDATA(ps7_bus_s_axi_acp_r_data),
+	.SAXIACPRID(ps7_bus_s_axi_acp_r_id),
+	.SAXIACPRLAST(ps7_bus_s_axi_acp_r_last),
+	.SAXIACPRRESP(ps7_bus_s_axi_acp_r_resp),
+	.SAXIACPRVALID(ps7_bus_s_axi_acp_r_valid),
+	.SAXIACPWREADY(ps7_bus_s_axi_acp_w_ready),
+	.SAXIGP0ACLK(ps7_s_axi_gp0_aclk),
+	.SAXIGP0ARESETN(ps7_s_axi_gp0_areset_n),
+	.SAXIGP0ARREADY(ps7_shim_s_axi_gp0_ar_ready),
+	.SAXIGP0AWREADY(ps7_shim_s_axi_gp0_aw_ready),
+	.SAXIGP0BID(ps7_shim_s_axi_gp0_b_id),
+	.SAXIGP0BRESP(ps7_shim_s_axi_gp0_b_resp),
+	.SAXIGP0BVALID(ps7_shim_s_axi_gp0_b_valid),
+	.SAXIGP0RDATA(ps7_shim_s_axi_gp0_r_data),
+	.SAXIGP0RID(ps7_shim_s_axi_gp0_r_id),
+	.SAXIGP0RLAST(ps7_shim_s_axi_gp0_r_last),
+	.SAXIGP0RRESP(ps7_shim_s_axi_gp0_r_resp),
+	.SAXIGP0RVALID(ps7_shim_s_axi_gp0_r_valid),
+	.SAXIGP0WREADY(ps7_shim_s_axi_gp0_w_ready),
+	.SAXIGP1ACLK(ps7_s_axi_gp1_aclk),
+	.SAXIGP1ARESETN(ps7_s_axi_gp1_areset_n),
+	.SAXIGP1ARREADY(ps7_shim_s_axi_gp1_ar_ready),
+	.SAXIGP1AWREADY(ps7_shim_s_axi_gp1_aw_ready),
+	.SAXIGP1BID(ps7_shim_s_axi_gp1_b_id),
+	.SAXIGP1BRESP(ps7_shim_s_axi_gp1_b_resp),
+	.SAXIGP1BVALID(ps7_shim_s_axi_gp1_b_valid),
+	.SAXIGP1RDATA(ps7_shim_s_axi_gp1_r_data),
+	.SAXIGP1RID(ps7_shim_s_axi_gp1_r_id),
+	.SAXIGP1RLAST(ps7_shim_s_axi_gp1_r_last),
+	.SAXIGP1RRESP(ps7_shim_s_axi_gp1_r_resp),
+	.SAXIGP1RVALID(ps7_shim_s_axi_gp1_r_valid),
+	.SAXIGP1WREADY(ps7_shim_s_axi_gp1_w_ready),
+	.SAXIHP0ACLK(ps7_s_axi_hp0_aclk),
+	.SAXIHP0ARESETN(ps7_s_axi_hp0_areset_n),
+	.SAXIHP0ARREADY(ps7_bus_s_axi_hp0_ar_ready),
+	.SAXIHP0AWREADY(ps7_bus_s_axi_hp0_aw_ready),
+	.SAXIHP0BID(ps7_bus_s_axi_hp0_b_id),
+	.SAXIHP0BRESP(ps7_bus_s_axi_hp0_b_resp),
+	.SAXIHP0BVALID(ps7_bus_s_axi_hp0_b_valid),
+	.SAXIHP0RACOUNT(ps7_s_axi_hp0_racount),
+	.SAXIHP0RCOUNT(ps7_s_axi_hp0_rcount),
+	.SAXIHP0RDATA(ps7_bus_s_axi_hp0_r_data),
+	.SAXIHP0RID(ps7_bus_s_axi_hp0_r_id),
+	.SAXIHP0RLAST(ps7_bus_s_axi_hp0_r_last),
+	.SAXIHP0RRESP(ps7_bus_s_axi_hp0_r_resp),
+	.SAXIHP0RVALID(ps7_bus_s_axi_hp0_r_valid),
+	.SAXIHP0WACOUNT(ps7_s_axi_hp0_wacount),
+	.SAXIHP0WCOUNT(ps7_s_axi_hp0_wcount),
+	.SAXIHP0WREADY(ps7_bus_s_axi_hp0_w_ready),
+	.SAXIHP1ACLK(ps7_s_axi_hp1_aclk),
+	.SAXIHP1ARESETN(ps7_s_axi_hp1_areset_n),
+	.SAXIHP1ARREADY(ps7_bus_s_axi_hp1_ar_ready),
+	.SAXIHP1AWREADY(ps7_bus_s_axi_hp1_aw_ready),
+	.SAXIHP1BID(ps7_bus_s_axi_hp1_b_id),
+	.SAXIHP1BRESP(ps7_bus_s_axi_hp1_b_resp),
+	.SAXIHP1BVALID(ps7_bus_s_axi_hp1_b_valid),
+	.SAXIHP1RACOUNT(ps7_s_axi_hp1_racount),
+	.SAXIHP1RCOUNT(ps7_s_axi_hp1_rcount),
+	.SAXIHP1RDATA(ps7_bus_s_axi_hp1_r_data),
+	.SAXIHP1RID(ps7_bus_s_axi_hp1_r_id),
+	.SAXIHP1RLAST(ps7_bus_s_axi_hp1_r_last),
+	.SAXIHP1RRESP(ps7_bus_s_axi_hp1_r_resp),
+	.SAXIHP1RVALID(ps7_bus_s_axi_hp1_r_valid),
+	.SAXIHP1WACOUNT(ps7_s_axi_hp1_wacount),
+	.SAXIHP1WCOUNT(ps7_s_axi_hp1_wcount),
+	.SAXIHP1WREADY(ps7_bus_s_axi_hp1_w_ready),
+	.SAXIHP2ACLK(ps7_s_axi_hp2_aclk),
+	.SAXIHP2ARESETN(ps7_s_axi_hp2_areset_n),
+	.SAXIHP2ARREADY(ps7_bus_s_axi_hp2_ar_ready),
+	.SAXIHP2AWREADY(ps7_bus_s_axi_hp2_aw_ready),
+	.SAXIHP2BID(ps7_bus_s_axi_hp2_b_id),
+	.SAXIHP2BRESP(ps7_bus_s_axi_hp2_b_resp),
+	.SAXIHP2BVALID(ps7_bus_s_axi_hp2_b_valid),
+	.SAXIHP2RACOUNT(ps7_s_axi_hp2_racount),
+	.SAXIHP2RCOUNT(ps7_s_axi_hp2_rcount),
+	.SAXIHP2RDATA(ps7_bus_s_axi_hp2_r_data),
+	.SAXIHP2RID(ps7_bus_s_axi_hp2_r_id),
+	.SAXIHP2RLAST(ps7_bus_s_axi_hp2_r_last),
+	.SAXIHP2RRESP(ps7_bus_s_axi_hp2_r_resp),
+	.SAXIHP2RVALID(ps7_bus_s_axi_hp2_r_valid),
+	.SAXIHP2WACOUNT(ps7_s_axi_hp2_wacount),
+	.SAXIHP2WCOUNT(ps7_s_axi_hp2_wcount),
+	.SAXIHP2WREADY(ps7_bus_s_axi_hp2_w_ready),
+	.SAXIHP3ACLK(ps7_s_axi_hp3_aclk),
+	.SAXIHP3ARESETN(ps7_s_axi_hp3_areset_n),
+	.SAXIHP3ARREADY(ps7_bus_s_axi_hp3_ar_ready),
+	.SAXIHP3AWREADY(ps7_bus_s_axi_hp3_aw_ready),
+	.SAXIHP3BID(ps7_bus_s_axi_hp3_b_id),
+	.SAXIHP3BRESP(ps7_bus_s_axi_hp3_b_resp),
+	.SAXIHP3BVALID(ps7_bus_s_axi_hp3_b_valid),
+	.SAXIHP3RACOUNT(ps7_s_axi_hp3_racount),
+	.SAXIHP3RCOUNT(ps7_s_axi_hp3_rcount),
+	.SAXIHP3RDATA(ps7_bus_s_axi_hp3_r_data),
+	.SAXIHP3RID(ps7_bus_s_axi_hp3_r_id),
+	.SAXIHP3RLAST(ps7_bus_s_axi_hp3_r_last),
+	.SAXIHP3RRESP(ps7_bus_s_axi_hp3_r_resp),
+	.SAXIHP3RVALID(ps7_bus_s_axi_hp3_r_valid),
+	.SAXIHP3WACOUNT(ps7_s_axi_hp3_wacount),
+	.SAXIHP3WCOUNT(ps7_s_axi_hp3_wcount),
+	.SAXIHP3WREADY(ps7_bus_s_axi_hp3_w_ready)
+);
+
+(* ars_ff1 = "true", async_reg = "true" *) FDPE #(
+	.INIT(1'd1)
+) FDPE (
+	.C(sys_clk),
+	.CE(1'd1),
+	.D(1'd0),
+	.PRE(async_reset),
+	.Q(rst_meta)
+);
+
+(* ars_ff2 = "true", async_reg = "true" *) FDPE #(
+	.INIT(1'd1)
+) FDPE_1 (
+	.C(sys_clk),
+	.CE(1'd1),
+	.D(rst_meta),
+	.PRE(async_reset),
+	.Q(sys_rst)
+);
+
+endmodule
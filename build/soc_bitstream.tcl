@@ -0,0 +1,2 @@
+write_bitstream -force soc.bit 
+quit
\ No newline at end of file
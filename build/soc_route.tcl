@@ -0,0 +1,24 @@
+create_project -force -name soc -part xc7z045-ffg900-2
+set_property XPM_LIBRARIES {XPM_CDC XPM_MEMORY} [current_project]
+add_files {soc.v}
+set_property library work [get_files {soc.v}]
+read_xdc soc.xdc
+synth_design -top soc -part xc7z045-ffg900-2
+report_timing_summary -file soc_timing_synth.rpt
+report_utilization -hierarchical -file soc_utilization_hierarchical_synth.rpt
+report_utilization -file soc_utilization_synth.rpt
+opt_design
+place_design
+report_utilization -hierarchical -file soc_utilization_hierarchical_place.rpt
+report_utilization -file soc_utilization_place.rpt
+report_io -file soc_io.rpt
+report_control_sets -verbose -file soc_control_sets.rpt
+report_clock_utilization -file soc_clock_utilization.rpt
+route_design
+phys_opt_design
+report_timing_summary -no_header -no_detailed_paths
+write_checkpoint -force soc_route.dcp
+report_route_status -file soc_route_status.rpt
+report_drc -file soc_drc.rpt
+report_timing_summary -datasheet -max_paths 10 -file soc_timing.rpt
+report_power -file soc_power.rpt
\ No newline at end of file
@@ -0,0 +1,167 @@
+from migen import *  # noqa
+from migen.genlib.resetsync import AsyncResetSynchronizer
+
+
+__all__ = ["MMCM", "PLL"]
+
+
+class _ClockGenerator(Module):
+    # primitive, outputs, VCO and PFD range in MHz, feedback multiplier and
+    # input divider range of a -1 speed grade
+    primitive = None
+    n_outputs = None
+    vco_range = None
+    pfd_range = None
+    mult_range = None
+    div_range = None
+    out_div_range = (1, 128)
+
+    def __init__(self, clkin, clkin_freq, reset=0, platform=None,
+                 margin=1e-2):
+        self.locked = Signal()
+        self.clkin = clkin
+        self.clkin_freq = clkin_freq
+        self.reset = reset
+        self.margin = margin
+        self.clkouts = []
+        if platform is not None:
+            platform.add_period_constraint(clkin, 1e9 / clkin_freq)
+
+    def create_clkout(self, cd, freq, phase=0):
+        """
+        Drive `cd` with `freq`, through a BUFG and with its reset held
+        until the generator locked.
+
+        Parameters
+        ----------
+        cd : migen.ClockDomain
+        freq : float
+            Frequency in Hz.
+        phase : float, optional
+            Phase in degrees.
+        """
+        if len(self.clkouts) == self.n_outputs:
+            raise ValueError("outputs shall be le {}".format(self.n_outputs))
+        clkout = Signal()
+        self.clkouts.append((clkout, freq, phase))
+        self.specials += [
+            Instance("BUFG", i_I=clkout, o_O=cd.clk),
+            AsyncResetSynchronizer(cd, ~self.locked),
+        ]
+
+    def compute_config(self):
+        """
+        Find the input divider, feedback multiplier and output dividers,
+        within `margin` of each output frequency.
+
+        Returns
+        -------
+        dict
+            ``div``, ``mult`` and ``clkout_div``, the list of output
+            dividers.
+        """
+        fin = self.clkin_freq / 1e6
+        for div in range(self.div_range[0], self.div_range[1] + 1):
+            if not self.pfd_range[0] <= fin / div <= self.pfd_range[1]:
+                continue
+            for mult in range(self.mult_range[0], self.mult_range[1] + 1):
+                vco = fin * mult / div
+                if not self.vco_range[0] <= vco <= self.vco_range[1]:
+                    continue
+                clkout_div = []
+                for _, freq, _ in self.clkouts:
+                    out_div = max(self.out_div_range[0], min(
+                        self.out_div_range[1], round(vco * 1e6 / freq)))
+                    if abs(vco * 1e6 / out_div - freq) > self.margin * freq:
+                        break
+                    clkout_div.append(out_div)
+                else:
+                    return dict(div=div, mult=mult, clkout_div=clkout_div)
+        raise ValueError("no configuration for {}".format(
+            ", ".join("{:g} Hz".format(freq) for _, freq, _ in self.clkouts)))
+
+    def do_finalize(self):
+        config = self.compute_config()
+        params = dict(
+            p_BANDWIDTH="OPTIMIZED",
+            p_CLKIN1_PERIOD=1e9 / self.clkin_freq,
+            p_DIVCLK_DIVIDE=config["div"],
+            i_CLKIN1=self.clkin,
+            i_RST=self.reset,
+            i_PWRDWN=0,
+            o_LOCKED=self.locked,
+        )
+        fb = Signal()
+        params.update(self.feedback_params(config["mult"], fb))
+        for i, ((clkout, _, phase), out_div) in enumerate(
+                zip(self.clkouts, config["clkout_div"])):
+            params.update(self.clkout_params(i, out_div, phase, clkout))
+        self.specials += Instance(self.primitive, **params)
+
+
+class MMCM(_ClockGenerator):
+    """
+    Clocks derived from a fabric clock, e.g. an FCLK of the PS7, by a 7
+    series MMCME2_BASE.
+
+    Outputs are added with `create_clkout`, the configuration is found on
+    finalisation. With `platform` the input clock is constrained, Vivado
+    derives the constraints of the outputs from it.
+
+    Parameters
+    ----------
+    clkin : migen.Signal
+        Input clock, e.g. ``ClockSignal("fclk1")``.
+    clkin_freq : float
+        Input frequency in Hz.
+    reset : migen.Signal, optional
+        Asynchronous reset, e.g. ``ResetSignal("fclk1")``.
+    platform : migen.build.generic_platform.GenericPlatform, optional
+    margin : float, optional
+        Relative error of the output frequencies.
+
+    Attributes
+    ----------
+    locked : migen.Signal
+    """
+    primitive = "MMCME2_BASE"
+    n_outputs = 7
+    vco_range = (600, 1200)
+    pfd_range = (10, 450)
+    mult_range = (2, 64)
+    div_range = (1, 106)
+
+    def feedback_params(self, mult, fb):
+        return dict(p_CLKFBOUT_MULT_F=float(mult), i_CLKFBIN=fb,
+                    o_CLKFBOUT=fb)
+
+    def clkout_params(self, i, out_div, phase, clkout):
+        divide = "p_CLKOUT{}_DIVIDE{}".format(i, "_F" if i == 0 else "")
+        return {
+            divide: float(out_div) if i == 0 else out_div,
+            "p_CLKOUT{}_PHASE".format(i): float(phase),
+            "o_CLKOUT{}".format(i): clkout,
+        }
+
+
+class PLL(MMCM):
+    """
+    Clocks derived from a fabric clock by a 7 series PLLE2_BASE, as `MMCM`
+    with fewer outputs and no fractional dividers.
+    """
+    primitive = "PLLE2_BASE"
+    n_outputs = 6
+    vco_range = (800, 1600)
+    pfd_range = (19, 450)
+    mult_range = (2, 64)
+    div_range = (1, 56)
+
+    def feedback_params(self, mult, fb):
+        return dict(p_CLKFBOUT_MULT=mult, i_CLKFBIN=fb, o_CLKFBOUT=fb)
+
+    def clkout_params(self, i, out_div, phase, clkout):
+        return {
+            "p_CLKOUT{}_DIVIDE".format(i): out_div,
+            "p_CLKOUT{}_PHASE".format(i): float(phase),
+            "o_CLKOUT{}".format(i): clkout,
+        }
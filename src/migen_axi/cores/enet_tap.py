@@ -0,0 +1,235 @@
+from migen import *  # noqa
+from migen.genlib.cdc import PulseSynchronizer
+from migen.genlib.fifo import AsyncFIFO
+from misoc.interconnect import stream
+from misoc.interconnect.csr import AutoCSR, CSRStatus
+
+
+__all__ = ["ENETTap"]
+
+
+GMII_SFD = 0xd5
+
+
+class _RxFramer(Module):
+    """
+    Frames of a GMII receiver, packed into words, in the receive domain.
+    """
+    def __init__(self, gmii, data, headers, dw, header_bytes, filter_):
+        self.frame = Signal()
+        self.filtered = Signal()
+        self.dropped = Signal()
+        self.error = Signal()
+
+        ###
+
+        # preamble stripped bytes, last known a cycle later
+        in_frame = Signal()
+        valid = Signal()
+        first = Signal()
+        errored = Signal()
+        byte = Record([("data", 8), ("valid", 1), ("first", 1), ("last", 1)])
+        self.comb += valid.eq(gmii.rx_dv & in_frame)
+        self.sync += [
+            If(
+                ~gmii.rx_dv,
+                in_frame.eq(0),
+            ).Elif(
+                gmii.rxd == GMII_SFD,
+                in_frame.eq(1),
+            ),
+            first.eq(~in_frame),
+            byte.data.eq(gmii.rxd),
+            byte.valid.eq(valid),
+            byte.first.eq(valid & first),
+            If(
+                valid,
+                errored.eq(gmii.rx_er | ~first & errored),
+            ),
+        ]
+        self.comb += [
+            byte.last.eq(byte.valid & ~valid),
+            self.error.eq(byte.last & errored),
+        ]
+
+        # the header is in the line once its first byte is at the tail
+        line = [byte]
+        for _ in range(header_bytes):
+            line.append(Record(byte.layout))
+            self.sync += line[-1].raw_bits().eq(line[-2].raw_bits())
+        tail = line[-1]
+        header = Cat(*[b.data for b in reversed(line[1:])])
+
+        accept = Signal()
+        room = Signal()
+        start = Signal()
+        self.comb += [
+            accept.eq(filter_(header) if filter_ else 1),
+            room.eq(headers.writable if header_bytes else 1),
+            start.eq(tail.first & accept & room),
+            self.filtered.eq(tail.first & ~accept),
+        ]
+
+        # words are held until written, a word finding the previous one
+        # still held ends its frame
+        ratio = dw // 8
+        keep = Signal()
+        take = Signal()
+        done = Signal()
+        overflow = Signal()
+        pushed = Signal()
+        index = Signal(max=max(ratio, 2))
+        word = Signal(dw)
+        word_next = Signal(dw)
+        pending = Signal()
+        pending_data = Signal(dw)
+        pending_eop = Signal()
+        self.comb += [
+            take.eq(tail.valid & Mux(tail.first, start, keep)),
+            done.eq(take & ((index == ratio - 1) | tail.last)),
+            overflow.eq(done & pending & ~data.writable),
+            # passed with its header once the first word is queued
+            self.frame.eq(done & ~overflow & (tail.first | ~pushed)),
+            self.dropped.eq(overflow | tail.first & accept & ~room),
+            word_next.eq(word),
+            Case(index, {i: word_next[8 * i:8 * (i + 1)].eq(tail.data)
+                         for i in range(ratio)}),
+            data.din.eq(Cat(pending_data, pending_eop)),
+            data.we.eq(pending),
+        ]
+        if header_bytes:
+            header_r = Signal(len(header))
+            self.sync += If(tail.first, header_r.eq(header))
+            self.comb += [
+                headers.din.eq(Mux(tail.first, header, header_r)),
+                headers.we.eq(self.frame),
+            ]
+        self.sync += [
+            If(
+                data.writable,
+                pending.eq(0),
+            ),
+            If(
+                tail.first,
+                keep.eq(start),
+                pushed.eq(0),
+            ),
+            If(
+                take,
+                word.eq(word_next),
+                index.eq(index + 1),
+            ),
+            If(
+                done,
+                word.eq(0),
+                index.eq(0),
+                If(
+                    overflow,
+                    keep.eq(0),
+                    If(
+                        pushed & ~tail.first,
+                        pending_eop.eq(1),
+                    ),
+                ).Else(
+                    pending.eq(1),
+                    pending_data.eq(word_next),
+                    pending_eop.eq(tail.last),
+                    pushed.eq(1),
+                ),
+            ),
+        ]
+
+
+class ENETTap(Module, AutoCSR):
+    """
+    Frames received on a GMII interface as a stream in ``sys``.
+
+    The preamble and SFD are stripped, the bytes of a frame including its
+    FCS are packed little endian into words of `source`, `eop` with the
+    last word, which is padded with zeros. The words cross into ``sys``
+    through an asynchronous FIFO. GMII can not be stalled, a frame
+    reaching a full FIFO is ended at its last word held and dropped from
+    there on.
+
+    With `header_bytes` the frame is delayed by as many bytes, which
+    makes its header available to `filter_` before the first byte is
+    packed. Frames `filter_` rejects are dropped at line rate, the header
+    of every accepted frame is passed to `header`.
+
+    Parameters
+    ----------
+    gmii : migen.Record
+        ``rxd``, ``rx_dv`` and ``rx_er``, e.g. ``PS7.enet0.enet.gmii``.
+    cd : str, optional
+        Receive domain of `gmii`, e.g. ``"enet0_rx"``.
+    dw : int, optional
+        Word width of `source`, a multiple of 8.
+    depth : int, optional
+        Words of the FIFO, a power of 2.
+    header_bytes : int, optional
+        Leading bytes of a frame to extract, e.g. 14 for the Ethernet
+        header.
+    filter_ : callable, optional
+        Takes the header, first byte in the LSBs, and returns the
+        expression accepting the frame.
+    header_depth : int, optional
+        Headers in their FIFO, a power of 2.
+
+    Attributes
+    ----------
+    source : misoc.interconnect.stream.Endpoint
+        ``data``, e.g. to ``stream2axi.Writer.sink``.
+    header : misoc.interconnect.stream.Endpoint
+        ``data``, the header of each frame in `source`.
+    _frames : misoc.interconnect.csr.CSRStatus
+        Frames passed to `source`.
+    _filtered : misoc.interconnect.csr.CSRStatus
+        Frames rejected by `filter_`.
+    _dropped : misoc.interconnect.csr.CSRStatus
+        Frames dropped or ended early on a full FIFO.
+    _errors : misoc.interconnect.csr.CSRStatus
+        Frames received with ``rx_er``.
+    """
+    def __init__(self, gmii, cd="eth_rx", dw=32, depth=512, header_bytes=0,
+                 filter_=None, header_depth=16):
+        if dw % 8:
+            raise ValueError("dw shall be a multiple of 8")
+        if filter_ and not header_bytes:
+            raise ValueError("header_bytes shall be gt 0 to filter")
+        self.source = stream.Endpoint([("data", dw)])
+        self.header = stream.Endpoint([("data", 8 * max(header_bytes, 1))])
+        self._frames = CSRStatus(32)
+        self._filtered = CSRStatus(32)
+        self._dropped = CSRStatus(32)
+        self._errors = CSRStatus(32)
+
+        ###
+
+        cdc = ClockDomainsRenamer({"write": cd, "read": "sys"})
+        data = cdc(AsyncFIFO(dw + 1, depth))
+        headers = cdc(AsyncFIFO(len(self.header.data), header_depth))
+        self.submodules += data, headers
+        framer = ClockDomainsRenamer(cd)(_RxFramer(
+            gmii, data, headers, dw, header_bytes, filter_))
+        self.submodules.framer = framer
+        self.comb += [
+            self.source.stb.eq(data.readable),
+            Cat(self.source.data, self.source.eop).eq(data.dout),
+            data.re.eq(self.source.ack),
+        ]
+        if header_bytes:
+            self.comb += [
+                self.header.stb.eq(headers.readable),
+                self.header.data.eq(headers.dout),
+                headers.re.eq(self.header.ack),
+            ]
+
+        for event, csr in [
+                (framer.frame, self._frames),
+                (framer.filtered, self._filtered),
+                (framer.dropped, self._dropped),
+                (framer.error, self._errors)]:
+            ps = PulseSynchronizer(cd, "sys")
+            self.submodules += ps
+            self.comb += ps.i.eq(event)
+            self.sync += If(ps.o, csr.status.eq(csr.status + 1))
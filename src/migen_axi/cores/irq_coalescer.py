@@ -0,0 +1,143 @@
+from functools import reduce
+from operator import or_
+from migen import *  # noqa
+from migen.util.misc import xdir
+from misoc.interconnect.csr import AutoCSR, CSRStatus, CSRStorage
+from misoc.interconnect.csr_eventmanager import (
+    EventSourceLevel, EventSourceProcess, EventSourcePulse)
+
+
+__all__ = ["EventStrobe", "IRQCoalescer"]
+
+
+class EventStrobe(Module):
+    """
+    Events of an event manager, as strobe for `IRQCoalescer`.
+
+    `o` is set for a cycle whenever an enabled event source becomes
+    pending: on the trigger of a pulse source, the falling edge of a
+    process source and the rising edge of a level source. Unlike
+    ``ev.irq`` it strobes for every event, also while a previous one is
+    still pending.
+
+    Parameters
+    ----------
+    ev : misoc.interconnect.csr_eventmanager.EventManager
+        Finalised event manager, e.g. in ``SoCCore.do_finalize``.
+
+    Attributes
+    ----------
+    o : migen.Signal
+    """
+    def __init__(self, ev):
+        self.o = Signal()
+
+        ###
+
+        sources = sorted(
+            (v for _, v in xdir(ev, True) if isinstance(
+                v, (EventSourceLevel, EventSourceProcess, EventSourcePulse))),
+            key=lambda source: source.duid)
+        strobes = []
+        for i, source in enumerate(sources):
+            trigger_r = Signal()
+            self.sync += trigger_r.eq(source.trigger)
+            if isinstance(source, EventSourcePulse):
+                strobe = source.trigger
+            elif isinstance(source, EventSourceProcess):
+                strobe = trigger_r & ~source.trigger
+            else:
+                strobe = source.trigger & ~trigger_r
+            strobes.append(strobe & ev.enable.storage[i])
+        self.comb += self.o.eq(reduce(or_, strobes, 0))
+
+
+class IRQCoalescer(Module, AutoCSR):
+    """
+    Interrupt moderation between event managers and ``PS7.interrupt``.
+
+    Line `i` is raised once its interrupt is pending and either
+    `_count<i>` events arrived, or `_timeout<i>` cycles passed since the
+    interrupt became pending. It stays raised until the interrupt is
+    cleared at the device, which also restarts the event count. Events
+    are only counted while the interrupt is not yet raised, so the
+    handler is expected to serve everything completed so far, e.g. all
+    filled buffers of a DMA.
+
+    Event managers only raise `irq` once until cleared, count thresholds
+    above 1 therefore need `events`, e.g. ``EventStrobe(ev).o``. Without
+    them a line sees a single event per interrupt, a count above 1 waits
+    for the timeout, and with the timeout disabled the count is ignored
+    rather than never raising the line.
+
+    Parameters
+    ----------
+    irqs : list of migen.Signal
+        Interrupts to moderate, e.g. ``ev.irq`` of the interrupt devices.
+    events : list of migen.Signal, optional
+        Event strobe of each line, by default the rising edge of its
+        interrupt.
+
+    Attributes
+    ----------
+    irq : migen.Signal
+        Moderated interrupts, to ``PS7.interrupt``.
+    _count<i> : misoc.interconnect.csr.CSRStorage
+        Events raising line `i`, 0 and 1 raise on the first. Ignored
+        without `events` and `_timeout<i>`.
+    _timeout<i> : misoc.interconnect.csr.CSRStorage
+        Cycles from pending to raising line `i`, 0 disables.
+    _pending : misoc.interconnect.csr.CSRStatus
+        Raised lines, to dispatch on with one read.
+    """
+    def __init__(self, irqs, events=None, count_width=16, timeout_width=32):
+        n = len(irqs)
+        if events is not None and len(events) != n:
+            raise ValueError("events shall be eq {}".format(n))
+        self.irq = Signal(n)
+        self._pending = CSRStatus(n)
+        for i in range(n):
+            setattr(self, "_count{}".format(i),
+                    CSRStorage(count_width, reset=1, name="count{}".format(i)))
+            setattr(self, "_timeout{}".format(i),
+                    CSRStorage(timeout_width, name="timeout{}".format(i)))
+
+        ###
+
+        self.comb += self._pending.status.eq(self.irq)
+        for i, irq in enumerate(irqs):
+            threshold = getattr(self, "_count{}".format(i)).storage
+            timeout = getattr(self, "_timeout{}".format(i)).storage
+            irq_r = Signal()
+            event = Signal()
+            if events is None:
+                # a single edge would never reach a count above 1
+                threshold = Mux(timeout == 0, 1, threshold)
+                self.comb += event.eq(irq & ~irq_r)
+            else:
+                self.comb += event.eq(events[i])
+            count = Signal(count_width)
+            timer = Signal(timeout_width)
+            raised = Signal()
+            self.comb += self.irq[i].eq(irq & raised)
+            self.sync += [
+                irq_r.eq(irq),
+                If(
+                    irq_r & ~irq,
+                    count.eq(0),
+                    timer.eq(0),
+                    raised.eq(0),
+                ).Elif(
+                    ~raised,
+                    If(
+                        event & (count != 2**count_width - 1),
+                        count.eq(count + 1),
+                    ),
+                    If(irq, timer.eq(timer + 1)),
+                    If(
+                        irq & ((count + event >= threshold) |
+                               ((timeout != 0) & (timer + 1 >= timeout))),
+                        raised.eq(1),
+                    ),
+                ),
+            ]
@@ -0,0 +1,355 @@
+from migen import *  # noqa
+from misoc.interconnect.csr import AutoCSR, CSR, CSRConstant, CSRStorage
+from ..interconnect import axi
+
+
+__all__ = ["AXILatencyHistogram"]
+
+
+# IDs tracked by their low bits, with depth timestamps each
+MAX_ID_BITS = 6
+
+
+class _LogBin(Module):
+    """
+    Log-linear bin of `i`.
+
+    Values below ``2**sub_bits`` get a bin each, every octave above is
+    split into ``2**sub_bits`` bins. Bins beyond `n_bins` saturate.
+    """
+    def __init__(self, width, sub_bits, n_bins):
+        self.i = Signal(width)
+        self.o = Signal(max=max(2, n_bins))
+
+        ###
+
+        raw = Signal(max=max(2, (width - sub_bits + 1) << sub_bits))
+        self.comb += raw.eq(self.i[:sub_bits] if sub_bits else 0)
+        # msb wins
+        for m in range(sub_bits, width):
+            if sub_bits:
+                value = Cat(self.i[m - sub_bits:m], C(m - sub_bits + 1))
+            else:
+                value = C(m + 1)
+            self.comb += If(self.i[m], raw.eq(value))
+        self.comb += self.o.eq(Mux(raw >= n_bins, n_bins - 1, raw))
+
+
+class _IdLatency(Module):
+    """
+    Latency of transactions matched by ID.
+
+    IDs are tracked in slots by their `id_bits` low bits. Up to `depth`
+    start timestamps are kept per slot, completions retire them in order.
+    A slot exceeding `depth` outstanding transactions, or starting an ID
+    other than the one outstanding in it, is not measured until it
+    drained.
+    """
+    def __init__(self, start, start_id, end, end_id, timestamp, depth,
+                 id_bits):
+        self.latency = Signal(len(timestamp))
+        self.valid = Signal()
+
+        ###
+
+        slot_bits = min(id_bits, len(start_id))
+        start_slot = start_id[:slot_bits]
+        end_slot = end_id[:slot_bits]
+        n = 2**slot_bits
+        ptr_bits = log2_int(depth)
+        mem = Memory(len(timestamp), n * depth)
+        wport = mem.get_port(write_capable=True)
+        rport = mem.get_port(async_read=True)
+        self.specials += mem, wport, rport
+
+        heads = [Signal(ptr_bits) for _ in range(n)]
+        pending = [Signal(8) for _ in range(n)]
+        poisoned = [Signal() for _ in range(n)]
+        owners = [Signal.like(start_id) for _ in range(n)]
+        start_pending = Array(pending)[start_slot]
+        alias = Signal()
+        self.comb += [
+            wport.adr.eq(Cat(
+                (Array(heads)[start_slot] + start_pending)[:ptr_bits],
+                start_slot)),
+            wport.dat_w.eq(timestamp),
+            wport.we.eq(start & (start_pending < depth)),
+            rport.adr.eq(Cat(Array(heads)[end_slot], end_slot)),
+            self.latency.eq(timestamp - rport.dat_r),
+            self.valid.eq(
+                end & ~Array(poisoned)[end_slot] &
+                (Array(pending)[end_slot] != 0)),
+            alias.eq((start_pending != 0) &
+                     (Array(owners)[start_slot] != start_id)),
+        ]
+        for i, (head, count, poison, owner) in enumerate(
+                zip(heads, pending, poisoned, owners)):
+            inc = Signal()
+            dec = Signal()
+            self.comb += [
+                inc.eq(start & (start_slot == i)),
+                dec.eq(end & (end_slot == i)),
+            ]
+            self.sync += [
+                If(
+                    inc & ~dec,
+                    If(count != 2**len(count) - 1, count.eq(count + 1)),
+                    If(count >= depth, poison.eq(1)),
+                ).Elif(
+                    dec & ~inc & (count != 0),
+                    count.eq(count - 1),
+                    head.eq(head + 1),
+                    If(
+                        count == 1,
+                        head.eq(0),
+                        poison.eq(0),
+                    ),
+                ).Elif(
+                    dec & inc,
+                    head.eq(head + 1),
+                ),
+                If(
+                    inc,
+                    If(count == 0, owner.eq(start_id)),
+                    If(alias, poison.eq(1)),
+                ),
+            ]
+
+
+class _Histogram(Module):
+    """
+    Histogram in block RAM, one read-modify-write per cycle.
+
+    Attributes
+    ----------
+    stb, bin : migen.Signal
+        Count an event in `bin`.
+    clear : migen.Signal
+        Zero all bins, takes `n_bins` cycles, see `clearing`.
+    adr, adr_ack, dat_r : migen.Signal
+        Read access, `dat_r` is valid the cycle after `adr_ack`.
+    """
+    def __init__(self, n_bins, width):
+        self.stb = Signal()
+        self.bin = Signal(max=max(2, n_bins))
+        self.clear = Signal()
+        self.clearing = Signal()
+        self.adr = Signal.like(self.bin)
+        self.adr_ack = Signal()
+        self.dat_r = Signal(width)
+
+        ###
+
+        mem = Memory(width, n_bins)
+        rport = mem.get_port()
+        wport = mem.get_port(write_capable=True)
+        self.specials += mem, rport, wport
+
+        stb = Signal()
+        bin_ = Signal.like(self.bin)
+        last_we = Signal()
+        last_adr = Signal.like(self.bin)
+        last_dat = Signal(width)
+        current = Signal(width)
+        clear_adr = Signal.like(self.bin)
+        self.comb += [
+            rport.adr.eq(Mux(self.stb, self.bin, self.adr)),
+            self.adr_ack.eq(~self.stb),
+            self.dat_r.eq(rport.dat_r),
+            # forward the previous update, it is not visible yet
+            current.eq(Mux(last_we & (last_adr == bin_),
+                           last_dat, rport.dat_r)),
+            If(
+                self.clearing,
+                wport.adr.eq(clear_adr),
+                wport.dat_w.eq(0),
+                wport.we.eq(1),
+            ).Else(
+                wport.adr.eq(bin_),
+                wport.dat_w.eq(
+                    Mux(current == 2**width - 1, current, current + 1)),
+                wport.we.eq(stb),
+            ),
+        ]
+        self.sync += [
+            stb.eq(self.stb & ~self.clearing),
+            bin_.eq(self.bin),
+            last_we.eq(wport.we),
+            last_adr.eq(wport.adr),
+            last_dat.eq(wport.dat_w),
+            If(
+                self.clear,
+                self.clearing.eq(1),
+                clear_adr.eq(0),
+            ).Elif(
+                self.clearing,
+                clear_adr.eq(clear_adr + 1),
+                If(clear_adr == n_bins - 1, self.clearing.eq(0)),
+            ),
+        ]
+
+
+class AXILatencyHistogram(Module, AutoCSR):
+    """
+    Per-ID AR to last R and AW to B latency histograms.
+
+    Each AR/AW is timestamped by ID and matched with its R last/B. Up to
+    ``2**id_bits`` IDs are tracked by their low bits, transactions of IDs
+    sharing low bits while outstanding are not measured. The
+    latency is binned log-linear and counted in block RAM. Both
+    histograms are read, with bursts, through `window`: read bins start
+    at word 0, write bins at word ``2**ceil(log2(n_bins))``.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+        Interface to tap, left untouched.
+    window : migen_axi.interconnect.axi.Interface, optional
+        Read-only AXI slave to fetch the histograms.
+    sub_bits : int, optional
+        Octaves are split into ``2**sub_bits`` bins.
+    latency_width : int, optional
+        Latency counter width, latencies wrap at ``2**latency_width``.
+    depth : int, optional
+        Outstanding transactions per ID, a power of 2.
+    id_bits : int, optional
+        Low ID bits tracked, at most 6.
+
+    Attributes
+    ----------
+    _enable : misoc.interconnect.csr.CSRStorage
+        Start or stop counting.
+    _clear : misoc.interconnect.csr.CSR
+        Write to zero both histograms.
+    _n_bins : misoc.interconnect.csr.CSRConstant
+        Number of bins per histogram.
+    """
+    def __init__(self, bus, window=None, sub_bits=2, latency_width=16,
+                 depth=4, id_bits=4):
+        if depth < 2:
+            raise ValueError("depth shall be ge 2")
+        if id_bits > MAX_ID_BITS:
+            raise ValueError("id_bits shall be le {}".format(MAX_ID_BITS))
+        n_bins = (latency_width - sub_bits + 1) << sub_bits
+        self.window = window or axi.Interface()
+        self._enable = CSRStorage()
+        self._clear = CSR()
+        self._n_bins = CSRConstant(n_bins)
+
+        ###
+
+        timestamp = Signal(latency_width)
+        self.sync += timestamp.eq(timestamp + 1)
+        enable = self._enable.storage
+
+        hists = []
+        for start, start_id, end, end_id in [
+                (bus.ar.valid & bus.ar.ready, bus.ar.id,
+                 bus.r.valid & bus.r.ready & bus.r.last, bus.r.id),
+                (bus.aw.valid & bus.aw.ready, bus.aw.id,
+                 bus.b.valid & bus.b.ready, bus.b.id)]:
+            latency = _IdLatency(
+                start, start_id, end, end_id, timestamp, depth, id_bits)
+            log_bin = _LogBin(latency_width, sub_bits, n_bins)
+            hist = _Histogram(n_bins, self.window.data_width)
+            self.submodules += latency, log_bin, hist
+            self.comb += [
+                log_bin.i.eq(latency.latency),
+                hist.bin.eq(log_bin.o),
+                hist.stb.eq(enable & latency.valid),
+                hist.clear.eq(self._clear.re),
+            ]
+            hists.append(hist)
+
+        # read-only window
+        ar, r, aw, w, b = (getattr(self.window, name)
+                           for name in ("ar", "r", "aw", "w", "b"))
+        word_bits = log2_int(self.window.data_width // 8)
+        bin_bits = bits_for(n_bins - 1)
+        adr = Signal(bin_bits + 1)
+        count = Signal.like(ar.len)
+        rid = Signal.like(ar.id)
+        data = Signal(self.window.data_width)
+        sel = adr[bin_bits]
+        in_range = Signal()
+        self.comb += [
+            in_range.eq(adr[:bin_bits] < n_bins),
+            [hist.adr.eq(adr[:bin_bits]) for hist in hists],
+            r.id.eq(rid),
+            r.data.eq(data),
+            r.resp.eq(axi.Response.okay),
+            r.last.eq(count == 0),
+        ]
+        self.submodules.rfsm = rfsm = FSM(reset_state="IDLE")
+        rfsm.act(
+            "IDLE",
+            ar.ready.eq(1),
+            If(
+                ar.valid,
+                NextValue(adr, ar.addr[word_bits:]),
+                NextValue(count, ar.len),
+                NextValue(rid, ar.id),
+                NextState("READ"),
+            ),
+        )
+        rfsm.act(
+            "READ",
+            If(
+                Array(hist.adr_ack for hist in hists)[sel],
+                NextState("LATCH"),
+            ),
+        )
+        rfsm.act(
+            "LATCH",
+            NextValue(data, Mux(
+                in_range, Array(hist.dat_r for hist in hists)[sel], 0)),
+            NextState("SEND"),
+        )
+        rfsm.act(
+            "SEND",
+            r.valid.eq(1),
+            If(
+                r.ready,
+                NextValue(adr, adr + 1),
+                NextValue(count, count - 1),
+                If(
+                    count == 0,
+                    NextState("IDLE"),
+                ).Else(
+                    NextState("READ"),
+                ),
+            ),
+        )
+
+        # writes are ignored
+        wid = Signal.like(aw.id)
+        self.comb += [
+            b.id.eq(wid),
+            b.resp.eq(axi.Response.okay),
+        ]
+        self.submodules.wfsm = wfsm = FSM(reset_state="IDLE")
+        wfsm.act(
+            "IDLE",
+            aw.ready.eq(1),
+            If(
+                aw.valid,
+                NextValue(wid, aw.id),
+                NextState("WRITE"),
+            ),
+        )
+        wfsm.act(
+            "WRITE",
+            w.ready.eq(1),
+            If(
+                w.valid & w.last,
+                NextState("WRITE_DONE"),
+            ),
+        )
+        wfsm.act(
+            "WRITE_DONE",
+            b.valid.eq(1),
+            If(
+                b.ready,
+                NextState("IDLE"),
+            ),
+        )
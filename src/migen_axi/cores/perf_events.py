@@ -0,0 +1,101 @@
+from migen import *  # noqa
+from misoc.interconnect.csr import AutoCSR, CSR, CSRStatus, CSRStorage
+
+
+__all__ = ["PerfEvents"]
+
+
+# FTM fabric to PS debug bits and triggers
+FTM_DEBUG_WIDTH = 32
+FTM_TRIGGERS = 4
+
+# names of the control registers
+RESERVED_NAMES = {"enable", "clear", "snapshot"}
+
+
+class PerfEvents(Module, AutoCSR):
+    """
+    Performance event counters, optionally traced by the PS7 FTM.
+
+    Each named event strobe is counted while `_enable` is set. Counters
+    are copied to their status registers ``_<name>`` on a write to
+    `_snapshot`, so they read consistently over a narrow CSR bus.
+
+    With `ftmt` the first 32 events toggle a bit each of the FTM debug
+    word, so the FTM traces every event as a change of the word, in line
+    with the program trace of the CPUs. Events in `triggers` raise the FTM
+    fabric to PS triggers, held until acknowledged.
+
+    Parameters
+    ----------
+    events : list of (str, migen.Signal)
+        Named event strobes, e.g. ``("hp0_ar_stall", ar.valid & ~ar.ready)``,
+        not named ``enable``, ``clear`` or ``snapshot``.
+    ftmt : migen.Record, optional
+        ``PS7.ftmt``.
+    triggers : list of str, optional
+        Names of up to 4 events raising the FTM triggers in order.
+    width : int, optional
+        Counter width.
+
+    Attributes
+    ----------
+    _enable : misoc.interconnect.csr.CSRStorage
+        Start or stop counting.
+    _clear : misoc.interconnect.csr.CSR
+        Write to reset all counters.
+    _snapshot : misoc.interconnect.csr.CSR
+        Write to latch all counters into their status registers.
+    """
+    def __init__(self, events, ftmt=None, triggers=(), width=32):
+        names = [name for name, _ in events]
+        if len(set(names)) != len(names):
+            raise ValueError("events shall have unique names")
+        if RESERVED_NAMES & set(names):
+            raise ValueError("events shall not be named {}".format(
+                ", ".join(sorted(RESERVED_NAMES))))
+        if len(triggers) > FTM_TRIGGERS:
+            raise ValueError("triggers shall be le {}".format(FTM_TRIGGERS))
+        if not set(triggers) <= set(names):
+            raise ValueError("triggers shall be in events")
+        if triggers and ftmt is None:
+            raise ValueError("ftmt shall be given for triggers")
+        self._enable = CSRStorage()
+        self._clear = CSR()
+        self._snapshot = CSR()
+
+        ###
+
+        enable = self._enable.storage
+        clear = self._clear.re
+
+        for name, strobe in events:
+            counter = Signal(width)
+            csr = CSRStatus(width, name=name)
+            setattr(self, "_" + name, csr)
+            self.sync += [
+                If(
+                    clear,
+                    counter.eq(0),
+                ).Elif(
+                    enable & strobe,
+                    counter.eq(counter + 1),
+                ),
+                If(self._snapshot.re, csr.status.eq(counter)),
+            ]
+
+        if ftmt is None:
+            return
+
+        f2p = ftmt.f2p
+        for i, (_, strobe) in enumerate(events[:FTM_DEBUG_WIDTH]):
+            self.sync += If(strobe, f2p.debug[i].eq(~f2p.debug[i]))
+        strobes = dict(events)
+        for i, name in enumerate(triggers):
+            self.sync += If(
+                f2p.trigack[i],
+                f2p.trig[i].eq(0),
+            ).Elif(
+                strobes[name],
+                f2p.trig[i].eq(1),
+            )
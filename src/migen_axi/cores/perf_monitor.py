@@ -0,0 +1,207 @@
+from migen import *  # noqa
+from migen.genlib.fifo import SyncFIFO
+from misoc.interconnect.csr import AutoCSR, CSR, CSRStatus, CSRStorage
+
+
+__all__ = ["AXIPerfMonitor"]
+
+
+class _ChannelCounter(Module):
+    def __init__(self, ch, enable, clear, width=32):
+        self.transfers = Signal(width)
+        self.stalls = Signal(width)
+
+        ###
+
+        self.sync += [
+            If(
+                clear,
+                self.transfers.eq(0),
+                self.stalls.eq(0),
+            ).Elif(
+                enable,
+                If(
+                    ch.valid & ch.ready,
+                    self.transfers.eq(self.transfers + 1),
+                ),
+                If(
+                    ch.valid & ~ch.ready,
+                    self.stalls.eq(self.stalls + 1),
+                ),
+            ),
+        ]
+
+
+class _LatencyMeter(Module):
+    """
+    Transaction latency, matched in issue order.
+
+    Start timestamps are queued and matched against completions in
+    order, which is exact as long as the slave completes in order. If
+    more than `depth` transactions are outstanding, measurement is
+    suspended until the bus drained.
+    """
+    def __init__(self, start, end, enable, clear, timestamp, depth=16,
+                 width=32):
+        self.outstanding = Signal(width)
+        self.outstanding_max = Signal(width)
+        self.count = Signal(width)
+        self.min = Signal(width, reset=2**width - 1)
+        self.max = Signal(width)
+        self.sum = Signal(width + 16)
+        self.lost = Signal()
+
+        ###
+
+        fifo = ResetInserter()(SyncFIFO(len(timestamp), depth))
+        self.submodules += fifo
+
+        self.sync += [
+            If(
+                start & ~end,
+                self.outstanding.eq(self.outstanding + 1),
+            ).Elif(
+                end & ~start,
+                self.outstanding.eq(self.outstanding - 1),
+            ),
+        ]
+        resync = Signal()
+        self.comb += [
+            fifo.din.eq(timestamp),
+            fifo.we.eq(start),
+            fifo.re.eq(end),
+            resync.eq(self.lost & (self.outstanding == 0) & ~start),
+            fifo.reset.eq(resync),
+        ]
+        self.sync += [
+            If(
+                start & ~fifo.writable,
+                self.lost.eq(1),
+            ).Elif(
+                resync,
+                self.lost.eq(0),
+            ),
+        ]
+
+        latency = Signal(width)
+        latency_valid = Signal()
+        self.comb += [
+            latency.eq(timestamp - fifo.dout),
+            latency_valid.eq(end & fifo.readable & ~self.lost),
+        ]
+        self.sync += [
+            If(
+                clear,
+                self.outstanding_max.eq(self.outstanding),
+                self.count.eq(0),
+                self.min.eq(self.min.reset),
+                self.max.eq(0),
+                self.sum.eq(0),
+            ).Elif(
+                enable,
+                If(
+                    self.outstanding > self.outstanding_max,
+                    self.outstanding_max.eq(self.outstanding),
+                ),
+                If(
+                    latency_valid,
+                    self.count.eq(self.count + 1),
+                    self.sum.eq(self.sum + latency),
+                    If(latency < self.min, self.min.eq(latency)),
+                    If(latency > self.max, self.max.eq(latency)),
+                ),
+            ),
+        ]
+
+
+class AXIPerfMonitor(Module, AutoCSR):
+    """
+    Passive AXI bandwidth and latency monitor.
+
+    Counts transfers and stall cycles (valid while not ready) of every
+    channel, tracks outstanding reads and writes, and measures AR to last
+    R and AW to B latency. Counters run while `_enable` is set, and are
+    copied to the status registers on a write to `_snapshot`, so they
+    read consistently over a narrow CSR bus. The average latency is
+    ``*_lat_sum / *_lat_count``.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+        Interface to tap, left untouched.
+    depth : int, optional
+        Outstanding transactions per direction to measure latency for.
+
+    Attributes
+    ----------
+    _enable : misoc.interconnect.csr.CSRStorage
+        Start or stop counting.
+    _clear : misoc.interconnect.csr.CSR
+        Write to reset all counters.
+    _snapshot : misoc.interconnect.csr.CSR
+        Write to latch all counters into their status registers.
+    """
+    def __init__(self, bus, depth=16):
+        self._enable = CSRStorage()
+        self._clear = CSR()
+        self._snapshot = CSR()
+
+        ###
+
+        enable = self._enable.storage
+        clear = self._clear.re
+
+        timestamp = Signal(32)
+        cycles = Signal(32)
+        self.sync += [
+            timestamp.eq(timestamp + 1),
+            If(
+                clear,
+                cycles.eq(0),
+            ).Elif(
+                enable,
+                cycles.eq(cycles + 1),
+            ),
+        ]
+
+        channels = {
+            name: _ChannelCounter(getattr(bus, name), enable, clear)
+            for name in ("ar", "r", "aw", "w", "b")}
+        self.submodules += list(channels.values())
+        rd = _LatencyMeter(
+            bus.ar.valid & bus.ar.ready,
+            bus.r.valid & bus.r.ready & bus.r.last,
+            enable, clear, timestamp, depth)
+        wr = _LatencyMeter(
+            bus.aw.valid & bus.aw.ready,
+            bus.b.valid & bus.b.ready,
+            enable, clear, timestamp, depth)
+        self.submodules += rd, wr
+
+        counters = [
+            ("cycles", cycles),
+            ("ar_bursts", channels["ar"].transfers),
+            ("ar_stalls", channels["ar"].stalls),
+            ("r_beats", channels["r"].transfers),
+            ("r_stalls", channels["r"].stalls),
+            ("aw_bursts", channels["aw"].transfers),
+            ("aw_stalls", channels["aw"].stalls),
+            ("w_beats", channels["w"].transfers),
+            ("w_stalls", channels["w"].stalls),
+            ("b_resps", channels["b"].transfers),
+            ("b_stalls", channels["b"].stalls),
+        ]
+        for prefix, meter in (("rd", rd), ("wr", wr)):
+            counters += [
+                (prefix + "_outstanding", meter.outstanding),
+                (prefix + "_outstanding_max", meter.outstanding_max),
+                (prefix + "_lat_count", meter.count),
+                (prefix + "_lat_min", meter.min),
+                (prefix + "_lat_max", meter.max),
+                (prefix + "_lat_sum", meter.sum),
+                (prefix + "_lat_lost", meter.lost),
+            ]
+        for name, value in counters:
+            csr = CSRStatus(len(value), name=name)
+            setattr(self, "_" + name, csr)
+            self.sync += If(self._snapshot.re, csr.status.eq(value))
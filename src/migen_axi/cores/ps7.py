@@ -6,10 +6,10 @@ from migen import *  # noqa
 from migen.genlib.resetsync import AsyncResetSynchronizer
 from migen.genlib.record import DIR_S_TO_M, DIR_M_TO_S, DIR_NONE
 from ..interconnect import (Interface, InterconnectPointToPoint, dmac_bus,
-                            wrshim)
+                            interface_layout, wrshim)
 
 
-__all__ = ["PS7", "ddr_rec", "enet_rec"]
+__all__ = ["PS7", "PS7_PORTS", "ddr_rec", "enet_rec"]
 
 
 @R.curry
@@ -27,26 +27,54 @@ sig_name = comp(
     get_in([-1, 0]), operator.attrgetter("backtrace"))
 
 
+def freeze_layout(layout):
+    return tuple(
+        tuple(freeze_layout(f) if isinstance(f, list) else f for f in field)
+        for field in layout)
+
+
+def port_prefix(direction, ps_m):
+    return {DIR_M_TO_S: "o_" if ps_m else "i_",
+            DIR_S_TO_M: "i_" if ps_m else "o_",
+            DIR_NONE: "io_"}[direction]
+
+
+# port names by record name, layout and direction
+port_names_cache = {}
+
+
+@memoize(cache=port_names_cache, key=lambda args, kwargs: (
+    args[0].name, freeze_layout(args[0].layout), args[1]))
+def port_names(interface, ps_m):
+    return tuple(port_prefix(direction, ps_m) + sig_name(sig).upper()
+                 for sig, direction in interface.iter_flat())
+
+
+def flat_layout(name, layout):
+    for field, shape, *direction in layout:
+        if isinstance(shape, list):
+            yield from flat_layout(name + field.replace("_", ""), shape)
+        else:
+            yield (name + field.replace("_", ""), shape,
+                   first(direction) if direction else DIR_NONE)
+
+
+# port widths by record name, layout and direction, as `port_names` but
+# from the layout, without creating the record
+port_widths_cache = {}
+
+
+@memoize(cache=port_widths_cache, key=lambda args, kwargs: (
+    args[0], freeze_layout(args[1]), args[2]))
+def port_widths(name, layout, ps_m):
+    return tuple((port_prefix(direction, ps_m) + port.upper(), width)
+                 for port, width, direction in flat_layout(
+                     name.replace("_", ""), layout))
+
+
 def connect_interface(interface, ps_m=True):
-    return pipe(
-        interface.iter_flat(),
-        map(
-            juxt([
-                comp(
-                    R.apply(operator.concat),
-                    juxt([
-                        comp(
-                            comp(
-                                flip(get)(
-                                    dict([(DIR_M_TO_S, "o_" if ps_m else "i_"),
-                                          (DIR_S_TO_M, "i_" if ps_m else "o_"),
-                                          (DIR_NONE, "io_")])),
-                                get(-1))),
-                        comp(operator.methodcaller("upper"), sig_name, first),
-                    ])
-                ),
-                first])),
-        dict)
+    return dict(zip(port_names(interface, ps_m),
+                    map(first, interface.iter_flat())))
 
 
 fix_arsize = comp(
@@ -81,6 +109,16 @@ def connect_m_axi(interface):
         fix_arsize, fix_awsize)
 
 
+def s_axi_widths(name, layout):
+    # as sliced by `connect_s_axi`
+    return {port: width - port.endswith(("ARSIZE", "AWSIZE"))
+            for port, width in port_widths(name, layout, False)}
+
+
+# layout of a `partial(Record, layout)`
+layout_of = comp(first, operator.attrgetter("args"))
+
+
 axi_global_rec = partial(Record, [
     ("aclk", 1, DIR_M_TO_S),
     ("areset_n", 1, DIR_M_TO_S),
@@ -293,6 +331,38 @@ irq_rec = partial(Record, [
     ("f2p", 20, DIR_S_TO_M),
 ])
 
+# shared peripheral interrupts, PS to fabric
+spi_irq_rec = partial(Record, [
+    ("can1", 1),
+    ("uart1", 1),
+    ("spi1", 1),
+    ("i2c1", 1),
+    ("sdio1", 1),
+    ("enet1_wake", 1),
+    ("enet1", 1),
+    ("usb1", 1),
+    ("can0", 1),
+    ("uart0", 1),
+    ("spi0", 1),
+    ("i2c0", 1),
+    ("sdio0", 1),
+    ("enet0_wake", 1),
+    ("enet0", 1),
+    ("usb0", 1),
+    ("gpio", 1),
+    ("cti", 1),
+    ("qspi", 1),
+    ("smc", 1),
+    ("dmac", 8),
+    ("dmac_abort", 1),
+])
+
+# interrupts of the CPUs, fabric to PS
+core_irq_rec = partial(Record, [
+    ("core0", [("nirq", 1), ("nfiq", 1)]),
+    ("core1", [("nirq", 1), ("nfiq", 1)]),
+])
+
 bibuf = comp(
     apply_map(partial(Instance, "BIBUF")),
     dict, partial(zip, ["io_PAD", "io_IO"]))
@@ -301,6 +371,61 @@ bufg = comp(
     apply_map(partial(Instance, "BUFG")),
     dict, partial(zip, ["i_I", "o_O"]))
 
+# inputs driven with 0, outputs left open, by port widths
+tie_off = comp(
+    valmap(partial(C, 0)),
+    keyfilter(flip(str.startswith, "i_")))
+
+emio_recs = dict(
+    ttc0=ttc_rec, ttc1=ttc_rec, wdt=wdt_rec, spi0=spio_rec, spi1=spio_rec,
+    i2c0=i2c_rec, i2c1=i2c_rec, can0=can_rec, can1=can_rec,
+    uart0=uart_rec, uart1=uart_rec, sdio0=sdio_rec, sdio1=sdio_rec,
+    gpio=gpio_rec, usb0=usb_rec, usb1=usb_rec, sram=sram_rec,
+    event=event_rec, trace=trace_rec, pjtag=pjtag_rec)
+
+# PS7 port renames, applied in order
+PS7_RENAMES = [
+    ("TTC", "EMIOTTC"),
+    ("WDT", "EMIOWDT"),
+    ("SPI", "EMIOSPI"),
+    ("I2C", "EMIOI2C"),
+    ("CAN", "EMIOCAN"),
+    ("UART", "EMIOUART"),
+    ("SDIO", "EMIOSDIO"),
+    ("GPIO", "EMIOGPIO"),
+    ("PJTAG", "EMIOPJTAG"),
+    ("USB", "EMIOUSB"),
+    ("SRAM", "EMIOSRAM"),
+    ("DDRDRSTN", "DDRDRSTB"),
+    ("DDRWEN", "DDRWEB"),
+    ("DDRRASN", "DDRRASB"),
+    ("DDRCASN", "DDRCASB"),
+    ("DDRCSN", "DDRCSB"),
+    ("EMIOSPI0SSTN", "EMIOSPI0SSNTN"),
+    ("EMIOSPI1SSTN", "EMIOSPI1SSNTN"),
+    ("EMIOSPI0MTN", "EMIOSPI0MOTN"),
+    ("EMIOSPI1MTN", "EMIOSPI1MOTN"),
+    ("EVENTO", "EVENTEVENTO"),
+    ("EVENTI", "EVENTEVENTI"),
+]
+
+
+@memoize
+def rename_port(name):
+    return reduce(lambda name, rename: str_replace(*rename, name),
+                  PS7_RENAMES, name)
+
+
+# ports created only when used, see `PS7`
+PS7_PORTS = tuple(
+    ["m_axi_gp{}".format(i) for i in range(2)] +
+    ["s_axi_gp{}".format(i) for i in range(2)] +
+    ["s_axi_acp"] +
+    ["s_axi_hp{}".format(i) for i in range(4)] +
+    ["dma{}".format(i) for i in range(4)] +
+    ["enet0", "enet1"] +
+    list(emio_recs))
+
 
 class ENETRx(Module):
     def __init__(self, pads, gmii):
@@ -350,121 +475,57 @@ class ENET(Module):
 
 
 class PS7(Module):
+    """
+    Zynq-7000 processing system.
+
+    Parameters
+    ----------
+    pads : types.SimpleNamespace, optional
+        ``ps``, ``ddr``, ``enet0`` and ``enet1`` pads.
+    ports : iterable of str, optional
+        Ports of `PS7_PORTS` used by the design, all by default. Only
+        these are created as attributes, with their shims, the inputs of
+        the others are tied to 0 and their outputs left open.
+    fclks : iterable of int, optional
+        FCLKs 1 to 3 to create ``cd_fclk<i>`` domains of, through a BUFG
+        and with the reset synchronised to the clock. FCLK0 is ``cd_sys``.
+    """
     def __init__(self, pads=SimpleNamespace(
-            ps=None, ddr=None, enet0=None, enet1=None), **kwargs):
+            ps=None, ddr=None, enet0=None, enet1=None), ports=None,
+            fclks=(), **kwargs):
         pads.ps = pads.ps or ps_rec()
         pads.ddr = pads.ddr or ddr_rec()
+        ports = set(PS7_PORTS if ports is None else ports)
+        if not ports <= set(PS7_PORTS):
+            raise ValueError("ports shall be in PS7_PORTS, not {}".format(
+                ", ".join(sorted(ports - set(PS7_PORTS)))))
+        self.ports = ports
+        if not set(fclks) <= {1, 2, 3}:
+            raise ValueError("fclks shall be in 1, 2, 3")
 
-        self.m_axi_gp0 = Interface(id_width=12)
-        self.m_axi_gp1 = Interface(id_width=12)
-        self.s_axi_gp0 = Interface(id_width=6)
-        self.s_axi_gp1 = Interface(id_width=6)
-        self.s_axi_acp = Interface(data_width=64, id_width=3)
-        self.s_axi_acp_user = acp_user_rec(name="s_axi_acp")
-        self.s_axi_hp0 = Interface(
-            data_width=64, addr_width=32, id_width=6)
-        self.s_axi_hp0_fifo = hp_fifo_rec(name="s_axi_hp0")
-        self.s_axi_hp1 = Interface(
-            data_width=64, addr_width=32, id_width=6)
-        self.s_axi_hp1_fifo = hp_fifo_rec(name="s_axi_hp1")
-        self.s_axi_hp2 = Interface(
-            data_width=64, addr_width=32, id_width=6)
-        self.s_axi_hp2_fifo = hp_fifo_rec(name="s_axi_hp2")
-        self.s_axi_hp3 = Interface(
-            data_width=64, addr_width=32, id_width=6)
-        self.s_axi_hp3_fifo = hp_fifo_rec(name="s_axi_hp3")
-
-        self.ttc0 = ttc_rec()
-        self.ttc1 = ttc_rec()
-        self.wdt = wdt_rec()
-        self.spi0 = spio_rec()
-        self.spi1 = spio_rec()
-        self.i2c0 = i2c_rec()
-        self.i2c1 = i2c_rec()
-        self.can0 = can_rec()
-        self.can1 = can_rec()
-        self.uart0 = uart_rec()
-        self.uart1 = uart_rec()
-        self.sdio0 = sdio_rec()
-        self.sdio1 = sdio_rec()
-        self.gpio = gpio_rec()
-        self.usb0 = usb_rec()
-        self.usb1 = usb_rec()
-        self.sram = sram_rec()
         self.fpga_idle_n = Signal()
-        self.event = event_rec()
         self.ddr_arb = Signal(4)
         self.mio = Signal(54)
 
         self.clock_domains.cd_sys = ClockDomain()
         self.clock_domains.cd_por = ClockDomain(reset_less=True)
+        for i in fclks:
+            setattr(self.clock_domains, "cd_fclk{}".format(i),
+                    ClockDomain("fclk{}".format(i)))
 
-        self.dma0 = dmac_bus.Interface(name="dma0")
-        self.dma1 = dmac_bus.Interface(name="dma1")
-        self.dma2 = dmac_bus.Interface(name="dma2")
-        self.dma3 = dmac_bus.Interface(name="dma3")
-
-        self.spi = Record([
-            ("can1", 1),
-            ("uart1", 1),
-            ("spi1", 1),
-            ("i2c1", 1),
-            ("sdio1", 1),
-            ("enet1_wake", 1),
-            ("enet1", 1),
-            ("usb1", 1),
-            ("can0", 1),
-            ("uart0", 1),
-            ("spi0", 1),
-            ("i2c0", 1),
-            ("sdio0", 1),
-            ("enet0_wake", 1),
-            ("enet0", 1),
-            ("usb0", 1),
-            ("gpio", 1),
-            ("cti", 1),
-            ("qspi", 1),
-            ("smc", 1),
-            ("dmac", 8),
-            ("dmac_abort", 1),
-        ])
+        self.spi = spi_irq_rec()
         self.interrupt = Signal(16)
-        self.core = Record([
-            ("core0", [("nirq", 1), ("nfiq", 1)]),
-            ("core1", [("nirq", 1), ("nfiq", 1)]),
-        ])
-        self.trace = trace_rec()
-        self.pjtag = pjtag_rec()
+        self.core = core_irq_rec()
 
         ###
 
-        s_axi_gp0_shim = Interface.like(self.s_axi_gp0, "s_axi_gp0")
-        s_axi_gp1_shim = Interface.like(self.s_axi_gp1, "s_axi_gp1")
-        wrshim_s_axi_gp0 = wrshim.AxiWrshim()
-        wrshim_s_axi_gp1 = wrshim.AxiWrshim()
-        m_axi_gp_global = [
-            axi_global_rec(name="m_axi_gp{}".format(i)) for i in range(2)]
-        self.comb += [i.aclk.eq(ClockSignal()) for i in m_axi_gp_global]
-        s_axi_gp_global = [
-            axi_global_rec(name="s_axi_gp{}".format(i)) for i in range(2)]
-        self.comb += [i.aclk.eq(ClockSignal()) for i in s_axi_gp_global]
-        s_axi_acp_global = axi_global_rec(name="s_axi_acp")
-        self.comb += [s_axi_acp_global.aclk.eq(ClockSignal())]
-        s_axi_hp_global = [
-            axi_global_rec(name="s_axi_hp{}".format(i)) for i in range(4)]
-        self.comb += [i.aclk.eq(ClockSignal()) for i in s_axi_hp_global]
-        dma_global = [
-            dma_global_rec(name="dma{}".format(i)) for i in range(4)]
-        [setattr(self, "dma{}_rst_n".format(i), rec.rst_n)
-         for i, rec in enumerate(dma_global)]
-        self.comb += [i.aclk.eq(ClockSignal()) for i in dma_global]
-
-        self.submodules.enet0 = ClockDomainsRenamer(
-            dict(eth_rx="enet0_rx", eth_tx="enet0_tx"))(
-                ENET(getattr(pads, "enet0", None)))
-        self.submodules.enet1 = ClockDomainsRenamer(
-            dict(eth_rx="enet1_rx", eth_tx="enet1_tx"))(
-                ENET(getattr(pads, "enet1", None)))
+        port_attrs = pipe(
+            [(name, getattr(self, "_" + name.rstrip("0123456789"))(
+                name, name in ports, pads)) for name in PS7_PORTS],
+            groupby(lambda port: port[0] in ports),
+            valmap(comp(R.apply(merge), R.map(second))))
+        # all unused ports in one constant assignment
+        unused_attrs = tie_off(port_attrs.get(False, {}))
 
         ddr_buf, ps_buf = ddr_rec(name="ddr"), ps_rec(name="ps")
         mio_buf = Signal(len(self.mio))
@@ -483,23 +544,23 @@ class PS7(Module):
         self.specials += [bibuf([self.mio[i], mio_buf[i]])
                           for i in range(len(self.mio))]
 
-        self.submodules += [
-            wrshim_s_axi_gp0,
-            InterconnectPointToPoint(self.s_axi_gp0, s_axi_gp0_shim),
-            wrshim_s_axi_gp1,
-            InterconnectPointToPoint(self.s_axi_gp1, s_axi_gp1_shim),
-        ]
-
         self.fclk = fclk_rec()
         # fclk.reset_n considered async
         self.specials += [
             AsyncResetSynchronizer(self.cd_sys, ~self.fclk.reset_n[0]),
             bufg([self.fclk.clk[0], ClockSignal()]),
         ]
+        for i in fclks:
+            cd = getattr(self, "cd_fclk{}".format(i))
+            self.specials += [
+                AsyncResetSynchronizer(cd, ~self.fclk.reset_n[i]),
+                bufg([self.fclk.clk[i], cd.clk]),
+            ]
 
         self.comb += self.fclk.clktrig_n.eq(0)
-        ftmd = ftmd_rec()
-        ftmt = ftmt_rec()
+        # fabric trace and cross triggers, e.g. for `PerfEvents`
+        self.ftmd = ftmd_rec()
+        self.ftmt = ftmt_rec()
         irq = irq_rec()
         self.comb += [
             irq.f2p[: 16].eq(self.interrupt),
@@ -509,96 +570,118 @@ class PS7(Module):
             self.spi.raw_bits().eq(irq.p2f),
         ]
         ps7_attrs = pipe([
-            connect_interface(s_axi_gp_global[0]),
-            connect_s_axi(s_axi_gp0_shim),
-            connect_interface(s_axi_gp_global[1]),
-            connect_s_axi(s_axi_gp1_shim),
-            connect_interface(m_axi_gp_global[0]),
-            connect_m_axi(self.m_axi_gp0),
-            connect_interface(m_axi_gp_global[1]),
-            connect_m_axi(self.m_axi_gp1),
-            connect_interface(s_axi_acp_global),
-            connect_s_axi(self.s_axi_acp),
-            connect_interface(self.s_axi_acp_user),
-            connect_interface(s_axi_hp_global[0]),
-            connect_interface(self.s_axi_hp0, False),
-            connect_interface(self.s_axi_hp0_fifo),
-            connect_interface(s_axi_hp_global[1]),
-            connect_interface(self.s_axi_hp1, False),
-            connect_interface(self.s_axi_hp1_fifo),
-            connect_interface(s_axi_hp_global[2]),
-            connect_interface(self.s_axi_hp2, False),
-            connect_interface(self.s_axi_hp2_fifo),
-            connect_interface(s_axi_hp_global[3]),
-            connect_interface(self.s_axi_hp3, False),
-            connect_interface(self.s_axi_hp3_fifo),
+            port_attrs.get(True, {}),
+            unused_attrs,
             connect_interface(ddr_buf),
             dict(io_MIO=mio_buf),
-            connect_interface(self.ttc0),
-            connect_interface(self.ttc1),
-            connect_interface(self.wdt),
-            connect_interface(self.spi0),
-            connect_interface(self.spi1),
-            connect_interface(self.i2c0),
-            connect_interface(self.i2c1),
-            connect_interface(self.can0),
-            connect_interface(self.can1),
-            connect_interface(self.uart0),
-            connect_interface(self.uart1),
-            connect_interface(self.sdio0),
-            connect_interface(self.sdio1),
-            connect_interface(self.gpio),
-            keymap(str_replace("TRACE", "EMIOTRACE"),
-                   connect_interface(self.trace)),
-            connect_interface(self.pjtag),
-            connect_interface(self.usb0),
-            connect_interface(self.usb1),
-            connect_interface(self.sram),
             connect_interface(self.fclk),
             dict(i_FPGAIDLEN=self.fpga_idle_n),
-            connect_interface(self.event),
             dict(i_DDRARB=self.ddr_arb),
-            connect_interface(ftmd),
-            connect_interface(ftmt),
-            connect_interface(dma_global[0]),
-            connect_interface(self.dma0),
-            connect_interface(dma_global[1]),
-            connect_interface(self.dma1),
-            connect_interface(dma_global[2]),
-            connect_interface(self.dma2),
-            connect_interface(dma_global[3]),
-            connect_interface(self.dma3),
+            connect_interface(self.ftmd),
+            connect_interface(self.ftmt),
             connect_interface(irq),
             dict(io_PSPORB=ps_buf.por_b,
                  io_PSSRSTB=ps_buf.srst_b,
                  io_PSCLK=ps_buf.clk),
-            keymap(str_replace("ENET", "EMIOENET0"),
-                   connect_interface(self.enet0.enet)),
-            keymap(str_replace("ENET", "EMIOENET1"),
-                   connect_interface(self.enet1.enet)),
         ],
             R.apply(merge),
-            keymap(str_replace("TTC", "EMIOTTC")),
-            keymap(str_replace("WDT", "EMIOWDT")),
-            keymap(str_replace("SPI", "EMIOSPI")),
-            keymap(str_replace("I2C", "EMIOI2C")),
-            keymap(str_replace("CAN", "EMIOCAN")),
-            keymap(str_replace("UART", "EMIOUART")),
-            keymap(str_replace("SDIO", "EMIOSDIO")),
-            keymap(str_replace("GPIO", "EMIOGPIO")),
-            keymap(str_replace("PJTAG", "EMIOPJTAG")),
-            keymap(str_replace("USB", "EMIOUSB")),
-            keymap(str_replace("SRAM", "EMIOSRAM")),
-            keymap(str_replace("DDRDRSTN", "DDRDRSTB")),
-            keymap(str_replace("DDRWEN", "DDRWEB")),
-            keymap(str_replace("DDRRASN", "DDRRASB")),
-            keymap(str_replace("DDRCASN", "DDRCASB")),
-            keymap(str_replace("DDRCSN", "DDRCSB")),
-            keymap(str_replace("EMIOSPI0SSTN", "EMIOSPI0SSNTN")),
-            keymap(str_replace("EMIOSPI1SSTN", "EMIOSPI1SSNTN")),
-            keymap(str_replace("EMIOSPI0MTN", "EMIOSPI0MOTN")),
-            keymap(str_replace("EMIOSPI1MTN", "EMIOSPI1MOTN")),
-            keymap(str_replace("EVENTO", "EVENTEVENTO")),
-            keymap(str_replace("EVENTI", "EVENTEVENTI")),
+            keymap(rename_port),
         )
         self.specials += Instance("PS7", **ps7_attrs)
+
+    # Each port method returns the PS7 connections of the port, made
+    # an attribute with its logic if `used`, else the widths of the PS7
+    # ports to tie off, without creating records.
+
+    def _axi_global(self, name, used):
+        if not used:
+            return dict(port_widths(name, layout_of(axi_global_rec), True))
+        glob = axi_global_rec(name=name)
+        self.comb += glob.aclk.eq(ClockSignal())
+        return connect_interface(glob)
+
+    def _m_axi_gp(self, name, used, pads):
+        if not used:
+            return merge(
+                self._axi_global(name, used),
+                port_widths(name, interface_layout(id_width=12), True))
+        bus = Interface(id_width=12, name=name)
+        setattr(self, name, bus)
+        return merge(self._axi_global(name, used), connect_m_axi(bus))
+
+    def _s_axi_gp(self, name, used, pads):
+        if not used:
+            return merge(
+                self._axi_global(name, used),
+                s_axi_widths(name, interface_layout(id_width=6)))
+        bus = Interface(id_width=6, name=name)
+        shim = Interface.like(bus, name)
+        setattr(self, name, bus)
+        self.submodules += [
+            wrshim.AxiWrshim(),
+            InterconnectPointToPoint(bus, shim),
+        ]
+        return merge(self._axi_global(name, used), connect_s_axi(shim))
+
+    def _s_axi_acp(self, name, used, pads):
+        if not used:
+            return merge(
+                self._axi_global(name, used),
+                s_axi_widths(name, interface_layout(64, id_width=3)),
+                port_widths(name, layout_of(acp_user_rec), True))
+        bus = Interface(data_width=64, id_width=3, name=name)
+        user = acp_user_rec(name=name)
+        setattr(self, name, bus)
+        setattr(self, name + "_user", user)
+        return merge(self._axi_global(name, used), connect_s_axi(bus),
+                     connect_interface(user))
+
+    def _s_axi_hp(self, name, used, pads):
+        if not used:
+            return merge(
+                self._axi_global(name, used),
+                port_widths(name, interface_layout(64, id_width=6), False),
+                port_widths(name, layout_of(hp_fifo_rec), True))
+        bus = Interface(data_width=64, addr_width=32, id_width=6, name=name)
+        fifo = hp_fifo_rec(name=name)
+        setattr(self, name, bus)
+        setattr(self, name + "_fifo", fifo)
+        return merge(self._axi_global(name, used),
+                     connect_interface(bus, False), connect_interface(fifo))
+
+    def _dma(self, name, used, pads):
+        if not used:
+            return merge(
+                port_widths(name, layout_of(dma_global_rec), True),
+                port_widths(name, dmac_bus.interface_layout(), True))
+        bus = dmac_bus.Interface(name=name)
+        glob = dma_global_rec(name=name)
+        setattr(self, name, bus)
+        setattr(self, name + "_rst_n", glob.rst_n)
+        self.comb += glob.aclk.eq(ClockSignal())
+        return merge(connect_interface(glob), connect_interface(bus))
+
+    def _enet(self, name, used, pads):
+        if used:
+            enet = ClockDomainsRenamer(
+                dict(eth_rx=name + "_rx", eth_tx=name + "_tx"))(
+                    ENET(getattr(pads, name, None)))
+            setattr(self.submodules, name, enet)
+            ports = connect_interface(enet.enet)
+        else:
+            ports = dict(port_widths("enet", layout_of(enet_rec), True))
+        return keymap(str_replace("ENET", "EMIO" + name.upper()), ports)
+
+    def _emio(self, name, used, pads):
+        if not used:
+            return dict(port_widths(name, layout_of(emio_recs[name]), True))
+        rec = emio_recs[name](name=name)
+        setattr(self, name, rec)
+        return connect_interface(rec)
+
+    _ttc = _wdt = _spi = _i2c = _can = _uart = _sdio = _gpio = _usb = \
+        _sram = _event = _pjtag = _emio
+
+    def _trace(self, name, used, pads):
+        return keymap(str_replace("TRACE", "EMIOTRACE"),
+                      self._emio(name, used, pads))
@@ -0,0 +1,170 @@
+from migen import *  # noqa
+from migen.genlib.fifo import SyncFIFO
+from misoc.interconnect import stream
+from misoc.interconnect.csr import AutoCSR, CSRStatus, CSRStorage
+from misoc.interconnect.csr_eventmanager import (
+    EventManager, EventSourceLevel, EventSourcePulse)
+from ..interconnect.axi_dma import Writer, BURST_LENGTH
+
+
+__all__ = ["RingCapture"]
+
+
+class RingCapture(Module, AutoCSR):
+    """
+    Continuous stream capture into a circular DDR buffer.
+
+    Words are written in bursts of `burst` words to the ring at `_base`,
+    incomplete bursts stay in the input FIFO. `_wr_ptr` only advances
+    once the write response of a burst arrived, so everything in front
+    of it can be read in place, e.g. by a process mapping the buffer.
+    The consumer hands back space by advancing `_rd_ptr`; without space
+    for another burst `sink` is stalled. One burst of the ring is always
+    kept free to tell a full from an empty ring.
+
+    Add the instance to ``SoCCore.interrupt_devices`` to raise its events
+    on ``PS7.interrupt``.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+        Master to the DDR, e.g. an HP port.
+    burst : int, optional
+        Words per DDR burst, at most `BURST_LENGTH`.
+    depth : int, optional
+        Depth of the input FIFO, at least ``2 * burst``.
+
+    Attributes
+    ----------
+    sink : misoc.interconnect.stream.Endpoint
+    ev : misoc.interconnect.csr_eventmanager.EventManager
+        - threshold, level, at least `_threshold` bytes available.
+        - timeout, pulse, bytes available without a new burst for
+          `_timeout` cycles.
+    _enable : misoc.interconnect.csr.CSRStorage
+        Start bursts, once cleared `_wr_ptr` restarts at 0 after the
+        current burst.
+    _base : misoc.interconnect.csr.CSRStorage
+        Start of the ring, `burst` aligned.
+    _size : misoc.interconnect.csr.CSRStorage
+        Size of the ring in bytes, a multiple of the burst size.
+    _rd_ptr : misoc.interconnect.csr.CSRStorage
+        Consumer offset into the ring in bytes.
+    _threshold : misoc.interconnect.csr.CSRStorage
+        Available bytes raising the threshold event, 0 disables.
+    _timeout : misoc.interconnect.csr.CSRStorage
+        Cycles until the timeout event, 0 disables.
+    _wr_ptr : misoc.interconnect.csr.CSRStatus
+        Committed offset into the ring in bytes.
+    _level : misoc.interconnect.csr.CSRStatus
+        Available bytes, from `_rd_ptr` up to `_wr_ptr`.
+    _stalls : misoc.interconnect.csr.CSRStatus
+        Cycles `sink` was stalled on a full ring.
+    """
+    def __init__(self, bus, burst=BURST_LENGTH, depth=None):
+        depth = depth or 2 * burst
+        if burst > BURST_LENGTH:
+            raise ValueError("burst shall be le {}".format(BURST_LENGTH))
+        if depth < 2 * burst:
+            raise ValueError("depth shall be ge 2 * burst")
+        dw = bus.data_width
+        aw_ = len(bus.aw.addr)
+        burst_bytes = burst * dw // 8
+        self.sink = stream.Endpoint([("data", dw)])
+        self._enable = CSRStorage()
+        self._base = CSRStorage(aw_)
+        self._size = CSRStorage(aw_ + 1)
+        self._rd_ptr = CSRStorage(aw_ + 1)
+        self._threshold = CSRStorage(aw_ + 1)
+        self._timeout = CSRStorage(32)
+        self._wr_ptr = CSRStatus(aw_ + 1)
+        self._level = CSRStatus(aw_ + 1)
+        self._stalls = CSRStatus(32)
+        self.submodules.ev = EventManager()
+        self.ev.threshold = EventSourceLevel()
+        self.ev.timeout = EventSourcePulse()
+        self.ev.finalize()
+
+        ###
+
+        self.submodules.writer = writer = Writer(bus, fifo_depth=burst)
+        fifo = SyncFIFO(dw, depth)
+        self.submodules += fifo
+        self.comb += [
+            fifo.din.eq(self.sink.data),
+            fifo.we.eq(self.sink.stb),
+            self.sink.ack.eq(fifo.writable),
+        ]
+        self.sync += If(
+            self.sink.stb & ~self.sink.ack,
+            self._stalls.status.eq(self._stalls.status + 1),
+        )
+
+        wr_ptr = self._wr_ptr.status
+        rd_ptr = self._rd_ptr.storage
+        size = self._size.storage
+        level = self._level.status
+        room = Signal()
+        self.comb += [
+            level.eq(Mux(wr_ptr >= rd_ptr, wr_ptr - rd_ptr,
+                         wr_ptr + size - rd_ptr)),
+            room.eq(level + burst_bytes < size),
+        ]
+
+        committed = Signal()
+        count = Signal(max=burst + 1)
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act(
+            "IDLE",
+            If(
+                ~self._enable.storage,
+                NextValue(wr_ptr, 0),
+            ).Elif(
+                (fifo.level >= burst) & room,
+                NextValue(count, 0),
+                NextState("WRITE"),
+            ),
+        )
+        fsm.act(
+            "WRITE",
+            writer.sink.stb.eq(1),
+            writer.sink.data.eq(fifo.dout),
+            fifo.re.eq(writer.sink.ack),
+            If(
+                writer.sink.ack,
+                NextValue(count, count + 1),
+                If(count == burst - 1, NextState("COMMIT")),
+            ),
+        )
+        # eop completes with the write response
+        fsm.act(
+            "COMMIT",
+            writer.sink.stb.eq(1),
+            writer.sink.eop.eq(1),
+            If(
+                writer.sink.ack,
+                committed.eq(1),
+                NextValue(wr_ptr, Mux(wr_ptr + burst_bytes >= size, 0,
+                                      wr_ptr + burst_bytes)),
+                NextState("IDLE"),
+            ),
+        )
+        self.comb += writer.sink.addr.eq(self._base.storage + wr_ptr)
+
+        # events
+        threshold = self._threshold.storage
+        timeout = self._timeout.storage
+        timer = Signal(32)
+        self.comb += [
+            self.ev.threshold.trigger.eq(
+                (threshold != 0) & (level >= threshold)),
+            self.ev.timeout.trigger.eq(
+                (timeout != 0) & (level != 0) & (timer == timeout - 1)),
+        ]
+        self.sync += If(
+            committed | self._rd_ptr.re | (level == 0),
+            timer.eq(0),
+        ).Elif(
+            timer != timeout,
+            timer.eq(timer + 1),
+        )
@@ -0,0 +1,371 @@
+from migen import *  # noqa
+from migen.genlib.fifo import SyncFIFO
+from migen.genlib.coding import PriorityEncoder
+from misoc.interconnect.csr import AutoCSR, CSR, CSRStatus, CSRStorage
+from ..interconnect.axi import Burst, Response, burst_size
+
+
+__all__ = ["Channel", "trace_layout", "AXITraceCapture"]
+
+
+class Channel:
+    ar = 0
+    aw = 1
+    r = 2
+    b = 3
+
+
+def trace_layout(bus, timestamp_width=16):
+    """Trace entry layout, LSB first."""
+    return [
+        ("timestamp", timestamp_width),
+        ("channel", 2),
+        ("id", len(bus.ar.id)),
+        ("resp", 2),
+        ("len", 8),
+        ("addr", len(bus.ar.addr)),
+    ]
+
+
+class AXITraceCapture(Module, AutoCSR):
+    """
+    AXI transaction trace capture.
+
+    Every AR, AW, last R and B handshake of `bus` is recorded as a
+    `trace_layout` entry: R and B entries carry `resp`, AR and AW entries
+    `addr` and `len`. The timestamp is the free running cycle counter,
+    truncated to `timestamp_width` bits.
+
+    Entries go into an on-chip ring buffer of `depth` entries, read
+    through `_rd_index` and `_rd_data`, or with `dram` given, are written
+    to a ring of `depth` entries at `_dram_base`, each entry padded to a
+    power of 2 of bus words.
+
+    Writing `_arm` restarts capture. `_pre` entries are captured before
+    the trigger is armed, then the trigger condition is evaluated on
+    every entry. The matching entry, at `_trig_ptr`, and `_post` further
+    entries complete the capture. An entry matches if its channel is in
+    `_trig_channels`, ``(id ^ _trig_id) & _trig_id_mask`` and
+    ``(addr ^ _trig_addr) & _trig_addr_mask`` are zero and, with
+    `_trig_error` set, it has an error response. Writing `_trigger`
+    forces the trigger.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+        Interface to tap, left untouched.
+    depth : int, optional
+        Ring buffer entries, a power of 2.
+    dram : migen_axi.interconnect.axi.Interface, optional
+        Master to write the ring buffer to, e.g. an HP port.
+    timestamp_width : int, optional
+    fifo_depth : int, optional
+        Cycles with handshakes buffered before the ring buffer and, with
+        `dram`, entries buffered for the writer.
+
+    Attributes
+    ----------
+    _wr_ptr : misoc.interconnect.csr.CSRStatus
+        Index of the next entry to write.
+    _count : misoc.interconnect.csr.CSRStatus
+        Entries written since `_arm`, the oldest valid one is at
+        ``_wr_ptr - min(_count, depth)``.
+    _dropped : misoc.interconnect.csr.CSRStatus
+        Entries lost to back-pressure while capturing.
+    """
+    def __init__(self, bus, depth=1024, dram=None, timestamp_width=16,
+                 fifo_depth=4):
+        log2_int(depth, need_pow2=True)
+        layout = trace_layout(bus, timestamp_width)
+        ptr_bits = log2_int(depth)
+        self._arm = CSR()
+        self._trigger = CSR()
+        self._channels = CSRStorage(4, reset=0xf)
+        self._pre = CSRStorage(ptr_bits + 1)
+        self._post = CSRStorage(ptr_bits + 1)
+        self._trig_channels = CSRStorage(4)
+        self._trig_id = CSRStorage(len(bus.ar.id))
+        self._trig_id_mask = CSRStorage(len(bus.ar.id))
+        self._trig_addr = CSRStorage(len(bus.ar.addr))
+        self._trig_addr_mask = CSRStorage(len(bus.ar.addr))
+        self._trig_error = CSRStorage()
+        self._armed = CSRStatus()
+        self._triggered = CSRStatus()
+        self._done = CSRStatus()
+        self._trig_ptr = CSRStatus(ptr_bits)
+        self._wr_ptr = CSRStatus(ptr_bits)
+        self._count = CSRStatus(32)
+        self._dropped = CSRStatus(32)
+        if dram is None:
+            self._rd_index = CSRStorage(ptr_bits)
+            self._rd_data = CSRStatus(layout_len(layout))
+        else:
+            self._dram_base = CSRStorage(len(dram.aw.addr))
+
+        ###
+
+        timestamp = Signal(timestamp_width)
+        self.sync += timestamp.eq(timestamp + 1)
+
+        # handshakes of one cycle are queued together, then committed one
+        # by one, which keeps entries in timestamp order
+        ar, r, aw, b = bus.ar, bus.r, bus.aw, bus.b
+        sources = [
+            (Channel.ar, ar.valid & ar.ready, ar.id, 0, ar.len, ar.addr),
+            (Channel.aw, aw.valid & aw.ready, aw.id, 0, aw.len, aw.addr),
+            (Channel.r, r.valid & r.ready & r.last, r.id, r.resp, 0, 0),
+            (Channel.b, b.valid & b.ready, b.id, b.resp, 0, 0),
+        ]
+        capturing = Signal()
+        stbs = Signal(len(sources))
+        entries = []
+        for channel, stb, id_, resp, len_, addr in sources:
+            entry = Record(layout)
+            self.comb += [
+                stbs[channel].eq(stb & self._channels.storage[channel]),
+                entry.timestamp.eq(timestamp),
+                entry.channel.eq(channel),
+                entry.id.eq(id_),
+                entry.resp.eq(resp),
+                entry.len.eq(len_),
+                entry.addr.eq(addr),
+            ]
+            entries.append(entry)
+        entry_bits = layout_len(layout)
+        fifo = ResetInserter()(SyncFIFO(
+            len(stbs) + len(entries) * entry_bits, fifo_depth))
+        self.submodules += fifo
+        dropped = Signal(32)
+        self.comb += [
+            fifo.reset.eq(self._arm.re),
+            fifo.din.eq(Cat(stbs, *[e.raw_bits() for e in entries])),
+            fifo.we.eq(capturing & (stbs != 0)),
+        ]
+        self.sync += [
+            If(
+                self._arm.re,
+                dropped.eq(0),
+            ).Elif(
+                fifo.we & ~fifo.writable,
+                dropped.eq(dropped + sum(stbs[i] for i in range(len(stbs)))),
+            ),
+        ]
+        done = Signal(len(stbs))
+        pending = Signal(len(stbs))
+        select = PriorityEncoder(len(stbs))
+        self.submodules += select
+        entry = Record(layout)
+        commit = Signal()
+        ready = Signal()
+        self.comb += [
+            pending.eq(fifo.dout[:len(stbs)] & ~done),
+            select.i.eq(pending),
+            entry.raw_bits().eq(Array(
+                fifo.dout[len(stbs) + i * entry_bits:
+                          len(stbs) + (i + 1) * entry_bits]
+                for i in range(len(entries)))[select.o]),
+            commit.eq(fifo.readable & ready & capturing),
+            # last pending entry of the cycle
+            fifo.re.eq(commit & (pending == (1 << select.o))),
+        ]
+        self.sync += [
+            If(
+                fifo.re | self._arm.re,
+                done.eq(0),
+            ).Elif(
+                commit,
+                done.eq(done | (1 << select.o)),
+            ),
+        ]
+
+        # trigger
+        match = Signal()
+        self.comb += match.eq(
+            (self._trig_channels.storage >> entry.channel)[0] &
+            (((entry.id ^ self._trig_id.storage) &
+              self._trig_id_mask.storage) == 0) &
+            (((entry.addr ^ self._trig_addr.storage) &
+              self._trig_addr_mask.storage) == 0) &
+            (~self._trig_error.storage |
+             (((entry.channel == Channel.r) | (entry.channel == Channel.b)) &
+              (entry.resp != Response.okay))))
+
+        wr_ptr = Signal(ptr_bits)
+        count = Signal(32)
+        remaining = Signal.like(self._post.storage)
+        flushed = Signal()
+        self.sync += [
+            If(
+                self._arm.re,
+                wr_ptr.eq(0),
+                count.eq(0),
+            ).Elif(
+                commit,
+                wr_ptr.eq(wr_ptr + 1),
+                If(count != 2**32 - 1, count.eq(count + 1)),
+            ),
+        ]
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act(
+            "IDLE",
+            If(self._arm.re, NextState("PRE")),
+        )
+        fsm.act(
+            "PRE",
+            capturing.eq(1),
+            If(
+                self._arm.re,
+                NextState("PRE"),
+            ).Elif(
+                count >= self._pre.storage,
+                NextState("ARMED"),
+            ),
+        )
+        fsm.act(
+            "ARMED",
+            capturing.eq(1),
+            self._armed.status.eq(1),
+            If(
+                self._arm.re,
+                NextState("PRE"),
+            ).Elif(
+                self._trigger.re | (commit & match),
+                NextValue(self._trig_ptr.status, wr_ptr),
+                NextValue(remaining, self._post.storage),
+                NextState("POST"),
+            ),
+        )
+        fsm.act(
+            "POST",
+            capturing.eq(remaining != 0),
+            self._triggered.status.eq(1),
+            If(
+                self._arm.re,
+                NextState("PRE"),
+            ).Elif(
+                remaining == 0,
+                NextState("DONE"),
+            ).Elif(
+                commit,
+                NextValue(remaining, remaining - 1),
+            ),
+        )
+        fsm.act(
+            "DONE",
+            self._triggered.status.eq(1),
+            self._done.status.eq(flushed),
+            If(self._arm.re, NextState("PRE")),
+        )
+        self.comb += [
+            self._wr_ptr.status.eq(wr_ptr),
+            self._count.status.eq(count),
+            self._dropped.status.eq(dropped),
+        ]
+
+        if dram is None:
+            self.comb += [
+                ready.eq(1),
+                flushed.eq(1),
+            ]
+            mem = Memory(len(entry), depth)
+            wport = mem.get_port(write_capable=True)
+            rport = mem.get_port()
+            self.specials += mem, wport, rport
+            self.comb += [
+                wport.adr.eq(wr_ptr),
+                wport.dat_w.eq(entry.raw_bits()),
+                wport.we.eq(commit),
+                rport.adr.eq(self._rd_index.storage),
+                self._rd_data.status.eq(rport.dat_r),
+            ]
+        else:
+            self.submodules.writer = _EntryWriter(
+                dram, len(entry), depth, self._dram_base.storage, fifo_depth)
+            self.comb += [
+                self.writer.index.eq(wr_ptr),
+                self.writer.din.eq(entry.raw_bits()),
+                self.writer.we.eq(commit),
+                ready.eq(self.writer.writable),
+                flushed.eq(self.writer.idle),
+            ]
+
+
+class _EntryWriter(Module):
+    """
+    Write entries to `base` + `index` times the padded entry size, one
+    burst each.
+    """
+    def __init__(self, bus, width, depth, base, fifo_depth):
+        self.index = Signal(log2_int(depth))
+        self.din = Signal(width)
+        self.we = Signal()
+        self.writable = Signal()
+        self.idle = Signal()
+
+        ###
+
+        dw = bus.data_width
+        words = 1 << log2_int((width + dw - 1) // dw, need_pow2=False)
+        fifo = SyncFIFO(len(self.index) + width, fifo_depth)
+        self.submodules += fifo
+        self.comb += [
+            fifo.din.eq(Cat(self.index, self.din)),
+            fifo.we.eq(self.we),
+            self.writable.eq(fifo.writable),
+        ]
+
+        aw, w, b = bus.aw, bus.w, bus.b
+        ptr = Signal(len(self.index))
+        beat = Signal(max=max(2, words))
+        padded = Signal(words * dw)
+        self.comb += [
+            ptr.eq(fifo.dout[:len(ptr)]),
+            padded.eq(fifo.dout[len(ptr):]),
+            aw.id.eq(0),
+            aw.addr.eq(base + (ptr << log2_int(words * dw // 8))),
+            aw.len.eq(words - 1),
+            aw.size.eq(burst_size(dw // 8)),
+            aw.burst.eq(Burst.incr),
+            aw.cache.eq(0b0011),
+            w.id.eq(0),
+            w.data.eq(Array(padded[i * dw:(i + 1) * dw]
+                            for i in range(words))[beat]),
+            w.strb.eq(2**(dw // 8) - 1),
+            w.last.eq(beat == words - 1),
+        ]
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act(
+            "IDLE",
+            self.idle.eq(~fifo.readable),
+            If(
+                fifo.readable,
+                NextState("AW"),
+            ),
+        )
+        fsm.act(
+            "AW",
+            aw.valid.eq(1),
+            If(
+                aw.ready,
+                NextValue(beat, 0),
+                NextState("W"),
+            ),
+        )
+        fsm.act(
+            "W",
+            w.valid.eq(1),
+            If(
+                w.ready,
+                NextValue(beat, beat + 1),
+                If(w.last, NextState("B")),
+            ),
+        )
+        fsm.act(
+            "B",
+            b.ready.eq(1),
+            If(
+                b.valid,
+                fifo.re.eq(1),
+                NextState("IDLE"),
+            ),
+        )
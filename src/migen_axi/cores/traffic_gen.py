@@ -0,0 +1,264 @@
+from migen import *  # noqa
+from migen.genlib.fifo import SyncFIFO
+from misoc.interconnect.csr import AutoCSR, CSR, CSRStatus, CSRStorage
+from ..interconnect.axi import Burst, Response
+
+
+__all__ = ["Pattern", "AXITrafficGen"]
+
+
+class Pattern:
+    sequential = 0
+    strided = 1
+    random = 2
+
+
+class AXITrafficGen(Module, AutoCSR):
+    """
+    CSR-programmable AXI traffic generator.
+
+    Issues `_count` transactions (0 runs until `_stop`) of ``_len + 1``
+    beats of ``2**_size`` bytes each, at most `_outstanding` at a time,
+    clamped to `max_outstanding`, and one every `_period` cycles (0 is
+    unlimited). `_stop` lets an address already presented complete its
+    handshake. A transaction is a write
+    with probability ``_write_ratio / 256``. Addresses are
+    ``_base + (offset & _mask)``, the offset follows `_pattern`:
+
+    - `Pattern.sequential`, advance by the burst size
+    - `Pattern.strided`, advance by `_stride`
+    - `Pattern.random`, LFSR seeded by `_seed`, burst aligned
+
+    The achieved bandwidth is ``(_rd_beats + _wr_beats) * 2**_size /
+    _cycles`` bytes per cycle. The average latency, from Little's law, is
+    ``_rd_lat_sum / _rd_bursts`` and ``_wr_lat_sum / _wr_bursts``.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+        Master interface.
+    max_outstanding : int, optional
+        Upper bound of `_outstanding`.
+    """
+    def __init__(self, bus, max_outstanding=16):
+        dw = bus.data_width
+        aw_, ar_ = len(bus.aw.addr), len(bus.ar.addr)
+        self._start = CSR()
+        self._stop = CSR()
+        self._pattern = CSRStorage(2)
+        self._base = CSRStorage(ar_)
+        self._mask = CSRStorage(ar_, reset=2**ar_ - 1)
+        self._stride = CSRStorage(ar_)
+        self._seed = CSRStorage(32, reset=1)
+        self._write_ratio = CSRStorage(9)
+        self._len = CSRStorage(8)
+        self._size = CSRStorage(3, reset=log2_int(dw // 8))
+        self._outstanding = CSRStorage(
+            bits_for(max_outstanding), reset=max_outstanding)
+        self._period = CSRStorage(16)
+        self._count = CSRStorage(32)
+        self._busy = CSRStatus()
+
+        ###
+
+        ar, r, aw, w, b = (getattr(bus, name)
+                           for name in ("ar", "r", "aw", "w", "b"))
+        busy = Signal()
+        issuing = Signal()
+        self.comb += self._busy.status.eq(busy)
+
+        # address generation
+        lfsr = Signal(32, reset=1)
+        offset = Signal(ar_)
+        addr = Signal(ar_)
+        size = self._size.storage
+        len_ = self._len.storage
+        burst_bytes = Signal(12)
+        align_bits = Signal(5)
+        self.comb += [
+            burst_bytes.eq((len_ + 1) << size),
+            align_bits.eq(size),
+            [If(len_[i], align_bits.eq(size + i + 1)) for i in range(8)],
+            addr.eq(self._base.storage + (offset & self._mask.storage)),
+        ]
+        issued = Signal()
+        self.sync += [
+            If(
+                self._start.re,
+                lfsr.eq(self._seed.storage),
+            ).Elif(
+                issued,
+                lfsr.eq(Mux(lfsr[0], (lfsr >> 1) ^ 0x80200003, lfsr >> 1)),
+            ),
+            If(
+                self._start.re,
+                offset.eq(0),
+            ).Elif(
+                issued,
+                Case(self._pattern.storage, {
+                    Pattern.sequential: offset.eq(offset + burst_bytes),
+                    Pattern.strided: offset.eq(offset + self._stride.storage),
+                    "default": offset.eq(
+                        lfsr & ~((C(1, ar_) << align_bits) - 1)),
+                }),
+            ),
+        ]
+
+        # issue control
+        rd_outstanding = Signal(max=max_outstanding + 1)
+        wr_outstanding = Signal(max=max_outstanding + 1)
+        remaining = Signal(32)
+        unlimited = Signal()
+        timer = Signal(16)
+        is_write = Signal()
+        limit = Signal.like(self._outstanding.storage)
+        # an address presented is held until its handshake
+        held = Signal()
+        held_write = Signal()
+        self.comb += [
+            limit.eq(Mux(self._outstanding.storage > max_outstanding,
+                         max_outstanding, self._outstanding.storage)),
+            is_write.eq(Mux(held, held_write,
+                            lfsr[:8] < self._write_ratio.storage)),
+            issuing.eq(held | (
+                busy & (unlimited | (remaining != 0)) & (timer == 0) &
+                (rd_outstanding + wr_outstanding < limit))),
+            ar.valid.eq(issuing & ~is_write),
+            aw.valid.eq(issuing & is_write),
+            issued.eq((ar.valid & ar.ready) | (aw.valid & aw.ready)),
+        ]
+        for a in (ar, aw):
+            self.comb += [
+                a.id.eq(0),
+                a.addr.eq(addr),
+                a.len.eq(len_),
+                a.size.eq(size),
+                a.burst.eq(Burst.incr),
+            ]
+        self.sync += [
+            If(
+                self._start.re,
+                busy.eq(1),
+                unlimited.eq(self._count.storage == 0),
+                remaining.eq(self._count.storage),
+            ).Elif(
+                self._stop.re,
+                unlimited.eq(0),
+                remaining.eq(0),
+            ).Elif(
+                issued & ~unlimited & (remaining != 0),
+                remaining.eq(remaining - 1),
+            ),
+            held.eq(issuing & ~issued),
+            held_write.eq(is_write),
+            If(
+                issued,
+                timer.eq(Mux(self._period.storage == 0, 0,
+                             self._period.storage - 1)),
+            ).Elif(
+                timer != 0,
+                timer.eq(timer - 1),
+            ),
+        ]
+
+        # w channel, beats follow aw in order
+        wfifo = SyncFIFO(aw_, max_outstanding)
+        self.submodules += wfifo
+        beat = Signal(8)
+        beat_addr = Signal(aw_)
+        lane = Signal(log2_int(dw // 8) or 1)
+        self.comb += [
+            wfifo.din.eq(addr),
+            wfifo.we.eq(aw.valid & aw.ready),
+            beat_addr.eq(Mux(
+                beat == 0, wfifo.dout,
+                (wfifo.dout & ~((C(1, aw_) << size) - 1)) + (beat << size))),
+            lane.eq(beat_addr),
+            w.valid.eq(wfifo.readable),
+            w.id.eq(0),
+            w.data.eq(Replicate(Cat(beat, wfifo.dout[:24]), dw // 32 or 1)),
+            w.strb.eq(Array(
+                C(2**min(2**i, dw // 8) - 1, dw // 8) for i in range(8)
+            )[size] << lane),
+            w.last.eq(beat == len_),
+            wfifo.re.eq(w.valid & w.ready & w.last),
+        ]
+        self.sync += If(
+            w.valid & w.ready,
+            beat.eq(Mux(w.last, 0, beat + 1)),
+        )
+
+        # responses
+        cycles = Signal(32)
+        rd_beats = Signal(32)
+        wr_beats = Signal(32)
+        rd_bursts = Signal(32)
+        wr_bursts = Signal(32)
+        rd_lat_sum = Signal(48)
+        wr_lat_sum = Signal(48)
+        errors = Signal(32)
+        rd_done = Signal()
+        wr_done = Signal()
+        self.comb += [
+            r.ready.eq(1),
+            b.ready.eq(1),
+            rd_done.eq(r.valid & r.last),
+            wr_done.eq(b.valid),
+        ]
+        self.sync += [
+            If(
+                ar.valid & ar.ready & ~rd_done,
+                rd_outstanding.eq(rd_outstanding + 1),
+            ).Elif(
+                rd_done & ~(ar.valid & ar.ready),
+                rd_outstanding.eq(rd_outstanding - 1),
+            ),
+            If(
+                aw.valid & aw.ready & ~wr_done,
+                wr_outstanding.eq(wr_outstanding + 1),
+            ).Elif(
+                wr_done & ~(aw.valid & aw.ready),
+                wr_outstanding.eq(wr_outstanding - 1),
+            ),
+            If(
+                self._start.re,
+                cycles.eq(0),
+                rd_beats.eq(0),
+                wr_beats.eq(0),
+                rd_bursts.eq(0),
+                wr_bursts.eq(0),
+                rd_lat_sum.eq(0),
+                wr_lat_sum.eq(0),
+                errors.eq(0),
+            ).Elif(
+                busy,
+                cycles.eq(cycles + 1),
+                rd_lat_sum.eq(rd_lat_sum + rd_outstanding),
+                wr_lat_sum.eq(wr_lat_sum + wr_outstanding),
+                If(r.valid, rd_beats.eq(rd_beats + 1)),
+                If(w.valid & w.ready, wr_beats.eq(wr_beats + 1)),
+                If(rd_done, rd_bursts.eq(rd_bursts + 1)),
+                If(wr_done, wr_bursts.eq(wr_bursts + 1)),
+                If(
+                    (r.valid & (r.resp != Response.okay)) |
+                    (b.valid & (b.resp != Response.okay)),
+                    errors.eq(errors + 1),
+                ),
+                # all issued transactions completed
+                If(
+                    ~unlimited & (remaining == 0) & ~issuing &
+                    (rd_outstanding == 0) & (wr_outstanding == 0),
+                    busy.eq(0),
+                ),
+            ),
+        ]
+
+        for name, value in [
+                ("cycles", cycles),
+                ("rd_beats", rd_beats), ("wr_beats", wr_beats),
+                ("rd_bursts", rd_bursts), ("wr_bursts", wr_bursts),
+                ("rd_lat_sum", rd_lat_sum), ("wr_lat_sum", wr_lat_sum),
+                ("errors", errors)]:
+            csr = CSRStatus(len(value), name=name)
+            setattr(self, "_" + name, csr)
+            self.comb += csr.status.eq(value)
@@ -0,0 +1,178 @@
+from migen import *  # noqa
+from migen.genlib.fifo import SyncFIFO
+from misoc.interconnect import stream
+from misoc.interconnect.csr import AutoCSR, CSRStatus, CSRStorage
+from ..interconnect.axi_dma import Reader, Writer, BURST_LENGTH
+
+
+__all__ = ["VirtualFIFO"]
+
+
+class VirtualFIFO(Module, AutoCSR):
+    """
+    Deep stream FIFO spilling into a DDR region.
+
+    Words pass from the input to the output FIFO directly while nothing
+    is held in DDR. Once the output FIFO backs up, bursts of `burst`
+    words from the input FIFO are written to the ring at `_base` by a
+    `Writer` and read back in order by a `Reader` as the output FIFO
+    drains. A burst counts as stored once its write response arrived.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+        Master to the DDR, e.g. an HP port.
+    burst : int, optional
+        Words per DDR burst, at most `BURST_LENGTH`.
+    depth : int, optional
+        Depth of the on-chip input and output FIFO, at least ``2 * burst``.
+
+    Attributes
+    ----------
+    _base : misoc.interconnect.csr.CSRStorage
+        Start of the DDR region, `burst` aligned.
+    _size : misoc.interconnect.csr.CSRStorage
+        Size of the DDR region in bytes, a multiple of the burst size.
+    _level : misoc.interconnect.csr.CSRStatus
+        Words held in DDR.
+    _level_max : misoc.interconnect.csr.CSRStatus
+        Highest `_level` seen.
+    """
+    def __init__(self, bus, burst=BURST_LENGTH, depth=64):
+        if burst > BURST_LENGTH:
+            raise ValueError("burst shall be le {}".format(BURST_LENGTH))
+        if depth < 2 * burst:
+            raise ValueError("depth shall be ge 2 * burst")
+        dw = bus.data_width
+        aw_ = len(bus.aw.addr)
+        burst_bytes = burst * dw // 8
+        self.sink = stream.Endpoint([("data", dw)])
+        self.source = stream.Endpoint([("data", dw)])
+        self._base = CSRStorage(aw_)
+        self._size = CSRStorage(aw_ + 1)
+        self._level = CSRStatus(aw_)
+        self._level_max = CSRStatus(aw_)
+
+        ###
+
+        self.submodules.writer = writer = Writer(bus, fifo_depth=burst)
+        self.submodules.reader = reader = Reader(bus, fifo_depth=burst)
+        ififo = SyncFIFO(dw, depth)
+        ofifo = SyncFIFO(dw, depth)
+        self.submodules += ififo, ofifo
+        self.comb += [
+            ififo.din.eq(self.sink.data),
+            ififo.we.eq(self.sink.stb),
+            self.sink.ack.eq(ififo.writable),
+            self.source.data.eq(ofifo.dout),
+            self.source.stb.eq(ofifo.readable),
+            ofifo.re.eq(self.source.ack),
+        ]
+
+        # words in ddr, bursts are stored after b and reserved on read
+        level = Signal(aw_)
+        stored = Signal()
+        reserved = Signal()
+        wr_ptr = Signal(aw_ + 1)
+        rd_ptr = Signal(aw_ + 1)
+        # words requested from the reader, not yet in the output fifo
+        pending = Signal(max=depth + 1)
+        ddr_empty = Signal()
+        writing = Signal()
+        size_words = Signal(aw_)
+        self.comb += size_words.eq(self._size.storage[log2_int(dw // 8):])
+        self.sync += [
+            If(
+                stored & ~reserved,
+                level.eq(level + burst),
+            ).Elif(
+                reserved & ~stored,
+                level.eq(level - burst),
+            ),
+            If(
+                level > self._level_max.status,
+                self._level_max.status.eq(level),
+            ),
+        ]
+        self.comb += [
+            self._level.status.eq(level),
+            ddr_empty.eq((level == 0) & (pending == 0) & ~writing),
+        ]
+
+        def advance(ptr):
+            return Mux(ptr + burst_bytes >= self._size.storage, 0,
+                       ptr + burst_bytes)
+
+        # input side
+        count = Signal(max=burst + 1)
+        self.submodules.wfsm = wfsm = FSM(reset_state="IDLE")
+        wfsm.act(
+            "IDLE",
+            If(
+                ddr_empty & ofifo.writable,
+                # bypass
+                ofifo.din.eq(ififo.dout),
+                ofifo.we.eq(ififo.readable),
+                ififo.re.eq(1),
+            ).Elif(
+                (ififo.level >= burst) &
+                (level + pending + burst <= size_words),
+                NextValue(count, 0),
+                NextState("WRITE"),
+            ),
+        )
+        wfsm.act(
+            "WRITE",
+            writing.eq(1),
+            writer.sink.stb.eq(1),
+            writer.sink.data.eq(ififo.dout),
+            ififo.re.eq(writer.sink.ack),
+            If(
+                writer.sink.ack,
+                NextValue(count, count + 1),
+                If(count == burst - 1, NextState("COMMIT")),
+            ),
+        )
+        # eop completes with the write response
+        wfsm.act(
+            "COMMIT",
+            writing.eq(1),
+            writer.sink.stb.eq(1),
+            writer.sink.eop.eq(1),
+            If(
+                writer.sink.ack,
+                stored.eq(1),
+                NextValue(wr_ptr, advance(wr_ptr)),
+                NextState("IDLE"),
+            ),
+        )
+        self.comb += writer.sink.addr.eq(self._base.storage + wr_ptr)
+
+        # output side
+        self.comb += [
+            reader.sink.addr.eq(self._base.storage + rd_ptr),
+            reader.sink.n.eq(burst),
+            reader.sink.eop.eq(1),
+            reader.sink.stb.eq(
+                (level != 0) & (ofifo.level + pending + burst <= depth)),
+            reserved.eq(reader.sink.stb & reader.sink.ack),
+            reader.source.ack.eq(1),
+            If(
+                reader.source.stb,
+                ofifo.din.eq(reader.source.data),
+                ofifo.we.eq(1),
+            ),
+        ]
+        self.sync += [
+            If(
+                reserved,
+                rd_ptr.eq(advance(rd_ptr)),
+            ),
+            If(
+                reserved,
+                pending.eq(pending + burst - reader.source.stb),
+            ).Elif(
+                reader.source.stb,
+                pending.eq(pending - 1),
+            ),
+        ]
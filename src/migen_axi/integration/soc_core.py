@@ -4,7 +4,7 @@ from misoc.cores import identifier
 from misoc.integration.wb_slaves import WishboneSlaveManager as SlaveManager
 from misoc.interconnect import csr_bus
 from ..interconnect import axi, axi2csr
-from ..cores import ps7
+from ..cores import irq_coalescer, ps7
 
 
 def interrupt2irq_id(idx):
@@ -24,8 +24,14 @@ class SoCCore(Module):
                  csr_data_width=8,
                  csr_address_width=14,
                  max_addr=0xc0000000,
-                 ident="SoCCore"):
+                 ident="SoCCore",
+                 irq_coalescing=False,
+                 fclks=None,
+                 ps7_cls=ps7.PS7):
         self.platform = platform
+        self.irq_coalescing = irq_coalescing
+        # FCLK index: frequency in Hz, of the cd_fclk<index> domains
+        fclks = fclks or {}
         # self.clk_freq = clk_freq
 
         self.csr_data_width = csr_data_width
@@ -42,10 +48,14 @@ class SoCCore(Module):
         ]
         self.interrupt_devices = []
 
-        self.submodules.ps7 = ps7.PS7(SimpleNamespace(
+        # PS7 or a stand-in taking its arguments, e.g. `sim.PS7Sim`
+        self.submodules.ps7 = ps7_cls(pads=SimpleNamespace(
             ps=platform.request("ps"),
             ddr=platform.request("ddr"),
-        ))
+        ), fclks=list(fclks))
+        for i, freq in fclks.items():
+            platform.add_period_constraint(
+                getattr(self.ps7, "cd_fclk{}".format(i)).clk, 1e9 / freq)
 
         self.submodules.axi2csr = axi2csr.AXI2CSR(
             bus_csr=csr_bus.Interface(csr_data_width, csr_address_width),
@@ -101,6 +111,16 @@ class SoCCore(Module):
             return None
 
     def do_finalize(self):
+        evs = [getattr(self, name).ev for name in self.interrupt_devices]
+        irqs = [ev.irq for ev in evs]
+        if self.irq_coalescing and irqs:
+            strobes = [irq_coalescer.EventStrobe(ev) for ev in evs]
+            self.submodules += strobes
+            self.submodules.irq_coalescer = irq_coalescer.IRQCoalescer(
+                irqs, [strobe.o for strobe in strobes])
+            self.csr_devices.append("irq_coalescer")
+            irqs = list(self.irq_coalescer.irq)
+
         # CSR
         self.submodules.csrbankarray = csr_bus.CSRBankArray(
             self, self.get_csr_dev_address,
@@ -125,8 +145,8 @@ class SoCCore(Module):
                   constant.value.value)))
 
         # Interrupts
-        for n, name in enumerate(self.interrupt_devices):
-            self.comb += self.ps7.interrupt[n].eq(getattr(self, name).ev.irq)
+        for n, irq in enumerate(irqs):
+            self.comb += self.ps7.interrupt[n].eq(irq)
 
         # AXI: FIXME: add InterconnectShared support
         slaves = self._axi_slaves.get_interconnect_slaves()
@@ -1,5 +1,14 @@
 from .axi import *  # noqa
 from .axi2csr import *  # noqa
 from .axi_dma import *  # noqa
+from .id_remap import *  # noqa
+from .write_combiner import *  # noqa
+from .read_cache import *  # noqa
+from .axis_switch import *  # noqa
+from .gearbox import *  # noqa
+from .hp_throttle import *  # noqa
+from .hp_striper import *  # noqa
+from .acp import *  # noqa
 from . import dmac_bus  # noqa
 from . import stream2axi  # noqa
+from . import axis  # noqa
@@ -0,0 +1,139 @@
+from migen import *  # noqa
+from misoc.interconnect import stream
+from .axi import Burst, Interface, Incr, burst_size, rec_layout
+from .id_remap import AXIIdRemap
+
+
+__all__ = ["ACPAdapter", "LineFill"]
+
+
+# AxCACHE write-back, read and write allocate
+ACP_CACHE = 0b1111
+# AxUSER[0] shared, AxUSER[4:1] inner write-back, write allocate
+ACP_USER = 0b11111
+
+
+class ACPAdapter(Module):
+    """
+    Master to the PS7 ACP, coherent with the Cortex-A9 caches.
+
+    Every transaction is issued with the coherent `cache` and `user`
+    attributes, so it is snooped by the SCU and may hit in L1 or L2.
+    Master IDs wider than the 3 bit ACP ID are remapped with
+    `AXIIdRemap`.
+
+    Parameters
+    ----------
+    master : migen_axi.interconnect.axi.Interface
+        64 bit fabric master, e.g. a `LineFill` bus.
+    slave : migen_axi.interconnect.axi.Interface
+        ``PS7.s_axi_acp``.
+    user : migen.Record
+        ``PS7.s_axi_acp_user``.
+    cache : int, optional
+        AxCACHE of all transactions.
+    aruser : int, optional
+    awuser : int, optional
+    """
+    def __init__(self, master, slave, user, cache=ACP_CACHE,
+                 aruser=ACP_USER, awuser=ACP_USER):
+        if master.data_width != slave.data_width:
+            raise ValueError("master.data_width shall be eq {}".format(
+                slave.data_width))
+
+        ###
+
+        if master.id_width > slave.id_width:
+            narrow = Interface(master.data_width, master.addr_width,
+                               slave.id_width)
+            self.submodules.id_remap = AXIIdRemap(master, narrow)
+        else:
+            narrow = master
+        self.comb += [
+            narrow.ar.connect(slave.ar, omit={"cache"}),
+            narrow.aw.connect(slave.aw, omit={"cache"}),
+            narrow.w.connect(slave.w),
+            narrow.r.connect(slave.r),
+            narrow.b.connect(slave.b),
+            slave.ar.cache.eq(cache),
+            slave.aw.cache.eq(cache),
+            user.aruser.eq(aruser),
+            user.awuser.eq(awuser),
+        ]
+
+
+class LineFill(Module):
+    """
+    Critical word first cache line reads.
+
+    A request on `sink` reads the line holding ``addr`` with one WRAP
+    burst starting at the requested word. The words are passed to
+    `source` as they arrive, each with its address from `Incr`, `eop`
+    with the last one. One fill is outstanding at a time.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+    line_bytes : int, optional
+        Line size, 2, 4, 8 or 16 bus words. The Cortex-A9 line is 32
+        bytes, the only WRAP burst the ACP accepts.
+    id_ : int, optional
+        Read ID.
+
+    Attributes
+    ----------
+    sink : misoc.interconnect.stream.Endpoint
+        ``addr``, of the critical word.
+    source : misoc.interconnect.stream.Endpoint
+        ``addr``, ``data`` and ``resp`` per word.
+    """
+    def __init__(self, bus, line_bytes=32, id_=0):
+        ar, r = bus.ar, bus.r
+        dw = bus.data_width
+        n_beats = line_bytes // (dw // 8)
+        if n_beats not in (2, 4, 8, 16):
+            raise ValueError("line_bytes shall be 2, 4, 8 or 16 bus words")
+        self.sink = sink = stream.Endpoint(rec_layout(ar, {"addr"}))
+        self.source = source = stream.Endpoint(
+            rec_layout(ar, {"addr"}) + rec_layout(r, {"data", "resp"}))
+
+        ###
+
+        beat = Record(rec_layout(ar, {"addr", "len", "size", "burst"}))
+        self.submodules.incr = incr = Incr(beat, dw)
+        alignment_bits = log2_int(dw // 8)
+        self.comb += [
+            ar.id.eq(id_),
+            ar.addr.eq(Cat(C(0, alignment_bits), sink.addr[alignment_bits:])),
+            ar.len.eq(n_beats - 1),
+            ar.size.eq(burst_size(dw // 8)),
+            ar.burst.eq(Burst.wrap),
+            beat.len.eq(ar.len),
+            beat.size.eq(ar.size),
+            beat.burst.eq(ar.burst),
+            source.addr.eq(beat.addr),
+            source.data.eq(r.data),
+            source.resp.eq(r.resp),
+            source.eop.eq(r.last),
+        ]
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act(
+            "IDLE",
+            ar.valid.eq(sink.stb),
+            sink.ack.eq(ar.ready),
+            If(
+                ar.valid & ar.ready,
+                NextValue(beat.addr, ar.addr),
+                NextState("READ"),
+            ),
+        )
+        fsm.act(
+            "READ",
+            source.stb.eq(r.valid),
+            r.ready.eq(source.ack),
+            If(
+                r.valid & r.ready,
+                NextValue(beat.addr, incr.addr),
+                If(r.last, NextState("IDLE")),
+            ),
+        )
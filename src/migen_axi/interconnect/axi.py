@@ -11,7 +11,7 @@ from migen.genlib.record import set_layout_parameters
 from misoc.interconnect import stream
 
 __all__ = ["Burst", "Alock", "Response",
-           "burst_size", "rec_layout",
+           "burst_size", "rec_layout", "interface_layout",
            "connect_sink_hdshk", "connect_source_hdshk",
            "Interface", "InterconnectPointToPoint", "Incr"]
 
@@ -133,15 +133,19 @@ def read_attrs(ch):
     return ns
 
 
+def interface_layout(data_width=32, addr_width=32, id_width=12):
+    return set_layout_parameters(
+        _layout, data_width=data_width, addr_width=addr_width,
+        wstrb_width=data_width // 8, id_width=id_width)
+
+
 class Interface(Record):
     def __init__(self, data_width=32, addr_width=32, id_width=12, name=None):
         self.addr_width = addr_width
         self.data_width = data_width
         self.id_width = id_width
         super().__init__(
-            set_layout_parameters(
-                _layout, data_width=data_width, addr_width=addr_width,
-                wstrb_width=data_width // 8, id_width=id_width), name=name)
+            interface_layout(data_width, addr_width, id_width), name=name)
 
     @staticmethod
     def like(other, name=None):
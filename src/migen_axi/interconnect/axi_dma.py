@@ -1,12 +1,15 @@
 import operator
 from toolz.curried import *  # noqa
 from migen import *  # noqa
+from migen.genlib.fifo import SyncFIFO
+from migen.genlib.roundrobin import RoundRobin, SP_CE
 from misoc.interconnect import stream
 import ramda as R
 from .axi import rec_layout, Burst, connect_source_hdshk, burst_size
+from .gearbox import Gearbox
 
 
-__all__ = ["Reader", "Writer"]
+__all__ = ["Reader", "Writer", "DuplexDMA", "MultiChannelReader"]
 
 
 BURST_LENGTH = 16
@@ -43,10 +46,10 @@ class Countdown(Module):
         self.done = Signal()
         self.we = Signal()
         self.count_w = Signal(bits_for(t))
+        self.count = count = Signal(bits_for(t))
 
         ###
 
-        count = Signal(bits_for(t))
         self.comb += self.done.eq(count == 0)
         self.sync += [
             If(
@@ -75,13 +78,13 @@ class Reader(Module):
         dw = bus.data_width
         alignment_bits = bits_for(dw // 8) - 1
         if nbits_source:
-            if nbits_source % 8:
-                raise ValueError("nbits_source must be a multiple of 8")
-            if nbits_source > dw:
-                raise ValueError("nbits_source must be <= bus.data_width")
+            if nbits_source > dw and nbits_source % dw:
+                raise ValueError(
+                    "nbits_source must be <= bus.data_width or a multiple "
+                    "of it")
         nbits_source = nbits_source or dw
         counter_bits = bits_for(
-            (2**len(bus.ar.addr) - 1) // (nbits_source // 8))
+            (2**len(bus.ar.addr) - 1) // max(1, nbits_source // 8))
         self.sink = stream.Endpoint(
             pipe(
                 rec_layout(ar, {"addr"}),
@@ -113,12 +116,17 @@ class Reader(Module):
                 eop_consumed.eq(1)
             )
         ]
-        converter = stream.Converter(dw, nbits_source)
+        if nbits_source < dw and dw % nbits_source:
+            # densely packed, e.g. 12 bit samples in 32 bit words
+            converter = Gearbox(dw, nbits_source)
+        else:
+            # wider sources gather consecutive words
+            converter = stream.Converter(dw, nbits_source)
         self.submodules += converter
         self.comb += [
             converter.source.ack.eq(self.source.ack | eop_consumed),
             self.source.stb.eq(converter.source.stb & ~eop_consumed),
-            self.source.eop.eq(remaining.done),
+            self.source.eop.eq(converter.source.eop),
             self.source.data.eq(converter.source.data),
         ]
         fifo_depth = min(fifo_depth or BURST_LENGTH, BURST_LENGTH)
@@ -132,14 +140,25 @@ class Reader(Module):
         self.sync += burst_done.eq(r.valid & r.ready & r.last)
         # ar channel
         ar_acked = Signal(reset=1)
-        sink_acked = Signal()
+        # a request is taken once the previous one left, with the words
+        # of its last burst beyond the eop
+        busy = Signal()
+        bursting = Signal()
         self.sync += [
+            If(
+                ar.valid & ar.ready,
+                bursting.eq(1)
+            ).Elif(
+                r.valid & r.ready & r.last,
+                bursting.eq(0)
+            ),
             If(
                 sink_consume,
-                sink_acked.eq(1)
+                busy.eq(1)
             ).Elif(
-                remaining.done,
-                sink_acked.eq(0)
+                eop_consumed & ~bursting & ~rfifo.source.stb &
+                ~converter.source.stb,
+                busy.eq(0)
             )
         ]
 
@@ -161,7 +180,7 @@ class Reader(Module):
             ),
         ]
         self.comb += [
-            self.sink.ack.eq(~sink_acked & remaining.done),
+            self.sink.ack.eq(~busy),
             ar.len.eq(fifo_depth - 1),
             ar.size.eq(burst_size(dw // 8)),
             ar.burst.eq(Burst.incr),
@@ -172,41 +191,85 @@ class Reader(Module):
         self.comb += [
             remaining.ce.eq(rfifo.sink.stb & rfifo.sink.ack),
             rfifo.sink.data.eq(r.data),
+            # eop of the last word passes the converter, words beyond
+            # are dropped after it
+            rfifo.sink.eop.eq(remaining.count <= 1),
             rfifo.sink.stb.eq(r.valid),
             r.ready.eq(rfifo.sink.ack),
         ]
 
 
 class Writer(Module):
-    def __init__(self, bus, fifo_depth=None):
+    def __init__(self, bus, fifo_depth=None, nbits_sink=None):
         aw, w, b = operator.attrgetter("aw", "w", "b")(bus)
+        dw = bus.data_width
+        nbits_sink = nbits_sink or dw
+        if nbits_sink % dw:
+            raise ValueError(
+                "nbits_sink must be a multiple of bus.data_width")
         self.sink = stream.Endpoint(
-            rec_layout(aw, {"addr"}) + rec_layout(w, {"data"}))
+            rec_layout(aw, {"addr"}) + [("data", nbits_sink)])
 
         ###
 
-        dw = bus.data_width
+        if nbits_sink == dw:
+            sink = self.sink
+        else:
+            # split into consecutive words, eop carries no data
+            sink = stream.Endpoint(
+                rec_layout(aw, {"addr"}) + rec_layout(w, {"data"}))
+            ratio = nbits_sink // dw
+            index = Signal(max=ratio)
+            last = Signal()
+            self.comb += [
+                last.eq(self.sink.eop | (index == ratio - 1)),
+                sink.stb.eq(self.sink.stb),
+                sink.eop.eq(self.sink.eop),
+                sink.addr.eq(self.sink.addr),
+                sink.data.eq(Array(
+                    self.sink.data[i * dw:(i + 1) * dw]
+                    for i in range(ratio))[index]),
+                self.sink.ack.eq(sink.ack & last),
+            ]
+            self.sync += If(
+                sink.stb & sink.ack,
+                index.eq(Mux(last, 0, index + 1)),
+            )
         alignment_bits = bits_for(dw // 8) - 1
         fifo_depth = min(fifo_depth or BURST_LENGTH, BURST_LENGTH)
         self.submodules.burst_cnt = Counter(fifo_depth - 1)
         sink_consume = Signal()
-        self.comb += sink_consume.eq(self.sink.stb & self.sink.ack)
+        self.comb += sink_consume.eq(sink.stb & sink.ack)
         sof = Signal(reset=1)
-        # aw channel
+        # aw channel, one burst at a time, issued once its data is queued
         aw_acked = Signal()
+        aw_consume = Signal()
+        burst_start = Signal()
+        # bursts without aw, W may be taken ahead
+        pending = Signal(8)
+        self.comb += [
+            aw_consume.eq(aw.valid & aw.ready),
+            burst_start.eq(self.burst_cnt.ce & ~self.burst_cnt.running),
+        ]
         self.sync += [
             If(
                 sink_consume,
-                sof.eq(self.sink.eop),
-                If(
-                    sof,
-                    aw.addr[alignment_bits:].eq(
-                        self.sink.addr[alignment_bits:])
-                ).Elif(
-                    self.burst_cnt.done & aw_acked,
-                    aw.addr.eq(aw.addr + fifo_depth * dw // 8)
-                )
-            )
+                sof.eq(sink.eop),
+            ),
+            If(
+                sink_consume & sof,
+                aw.addr[alignment_bits:].eq(sink.addr[alignment_bits:])
+            ).Elif(
+                aw_consume,
+                aw.addr.eq(aw.addr + fifo_depth * dw // 8)
+            ),
+            If(
+                burst_start & ~aw_consume,
+                pending.eq(pending + 1)
+            ).Elif(
+                aw_consume & ~burst_start,
+                pending.eq(pending - 1)
+            ),
         ]
         self.comb += [
             aw.len.eq(fifo_depth - 1),
@@ -215,10 +278,10 @@ class Writer(Module):
         ]
         self.sync += [
             If(
-                aw.valid & aw.ready,
+                aw_consume,
                 aw.valid.eq(0), aw_acked.eq(1)
             ).Elif(
-                sink_consume & ~aw_acked,
+                ~aw_acked & (pending != 0),
                 aw.valid.eq(1)
             )
         ]
@@ -227,23 +290,27 @@ class Writer(Module):
         self.submodules += wfifo
         self.comb += [
             If(
-                self.sink.eop,
+                sink.eop,
+                # write response of the last burst, or at once if it came
+                # before eop
                 If(
-                    b.valid & b.ready,
-                    self.sink.ack.eq(1)
+                    (pending == 0) &
+                    (b.valid & b.ready |
+                     ~aw_acked & ~aw.valid & ~self.burst_cnt.running),
+                    sink.ack.eq(1)
                 )
             ).Else(
-                self.sink.ack.eq(wfifo.sink.ack)
+                sink.ack.eq(wfifo.sink.ack)
             )
         ]
         self.comb += [
             wfifo.sink.stb.eq(
-                self.sink.stb &
-                (~self.sink.eop |
-                 (self.sink.eop & self.burst_cnt.running))),
+                sink.stb &
+                (~sink.eop |
+                 (sink.eop & self.burst_cnt.running))),
             self.burst_cnt.ce.eq(wfifo.sink.stb & wfifo.sink.ack),
             wfifo.sink.eop.eq(self.burst_cnt.done),
-            wfifo.sink.data.eq(self.sink.data),
+            wfifo.sink.data.eq(sink.data),
         ]
         self.comb += [
             w.data.eq(wfifo.source.data),
@@ -261,3 +328,169 @@ class Writer(Module):
                 b.ready.eq(1)
             )
         ]
+
+
+class DuplexDMA(Module):
+    """
+    `Reader` and `Writer` sharing one interface.
+
+    The `Reader` only drives AR and R, the `Writer` only AW, W and B, so
+    both run concurrently on the same port, e.g. a HP port for a loopback
+    accelerator.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+    fifo_depth : int, optional
+        Of both, see `Reader` and `Writer`.
+    nbits_source : int, optional
+        See `Reader`.
+    nbits_sink : int, optional
+        See `Writer`.
+    read_id : int, optional
+        ID of the reads.
+    write_id : int, optional
+        ID of the writes.
+
+    Attributes
+    ----------
+    reader : Reader
+    writer : Writer
+    request : misoc.interconnect.stream.Endpoint
+        Read requests, `Reader.sink`.
+    source : misoc.interconnect.stream.Endpoint
+        Read data, `Reader.source`.
+    sink : misoc.interconnect.stream.Endpoint
+        Write address and data, `Writer.sink`.
+    """
+    def __init__(self, bus, fifo_depth=None, nbits_source=None,
+                 nbits_sink=None, read_id=0, write_id=0):
+        self.submodules.reader = Reader(bus, nbits_source, fifo_depth)
+        self.submodules.writer = Writer(bus, fifo_depth, nbits_sink)
+        self.request = self.reader.sink
+        self.source = self.reader.source
+        self.sink = self.writer.sink
+
+        ###
+
+        self.comb += [
+            bus.ar.id.eq(read_id),
+            bus.aw.id.eq(write_id),
+            bus.w.id.eq(write_id),
+        ]
+
+
+class MultiChannelReader(Module):
+    """
+    `Reader` for several channels sharing one interface.
+
+    Each channel takes requests of ``n`` words from ``addr`` on its sink
+    and reads them in bursts of up to `burst` words, issued round robin
+    with the channel index as ID. R data is routed by ID into the output
+    FIFO of the channel, `eop` with the last word of a request. A burst
+    is only issued while the FIFO has room for all of its words, so
+    reads are always accepted and a stalled source never holds up the
+    other channels.
+
+    Requests shall be burst aligned, a new request is accepted once all
+    words of the previous one arrived.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+    n_channels : int
+        At most ``2**bus.id_width``.
+    burst : int, optional
+        At most `BURST_LENGTH`.
+    fifo_depth : int, optional
+        Words per channel, at least `burst`.
+
+    Attributes
+    ----------
+    sinks : list of misoc.interconnect.stream.Endpoint
+        ``addr`` and ``n`` per request.
+    sources : list of misoc.interconnect.stream.Endpoint
+        ``data`` per word.
+    """
+    def __init__(self, bus, n_channels, burst=BURST_LENGTH, fifo_depth=None):
+        ar, r = operator.attrgetter("ar", "r")(bus)
+        dw = bus.data_width
+        fifo_depth = fifo_depth or 2 * burst
+        if n_channels > 2**bus.id_width:
+            raise ValueError("n_channels shall be le 2**bus.id_width")
+        if burst > BURST_LENGTH:
+            raise ValueError("burst shall be le {}".format(BURST_LENGTH))
+        if fifo_depth < burst:
+            raise ValueError("fifo_depth shall be ge burst")
+        counter_bits = bits_for((2**len(ar.addr) - 1) // (dw // 8))
+        self.sinks = [
+            stream.Endpoint(
+                rec_layout(ar, {"addr"}) + [("n", counter_bits)])
+            for _ in range(n_channels)]
+        self.sources = [stream.Endpoint(rec_layout(r, {"data"}))
+                        for _ in range(n_channels)]
+
+        ###
+
+        self.submodules.rr = rr = RoundRobin(n_channels, SP_CE)
+        addrs, beats = [], []
+        ar_consume = Signal()
+        self.comb += [
+            ar_consume.eq(ar.valid & ar.ready),
+            rr.ce.eq(~ar.valid | ar.ready),
+        ]
+        for i, (sink, source) in enumerate(zip(self.sinks, self.sources)):
+            fifo = SyncFIFO(dw + 1, fifo_depth)
+            self.submodules += fifo
+            addr = Signal.like(ar.addr)
+            # words to request, resp. to receive
+            remaining = Signal(counter_bits)
+            receiving = Signal(counter_bits)
+            n_beats = Signal(max=burst + 1)
+            inflight = Signal(max=fifo_depth + 1)
+            issued = Signal()
+            received = Signal()
+            self.comb += [
+                n_beats.eq(Mux(remaining < burst, remaining, burst)),
+                rr.request[i].eq(
+                    (remaining != 0) &
+                    (fifo.level + inflight + n_beats <= fifo_depth)),
+                issued.eq(ar_consume & (rr.grant == i)),
+                received.eq(r.valid & (r.id == i)),
+                sink.ack.eq(receiving == 0),
+                fifo.din.eq(Cat(r.data, receiving == 1)),
+                fifo.we.eq(received),
+                source.stb.eq(fifo.readable),
+                Cat(source.data, source.eop).eq(fifo.dout),
+                fifo.re.eq(source.ack),
+            ]
+            self.sync += [
+                If(
+                    sink.stb & sink.ack,
+                    addr.eq(sink.addr),
+                    remaining.eq(sink.n),
+                    receiving.eq(sink.n),
+                ).Else(
+                    If(
+                        issued,
+                        addr.eq(addr + n_beats * (dw // 8)),
+                        remaining.eq(remaining - n_beats),
+                    ),
+                    If(
+                        received,
+                        receiving.eq(receiving - 1),
+                    ),
+                ),
+                inflight.eq(inflight + Mux(issued, n_beats, 0) - received),
+            ]
+            addrs.append(addr)
+            beats.append(n_beats)
+        self.comb += [
+            ar.valid.eq((rr.request >> rr.grant)[0]),
+            ar.id.eq(rr.grant),
+            ar.addr.eq(Array(addrs)[rr.grant]),
+            ar.len.eq(Array(beats)[rr.grant] - 1),
+            ar.size.eq(burst_size(dw // 8)),
+            ar.burst.eq(Burst.incr),
+            r.ready.eq(1),
+        ]
@@ -0,0 +1,254 @@
+from types import SimpleNamespace
+from migen import *  # noqa
+from migen.genlib.record import set_layout_parameters
+from misoc.interconnect import stream
+
+
+__all__ = ["Interface", "StreamToAXIS", "AXISToStream", "Converter"]
+
+
+_layout = [
+    ("data", "data_width", DIR_M_TO_S),  # TDATA
+    ("keep", "keep_width", DIR_M_TO_S),  # TKEEP, data or position byte
+    ("strb", "keep_width", DIR_M_TO_S),  # TSTRB, data byte
+    ("last", 1, DIR_M_TO_S),  # TLAST
+    ("id", "id_width", DIR_M_TO_S),  # TID
+    ("dest", "dest_width", DIR_M_TO_S),  # TDEST
+    ("user", "user_width", DIR_M_TO_S),  # TUSER
+    ("valid", 1, DIR_M_TO_S),  # TVALID
+    ("ready", 1, DIR_S_TO_M),  # TREADY
+]
+
+
+class Interface(Record):
+    """
+    AXI4-Stream interface, signals named without the ``T`` prefix.
+
+    Migen has no zero width signals, unused `id`, `dest` and `user` are
+    one bit wide and shall be tied to 0.
+    """
+    def __init__(self, data_width=32, id_width=1, dest_width=1,
+                 user_width=1, name=None):
+        self.data_width = data_width
+        self.id_width = id_width
+        self.dest_width = dest_width
+        self.user_width = user_width
+        super().__init__(
+            set_layout_parameters(
+                _layout, data_width=data_width, keep_width=data_width // 8,
+                id_width=id_width, dest_width=dest_width,
+                user_width=user_width), name=name)
+
+    @staticmethod
+    def like(other, name=None):
+        return Interface(other.data_width, other.id_width, other.dest_width,
+                         other.user_width, name=name)
+
+    def write(self, data, last=0, keep=None, id_=0, dest=0, user=0):
+        yield self.data.eq(data)
+        yield self.keep.eq(2**len(self.keep) - 1 if keep is None else keep)
+        yield self.strb.eq(2**len(self.strb) - 1 if keep is None else keep)
+        yield self.last.eq(last)
+        yield self.id.eq(id_)
+        yield self.dest.eq(dest)
+        yield self.user.eq(user)
+        yield self.valid.eq(1)
+        yield
+        while (yield self.ready) == 0:
+            yield
+        yield self.valid.eq(0)
+
+    def read(self):
+        yield self.ready.eq(1)
+        yield
+        while (yield self.valid) == 0:
+            yield
+        beat = SimpleNamespace()
+        for name in ("data", "keep", "strb", "last", "id", "dest", "user"):
+            setattr(beat, name, (yield getattr(self, name)))
+        yield self.ready.eq(0)
+        return beat
+
+
+def _data_width(layout):
+    return dict((name, width) for name, width, *_ in layout)["data"]
+
+
+class StreamToAXIS(Module):
+    """
+    misoc stream to AXI4-Stream, without latency.
+
+    Payload fields of `layout` named like an `Interface` signal are
+    forwarded, `eop` drives `last`. Without a ``keep`` field all bytes
+    are kept, without a ``strb`` field it follows `keep`.
+
+    Parameters
+    ----------
+    layout : list
+        Payload layout of `sink`, with a ``data`` field.
+    **kwargs
+        Passed to `Interface`.
+    """
+    def __init__(self, layout, **kwargs):
+        self.sink = sink = stream.Endpoint(layout)
+        self.source = source = Interface(_data_width(layout), **kwargs)
+
+        ###
+
+        fields = [name for name, *_ in layout]
+        self.comb += [
+            source.valid.eq(sink.stb),
+            sink.ack.eq(source.ready),
+            source.last.eq(sink.eop),
+            source.keep.eq(
+                sink.keep if "keep" in fields else 2**len(source.keep) - 1),
+            source.strb.eq(sink.strb if "strb" in fields else source.keep),
+            [getattr(source, name).eq(getattr(sink, name))
+             for name in ("data", "id", "dest", "user") if name in fields],
+        ]
+
+
+class AXISToStream(Module):
+    """
+    AXI4-Stream to misoc stream, without latency.
+
+    Payload fields of `layout` are driven by the `Interface` signal of
+    the same name, `last` drives `eop`. Other signals are dropped.
+
+    Parameters
+    ----------
+    layout : list
+        Payload layout of `source`, with a ``data`` field.
+    **kwargs
+        Passed to `Interface`.
+    """
+    def __init__(self, layout, **kwargs):
+        self.sink = sink = Interface(_data_width(layout), **kwargs)
+        self.source = source = stream.Endpoint(layout)
+
+        ###
+
+        self.comb += [
+            source.stb.eq(sink.valid),
+            sink.ready.eq(source.ack),
+            source.eop.eq(sink.last),
+            [getattr(source, name).eq(getattr(sink, name))
+             for name, *_ in layout],
+        ]
+
+
+class Converter(Module):
+    """
+    AXI4-Stream data width converter, integer ratios only.
+
+    Upsizing packs `ratio` input beats into one output beat, a `last`
+    input beat ends the output beat early with the remaining bytes not
+    kept. Downsizing splits an input beat into `ratio` output beats,
+    trailing beats without kept bytes of a `last` input beat are
+    dropped. Both sustain one input, resp. output, beat per cycle.
+    `id`, `dest` and `user` are taken from the last input beat.
+
+    Parameters
+    ----------
+    sink_width : int
+    source_width : int
+    **kwargs
+        Passed to `Interface`.
+    """
+    def __init__(self, sink_width, source_width, **kwargs):
+        self.sink = sink = Interface(sink_width, **kwargs)
+        self.source = source = Interface(source_width, **kwargs)
+
+        ###
+
+        if sink_width == source_width:
+            self.comb += sink.connect(source)
+        elif source_width > sink_width:
+            if source_width % sink_width:
+                raise ValueError(
+                    "source_width shall be a multiple of sink_width")
+            self._upsize(source_width // sink_width)
+        else:
+            if sink_width % source_width:
+                raise ValueError(
+                    "sink_width shall be a multiple of source_width")
+            self._downsize(sink_width // source_width)
+
+    def _upsize(self, ratio):
+        sink, source = self.sink, self.source
+        nbytes = len(sink.keep)
+        index = Signal(max=ratio)
+        done = Signal()
+        self.comb += [
+            sink.ready.eq(~source.valid | source.ready),
+            done.eq(sink.last | (index == ratio - 1)),
+        ]
+        cases = {}
+        for i in range(ratio):
+            lane = slice(i * nbytes, (i + 1) * nbytes)
+            cases[i] = [
+                source.data[i * len(sink.data):(i + 1) * len(sink.data)].eq(
+                    sink.data),
+                source.keep[lane].eq(sink.keep),
+                source.strb[lane].eq(sink.strb),
+            ]
+            if i == 0:
+                # first beat, clear lanes of the previous output beat
+                cases[i] += [
+                    source.keep[nbytes:].eq(0),
+                    source.strb[nbytes:].eq(0),
+                ]
+        self.sync += [
+            If(
+                sink.valid & sink.ready,
+                Case(index, cases),
+                source.last.eq(sink.last),
+                source.id.eq(sink.id),
+                source.dest.eq(sink.dest),
+                source.user.eq(sink.user),
+                If(
+                    done,
+                    index.eq(0),
+                    source.valid.eq(1),
+                ).Else(
+                    index.eq(index + 1),
+                    source.valid.eq(0),
+                ),
+            ).Elif(
+                source.ready,
+                source.valid.eq(0),
+            ),
+        ]
+
+    def _downsize(self, ratio):
+        sink, source = self.sink, self.source
+        nbytes = len(source.keep)
+        index = Signal(max=ratio)
+        done = Signal()
+        # no bytes kept beyond the current beat
+        tail_empty = Signal()
+        self.comb += [
+            tail_empty.eq(Array(
+                sink.keep[(i + 1) * nbytes:] == 0 if i < ratio - 1 else C(1)
+                for i in range(ratio))[index]),
+            done.eq((index == ratio - 1) | (sink.last & tail_empty)),
+            source.valid.eq(sink.valid),
+            sink.ready.eq(source.ready & done),
+            source.data.eq(Array(
+                sink.data[i * len(source.data):(i + 1) * len(source.data)]
+                for i in range(ratio))[index]),
+            source.keep.eq(Array(
+                sink.keep[i * nbytes:(i + 1) * nbytes]
+                for i in range(ratio))[index]),
+            source.strb.eq(Array(
+                sink.strb[i * nbytes:(i + 1) * nbytes]
+                for i in range(ratio))[index]),
+            source.last.eq(sink.last & done),
+            source.id.eq(sink.id),
+            source.dest.eq(sink.dest),
+            source.user.eq(sink.user),
+        ]
+        self.sync += If(
+            source.valid & source.ready,
+            index.eq(Mux(done, 0, index + 1)),
+        )
@@ -0,0 +1,114 @@
+from functools import reduce
+from operator import or_
+from migen import *  # noqa
+from .axis import Interface
+
+
+__all__ = ["AXISSwitch"]
+
+
+class _Arbiter(Module):
+    """
+    Packet arbiter of one output, the grant is combinatorial while idle so
+    packets can follow back to back. It is locked from the first cycle its
+    output is valid, so it holds while the output is stalled.
+    """
+    def __init__(self, requests, policy):
+        n = len(requests)
+        self.grant = Signal(max=max(2, n))
+        self.valid = Signal()
+        self.locked = Signal()
+        self.lock = Signal()
+        self.release = Signal()
+
+        ###
+
+        grant = Signal.like(self.grant)
+        last = Signal.like(self.grant, reset=n - 1)
+        select = Signal.like(self.grant)
+        any_request = Signal()
+        cases = {}
+        for prev in range(n):
+            if policy == "round_robin":
+                order = [(prev + 1 + k) % n for k in range(n)]
+            else:
+                order = list(range(n))
+            stmt = If(requests[order[-1]], select.eq(order[-1]))
+            for i in reversed(order[:-1]):
+                stmt = If(requests[i], select.eq(i)).Else(stmt)
+            cases[prev] = stmt
+        self.comb += [
+            any_request.eq(Cat(*requests) != 0),
+            Case(last, cases),
+            self.grant.eq(Mux(self.locked, grant, select)),
+            self.valid.eq(self.locked | any_request),
+        ]
+        self.sync += [
+            If(
+                self.release,
+                self.locked.eq(0),
+                last.eq(self.grant),
+            ).Elif(
+                self.lock,
+                self.locked.eq(1),
+                grant.eq(select),
+            ),
+        ]
+
+
+class AXISSwitch(Module):
+    """
+    AXI4-Stream switch routing packets by `dest`.
+
+    A packet on ``sinks[i]`` with `dest` ``j`` goes to ``sources[j]``,
+    packets to a nonexistent output are dropped. Each output forwards
+    whole packets of one input at a time, arbitrated per packet, and
+    starts a new packet in the cycle after the last beat of the previous
+    one, without register stages.
+
+    Parameters
+    ----------
+    n_sinks : int
+        Number of inputs, slave ports.
+    n_sources : int
+        Number of outputs, master ports.
+    data_width : int, optional
+    arbitration : str, optional
+        ``"round_robin"``, or ``"priority"`` with ``sinks[0]`` highest.
+    **kwargs
+        Passed to `Interface`, `dest_width` defaults to the minimum.
+    """
+    def __init__(self, n_sinks, n_sources, data_width=32,
+                 arbitration="round_robin", **kwargs):
+        if arbitration not in ("round_robin", "priority"):
+            raise ValueError("unknown arbitration {}".format(arbitration))
+        kwargs.setdefault("dest_width", bits_for(max(1, n_sources - 1)))
+        self.sinks = [Interface(data_width, **kwargs)
+                      for _ in range(n_sinks)]
+        self.sources = [Interface(data_width, **kwargs)
+                        for _ in range(n_sources)]
+
+        ###
+
+        payload = ("data", "keep", "strb", "last", "id", "dest", "user")
+        readies = [[] for _ in self.sinks]
+        for j, source in enumerate(self.sources):
+            requests = [sink.valid & (sink.dest == j) for sink in self.sinks]
+            arbiter = _Arbiter(requests, arbitration)
+            self.submodules += arbiter
+            self.comb += [
+                Cat(*[getattr(source, name) for name in payload]).eq(
+                    Array(Cat(*[getattr(sink, name) for name in payload])
+                          for sink in self.sinks)[arbiter.grant]),
+                source.valid.eq(arbiter.valid & Array(
+                    requests)[arbiter.grant]),
+                arbiter.lock.eq(~arbiter.locked & source.valid),
+                arbiter.release.eq(
+                    source.valid & source.ready & source.last),
+            ]
+            for i, ready in enumerate(readies):
+                ready.append(requests[i] & (arbiter.grant == i) &
+                             source.ready)
+        for sink, ready in zip(self.sinks, readies):
+            self.comb += sink.ready.eq(
+                reduce(or_, ready, 0) | (sink.dest >= len(self.sources)))
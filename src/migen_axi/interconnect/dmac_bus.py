@@ -2,7 +2,8 @@ from enum import IntEnum
 from migen import Record, DIR_S_TO_M, DIR_M_TO_S, Module
 from .axi import write_ack, read_attrs
 
-__all__ = ["Type", "Interface", "InterconnectPointToPoint"]
+__all__ = ["Type", "interface_layout", "Interface",
+           "InterconnectPointToPoint"]
 
 Type = IntEnum("Type", "single burst flush reserved", start=0)
 
@@ -24,9 +25,13 @@ _layout = [
 ]
 
 
+def interface_layout():
+    return _layout
+
+
 class Interface(Record):
     def __init__(self, name=None):
-        super().__init__(_layout, name=name)
+        super().__init__(interface_layout(), name=name)
 
     def write_da(self, type_):
         yield self.da.type.eq(type_)
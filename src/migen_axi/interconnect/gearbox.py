@@ -0,0 +1,85 @@
+from migen import *  # noqa
+from misoc.interconnect import stream
+
+
+__all__ = ["Gearbox"]
+
+
+class Gearbox(Module):
+    """
+    Stream width converter for any ratio, e.g. 12 or 24 bit samples into
+    32 or 64 bit words and back, without padding in between.
+
+    Bits are packed LSB first. At the end of a packet, `eop`, the
+    remaining bits are either padded with zeros to a final `source` word,
+    or dropped as padding of the last `sink` word.
+
+    `Reader` unpacks with a gearbox when `nbits_source` does not divide
+    the bus width, for `Writer` pack in front of its sink.
+
+    Parameters
+    ----------
+    sink_width : int
+    source_width : int
+    pad : bool, optional
+        Pad instead of drop, by default when `sink_width` is narrower.
+    """
+    def __init__(self, sink_width, source_width, pad=None):
+        self.sink = sink = stream.Endpoint([("data", sink_width)])
+        self.source = source = stream.Endpoint([("data", source_width)])
+
+        ###
+
+        if pad is None:
+            pad = sink_width < source_width
+        width = sink_width + source_width
+        buf = Signal(width)
+        level = Signal(max=width + 1)
+        flush = Signal()
+        out = Signal()
+        inp = Signal()
+        level_out = Signal.like(level)
+        buf_out = Signal.like(buf)
+        if pad:
+            self.comb += [
+                source.stb.eq(
+                    (level >= source_width) | (flush & (level != 0))),
+                source.eop.eq(flush & (level <= source_width)),
+            ]
+        else:
+            self.comb += [
+                source.stb.eq(level >= source_width),
+                source.eop.eq(flush & (level < 2 * source_width)),
+            ]
+        self.comb += [
+            source.data.eq(buf),
+            out.eq(source.stb & source.ack),
+            level_out.eq(Mux(out, level - source_width, level)),
+            buf_out.eq(Mux(out, buf >> source_width, buf)),
+            # room for a word, counting the one leaving
+            sink.ack.eq(~flush & (level_out <= source_width)),
+            inp.eq(sink.stb & sink.ack),
+        ]
+        self.sync += [
+            If(
+                out & source.eop,
+                buf.eq(0),
+                level.eq(0),
+                flush.eq(0),
+            ).Elif(
+                inp,
+                buf.eq(buf_out | (sink.data << level_out)),
+                level.eq(level_out + sink_width),
+                flush.eq(sink.eop),
+            ).Else(
+                buf.eq(buf_out),
+                level.eq(level_out),
+                # eop word without a full word left
+                If(
+                    flush & ~source.stb,
+                    buf.eq(0),
+                    level.eq(0),
+                    flush.eq(0),
+                ),
+            ),
+        ]
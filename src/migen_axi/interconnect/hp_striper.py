@@ -0,0 +1,117 @@
+from functools import reduce
+from operator import and_
+from migen import *  # noqa
+from migen.genlib.fifo import SyncFIFO
+
+
+__all__ = ["HPStriper"]
+
+
+class HPStriper(Module):
+    """
+    Interleave one master across several slave ports by address, e.g.
+    the four PS7 HP ports into the same DDR.
+
+    Consecutive blocks of `granularity` bytes go to consecutive ports,
+    addresses are passed unchanged. A burst is routed by its start
+    address and shall not cross a block. Responses are returned in the
+    order the requests were accepted, buffering in the port while an
+    earlier port is behind, W beats follow their AW to the same port.
+    Each port takes at most `max_outstanding` reads and writes, a request
+    to a saturated port waits instead of overtaking.
+
+    Parameters
+    ----------
+    master : migen_axi.interconnect.axi.Interface
+    slaves : list of migen_axi.interconnect.axi.Interface
+        A power of 2 ports of the master's data width.
+    granularity : int, optional
+        Interleave block in bytes, a power of 2 and at least the largest
+        burst.
+    max_outstanding : int, optional
+        Transactions per port and direction.
+    """
+    def __init__(self, master, slaves, granularity=128, max_outstanding=4):
+        n = len(slaves)
+        if n < 2:
+            raise ValueError("slaves shall be ge 2")
+        shift = log2_int(granularity)
+        sel_bits = log2_int(n)
+        depth = n * max_outstanding
+
+        ###
+
+        for channel in ("ar", "aw"):
+            self._issue(master, slaves, channel, shift, sel_bits, depth,
+                        max_outstanding)
+
+    def _issue(self, master, slaves, channel, shift, sel_bits, depth,
+               max_outstanding):
+        n = len(slaves)
+        m = getattr(master, channel)
+        sel = Signal(sel_bits)
+        self.comb += sel.eq(m.addr[shift:shift + sel_bits])
+
+        # port order of responses, for writes also of W beats
+        order = SyncFIFO(sel_bits, depth)
+        fifos = [order]
+        if channel == "aw":
+            w_order = SyncFIFO(sel_bits, depth)
+            fifos.append(w_order)
+        self.submodules += fifos
+        room = Signal(n)
+        writable = Signal()
+        issue = Signal()
+        self.comb += [
+            writable.eq(reduce(and_, [fifo.writable for fifo in fifos])),
+            m.ready.eq(Array(getattr(s, channel).ready for s in slaves)[sel] &
+                       writable & Array(room)[sel]),
+            issue.eq(m.valid & m.ready),
+            [fifo.din.eq(sel) for fifo in fifos],
+            [fifo.we.eq(issue) for fifo in fifos],
+        ]
+
+        rsp = "r" if channel == "ar" else "b"
+        mr = getattr(master, rsp)
+
+        def done(ch):
+            return ch.valid & ch.ready & (ch.last if rsp == "r" else 1)
+
+        self.comb += [
+            If(
+                order.readable,
+                Case(order.dout, {i: mr.connect(getattr(s, rsp))
+                                  for i, s in enumerate(slaves)}),
+            ),
+            order.re.eq(done(mr)),
+        ]
+        if channel == "aw":
+            self.comb += [
+                If(
+                    w_order.readable,
+                    Case(w_order.dout, {i: master.w.connect(s.w)
+                                        for i, s in enumerate(slaves)}),
+                ),
+                w_order.re.eq(master.w.valid & master.w.ready &
+                              master.w.last),
+            ]
+
+        for i, s in enumerate(slaves):
+            ch = getattr(s, channel)
+            outstanding = Signal(max=max_outstanding + 1)
+            issued = Signal()
+            completed = Signal()
+            self.comb += [
+                m.connect(ch, omit={"valid", "ready"}),
+                ch.valid.eq(m.valid & (sel == i) & writable & room[i]),
+                room[i].eq(outstanding != max_outstanding),
+                issued.eq(ch.valid & ch.ready),
+                completed.eq(done(getattr(s, rsp))),
+            ]
+            self.sync += If(
+                issued & ~completed,
+                outstanding.eq(outstanding + 1),
+            ).Elif(
+                completed & ~issued,
+                outstanding.eq(outstanding - 1),
+            )
@@ -0,0 +1,125 @@
+from migen import *  # noqa
+from misoc.interconnect.csr import AutoCSR, CSRStatus, CSRStorage
+
+
+__all__ = ["HPThrottle"]
+
+
+# PS7 AFI FIFO depths of a HP port
+HP_RD_CMD_DEPTH = 8
+HP_WR_CMD_DEPTH = 32
+HP_DATA_DEPTH = 128
+
+
+class HPThrottle(Module, AutoCSR):
+    """
+    Issue throttling in front of a PS7 HP port, by the fill level of its
+    FIFOs.
+
+    A read is issued while the read command FIFO holds less than
+    `_ar_limit` commands and its beats, with those of issued reads not yet
+    taken, fit below `_r_limit` in the read data FIFO, i.e. while the
+    fabric keeps draining the data. A write is
+    issued while the write command FIFO holds less than `_aw_limit`
+    commands and its beats, with those of issued writes still to be sent
+    on W and less those sent ahead of their AW, fit below `_w_limit` in
+    the write data FIFO. This keeps the HP FIFOs filled without requests
+    backing up into the AFI shared with the other masters. Masters sharing
+    a port shall share its throttle.
+
+    A request presented to `slave` stays valid until accepted.
+
+    Parameters
+    ----------
+    master : migen_axi.interconnect.axi.Interface
+    slave : migen_axi.interconnect.axi.Interface
+        HP port, e.g. ``PS7.s_axi_hp0``.
+    fifo : migen.Record
+        FIFO status of the port, e.g. ``PS7.s_axi_hp0_fifo``.
+
+    Attributes
+    ----------
+    _issue_cap1 : misoc.interconnect.csr.CSRStorage
+        - [0] rdissuecap1_en
+        - [1] wrissuecap1_en
+    _ar_limit : misoc.interconnect.csr.CSRStorage
+    _r_limit : misoc.interconnect.csr.CSRStorage
+    _aw_limit : misoc.interconnect.csr.CSRStorage
+    _w_limit : misoc.interconnect.csr.CSRStorage
+    _ar_throttled : misoc.interconnect.csr.CSRStatus
+        Cycles a read was held back.
+    _aw_throttled : misoc.interconnect.csr.CSRStatus
+        Cycles a write was held back.
+    """
+    def __init__(self, master, slave, fifo):
+        self._issue_cap1 = CSRStorage(2)
+        self._ar_limit = CSRStorage(
+            bits_for(HP_RD_CMD_DEPTH), reset=HP_RD_CMD_DEPTH)
+        self._r_limit = CSRStorage(
+            bits_for(HP_DATA_DEPTH), reset=HP_DATA_DEPTH)
+        self._aw_limit = CSRStorage(
+            bits_for(HP_WR_CMD_DEPTH), reset=HP_WR_CMD_DEPTH)
+        self._w_limit = CSRStorage(
+            bits_for(HP_DATA_DEPTH), reset=HP_DATA_DEPTH)
+        self._ar_throttled = CSRStatus(32)
+        self._aw_throttled = CSRStatus(32)
+
+        ###
+
+        mar, maw, mw = master.ar, master.aw, master.w
+        sar, saw, sw = slave.ar, slave.aw, slave.w
+        self.comb += [
+            fifo.rdissuecap1_en.eq(self._issue_cap1.storage[0]),
+            fifo.wrissuecap1_en.eq(self._issue_cap1.storage[1]),
+            master.r.connect(slave.r),
+            master.b.connect(slave.b),
+            mw.connect(sw),
+        ]
+
+        # beats of accepted writes not yet sent, negative for beats sent
+        # ahead of their aw, which are in wcount already
+        w_pending = Signal((bits_for(HP_WR_CMD_DEPTH * 16) + 1, True))
+        self.sync += w_pending.eq(
+            w_pending +
+            Mux(saw.valid & saw.ready, saw.len + 1, 0) -
+            (sw.valid & sw.ready))
+
+        # beats of accepted reads not yet taken, in the data FIFO or still
+        # to arrive there
+        r_pending = Signal(bits_for(2 * HP_DATA_DEPTH))
+        r_fill = Signal.like(r_pending)
+        self.sync += r_pending.eq(
+            r_pending +
+            Mux(sar.valid & sar.ready, sar.len + 1, 0) -
+            (slave.r.valid & slave.r.ready))
+
+        ar_allow = Signal()
+        aw_allow = Signal()
+        self.comb += [
+            # at least the FIFO level, should reads bypass the throttle
+            r_fill.eq(Mux(fifo.rcount > r_pending, fifo.rcount, r_pending)),
+            ar_allow.eq(
+                (fifo.racount < self._ar_limit.storage) &
+                (r_fill + mar.len + 1 <= self._r_limit.storage)),
+            aw_allow.eq(
+                (fifo.wacount < self._aw_limit.storage) &
+                (fifo.wcount + w_pending + maw.len + 1 <=
+                 self._w_limit.storage)),
+        ]
+        for m, s, allow, throttled in [
+                (mar, sar, ar_allow, self._ar_throttled),
+                (maw, saw, aw_allow, self._aw_throttled)]:
+            # valid is not withdrawn once presented
+            presented = Signal()
+            self.comb += [
+                m.connect(s, omit={"valid", "ready"}),
+                s.valid.eq(m.valid & (allow | presented)),
+                m.ready.eq(s.ready & (allow | presented)),
+            ]
+            self.sync += [
+                presented.eq(s.valid & ~s.ready),
+                If(
+                    m.valid & ~s.valid,
+                    throttled.status.eq(throttled.status + 1),
+                ),
+            ]
@@ -0,0 +1,198 @@
+from migen import *  # noqa
+from migen.genlib.coding import PriorityEncoder
+
+
+__all__ = ["AXIIdRemap"]
+
+
+class _IdTable(Module):
+    """
+    CAM-style table mapping wide IDs onto narrow table indices.
+
+    An entry is in use while it has outstanding transactions. Transactions
+    sharing a wide ID always map onto the same entry to keep AXI ordering.
+
+    Attributes
+    ----------
+    id : migen.Signal
+        Wide ID to allocate an entry for.
+    index : migen.Signal
+        Narrow ID to use for `id`.
+    available : migen.Signal
+        `index` can accept another outstanding transaction.
+    alloc : migen.Signal
+        Account a transaction for `id` at `index`.
+    release : migen.Signal
+        Retire a transaction at `release_index`.
+    release_id : migen.Signal
+        Wide ID stored at `release_index`.
+    hold : migen.Signal
+        Keep `index` of the previous cycle, for a presented request.
+    """
+    def __init__(self, id_width, n, max_outstanding):
+        self.id = Signal(id_width)
+        self.index = Signal(max=max(2, n))
+        self.available = Signal()
+        self.alloc = Signal()
+        self.release = Signal()
+        self.release_index = Signal(max=max(2, n))
+        self.release_id = Signal(id_width)
+        self.hold = Signal()
+
+        ###
+
+        self.n = n
+        self.ids = [Signal(id_width, reset_less=True) for _ in range(n)]
+        self.counts = [Signal(max=max_outstanding + 1) for _ in range(n)]
+
+        hit, hit_index = self.lookup(self.id)
+        free = PriorityEncoder(n)
+        self.submodules += free
+        # counts only decrease while held
+        held = Signal.like(self.index)
+        self.sync += held.eq(self.index)
+        self.comb += [
+            free.i.eq(Cat(*[count == 0 for count in self.counts])),
+            If(
+                self.hold,
+                self.index.eq(held),
+                self.available.eq(1),
+            ).Elif(
+                hit,
+                self.index.eq(hit_index),
+                self.available.eq(
+                    Array(self.counts)[hit_index] != max_outstanding),
+            ).Else(
+                self.index.eq(free.o),
+                self.available.eq(~free.n),
+            ),
+            self.release_id.eq(Array(self.ids)[self.release_index]),
+        ]
+        for i, (id_, count) in enumerate(zip(self.ids, self.counts)):
+            inc = Signal()
+            dec = Signal()
+            self.comb += [
+                inc.eq(self.alloc & (self.index == i)),
+                dec.eq(self.release & (self.release_index == i)),
+            ]
+            self.sync += [
+                If(
+                    inc & ~dec,
+                    count.eq(count + 1),
+                ).Elif(
+                    dec & ~inc,
+                    count.eq(count - 1),
+                ),
+                If(inc, id_.eq(self.id)),
+            ]
+
+    def lookup(self, id_):
+        hit = Signal()
+        match = PriorityEncoder(self.n)
+        self.submodules += match
+        self.comb += [
+            match.i.eq(Cat(*[(count != 0) & (i == id_)
+                             for i, count in zip(self.ids, self.counts)])),
+            hit.eq(~match.n),
+        ]
+        return hit, match.o
+
+
+class AXIIdRemap(Module):
+    """
+    Map wide master IDs onto a small pool of narrow slave IDs.
+
+    Read and write IDs are remapped independently. Transactions with the
+    same master ID are issued with the same slave ID, so the ordering
+    rules are kept, while distinct master IDs may be outstanding
+    concurrently. The address channel stalls if no narrow ID is left.
+
+    W beats pass once their address is mapped, or while the AW with their
+    ID is presented to `slave`, whose narrow ID is then held until
+    accepted. A slave may thus wait for WVALID before asserting AWREADY.
+    Beats ahead of their AW do not pass on an older write of the same ID,
+    whose narrow ID may be released before the AW arrives.
+
+    Parameters
+    ----------
+    master : migen_axi.interconnect.axi.Interface
+        Wide ID side, e.g. `PS7.m_axi_gp0`.
+    slave : migen_axi.interconnect.axi.Interface
+        Narrow ID side.
+    n_ids : int, optional
+        Size of the narrow ID pool, at most ``2**slave.id_width``.
+    max_outstanding : int, optional
+        Outstanding transactions per narrow ID.
+    """
+    def __init__(self, master, slave, n_ids=None, max_outstanding=8):
+        n_ids = n_ids or min(2**slave.id_width, 8)
+        if n_ids > 2**slave.id_width:
+            raise ValueError("n_ids shall be le 2**slave.id_width")
+        if max_outstanding < 1:
+            raise ValueError("max_outstanding shall be ge 1")
+
+        ###
+
+        self.submodules.rtable = rtable = _IdTable(
+            master.id_width, n_ids, max_outstanding)
+        self.submodules.wtable = wtable = _IdTable(
+            master.id_width, n_ids, max_outstanding)
+
+        # ar channel
+        self.comb += [
+            master.ar.connect(slave.ar, omit={"id", "valid", "ready"}),
+            rtable.id.eq(master.ar.id),
+            slave.ar.id.eq(rtable.index),
+            slave.ar.valid.eq(master.ar.valid & rtable.available),
+            master.ar.ready.eq(slave.ar.ready & rtable.available),
+            rtable.alloc.eq(master.ar.valid & master.ar.ready),
+        ]
+        # r channel
+        self.comb += [
+            master.r.connect(slave.r, omit={"id"}),
+            rtable.release_index.eq(slave.r.id),
+            master.r.id.eq(rtable.release_id),
+            rtable.release.eq(slave.r.valid & slave.r.ready & slave.r.last),
+        ]
+        # aw channel
+        aw_presented = Signal()
+        self.sync += aw_presented.eq(slave.aw.valid & ~slave.aw.ready)
+        self.comb += [
+            wtable.hold.eq(aw_presented),
+            master.aw.connect(slave.aw, omit={"id", "valid", "ready"}),
+            wtable.id.eq(master.aw.id),
+            slave.aw.id.eq(wtable.index),
+            slave.aw.valid.eq(master.aw.valid & wtable.available),
+            master.aw.ready.eq(slave.aw.ready & wtable.available),
+            wtable.alloc.eq(master.aw.valid & master.aw.ready),
+        ]
+        # w channel, wait for the address to be mapped or presented. An
+        # entry may hold an older write of the same ID, the beats pass on
+        # it only while it has addresses mapped their last beat is owed
+        # for, negative for beats sent on a presented address.
+        w_owed = [Signal((bits_for(max_outstanding) + 1, True))
+                  for _ in range(n_ids)]
+        for i, owed in enumerate(w_owed):
+            self.sync += owed.eq(
+                owed + (wtable.alloc & (wtable.index == i)) -
+                (slave.w.valid & slave.w.ready & slave.w.last &
+                 (slave.w.id == i)))
+        w_hit, w_index = wtable.lookup(master.w.id)
+        w_mapped = Signal()
+        self.comb += [
+            w_mapped.eq(
+                w_hit & (Array(w_owed)[w_index] > 0) |
+                slave.aw.valid & (master.w.id == master.aw.id) &
+                (Array(w_owed)[wtable.index] == 0)),
+            master.w.connect(slave.w, omit={"id", "valid", "ready"}),
+            slave.w.id.eq(Mux(w_hit, w_index, wtable.index)),
+            slave.w.valid.eq(master.w.valid & w_mapped),
+            master.w.ready.eq(slave.w.ready & w_mapped),
+        ]
+        # b channel
+        self.comb += [
+            master.b.connect(slave.b, omit={"id"}),
+            wtable.release_index.eq(slave.b.id),
+            master.b.id.eq(wtable.release_id),
+            wtable.release.eq(slave.b.valid & slave.b.ready),
+        ]
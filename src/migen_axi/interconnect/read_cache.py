@@ -0,0 +1,397 @@
+from migen import *  # noqa
+from migen.genlib.coding import PriorityEncoder
+from misoc.interconnect.csr import AutoCSR, CSR, CSRStatus
+from .axi import Burst, Response, burst_size
+
+
+__all__ = ["AXIReadCache"]
+
+
+class AXIReadCache(Module, AutoCSR):
+    """
+    Set associative read cache with sequential next line prefetch.
+
+    Single line INCR reads of full bus width are served from the cache,
+    misses fill a whole line first. Any other read bypasses the cache.
+    Writes pass through and invalidate every line their burst covers when
+    accepted. Fills racing a write, one outstanding when the fill was
+    issued or accepted since, serve their read but are not kept, the slave
+    may have returned data older than the write. The same holds for an
+    `_invalidate` since the fill was issued.
+    Neither are fills with an error response, their read returns the first
+    error of the line.
+
+    Parameters
+    ----------
+    master : migen_axi.interconnect.axi.Interface
+    slave : migen_axi.interconnect.axi.Interface
+    line_words : int, optional
+        Line size in bus words, a power of 2.
+    n_sets : int, optional
+        Number of sets, a power of 2.
+    n_ways : int, optional
+        Associativity.
+    replacement : str, optional
+        ``"round_robin"``, ``"random"`` or ``"lru"``, tree pseudo LRU for
+        a power of 2 of ways.
+    prefetch : bool, optional
+        Fill the next line within the same 4 KiB page after a miss.
+
+    Attributes
+    ----------
+    _invalidate : misoc.interconnect.csr.CSR
+        Write to invalidate all lines.
+    _hits : misoc.interconnect.csr.CSRStatus
+        Read hit count.
+    _misses : misoc.interconnect.csr.CSRStatus
+        Read miss count.
+    """
+    def __init__(self, master, slave, line_words=16, n_sets=16, n_ways=2,
+                 replacement="round_robin", prefetch=True):
+        if replacement not in ("round_robin", "random", "lru"):
+            raise ValueError("unknown replacement {}".format(replacement))
+        if replacement == "lru" and n_ways & (n_ways - 1):
+            raise ValueError("n_ways shall be a power of 2 for lru")
+        if line_words < 2 or n_sets < 2:
+            raise ValueError("line_words and n_sets shall be ge 2")
+        self._invalidate = CSR()
+        self._hits = CSRStatus(32)
+        self._misses = CSRStatus(32)
+
+        ###
+
+        dw = master.data_width
+        word_bits = log2_int(dw // 8)
+        offset_bits = log2_int(line_words)
+        set_bits = log2_int(n_sets, need_pow2=True)
+        line_bits = word_bits + offset_bits
+        tag_bits = len(master.ar.addr) - line_bits - set_bits
+        ar, r = master.ar, master.r
+
+        # writes pass through
+        self.comb += [
+            master.aw.connect(slave.aw),
+            master.w.connect(slave.w),
+            master.b.connect(slave.b),
+        ]
+
+        def split(addr):
+            return (addr[word_bits:line_bits],
+                    addr[line_bits:line_bits + set_bits],
+                    addr[line_bits + set_bits:])
+
+        # tag store
+        tags = [[Signal(tag_bits, reset_less=True) for _ in range(n_ways)]
+                for _ in range(n_sets)]
+        valids = [[Signal() for _ in range(n_ways)] for _ in range(n_sets)]
+
+        pf_pending = Signal()
+        pf_addr = Signal.like(ar.addr)
+        lookup_addr = Signal.like(ar.addr)
+        self.comb += lookup_addr.eq(Mux(pf_pending, pf_addr, ar.addr))
+        _, lookup_set, lookup_tag = split(lookup_addr)
+        hits = Signal(n_ways)
+        self.comb += [
+            hits[w].eq(
+                Array(valids[s][w] for s in range(n_sets))[lookup_set] &
+                (Array(tags[s][w] for s in range(n_sets))[lookup_set] ==
+                 lookup_tag))
+            for w in range(n_ways)]
+        hit_enc = PriorityEncoder(n_ways)
+        self.submodules += hit_enc
+        self.comb += hit_enc.i.eq(hits)
+
+        # replacement
+        invalid_enc = PriorityEncoder(n_ways)
+        self.submodules += invalid_enc
+        self.comb += invalid_enc.i.eq(
+            ~Cat(*[Array(valids[s][w] for s in range(n_sets))[lookup_set]
+                   for w in range(n_ways)]))
+        victim_policy = Signal(max=max(2, n_ways))
+        victim = Signal(max=max(2, n_ways))
+        self.comb += victim.eq(
+            Mux(invalid_enc.n, victim_policy, invalid_enc.o))
+        access = Signal()
+        fill_done = Signal()
+        access_way = Signal(max=max(2, n_ways))
+        access_set = Signal(set_bits)
+        if n_ways == 1:
+            pass
+        elif replacement == "random":
+            lfsr = Signal(16, reset=1)
+            random = lfsr[:len(victim_policy)]
+            self.sync += lfsr.eq(Cat(lfsr[1:], lfsr[0] ^ lfsr[2] ^ lfsr[3] ^
+                                     lfsr[5]))
+            self.comb += victim_policy.eq(Mux(random < n_ways, random, 0))
+        elif replacement == "lru":
+            # a tree per set, each node points to the half of its ways
+            # used less recently
+            levels = log2_int(n_ways)
+            trees = [Signal(n_ways - 1) for _ in range(n_sets)]
+            tree = Signal(n_ways - 1)
+            self.comb += [
+                tree.eq(Array(trees)[lookup_set]),
+                victim_policy[levels - 1].eq(tree[0]),
+            ]
+            for level in range(1, levels):
+                nodes = Array(tree[2**level - 1 + node]
+                              for node in range(2**level))
+                self.comb += victim_policy[levels - 1 - level].eq(
+                    nodes[victim_policy[levels - level:]])
+            for s, t in enumerate(trees):
+                for level in range(levels):
+                    for node in range(2**level):
+                        used = access & (access_set == s)
+                        if level:
+                            used &= access_way[levels - level:] == node
+                        self.sync += If(
+                            used,
+                            t[2**level - 1 + node].eq(
+                                ~access_way[levels - 1 - level]),
+                        )
+        else:
+            # round robin pointer per set, advanced on fills
+            ptrs = [Signal(max=max(2, n_ways)) for _ in range(n_sets)]
+            self.comb += victim_policy.eq(Array(ptrs)[lookup_set])
+            for s, ptr in enumerate(ptrs):
+                self.sync += If(
+                    fill_done & (access_set == s) & (access_way == ptr),
+                    ptr.eq(Mux(ptr == n_ways - 1, 0, ptr + 1)))
+
+        # data store
+        rports, wports = [], []
+        for _ in range(n_ways):
+            mem = Memory(dw, n_sets * line_words)
+            rport = mem.get_port()
+            wport = mem.get_port(write_capable=True)
+            self.specials += mem, rport, wport
+            rports.append(rport)
+            wports.append(wport)
+
+        id_ = Signal.like(ar.id)
+        way = Signal(max=max(2, n_ways))
+        line_set = Signal(set_bits)
+        line_tag = Signal(tag_bits)
+        word = Signal(offset_bits)
+        word_next = Signal(offset_bits)
+        count = Signal.like(ar.len)
+        fill_word = Signal(offset_bits)
+        fill_error = Signal()
+        resp = Signal.like(r.resp)
+        is_prefetch = Signal()
+
+        ar_offset, ar_set, ar_tag = split(ar.addr)
+        cacheable = Signal()
+        self.comb += cacheable.eq(
+            (ar.burst == Burst.incr) & (ar.size == burst_size(dw // 8)) &
+            (ar_offset + ar.len < line_words))
+        next_line = Signal.like(ar.addr)
+        self.comb += next_line.eq(
+            Cat(C(0, line_bits), ar.addr[line_bits:] + 1))
+
+        hit_count = Signal(32)
+        miss_count = Signal(32)
+        self.comb += [
+            self._hits.status.eq(hit_count),
+            self._misses.status.eq(miss_count),
+        ]
+
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act(
+            "IDLE",
+            If(
+                pf_pending,
+                NextValue(line_set, lookup_set),
+                NextValue(line_tag, lookup_tag),
+                NextValue(pf_pending, 0),
+                If(
+                    hit_enc.n,
+                    NextValue(way, victim),
+                    NextValue(is_prefetch, 1),
+                    NextState("FILL_AR"),
+                ),
+            ).Elif(
+                ar.valid,
+                If(
+                    cacheable,
+                    ar.ready.eq(1),
+                    NextValue(id_, ar.id),
+                    NextValue(count, ar.len),
+                    NextValue(word, ar_offset),
+                    NextValue(line_set, ar_set),
+                    NextValue(line_tag, ar_tag),
+                    NextValue(resp, Response.okay),
+                    If(
+                        ~hit_enc.n,
+                        NextValue(way, hit_enc.o),
+                        NextValue(hit_count, hit_count + 1),
+                        NextState("LOAD"),
+                    ).Else(
+                        NextValue(way, victim),
+                        NextValue(is_prefetch, 0),
+                        NextValue(miss_count, miss_count + 1),
+                        If(
+                            next_line[12:] == ar.addr[12:],
+                            NextValue(pf_addr, next_line),
+                            NextValue(pf_pending, prefetch),
+                        ),
+                        NextState("FILL_AR"),
+                    ),
+                ).Else(
+                    NextState("BYPASS_AR"),
+                ),
+            ),
+        )
+        fsm.act(
+            "FILL_AR",
+            slave.ar.valid.eq(1),
+            If(
+                slave.ar.ready,
+                NextValue(fill_word, 0),
+                NextValue(resp, Response.okay),
+                NextState("FILL_R"),
+            ),
+        )
+        fsm.act(
+            "FILL_R",
+            slave.r.ready.eq(1),
+            If(
+                slave.r.valid,
+                NextValue(fill_word, fill_word + 1),
+                If(
+                    resp == Response.okay,
+                    NextValue(resp, slave.r.resp),
+                ),
+                If(
+                    slave.r.last,
+                    fill_done.eq(1),
+                    If(
+                        is_prefetch,
+                        NextState("IDLE"),
+                    ).Else(
+                        NextState("LOAD"),
+                    ),
+                ),
+            ),
+        )
+        fsm.act(
+            "LOAD",
+            NextState("HIT"),
+        )
+        fsm.act(
+            "HIT",
+            r.valid.eq(1),
+            r.last.eq(count == 0),
+            If(
+                r.ready,
+                NextValue(word, word + 1),
+                NextValue(count, count - 1),
+                If(
+                    count == 0,
+                    NextState("IDLE"),
+                ),
+            ),
+        )
+        fsm.act(
+            "BYPASS_AR",
+            slave.ar.valid.eq(ar.valid),
+            ar.ready.eq(slave.ar.ready),
+            If(
+                ar.valid & slave.ar.ready,
+                NextState("BYPASS_R"),
+            ),
+        )
+        fsm.act(
+            "BYPASS_R",
+            r.valid.eq(slave.r.valid),
+            slave.r.ready.eq(r.ready),
+            If(
+                slave.r.valid & r.ready & slave.r.last,
+                NextState("IDLE"),
+            ),
+        )
+
+        # ar, r data path
+        self.comb += [
+            If(
+                fsm.ongoing("FILL_AR"),
+                slave.ar.id.eq(0),
+                slave.ar.addr.eq(Cat(C(0, line_bits), line_set, line_tag)),
+                slave.ar.len.eq(line_words - 1),
+                slave.ar.size.eq(burst_size(dw // 8)),
+                slave.ar.burst.eq(Burst.incr),
+            ).Else(
+                ar.connect(slave.ar, omit={"valid", "ready"}),
+            ),
+            If(
+                fsm.ongoing("BYPASS_R"),
+                r.id.eq(slave.r.id),
+                r.data.eq(slave.r.data),
+                r.resp.eq(slave.r.resp),
+                r.last.eq(slave.r.last),
+            ).Else(
+                r.id.eq(id_),
+                r.data.eq(Array(p.dat_r for p in rports)[way]),
+                r.resp.eq(resp),
+            ),
+        ]
+        self.comb += [
+            word_next.eq(Mux(r.valid & r.ready, word + 1, word)),
+            [p.adr.eq(Cat(word_next, line_set)) for p in rports],
+            [p.adr.eq(Cat(fill_word, line_set)) for p in wports],
+            [p.dat_w.eq(slave.r.data) for p in wports],
+            [p.we.eq(fsm.ongoing("FILL_R") & slave.r.valid & (way == w))
+             for w, p in enumerate(wports)],
+        ]
+
+        # tag update, invalidation of the lines a write burst covers
+        aw = master.aw
+        aw_acked = Signal()
+        aw_bytes = Signal(len(aw.len) + 8)
+        aw_first = Signal(len(aw.addr) + 1)
+        aw_last = Signal(len(aw.addr) + 1)
+        writes = Signal(16)
+        # a write or invalidation since the fill was issued, or a write
+        # still in flight then, may leave the line stale
+        stale = Signal()
+        self.comb += [
+            aw_acked.eq(aw.valid & aw.ready),
+            aw_bytes.eq(Mux(aw.burst == Burst.fixed, 1,
+                            aw.len + 1) << aw.size),
+            aw_first.eq(Mux(aw.burst == Burst.wrap,
+                            aw.addr & ~(aw_bytes - 1), aw.addr)),
+            aw_last.eq(aw_first + aw_bytes - 1),
+            fill_error.eq((resp != Response.okay) |
+                          (slave.r.resp != Response.okay)),
+            access.eq(fill_done | fsm.ongoing("LOAD")),
+            access_way.eq(way),
+            access_set.eq(line_set),
+        ]
+        self.sync += [
+            writes.eq(writes + aw_acked - (master.b.valid & master.b.ready)),
+            If(
+                fsm.ongoing("FILL_AR") & slave.ar.ready,
+                stale.eq((writes != 0) | aw_acked | self._invalidate.re),
+            ).Elif(
+                aw_acked | self._invalidate.re,
+                stale.eq(1),
+            ),
+        ]
+        for s in range(n_sets):
+            for w in range(n_ways):
+                line = Cat(C(s, set_bits), tags[s][w])
+                self.sync += [
+                    If(
+                        self._invalidate.re,
+                        valids[s][w].eq(0),
+                    ).Elif(
+                        aw_acked & (line >= aw_first[line_bits:]) &
+                        (line <= aw_last[line_bits:]),
+                        valids[s][w].eq(0),
+                    ).Elif(
+                        fill_done & ~fill_error & ~stale & ~aw_acked &
+                        (line_set == s) & (way == w),
+                        valids[s][w].eq(1),
+                        tags[s][w].eq(line_tag),
+                    ),
+                ]
@@ -0,0 +1,250 @@
+from operator import and_, or_
+from toolz.curried import *  # noqa
+from migen import *  # noqa
+from .axi import Burst, Response, burst_size
+
+
+__all__ = ["AXIWriteCombiner"]
+
+
+class AXIWriteCombiner(Module):
+    """
+    Coalesce narrow single beat writes into full width INCR bursts.
+
+    Single beat writes flagged bufferable and modifiable through
+    ``aw.cache[1:0]`` are merged into a line buffer of `n_beats` words and
+    acknowledged immediately. The line is written as one burst, with the
+    merged strobes, once it is complete, on a line miss, on a read from
+    the buffered line, on `flush`, or after `timeout` cycles without a
+    merge. Any other write drains the line buffer and is passed through.
+
+    Parameters
+    ----------
+    master : migen_axi.interconnect.axi.Interface
+    slave : migen_axi.interconnect.axi.Interface
+    n_beats : int, optional
+        Line size in bus words, a power of 2.
+    timeout : int, optional
+        Flush timeout in cycles.
+
+    Attributes
+    ----------
+    flush : migen.Signal
+        Request to drain the line buffer.
+    busy : migen.Signal
+        Line buffer holds data.
+    """
+    def __init__(self, master, slave, n_beats=4, timeout=64):
+        self.flush = Signal()
+        self.busy = Signal()
+
+        ###
+
+        log2_beats = log2_int(n_beats)
+        dw = master.data_width
+        wstrb_width = dw // 8
+        word_bits = log2_int(wstrb_width)
+        line_bits = word_bits + log2_beats
+        maw, mw, mb = master.aw, master.w, master.b
+        saw, sw, sb = slave.aw, slave.w, slave.b
+
+        # reads bypass, but never overtake buffered writes
+        self.comb += master.r.connect(slave.r)
+        line = Signal(len(maw.addr) - line_bits, reset_less=True)
+        prot = Signal.like(maw.prot)
+        cache = Signal.like(maw.cache)
+        ar_hazard = Signal()
+        self.comb += [
+            master.ar.connect(slave.ar, omit={"valid", "ready"}),
+            ar_hazard.eq(self.busy & (master.ar.addr[line_bits:] == line)),
+            slave.ar.valid.eq(master.ar.valid & ~ar_hazard),
+            master.ar.ready.eq(slave.ar.ready & ~ar_hazard),
+        ]
+
+        # line buffer
+        data = [Signal(dw, reset_less=True) for _ in range(n_beats)]
+        strb = [Signal(wstrb_width) for _ in range(n_beats)]
+        id_ = Signal.like(maw.id)
+        word = Signal(max=max(2, n_beats))
+        merge = Signal()
+        clear = Signal()
+        for i, (d, s) in enumerate(zip(data, strb)):
+            self.sync += [
+                If(
+                    clear,
+                    s.eq(0),
+                ).Elif(
+                    merge & (word == i),
+                    s.eq(s | mw.strb),
+                    [If(mw.strb[j], d[8 * j: 8 * (j + 1)].eq(
+                        mw.data[8 * j: 8 * (j + 1)]))
+                     for j in range(wstrb_width)],
+                ),
+            ]
+        self.comb += self.busy.eq(Cat(*strb) != 0)
+        line_full = Signal()
+        self.comb += line_full.eq(Cat(*strb) == 2**len(Cat(*strb)) - 1)
+
+        combinable = Signal()
+        same_line = Signal()
+        self.comb += [
+            combinable.eq(
+                (maw.len == 0) & maw.cache[0] & maw.cache[1]),
+            same_line.eq(
+                (maw.addr[line_bits:] == line) & (maw.prot == prot)),
+        ]
+
+        expired = Signal()
+        if timeout:
+            idle_count = Signal(max=timeout + 1)
+            self.comb += expired.eq(idle_count == timeout)
+            self.sync += [
+                If(
+                    merge | ~self.busy,
+                    idle_count.eq(0),
+                ).Elif(
+                    ~expired,
+                    idle_count.eq(idle_count + 1),
+                ),
+            ]
+        drain = Signal()
+        self.comb += drain.eq(
+            self.busy & reduce(or_, [
+                line_full, expired, ar_hazard, self.flush]))
+
+        beat = Signal(max=max(2, n_beats))
+        flushing = Signal()
+        passing = Signal()
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act(
+            "IDLE",
+            If(
+                drain,
+                NextState("FLUSH_AW"),
+            ).Elif(
+                maw.valid,
+                If(
+                    combinable & (~self.busy | same_line),
+                    maw.ready.eq(1),
+                    NextValue(id_, maw.id),
+                    NextValue(word, maw.addr[word_bits:line_bits]),
+                    NextValue(line, maw.addr[line_bits:]),
+                    NextValue(prot, maw.prot),
+                    NextValue(cache, maw.cache),
+                    NextState("MERGE"),
+                ).Elif(
+                    self.busy,
+                    NextState("FLUSH_AW"),
+                ).Else(
+                    NextState("PASS_AW"),
+                ),
+            ),
+        )
+        fsm.act(
+            "MERGE",
+            mw.ready.eq(1),
+            If(
+                mw.valid,
+                merge.eq(1),
+                NextState("MERGE_B"),
+            ),
+        )
+        fsm.act(
+            "MERGE_B",
+            mb.valid.eq(1),
+            mb.id.eq(id_),
+            mb.resp.eq(Response.okay),
+            If(
+                mb.ready,
+                NextState("IDLE"),
+            ),
+        )
+        fsm.act(
+            "FLUSH_AW",
+            flushing.eq(1),
+            saw.valid.eq(1),
+            If(
+                saw.ready,
+                NextValue(beat, 0),
+                NextState("FLUSH_W"),
+            ),
+        )
+        fsm.act(
+            "FLUSH_W",
+            flushing.eq(1),
+            sw.valid.eq(1),
+            If(
+                sw.ready,
+                NextValue(beat, beat + 1),
+                If(
+                    sw.last,
+                    NextState("FLUSH_B"),
+                ),
+            ),
+        )
+        fsm.act(
+            "FLUSH_B",
+            flushing.eq(1),
+            sb.ready.eq(1),
+            If(
+                sb.valid,
+                clear.eq(1),
+                NextState("IDLE"),
+            ),
+        )
+        fsm.act(
+            "PASS_AW",
+            passing.eq(1),
+            saw.valid.eq(maw.valid),
+            maw.ready.eq(saw.ready),
+            If(
+                maw.valid & saw.ready,
+                NextState("PASS_W"),
+            ),
+        )
+        fsm.act(
+            "PASS_W",
+            passing.eq(1),
+            sw.valid.eq(mw.valid),
+            mw.ready.eq(sw.ready),
+            If(
+                reduce(and_, [mw.valid, sw.ready, mw.last]),
+                NextState("PASS_B"),
+            ),
+        )
+        fsm.act(
+            "PASS_B",
+            passing.eq(1),
+            mb.valid.eq(sb.valid),
+            sb.ready.eq(mb.ready),
+            If(
+                sb.valid & mb.ready,
+                NextState("IDLE"),
+            ),
+        )
+
+        # data path
+        self.comb += [
+            If(
+                flushing,
+                saw.id.eq(0),
+                saw.addr.eq(Cat(C(0, line_bits), line)),
+                saw.len.eq(n_beats - 1),
+                saw.size.eq(burst_size(wstrb_width)),
+                saw.burst.eq(Burst.incr),
+                saw.cache.eq(cache),
+                saw.prot.eq(prot),
+                sw.id.eq(0),
+                sw.data.eq(Array(data)[beat]),
+                sw.strb.eq(Array(strb)[beat]),
+                sw.last.eq(beat == n_beats - 1),
+            ).Else(
+                maw.connect(saw, omit={"valid", "ready"}),
+                mw.connect(sw, omit={"valid", "ready"}),
+            ),
+            If(
+                passing,
+                mb.id.eq(sb.id),
+                mb.resp.eq(sb.resp),
+            ),
+        ]
@@ -0,0 +1,388 @@
+from collections import deque
+from migen import ClockDomain, Module, Signal, passive
+from .interconnect import dmac_bus
+from .interconnect.axi import Burst, Interface, Response, burst_size
+from .cores.ps7 import (
+    ENET, PS7_PORTS, acp_user_rec, core_irq_rec, emio_recs, fclk_rec,
+    ftmd_rec, ftmt_rec, hp_fifo_rec, spi_irq_rec)
+
+
+__all__ = ["beat_addresses", "Bandwidth", "AXIMemory", "AXIMaster", "PS7Sim"]
+
+
+def beat_addresses(addr, len_, size, burst):
+    n, nbytes = len_ + 1, 1 << size
+    if burst == Burst.fixed:
+        return [addr] * n
+    if burst == Burst.wrap:
+        total = n * nbytes
+        low = addr // total * total
+        return [low + (addr - low + i * nbytes) % total for i in range(n)]
+    aligned = addr & ~(nbytes - 1)
+    return [addr] + [aligned + i * nbytes for i in range(1, n)]
+
+
+class Bandwidth:
+    """
+    Throughput limit shared by `AXIMemory` models, a token bucket.
+
+    Parameters
+    ----------
+    bytes_per_cycle : float
+    burst : int, optional
+        Bytes accumulating while idle.
+    """
+    def __init__(self, bytes_per_cycle, burst=64):
+        self.bytes_per_cycle = bytes_per_cycle
+        self.burst = burst
+        self.level = burst
+        self.cycle = 0
+
+    def _refill(self, cycle):
+        if cycle > self.cycle:
+            self.level = min(
+                self.burst,
+                self.level + (cycle - self.cycle) * self.bytes_per_cycle)
+            self.cycle = cycle
+
+    def available(self, cycle):
+        self._refill(cycle)
+        return self.level > 0
+
+    def take(self, cycle, nbytes):
+        self._refill(cycle)
+        self.level -= nbytes
+
+
+class AXIMemory:
+    """
+    Behavioural AXI slave backed by a `bytearray`, for simulation only.
+
+    Any number of transactions may be outstanding, each is answered in
+    order `latency` cycles after its address handshake, at most one beat
+    every `interval` cycles. Accesses outside the memory get
+    `Response.decerr`. `rd_bytes` and `wr_bytes` count the bytes
+    transferred.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+    data : bytearray or int
+        Backing store, or its size in bytes. Any byte indexable buffer
+        works, e.g. a NumPy ``uint8`` array.
+    base : int, optional
+        Bus address of ``data[0]``.
+    latency : int, optional
+    interval : int, optional
+    bandwidth : Bandwidth, optional
+        Shared throughput limit.
+
+    Examples
+    --------
+    >>> mem = AXIMemory(dut.bus, 4096)
+    >>> run_simulation(dut, [testbench()] + mem.generators())
+    """
+    def __init__(self, bus, data, base=0, latency=0, interval=1,
+                 bandwidth=None):
+        self.bus = bus
+        self.data = bytearray(data) if isinstance(data, int) else data
+        self.base = base
+        self.latency = latency
+        self.interval = max(1, interval)
+        self.bandwidth = bandwidth
+        self.bytes_per_word = bus.data_width // 8
+        self.rd_bytes = 0
+        self.wr_bytes = 0
+
+    def _available(self, cycle):
+        return self.bandwidth is None or self.bandwidth.available(cycle)
+
+    def _take(self, cycle, nbytes):
+        if self.bandwidth is not None:
+            self.bandwidth.take(cycle, nbytes)
+
+    def _offset(self, addr):
+        offset = (addr & ~(self.bytes_per_word - 1)) - self.base
+        if 0 <= offset <= len(self.data) - self.bytes_per_word:
+            return offset
+        return None
+
+    def read_word(self, addr):
+        offset = self._offset(addr)
+        if offset is None:
+            return None
+        return int.from_bytes(
+            self.data[offset:offset + self.bytes_per_word], "little")
+
+    def write_word(self, addr, value, strb):
+        offset = self._offset(addr)
+        if offset is None:
+            return False
+        for i, b in enumerate(value.to_bytes(self.bytes_per_word, "little")):
+            if strb & (1 << i):
+                self.data[offset + i] = b
+        return True
+
+    def generators(self):
+        return [self.read_process(), self.write_process()]
+
+    @passive
+    def read_process(self):
+        ar, r = self.bus.ar, self.bus.r
+        pending = deque()
+        beats = deque()
+        cycle = 0
+        next_beat = 0
+        # head beat counted against the bandwidth
+        granted = False
+        yield ar.ready.eq(1)
+        while True:
+            if (yield ar.valid) and (yield ar.ready):
+                pending.append((
+                    cycle + self.latency, (yield ar.id),
+                    beat_addresses((yield ar.addr), (yield ar.len),
+                                   (yield ar.size), (yield ar.burst))))
+            if (yield r.valid) and (yield r.ready):
+                beats.popleft()
+                next_beat = cycle + self.interval
+                granted = False
+                self.rd_bytes += self.bytes_per_word
+            if not beats and pending and pending[0][0] <= cycle:
+                _, id_, addresses = pending.popleft()
+                beats.extend((id_, addr, i == len(addresses) - 1)
+                             for i, addr in enumerate(addresses))
+            if (beats and cycle + 1 >= next_beat and
+                    (granted or self._available(cycle))):
+                if not granted:
+                    self._take(cycle, self.bytes_per_word)
+                    granted = True
+                id_, addr, last = beats[0]
+                value = self.read_word(addr)
+                yield r.id.eq(id_)
+                yield r.data.eq(value or 0)
+                yield r.resp.eq(
+                    Response.decerr if value is None else Response.okay)
+                yield r.last.eq(last)
+                yield r.valid.eq(1)
+            else:
+                yield r.valid.eq(0)
+            yield
+            cycle += 1
+
+    @passive
+    def write_process(self):
+        aw, w, b = self.bus.aw, self.bus.w, self.bus.b
+        pending = deque()
+        responses = deque()
+        addresses = deque()
+        id_ = None
+        error = False
+        cycle = 0
+        yield aw.ready.eq(1)
+        while True:
+            if (yield aw.valid) and (yield aw.ready):
+                pending.append((
+                    (yield aw.id),
+                    beat_addresses((yield aw.addr), (yield aw.len),
+                                   (yield aw.size), (yield aw.burst))))
+            if (yield w.valid) and (yield w.ready):
+                if not addresses:
+                    id_, beat_addrs = pending.popleft()
+                    addresses.extend(beat_addrs)
+                    error = False
+                addr = addresses.popleft()
+                strb = yield w.strb
+                error |= not self.write_word(addr, (yield w.data), strb)
+                self._take(cycle, self.bytes_per_word)
+                self.wr_bytes += bin(strb).count("1")
+                if (yield w.last):
+                    addresses.clear()
+                    responses.append((cycle + self.latency, id_, error))
+            if (yield b.valid) and (yield b.ready):
+                responses.popleft()
+            yield w.ready.eq(int(
+                (bool(pending) or bool(addresses)) and
+                self._available(cycle)))
+            if responses and responses[0][0] <= cycle:
+                _, bid, berror = responses[0]
+                yield b.id.eq(bid)
+                yield b.resp.eq(
+                    Response.decerr if berror else Response.okay)
+                yield b.valid.eq(1)
+            else:
+                yield b.valid.eq(0)
+            yield
+            cycle += 1
+
+
+class AXIMaster:
+    """
+    Bus functional AXI master, for simulation only.
+
+    `write` and `read` are generators issuing one INCR burst and
+    returning with its response, to be scripted in a testbench. The
+    cycles from the address to the response are appended to
+    `latencies`.
+
+    Parameters
+    ----------
+    bus : migen_axi.interconnect.axi.Interface
+    clock : callable, optional
+        Current cycle, e.g. `PS7Sim.cycle`.
+
+    Examples
+    --------
+    >>> resp = yield from master.write(0x100, [1, 2, 3, 4])
+    >>> data, resp = yield from master.read(0x100, 4)
+    """
+    def __init__(self, bus, clock=None):
+        self.bus = bus
+        self.clock = clock or (lambda: 0)
+        self.size = burst_size(bus.data_width // 8)
+        self.latencies = []
+
+    def write(self, addr, data, id_=0, strb=None):
+        bus = self.bus
+        start = self.clock()
+        yield from bus.write_aw(id_, addr, len(data) - 1, self.size,
+                                Burst.incr)
+        for i, word in enumerate(data):
+            yield from bus.write_w(id_, word, strb,
+                                   last=int(i == len(data) - 1))
+        b = yield from bus.read_b()
+        self.latencies.append(self.clock() - start)
+        return b.resp
+
+    def read(self, addr, n=1, id_=0):
+        bus = self.bus
+        start = self.clock()
+        yield from bus.write_ar(id_, addr, n - 1, self.size, Burst.incr)
+        data = []
+        resp = Response.okay
+        for _ in range(n):
+            r = yield from bus.read_r()
+            data.append(r.data)
+            resp = max(resp, r.resp)
+        self.latencies.append(self.clock() - start)
+        return data, resp
+
+
+class PS7Sim(Module):
+    """
+    Behavioural stand-in for `migen_axi.cores.ps7.PS7`, for simulation
+    only.
+
+    Takes the arguments of `PS7` and has its attributes, without the
+    vendor primitive, e.g. ``SoCCore(platform, ps7_cls=PS7Sim)``. The GP
+    masters are driven by the `AXIMaster` models `gp0` and `gp1`, the
+    GP, ACP and HP slave ports are `AXIMemory` models of the same DDR.
+    The HP FIFO counters, DMAC, Ethernet and EMIO ports stay idle. Pass
+    `generators` to `run_simulation` along with the testbench, and the
+    ``fclk<i>`` domains in its `clocks`.
+
+    Parameters
+    ----------
+    ddr : bytearray or int
+        Backing store, or its size in bytes, e.g. a NumPy ``uint8``
+        array.
+    ddr_base : int, optional
+        Bus address of ``ddr[0]``.
+    latency : int, optional
+        Cycles from the address to the first response, per port.
+    interval : int, optional
+        Cycles per read beat, per port.
+    bytes_per_cycle : float, optional
+        Throughput of the DDR shared by all ports, unlimited if None.
+    pads : types.SimpleNamespace, optional
+        Ignored, as the pads of `PS7`.
+    ports : iterable of str, optional
+        Ports of `PS7_PORTS` to create, all by default.
+    fclks : iterable of int, optional
+        FCLKs 1 to 3 to create ``cd_fclk<i>`` domains of.
+
+    Attributes
+    ----------
+    memories : dict
+        `AXIMemory` per slave port name.
+    cycle : int
+        Cycles simulated.
+    """
+    slave_ports = ["s_axi_gp0", "s_axi_gp1", "s_axi_acp", "s_axi_hp0",
+                   "s_axi_hp1", "s_axi_hp2", "s_axi_hp3"]
+
+    def __init__(self, ddr=2**20, ddr_base=0, latency=20, interval=1,
+                 bytes_per_cycle=None, pads=None, ports=None, fclks=()):
+        ports = set(PS7_PORTS if ports is None else ports)
+        if not ports <= set(PS7_PORTS):
+            raise ValueError("ports shall be in PS7_PORTS, not {}".format(
+                ", ".join(sorted(ports - set(PS7_PORTS)))))
+        self.ports = ports
+        if not set(fclks) <= {1, 2, 3}:
+            raise ValueError("fclks shall be in 1, 2, 3")
+
+        self.fpga_idle_n = Signal()
+        self.ddr_arb = Signal(4)
+        self.mio = Signal(54)
+        for i in fclks:
+            setattr(self.clock_domains, "cd_fclk{}".format(i),
+                    ClockDomain("fclk{}".format(i)))
+        self.fclk = fclk_rec()
+        self.ftmd = ftmd_rec()
+        self.ftmt = ftmt_rec()
+        self.spi = spi_irq_rec()
+        self.interrupt = Signal(16)
+        self.core = core_irq_rec()
+        for name in PS7_PORTS:
+            if name in ports:
+                getattr(self, "_" + name.rstrip("0123456789"))(name)
+
+        ###
+
+        self.ddr = bytearray(ddr) if isinstance(ddr, int) else ddr
+        bandwidth = Bandwidth(bytes_per_cycle) if bytes_per_cycle else None
+        self.memories = {
+            name: AXIMemory(getattr(self, name), self.ddr, ddr_base,
+                            latency, interval, bandwidth)
+            for name in self.slave_ports if name in ports}
+        self.cycle = 0
+        for name in ["m_axi_gp0", "m_axi_gp1"]:
+            if name in ports:
+                setattr(self, name[-3:], AXIMaster(
+                    getattr(self, name), lambda: self.cycle))
+
+    def _m_axi_gp(self, name):
+        setattr(self, name, Interface(id_width=12, name=name))
+
+    def _s_axi_gp(self, name):
+        setattr(self, name, Interface(id_width=6, name=name))
+
+    def _s_axi_acp(self, name):
+        setattr(self, name, Interface(data_width=64, id_width=3, name=name))
+        setattr(self, name + "_user", acp_user_rec(name=name))
+
+    def _s_axi_hp(self, name):
+        setattr(self, name, Interface(data_width=64, id_width=6, name=name))
+        setattr(self, name + "_fifo", hp_fifo_rec(name=name))
+
+    def _dma(self, name):
+        setattr(self, name, dmac_bus.Interface(name=name))
+        setattr(self, name + "_rst_n", Signal(reset=1, name=name + "_rst_n"))
+
+    def _enet(self, name):
+        setattr(self.submodules, name, ENET(None))
+
+    def _emio(self, name):
+        setattr(self, name, emio_recs[name](name=name))
+
+    _ttc = _wdt = _spi = _i2c = _can = _uart = _sdio = _gpio = _usb = \
+        _sram = _event = _pjtag = _trace = _emio
+
+    @passive
+    def _count(self):
+        while True:
+            yield
+            self.cycle += 1
+
+    def generators(self):
+        return [self._count()] + [
+            g for mem in self.memories.values() for g in mem.generators()]
@@ -0,0 +1,159 @@
+import pytest
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.interconnect import axis, axis_switch
+from .common import write_ack, file_tmp_folder
+
+
+def test_stream_adapters():
+    layout = [("data", 32), ("keep", 4)]
+    to_axis = axis.StreamToAXIS(layout, dest_width=2)
+    from_axis = axis.AXISToStream(layout, dest_width=2)
+    dut = Module()
+    dut.submodules += to_axis, from_axis
+    dut.comb += to_axis.source.connect(from_axis.sink)
+    sink, source = to_axis.sink, from_axis.source
+
+    def testbench_stream_adapters():
+        yield source.ack.eq(1)
+        yield sink.data.eq(0x11223344)
+        yield sink.keep.eq(0b0111)
+        yield sink.eop.eq(1)
+        yield sink.stb.eq(1)
+        yield
+        # no register stage
+        assert (yield source.stb)
+        assert (yield source.data) == 0x11223344
+        assert (yield source.keep) == 0b0111
+        assert (yield source.eop)
+        assert (yield to_axis.source.strb) == 0b0111
+        yield source.ack.eq(0)
+        yield
+        assert not (yield sink.ack)
+
+    run_simulation(dut, testbench_stream_adapters(),
+                   vcd_name=file_tmp_folder("test_stream_adapters.vcd"))
+
+
+def test_stream_to_axis_keep():
+    dut = axis.StreamToAXIS([("data", 16)])
+
+    def testbench_stream_to_axis_keep():
+        yield dut.source.ready.eq(1)
+        yield from write_ack(dut.sink)
+        assert (yield dut.source.keep) == 0b11
+        assert (yield dut.source.strb) == 0b11
+
+    run_simulation(dut, testbench_stream_to_axis_keep())
+
+
+@pytest.mark.parametrize("sink_width, source_width", [(8, 32), (32, 8)])
+def test_converter(sink_width, source_width):
+    dut = axis.Converter(sink_width, source_width)
+    packets = [
+        [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08],
+        [0x11, 0x12, 0x13, 0x14, 0x15, 0x16],
+    ]
+    nbytes = sink_width // 8
+    received = []
+
+    def write():
+        for packet in packets:
+            for i in range(0, len(packet), nbytes):
+                chunk = packet[i:i + nbytes]
+                yield from dut.sink.write(
+                    int.from_bytes(bytes(chunk), "little"),
+                    last=int(i + nbytes >= len(packet)),
+                    keep=2**len(chunk) - 1, dest=1)
+
+    def read():
+        beats = 0
+        packet = []
+        while len(received) < len(packets):
+            beat = yield from dut.source.read()
+            beats += 1
+            data = beat.data.to_bytes(source_width // 8, "little")
+            packet += [b for i, b in enumerate(data)
+                       if beat.keep & (1 << i)]
+            assert beat.dest == 1
+            if beat.last:
+                received.append(packet)
+                packet = []
+        if source_width < sink_width:
+            # trailing beats without kept bytes are dropped
+            assert beats == 8 + 6
+        assert received == packets
+
+    run_simulation(dut, [write(), read()],
+                   vcd_name=file_tmp_folder("test_axis_converter.vcd"))
+
+
+@pytest.mark.parametrize("arbitration", ["round_robin", "priority"])
+def test_axis_switch(arbitration):
+    dut = axis_switch.AXISSwitch(2, 2, arbitration=arbitration,
+                                 dest_width=2)
+    # (dest, beats) per sink
+    packets = [
+        [(0, 3), (0, 2), (1, 1), (2, 2)],
+        [(0, 1), (0, 3)],
+    ]
+    received = [[], []]
+
+    def write(i):
+        for n, (dest, beats) in enumerate(packets[i]):
+            for beat in range(beats):
+                yield from dut.sinks[i].write(
+                    (i << 8) | (n << 4) | beat, last=int(beat == beats - 1),
+                    dest=dest)
+
+    def read(j, n_packets):
+        packet = []
+        while len(received[j]) < n_packets:
+            beat = yield from dut.sources[j].read()
+            packet.append(beat.data)
+            if beat.last:
+                received[j].append(packet)
+                packet = []
+
+    run_simulation(dut, [write(0), write(1), read(0, 4), read(1, 1)],
+                   vcd_name=file_tmp_folder("test_axis_switch.vcd"))
+    # whole packets, in order per input
+    assert received[1] == [[0x020]]
+    sink0 = [p for p in received[0] if p[0] >> 8 == 0]
+    sink1 = [p for p in received[0] if p[0] >> 8 == 1]
+    assert sink0 == [[0x000, 0x001, 0x002], [0x010, 0x011]]
+    assert sink1 == [[0x100], [0x110, 0x111, 0x112]]
+    senders = [p[0] >> 8 for p in received[0]]
+    if arbitration == "round_robin":
+        assert senders == [0, 1, 0, 1]
+    else:
+        assert senders == [0, 0, 1, 1]
+
+
+def test_axis_switch_stall():
+    dut = axis_switch.AXISSwitch(2, 1, arbitration="priority")
+    source = dut.sources[0]
+    beats = []
+
+    def write(i, delay):
+        for _ in range(delay):
+            yield
+        for beat in range(2):
+            yield from dut.sinks[i].write(
+                (i << 8) | beat, last=beat)
+
+    def read():
+        # sinks[1] is granted first, sinks[0] requests while stalled
+        for _ in range(4):
+            yield
+            assert (yield source.valid)
+            assert (yield source.data) == 0x100
+        yield source.ready.eq(1)
+        while len(beats) < 4:
+            yield
+            if (yield source.valid):
+                beats.append((yield source.data))
+
+    run_simulation(dut, [write(0, 2), write(1, 0), read()],
+                   vcd_name=file_tmp_folder("test_axis_switch_stall.vcd"))
+    assert beats == [0x100, 0x101, 0x000, 0x001]
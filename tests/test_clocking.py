@@ -0,0 +1,34 @@
+import pytest
+from migen import *  # noqa
+from migen_axi.cores import clocking
+
+
+def test_mmcm():
+    clkin = Signal()
+    dut = clocking.MMCM(clkin, 100e6)
+    cd_fast = ClockDomain("fast")
+    cd_slow = ClockDomain("slow")
+    dut.create_clkout(cd_fast, 250e6)
+    dut.create_clkout(cd_slow, 125e6, phase=90)
+    inst, = [s for s in dut.get_fragment().specials
+             if isinstance(s, Instance) and s.of == "MMCME2_BASE"]
+    # integers are passed as constants
+    items = {item.name: getattr(item.value, "value", item.value)
+             for item in inst.items if isinstance(item, Instance.Parameter)}
+    vco = 100e6 * items["CLKFBOUT_MULT_F"] / items["DIVCLK_DIVIDE"]
+    assert vco / items["CLKOUT0_DIVIDE_F"] == 250e6
+    assert vco / items["CLKOUT1_DIVIDE"] == 125e6
+    assert items["CLKOUT1_PHASE"] == 90.
+
+
+def test_pll():
+    dut = clocking.PLL(Signal(), 50e6)
+    dut.create_clkout(ClockDomain("fast"), 200e6)
+    config = dut.compute_config()
+    assert 800 <= 50 * config["mult"] / config["div"] <= 1600
+    assert (50e6 * config["mult"] / config["div"] /
+            config["clkout_div"][0]) == 200e6
+    dut.create_clkout(ClockDomain("odd"), 123.456789e6)
+    with pytest.raises(ValueError):
+        dut.margin = 1e-9
+        dut.compute_config()
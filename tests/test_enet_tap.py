@@ -0,0 +1,141 @@
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.cores import enet_tap
+from .common import file_tmp_folder
+
+
+def test_enet_tap():
+    gmii = Record([("rxd", 8), ("rx_dv", 1), ("rx_er", 1)])
+    dut = enet_tap.ENETTap(gmii, header_bytes=6,
+                           filter_=lambda header: header[:8] != 0xaa)
+    frames = [
+        list(range(1, 19)),
+        [0xaa] + list(range(20)),
+        list(range(0x80, 0x80 + 9)),
+    ]
+    words = []
+    headers = []
+
+    def rx():
+        for _ in range(5):
+            yield
+        for n, frame in enumerate(frames):
+            yield gmii.rx_dv.eq(1)
+            for byte in [0x55] * 7 + [enet_tap.GMII_SFD] + frame:
+                yield gmii.rxd.eq(byte)
+                yield gmii.rx_er.eq(n == 2 and byte == 0x84)
+                yield
+            yield gmii.rx_dv.eq(0)
+            yield gmii.rx_er.eq(0)
+            for _ in range(12):
+                yield
+
+    def sink():
+        yield dut.source.ack.eq(1)
+        yield dut.header.ack.eq(1)
+        while len(words) < 8:
+            if (yield dut.header.stb):
+                headers.append((yield dut.header.data))
+            if (yield dut.source.stb):
+                words.append(((yield dut.source.data),
+                              (yield dut.source.eop)))
+            yield
+        for _ in range(10):
+            yield
+        assert (yield dut._frames.status) == 2
+        assert (yield dut._filtered.status) == 1
+        assert (yield dut._errors.status) == 1
+        assert (yield dut._dropped.status) == 0
+
+    run_simulation(dut, {"eth_rx": rx(), "sys": sink()},
+                   clocks={"sys": 10, "eth_rx": 8},
+                   vcd_name=file_tmp_folder("test_enet_tap.vcd"))
+
+    def pack(frame):
+        frame = frame + [0] * (-len(frame) % 4)
+        return [(int.from_bytes(bytes(frame[i:i + 4]), "little"),
+                 int(i == len(frame) - 4)) for i in range(0, len(frame), 4)]
+
+    assert words == pack(frames[0]) + pack(frames[2])
+    assert headers == [int.from_bytes(bytes(frame[:6]), "little")
+                       for frame in (frames[0], frames[2])]
+
+
+def test_enet_tap_overflow():
+    gmii = Record([("rxd", 8), ("rx_dv", 1), ("rx_er", 1)])
+    dut = enet_tap.ENETTap(gmii, depth=4)
+    frames = [list(range(40)), list(range(100, 108))]
+    words = []
+
+    def rx():
+        for frame in frames:
+            yield gmii.rx_dv.eq(1)
+            for byte in [0x55] * 7 + [enet_tap.GMII_SFD] + frame:
+                yield gmii.rxd.eq(byte)
+                yield
+            yield gmii.rx_dv.eq(0)
+            for _ in range(60):
+                yield
+
+    def sink():
+        # the first frame fills the FIFO
+        for _ in range(70):
+            yield
+        yield dut.source.ack.eq(1)
+        yield
+        while len(words) < 7:
+            if (yield dut.source.stb):
+                words.append(((yield dut.source.data),
+                              (yield dut.source.eop)))
+            yield
+        assert (yield dut._dropped.status) == 1
+        assert (yield dut._frames.status) == 2
+
+    run_simulation(dut, {"eth_rx": rx(), "sys": sink()},
+                   clocks={"sys": 10, "eth_rx": 8})
+    # ended at the word held, the second frame is complete
+    assert [eop for _, eop in words] == [0, 0, 0, 0, 1, 0, 1]
+    assert words[4][0] == int.from_bytes(bytes(range(16, 20)), "little")
+    assert words[6][0] == int.from_bytes(bytes(range(104, 108)), "little")
+
+
+def test_enet_tap_overflow_header():
+    gmii = Record([("rxd", 8), ("rx_dv", 1), ("rx_er", 1)])
+    dut = enet_tap.ENETTap(gmii, depth=4, header_bytes=6)
+    frames = [list(range(40)), list(range(50, 62)), list(range(100, 108))]
+    words = []
+    headers = []
+
+    def rx():
+        for frame in frames:
+            yield gmii.rx_dv.eq(1)
+            for byte in [0x55] * 7 + [enet_tap.GMII_SFD] + frame:
+                yield gmii.rxd.eq(byte)
+                yield
+            yield gmii.rx_dv.eq(0)
+            for _ in range(60):
+                yield
+
+    def sink():
+        # the first frame fills the FIFO, the second is lost entirely
+        for _ in range(120):
+            yield
+        yield dut.source.ack.eq(1)
+        yield dut.header.ack.eq(1)
+        yield
+        for _ in range(300):
+            if (yield dut.header.stb):
+                headers.append((yield dut.header.data))
+            if (yield dut.source.stb):
+                words.append(((yield dut.source.data),
+                              (yield dut.source.eop)))
+            yield
+        assert (yield dut._frames.status) == 2
+        assert (yield dut._dropped.status) == 2
+
+    run_simulation(dut, {"eth_rx": rx(), "sys": sink()},
+                   clocks={"sys": 10, "eth_rx": 8})
+    # a header for each frame in source
+    assert headers == [int.from_bytes(bytes(frame[:6]), "little")
+                       for frame in (frames[0], frames[2])]
+    assert sum(eop for _, eop in words) == 2
@@ -1,5 +1,12 @@
+from migen import *  # noqa
+from migen.sim import run_simulation
+from misoc.interconnect.csr import AutoCSR, CSRStatus, CSRStorage
+from toolz import partial
+from migen_axi.interconnect import axi
 from migen_axi.platforms import zedboard, zc706
 from migen_axi.integration import SoCCore
+from migen_axi.sim import AXIMemory, PS7Sim
+from .common import file_tmp_folder
 
 
 def test_soc_core_zedboard():
@@ -12,3 +19,50 @@ def test_soc_core_zc706():
     plat = zc706.Platform()
     soc = SoCCore(plat)
     soc.build(build_name="soc", run=False)
+
+
+class _Scratch(Module, AutoCSR):
+    def __init__(self):
+        self._value = CSRStorage(32)
+        self._incremented = CSRStatus(32)
+
+        ###
+
+        self.comb += self._incremented.status.eq(self._value.storage + 1)
+
+
+class _SimSoC(SoCCore):
+    def __init__(self):
+        SoCCore.__init__(self, zedboard.Platform(), csr_data_width=32,
+                         fclks={1: 200e6},
+                         ps7_cls=partial(PS7Sim, ddr=4096, latency=2))
+        self.submodules.scratch = _Scratch()
+        self.csr_devices.append("scratch")
+        bus = axi.Interface()
+        self.memory = AXIMemory(bus, 256, base=self.mem_map["axi"])
+        self.register_mem("axi", self.mem_map["axi"], 256, bus)
+
+
+def test_soc_core_sim():
+    soc = _SimSoC()
+    ps7 = soc.ps7
+    scratch = (soc.mem_map["csr"] +
+               0x800 * soc.csr_devices.index("scratch"))
+
+    def testbench_soc_core_sim():
+        # CSRs through m_axi_gp1
+        resp = yield from ps7.gp1.write(scratch, [0x1234])
+        assert resp == axi.Response.okay
+        assert (yield soc.scratch._value.storage) == 0x1234
+        data, resp = yield from ps7.gp1.read(scratch + 4)
+        assert data == [0x1235]
+        # AXI slaves through m_axi_gp0
+        resp = yield from ps7.gp0.write(soc.mem_map["axi"] + 0x10, [5, 6])
+        assert resp == axi.Response.okay
+        data, resp = yield from ps7.gp0.read(soc.mem_map["axi"] + 0x10, 2)
+        assert data == [5, 6]
+
+    run_simulation(soc, [testbench_soc_core_sim()] + ps7.generators() +
+                   soc.memory.generators(),
+                   clocks={"sys": 10, "fclk1": 5},
+                   vcd_name=file_tmp_folder("test_soc_core_sim.vcd"))
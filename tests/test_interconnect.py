@@ -7,6 +7,8 @@ from misoc.interconnect import csr_bus
 import pytest
 from migen_axi.interconnect import *  # noqa
 from migen_axi.interconnect import dmac_bus, stream2axi
+from migen_axi.cores.ps7 import hp_fifo_rec, acp_user_rec
+from migen_axi.sim import AXIMemory
 from .common import write_ack, wait_stb, ack, csr_w_mon, file_tmp_folder
 
 
@@ -499,6 +501,232 @@ def test_writer():
                    vcd_name=file_tmp_folder("test_writer.vcd"))
 
 
+@pytest.mark.parametrize("n", [4, 8])
+def test_writer_late_eop(n):
+    i = axi.Interface()
+    dut = axi_dma.Writer(i, fifo_depth=4)
+    sink = dut.sink
+    mem = AXIMemory(i, 1024)
+
+    def tx():
+        yield sink.addr.eq(0x100)
+        for k in range(n):
+            yield sink.data.eq(k)
+            yield from write_ack(sink)
+        # after the write response of the last burst
+        for _ in range(30):
+            yield
+        yield sink.eop.eq(1)
+        yield sink.stb.eq(1)
+        for _ in range(8):
+            yield
+            if (yield sink.ack):
+                break
+        assert (yield sink.ack)
+        yield sink.stb.eq(0)
+
+    run_simulation(dut, [tx()] + mem.generators(),
+                   vcd_name=file_tmp_folder("test_writer_late_eop.vcd"))
+    assert mem.wr_bytes == 4 * n
+
+
+@pytest.mark.parametrize("stall", [0, 20])
+def test_reader_wide_source(stall):
+    i = axi.Interface()
+    dut = axi_dma.Reader(i, nbits_source=64, fifo_depth=4)
+    sink, source = dut.sink, dut.source
+
+    def testbench_reader_wide_source():
+
+        def request_rx():
+            yield sink.addr.eq(0x11223340)
+            yield sink.n.eq(4)
+            yield sink.eop.eq(1)
+            yield from write_ack(sink)
+            yield sink.eop.eq(0)
+
+        def rx():
+            # a stalled consumer finds all words read
+            for _ in range(stall):
+                yield
+            yield source.ack.eq(1)
+            yield
+            yield from wait_stb(source)
+            assert (yield source.data) == 0x2222222211111111
+            assert (yield source.eop) == 0
+            yield
+            yield from wait_stb(source)
+            assert (yield source.data) == 0x4444444433333333
+            assert (yield source.eop) == 1
+            yield
+            assert (yield source.stb) == 0
+
+        def ar_and_r_channel():
+            assert attrgetter_ar((yield from i.read_ar())) == (
+                0x11223340, 3, Burst.incr)
+            yield from i.write_r(0x55, 0x11111111, okay, 0)
+            yield from i.write_r(0x55, 0x22222222, okay, 0)
+            yield from i.write_r(0x55, 0x33333333, okay, 0)
+            yield from i.write_r(0x55, 0x44444444, okay, 1)
+
+        return [
+            request_rx(), rx(), ar_and_r_channel(),
+        ]
+
+    run_simulation(dut, testbench_reader_wide_source(),
+                   vcd_name=file_tmp_folder("test_reader_wide_source.vcd"))
+
+
+def test_writer_wide_sink():
+    i = axi.Interface()
+    dut = axi_dma.Writer(i, fifo_depth=4, nbits_sink=64)
+    sink = dut.sink
+
+    def testbench_writer_wide_sink():
+
+        def tx():
+            yield sink.addr.eq(0x11223340)
+            yield sink.data.eq(0x2222222211111111)
+            yield from write_ack(sink)
+            yield sink.data.eq(0x4444444433333333)
+            yield from write_ack(sink)
+            yield sink.eop.eq(1)
+            yield from write_ack(sink)
+            yield sink.eop.eq(0)
+
+        def aw_channel():
+            assert attrgetter_aw((yield from i.read_aw())) == (
+                0x11223340, 3, Burst.incr)
+
+        def w_channel():
+            yield i.w.ready.eq(1)
+            assert attrgetter_w((yield from i.read_w())) == (
+                0x11111111, 0xf, 0)
+            assert attrgetter_w((yield from i.read_w())) == (
+                0x22222222, 0xf, 0)
+            assert attrgetter_w((yield from i.read_w())) == (
+                0x33333333, 0xf, 0)
+            assert attrgetter_w((yield from i.read_w())) == (
+                0x44444444, 0xf, 1)
+            yield i.w.ready.eq(0)
+
+        def b_channel():
+            yield from i.write_b(0)
+
+        return [
+            tx(), aw_channel(), w_channel(), b_channel()
+        ]
+
+    run_simulation(dut, testbench_writer_wide_sink(),
+                   vcd_name=file_tmp_folder("test_writer_wide_sink.vcd"))
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_writer_check_nbits_sink():
+    i = axi.Interface()
+    axi_dma.Writer(i, nbits_sink=48)
+
+
+def test_duplex_dma():
+    i = axi.Interface()
+    dut = axi_dma.DuplexDMA(i, fifo_depth=4, read_id=1, write_id=2)
+    mem = AXIMemory(i, 1024, latency=2)
+    n = 16
+    for k in range(n):
+        mem.write_word(4 * k, 0x1000 + k, 0xf)
+    overlap = []
+
+    def testbench_duplex_dma():
+
+        def request_rx():
+            yield dut.request.addr.eq(0)
+            yield dut.request.n.eq(n)
+            yield dut.request.eop.eq(1)
+            yield from write_ack(dut.request)
+
+        def rx():
+            yield dut.source.ack.eq(1)
+            for k in range(n):
+                yield from wait_stb(dut.source)
+                assert (yield dut.source.data) == 0x1000 + k
+                assert (yield dut.source.eop) == int(k == n - 1)
+                yield
+
+        def tx():
+            yield dut.sink.addr.eq(0x100)
+            for k in range(n):
+                yield dut.sink.data.eq(0x2000 + k)
+                yield from write_ack(dut.sink)
+            yield dut.sink.eop.eq(1)
+            yield from write_ack(dut.sink)
+            yield dut.sink.eop.eq(0)
+
+        @passive
+        def monitor():
+            while True:
+                if (yield i.r.valid) and (yield i.w.valid):
+                    assert (yield i.r.id) == 1
+                    assert (yield i.w.id) == 2
+                    overlap.append(1)
+                yield
+
+        return [request_rx(), rx(), tx(), monitor()]
+
+    run_simulation(dut, testbench_duplex_dma() + mem.generators(),
+                   vcd_name=file_tmp_folder("test_duplex_dma.vcd"))
+    # reads and writes in parallel
+    assert overlap
+    assert [mem.read_word(0x100 + 4 * k) for k in range(n)] == [
+        0x2000 + k for k in range(n)]
+
+
+def test_multi_channel_reader():
+    i = axi.Interface(id_width=2)
+    dut = axi_dma.MultiChannelReader(i, 3, burst=4)
+    mem = AXIMemory(i, 1024, latency=3)
+    for k in range(256):
+        mem.write_word(4 * k, k, 0xf)
+    # (addr, n) per channel
+    requests = [(0x000, 10), (0x100, 12), (0x200, 6)]
+    received = [[], [], []]
+    done = []
+
+    def testbench_multi_channel_reader():
+
+        def request(c):
+            sink = dut.sinks[c]
+            addr, n = requests[c]
+            yield sink.addr.eq(addr)
+            yield sink.n.eq(n)
+            yield from write_ack(sink)
+
+        def rx(c, stall=0):
+            source = dut.sources[c]
+            for _ in range(stall):
+                yield
+            yield source.ack.eq(1)
+            while not received[c] or not received[c][-1][1]:
+                yield
+                if (yield source.stb):
+                    received[c].append(
+                        ((yield source.data), (yield source.eop)))
+            yield source.ack.eq(0)
+            done.append(c)
+
+        return [request(c) for c in range(3)] + [
+            rx(0, stall=100), rx(1), rx(2)]
+
+    run_simulation(
+        dut, testbench_multi_channel_reader() + mem.generators(),
+        vcd_name=file_tmp_folder("test_multi_channel_reader.vcd"))
+    # a stalled channel does not block the others
+    assert done == [1, 2, 0] or done == [2, 1, 0]
+    for c, (addr, n) in enumerate(requests):
+        assert [d for d, _ in received[c]] == list(
+            range(addr // 4, addr // 4 + n))
+        assert [eop for _, eop in received[c]] == [0] * (n - 1) + [1]
+
+
 def mem_decoder(address, start=28, end=31):
     def decoder(addr):
         return addr[start:end] == (
@@ -612,3 +840,610 @@ def test_incr():
     run_simulation(
         dut, testbench_incr(),
         vcd_name=file_tmp_folder("test_incr.vcd"))
+
+
+def test_id_remap():
+    master = axi.Interface(id_width=12)
+    slave = axi.Interface(id_width=6)
+    dut = AXIIdRemap(master, slave, n_ids=4)
+    attrgetter_id_addr = attrgetter("id", "addr")
+
+    def testbench_id_remap():
+
+        def ar_channel():
+            yield from master.write_ar(
+                0x123, 0x1000, 0, burst_size(4), Burst.incr)
+            yield from master.write_ar(
+                0x456, 0x2000, 0, burst_size(4), Burst.incr)
+            yield from master.write_ar(
+                0x123, 0x3000, 0, burst_size(4), Burst.incr)
+
+        def slave_ar_and_r_channel():
+            # same master ID, same slave ID
+            assert attrgetter_id_addr((yield from slave.read_ar())) == (
+                0, 0x1000)
+            assert attrgetter_id_addr((yield from slave.read_ar())) == (
+                1, 0x2000)
+            assert attrgetter_id_addr((yield from slave.read_ar())) == (
+                0, 0x3000)
+            # out of order between IDs
+            yield from slave.write_r(1, 0x22, last=1)
+            yield from slave.write_r(0, 0x11, last=1)
+            yield from slave.write_r(0, 0x33, last=1)
+
+        def r_channel():
+            assert attrgetter_r((yield from master.read_r())) == (
+                0x456, 0x22, okay, 1)
+            assert attrgetter_r((yield from master.read_r())) == (
+                0x123, 0x11, okay, 1)
+            assert attrgetter_r((yield from master.read_r())) == (
+                0x123, 0x33, okay, 1)
+
+        def aw_and_w_channel():
+            yield from master.write_aw(
+                0x7, 0x100, 0, burst_size(4), Burst.incr)
+            yield from master.write_aw(
+                0x9, 0x200, 0, burst_size(4), Burst.incr)
+            yield from master.write_w(0x9, 0xbb)
+            yield from master.write_w(0x7, 0xaa)
+
+        def slave_aw_w_and_b_channel():
+            assert attrgetter_id_addr((yield from slave.read_aw())) == (
+                0, 0x100)
+            assert attrgetter_id_addr((yield from slave.read_aw())) == (
+                1, 0x200)
+            assert (yield from slave.read_w()).id == 1
+            assert (yield from slave.read_w()).id == 0
+            yield from slave.write_b(1)
+            yield from slave.write_b(0)
+
+        def b_channel():
+            assert attrgetter_b((yield from master.read_b())) == (0x9, okay)
+            assert attrgetter_b((yield from master.read_b())) == (0x7, okay)
+
+        return [
+            ar_channel(), slave_ar_and_r_channel(), r_channel(),
+            aw_and_w_channel(), slave_aw_w_and_b_channel(), b_channel(),
+        ]
+
+    run_simulation(
+        dut, testbench_id_remap(),
+        vcd_name=file_tmp_folder("test_id_remap.vcd"))
+
+
+def test_id_remap_w_before_aw():
+    master = axi.Interface(id_width=12)
+    slave = axi.Interface(id_width=6)
+    dut = AXIIdRemap(master, slave, n_ids=4)
+
+    def testbench_id_remap_w_before_aw():
+
+        def aw_channel():
+            # W first
+            for _ in range(3):
+                yield
+            for id_, addr in [(0x7, 0x100), (0x9, 0x200)]:
+                yield from master.write_aw(
+                    id_, addr, 0, burst_size(4), Burst.incr)
+
+        def w_channel():
+            yield from master.write_w(0x7, 0xaa)
+            yield from master.write_w(0x9, 0xbb)
+
+        def slave_channels():
+            # AWREADY waits for WVALID
+            for id_, addr, data in [(0, 0x100, 0xaa), (1, 0x200, 0xbb)]:
+                while not (yield slave.w.valid):
+                    yield
+                w = yield from slave.read_w()
+                assert (w.id, w.data) == (id_, data)
+                aw = yield from slave.read_aw()
+                assert (aw.id, aw.addr) == (id_, addr)
+            yield from slave.write_b(1)
+            yield from slave.write_b(0)
+
+        def b_channel():
+            assert attrgetter_b((yield from master.read_b())) == (0x9, okay)
+            assert attrgetter_b((yield from master.read_b())) == (0x7, okay)
+
+        return [aw_channel(), w_channel(), slave_channels(), b_channel()]
+
+    run_simulation(
+        dut, testbench_id_remap_w_before_aw(),
+        vcd_name=file_tmp_folder("test_id_remap_w_before_aw.vcd"))
+
+
+def test_id_remap_w_before_aw_reused():
+    master = axi.Interface(id_width=12)
+    slave = axi.Interface(id_width=6)
+    dut = AXIIdRemap(master, slave, n_ids=4)
+    aws = []
+    ws = []
+
+    def testbench_id_remap_w_before_aw_reused():
+
+        def master_channel():
+            yield from master.write_aw(
+                0x5, 0x100, 0, burst_size(4), Burst.incr)
+            yield from master.write_w(0x5, 0xaa)
+            # the next write of 0x5 sends W first, the older one holds
+            # its narrow ID until its B
+            for _ in range(8):
+                yield
+            assert len(ws) == 1
+            assert attrgetter_b((yield from master.read_b())) == (0x5, okay)
+            for id_, addr in [(0x6, 0x200), (0x5, 0x300)]:
+                yield from master.write_aw(
+                    id_, addr, 0, burst_size(4), Burst.incr)
+
+        def w_channel():
+            while not ws:
+                yield
+            yield from master.write_w(0x5, 0xbb)
+
+        def slave_aw_channel():
+            while len(aws) < 3:
+                aw = yield from slave.read_aw()
+                aws.append((aw.id, aw.addr))
+
+        def slave_w_channel():
+            while len(ws) < 2:
+                w = yield from slave.read_w()
+                ws.append((w.id, w.data))
+
+        def slave_b_channel():
+            while not ws:
+                yield
+            for _ in range(10):
+                yield
+            yield from slave.write_b(ws[0][0])
+
+        return [master_channel(), w_channel(), slave_aw_channel(),
+                slave_w_channel(), slave_b_channel()]
+
+    run_simulation(
+        dut, testbench_id_remap_w_before_aw_reused(),
+        vcd_name=file_tmp_folder("test_id_remap_w_before_aw_reused.vcd"))
+    # the freed narrow ID went to 0x6, the beats follow the AW of 0x5
+    assert aws[1][0] == aws[0][0] != aws[2][0]
+    assert ws[1] == (aws[2][0], 0xbb)
+
+
+def test_write_combiner():
+    master = axi.Interface()
+    slave = axi.Interface()
+    dut = AXIWriteCombiner(master, slave, n_beats=4, timeout=8)
+    bufferable = 0b0011
+
+    def testbench_write_combiner():
+
+        def aw_channel():
+            for i in range(3):
+                yield from master.write_aw(
+                    i, 0x100 + 4 * i, 0, burst_size(4), Burst.incr,
+                    cache=bufferable)
+            # narrow writes into the same word
+            yield from master.write_aw(
+                3, 0x10c, 0, burst_size(1), Burst.incr, cache=bufferable)
+            yield from master.write_aw(
+                4, 0x10e, 0, burst_size(1), Burst.incr, cache=bufferable)
+            # flushed by timeout
+            yield from master.write_aw(
+                5, 0x204, 0, burst_size(4), Burst.incr, cache=bufferable)
+            # not bufferable, passed through
+            yield from master.write_aw(
+                6, 0x300, 0, burst_size(4), Burst.incr)
+
+        def w_channel():
+            for i in range(3):
+                yield from master.write_w(0, 0x11111111 * (i + 1))
+            yield from master.write_w(0, 0x44, strb=0b0001)
+            yield from master.write_w(0, 0x55 << 16, strb=0b0100)
+            yield from master.write_w(0, 0x66666666)
+            yield from master.write_w(0, 0x77777777)
+
+        def b_channel():
+            for i in range(7):
+                assert attrgetter_b((yield from master.read_b())) == (
+                    i, okay)
+
+        def slave_channel():
+            assert attrgetter_aw((yield from slave.read_aw())) == (
+                0x100, 3, Burst.incr)
+            assert attrgetter_w((yield from slave.read_w())) == (
+                0x11111111, 0xf, 0)
+            assert attrgetter_w((yield from slave.read_w())) == (
+                0x22222222, 0xf, 0)
+            assert attrgetter_w((yield from slave.read_w())) == (
+                0x33333333, 0xf, 0)
+            assert attrgetter_w((yield from slave.read_w())) == (
+                0x00550044, 0x5, 1)
+            yield from slave.write_b(0)
+            assert attrgetter_aw((yield from slave.read_aw())) == (
+                0x200, 3, Burst.incr)
+            assert (yield from slave.read_w()).strb == 0
+            assert attrgetter_w((yield from slave.read_w())) == (
+                0x66666666, 0xf, 0)
+            assert (yield from slave.read_w()).strb == 0
+            assert (yield from slave.read_w()).strb == 0
+            yield from slave.write_b(0)
+            assert attrgetter_aw((yield from slave.read_aw())) == (
+                0x300, 0, Burst.incr)
+            assert attrgetter_w((yield from slave.read_w())) == (
+                0x77777777, 0xf, 1)
+            yield from slave.write_b(6)
+
+        return [
+            aw_channel(), w_channel(), b_channel(), slave_channel(),
+        ]
+
+    run_simulation(
+        dut, testbench_write_combiner(),
+        vcd_name=file_tmp_folder("test_write_combiner.vcd"))
+
+
+@pytest.mark.parametrize(
+    "replacement", [
+        "round_robin",
+        "random",
+        "lru",
+    ])
+def test_read_cache(replacement):
+    master = axi.Interface()
+    slave = axi.Interface()
+    dut = AXIReadCache(master, slave, line_words=4, n_sets=4, n_ways=2,
+                       replacement=replacement)
+    fills = []
+    responses = []
+
+    def testbench_read_cache():
+
+        @passive
+        def memory():
+            while True:
+                ar = yield from slave.read_ar()
+                fills.append(ar.addr)
+                for _ in range(4):
+                    yield
+                for i in range(ar.len + 1):
+                    addr = ar.addr + 4 * i
+                    yield from slave.write_r(
+                        ar.id, addr,
+                        resp=Response.slverr if addr == 0x808 else okay,
+                        last=int(i == ar.len))
+
+        @passive
+        def write_channel():
+            while True:
+                aw = yield from slave.read_aw()
+                while not responses:
+                    yield
+                responses.pop()
+                yield from slave.write_b(aw.id)
+
+        def read(addr, n, resp=okay):
+            yield from master.write_ar(
+                0x7, addr, n - 1, burst_size(4), Burst.incr)
+            for i in range(n):
+                assert attrgetter_r((yield from master.read_r())) == (
+                    0x7, addr + 4 * i, resp, int(i == n - 1))
+
+        def write(addr, n):
+            yield from master.write_aw(
+                0x1, addr, n - 1, burst_size(4), Burst.incr)
+            responses.append(1)
+            yield from master.read_b()
+
+        def master_channel():
+            # miss, prefetch next line
+            yield from read(0x100, 4)
+            yield from read(0x104, 2)
+            yield from read(0x110, 4)
+            assert fills == [0x100, 0x110]
+            # writes invalidate every line they cover
+            yield from write(0x10c, 2)
+            yield from read(0x100, 1)
+            yield from read(0x110, 1)
+            assert fills[-2:] == [0x100, 0x110]
+            # fills racing a write are not kept
+            yield from master.write_ar(
+                0x7, 0x130, 0, burst_size(4), Burst.incr)
+            yield from master.write_aw(
+                0x1, 0x130, 0, burst_size(4), Burst.incr)
+            assert (yield from master.read_r()).data == 0x130
+            responses.append(1)
+            yield from master.read_b()
+            misses = yield dut._misses.status
+            yield from read(0x130, 1)
+            assert (yield dut._misses.status) == misses + 1
+            # nor fills a write completed during
+            yield from master.write_ar(
+                0x7, 0x1c0, 0, burst_size(4), Burst.incr)
+            yield from write(0x1c0, 1)
+            assert (yield from master.read_r()).data == 0x1c0
+            yield from read(0x1c0, 1)
+            assert (yield dut._misses.status) == misses + 3
+            # nor fills an invalidation happened during
+            yield from master.write_ar(
+                0x7, 0x1e0, 0, burst_size(4), Burst.incr)
+            # fill issued, data not yet returned
+            for _ in range(2):
+                yield
+            yield dut._invalidate.re.eq(1)
+            yield
+            yield dut._invalidate.re.eq(0)
+            assert (yield from master.read_r()).data == 0x1e0
+            yield from read(0x1e0, 1)
+            assert (yield dut._misses.status) == misses + 5
+            # fills with an error response are not kept
+            yield from read(0x800, 1, Response.slverr)
+            yield from read(0x800, 1, Response.slverr)
+            assert fills[-3:] == [0x800, 0x810, 0x800]
+            # bypass
+            yield from master.write_ar(
+                0x7, 0x404, 3, burst_size(4), Burst.wrap)
+            for _ in range(4):
+                yield from master.read_r()
+            assert fills[-1] == 0x404
+            yield dut._invalidate.re.eq(1)
+            yield
+            yield dut._invalidate.re.eq(0)
+            yield from read(0x110, 1)
+            assert fills[-1] == 0x110
+            assert (yield dut._hits.status) == 3
+            assert (yield dut._misses.status) == 11
+            # evict after a hit on the way filled first
+            yield from read(0x230, 1)
+            yield from read(0x330, 1)
+            yield from read(0x230, 1)
+            yield from read(0x430, 1)
+            hits = yield dut._hits.status
+            yield from read(0x230, 1)
+            kept = (yield dut._hits.status) == hits + 1
+            if replacement != "random":
+                assert kept == (replacement == "lru")
+
+        return [
+            memory(), write_channel(), master_channel(),
+        ]
+
+    run_simulation(
+        dut, testbench_read_cache(),
+        vcd_name=file_tmp_folder("test_read_cache.vcd"))
+
+
+def test_read_cache_plru():
+    master = axi.Interface()
+    slave = axi.Interface()
+    dut = AXIReadCache(master, slave, line_words=4, n_sets=2, n_ways=4,
+                       replacement="lru", prefetch=False)
+
+    def testbench_read_cache_plru():
+
+        @passive
+        def memory():
+            while True:
+                ar = yield from slave.read_ar()
+                for i in range(ar.len + 1):
+                    yield from slave.write_r(
+                        ar.id, ar.addr + 4 * i, last=int(i == ar.len))
+
+        def read(addr):
+            hits = yield dut._hits.status
+            yield from master.write_ar(0x7, addr, 0, burst_size(4),
+                                       Burst.incr)
+            assert (yield from master.read_r()).data == addr
+            return (yield dut._hits.status) == hits + 1
+
+        def master_channel():
+            # a, b, c, d fill the ways of a set, the hit on a leaves b
+            # least recently used but points the tree to c
+            for addr in [0x00, 0x20, 0x40, 0x60, 0x00, 0x80]:
+                yield from read(addr)
+            assert (yield from read(0x20))
+            assert (yield from read(0x60))
+            assert (yield from read(0x80))
+            assert not (yield from read(0x40))
+
+        return [memory(), master_channel()]
+
+    run_simulation(
+        dut, testbench_read_cache_plru(),
+        vcd_name=file_tmp_folder("test_read_cache_plru.vcd"))
+    with pytest.raises(ValueError):
+        AXIReadCache(master, slave, n_ways=3, replacement="lru")
+
+
+def test_hp_throttle():
+    master = axi.Interface(data_width=64, id_width=6)
+    slave = axi.Interface.like(master)
+    fifo = hp_fifo_rec()
+    dut = HPThrottle(master, slave, fifo)
+
+    def held(ch, cycles=4):
+        for _ in range(cycles):
+            yield
+            if (yield ch.ready):
+                return False
+        return True
+
+    def testbench_hp_throttle():
+        yield dut._issue_cap1.storage.eq(0b10)
+        yield dut._ar_limit.storage.eq(2)
+        yield fifo.racount.eq(2)
+        yield slave.ar.ready.eq(1)
+        yield
+        assert (yield fifo.wrissuecap1_en)
+        assert not (yield fifo.rdissuecap1_en)
+        # command fifo full
+        yield master.ar.addr.eq(0x100)
+        yield master.ar.valid.eq(1)
+        assert (yield from held(master.ar))
+        assert not (yield slave.ar.valid)
+        assert (yield dut._ar_throttled.status) != 0
+        yield fifo.racount.eq(1)
+        assert not (yield from held(master.ar))
+        yield master.ar.valid.eq(0)
+        # data fifo fill
+        yield fifo.racount.eq(0)
+        yield fifo.rcount.eq(120)
+        yield master.ar.len.eq(15)
+        yield master.ar.valid.eq(1)
+        assert (yield from held(master.ar))
+        yield fifo.rcount.eq(112)
+        assert not (yield from held(master.ar))
+        yield master.ar.valid.eq(0)
+        yield slave.ar.ready.eq(0)
+        # presented request is not withdrawn
+        yield fifo.rcount.eq(0)
+        yield master.ar.valid.eq(1)
+        yield
+        yield
+        yield fifo.rcount.eq(120)
+        for _ in range(4):
+            yield
+            assert (yield slave.ar.valid)
+        ar = yield from slave.read_ar()
+        assert (ar.addr, ar.len) == (0x100, 15)
+        yield master.ar.valid.eq(0)
+        # beats of issued reads count until taken, 33 so far
+        yield fifo.rcount.eq(0)
+        yield dut._r_limit.storage.eq(64)
+        yield slave.ar.ready.eq(1)
+        yield from master.write_ar(4, 0x200, 15, burst_size(8), Burst.incr)
+        yield master.ar.valid.eq(1)
+        assert (yield from held(master.ar))
+        yield master.r.ready.eq(1)
+        yield from slave.write_r(0, 0, last=1)
+        assert not (yield from held(master.ar))
+        yield master.ar.valid.eq(0)
+        yield slave.ar.ready.eq(0)
+
+        # beats of issued writes count until sent
+        yield fifo.wcount.eq(124)
+        yield slave.aw.ready.eq(1)
+        yield from master.write_aw(2, 0x300, 3, burst_size(8), Burst.incr)
+        yield master.aw.valid.eq(1)
+        assert (yield from held(master.aw))
+        yield slave.w.ready.eq(1)
+        for i in range(4):
+            yield from master.write_w(2, i, last=int(i == 3))
+        assert not (yield from held(master.aw))
+        yield master.aw.valid.eq(0)
+        assert (yield dut._aw_throttled.status) != 0
+        # beats sent ahead of their aw count once
+        for id_ in [2, 3]:
+            for i in range(4):
+                yield from master.write_w(id_, i, last=int(i == 3))
+        yield master.aw.valid.eq(1)
+        assert not (yield from held(master.aw))
+        yield master.aw.valid.eq(0)
+        yield fifo.wcount.eq(125)
+        yield
+        yield master.aw.valid.eq(1)
+        assert (yield from held(master.aw))
+
+    run_simulation(dut, testbench_hp_throttle(),
+                   vcd_name=file_tmp_folder("test_hp_throttle.vcd"))
+
+
+def test_hp_striper():
+    master = axi.Interface(data_width=64, id_width=6)
+    slaves = [axi.Interface.like(master) for _ in range(4)]
+    dut = HPStriper(master, slaves, granularity=32)
+    ddr = bytearray(1024)
+    mems = [AXIMemory(s, ddr, latency=latency)
+            for s, latency in zip(slaves, [6, 0, 3, 1])]
+    n = 8
+    issued = [0] * 4
+
+    def data(k, beat):
+        return (k << 8) | beat
+
+    def aw_channel():
+        for k in range(n):
+            yield from master.write_aw(
+                k, 32 * k, 3, burst_size(8), Burst.incr)
+
+    def w_channel():
+        for k in range(n):
+            for beat in range(4):
+                yield from master.write_w(k, data(k, beat),
+                                          last=int(beat == 3))
+
+    def ar_channel():
+        # after the writes completed
+        while (yield master.b.valid) == 0 or (yield master.b.id) != n - 1:
+            yield
+        for _ in range(4):
+            yield
+        for k in reversed(range(n)):
+            yield from master.write_ar(
+                k, 32 * k, 3, burst_size(8), Burst.incr)
+
+    def b_r_channel():
+        for k in range(n):
+            assert attrgetter_b((yield from master.read_b())) == (k, okay)
+        for k in reversed(range(n)):
+            for beat in range(4):
+                assert attrgetter_r((yield from master.read_r())) == (
+                    k, data(k, beat), okay, int(beat == 3))
+
+    @passive
+    def monitor():
+        while True:
+            yield
+            for i, s in enumerate(slaves):
+                if (yield s.ar.valid) and (yield s.ar.ready):
+                    issued[i] += 1
+
+    run_simulation(
+        dut, [aw_channel(), w_channel(), ar_channel(), b_r_channel(),
+              monitor()] + [g for mem in mems for g in mem.generators()],
+        vcd_name=file_tmp_folder("test_hp_striper.vcd"))
+    assert issued == [2, 2, 2, 2]
+    assert int.from_bytes(ddr[32 * 5:32 * 5 + 8], "little") == data(5, 0)
+
+
+def test_acp_line_fill():
+    bus = axi.Interface(data_width=64, id_width=6)
+    acp = axi.Interface(data_width=64, id_width=3)
+    user = acp_user_rec()
+    dut = Module()
+    dut.submodules.fill = fill = LineFill(bus, id_=0x2a)
+    dut.submodules.adapter = ACPAdapter(bus, acp, user)
+    mem = AXIMemory(acp, 256, base=0x100, latency=2)
+    for i in range(32):
+        mem.write_word(0x100 + 8 * i, 0x1000 + i, 0xff)
+
+    def testbench_acp_line_fill():
+        yield fill.source.ack.eq(1)
+        for addr, words in [(0x118, [3, 0, 1, 2]), (0x124, [4, 5, 6, 7])]:
+            yield fill.sink.addr.eq(addr)
+            yield fill.sink.stb.eq(1)
+            yield
+            while not (yield acp.ar.valid):
+                yield
+            assert (yield acp.ar.burst) == Burst.wrap
+            assert (yield acp.ar.cache) == 0b1111
+            assert (yield user.aruser) == 0b11111
+            assert (yield acp.ar.id) < 8
+            while not (yield fill.sink.ack):
+                yield
+            yield
+            yield fill.sink.stb.eq(0)
+            received = []
+            while not received or not received[-1][2]:
+                if (yield fill.source.stb):
+                    received.append(((yield fill.source.addr),
+                                     (yield fill.source.data),
+                                     (yield fill.source.eop)))
+                yield
+            assert [a for a, *_ in received] == [
+                (addr & ~0x1f) + 8 * (w & 3) for w in words]
+            assert [d for _, d, _ in received] == [0x1000 + w for w in words]
+        assert (yield bus.r.id) == 0x2a
+
+    run_simulation(
+        dut, [testbench_acp_line_fill()] + mem.generators(),
+        vcd_name=file_tmp_folder("test_acp_line_fill.vcd"))
@@ -0,0 +1,108 @@
+from migen import *  # noqa
+from migen.sim import passive, run_simulation
+from misoc.interconnect.csr_eventmanager import (
+    EventManager, EventSourceProcess, EventSourcePulse)
+from migen_axi.cores import irq_coalescer
+from .common import file_tmp_folder
+
+
+def test_irq_coalescer():
+    irqs = [Signal(), Signal()]
+    event = Signal()
+    dut = irq_coalescer.IRQCoalescer(irqs, [event, 0])
+
+    def pulse(signal):
+        yield signal.eq(1)
+        yield
+        yield signal.eq(0)
+
+    def testbench_irq_coalescer():
+        yield dut._count0.storage.eq(3)
+        yield dut._count1.storage.eq(4)
+        yield dut._timeout1.storage.eq(10)
+        yield
+        # line 0 by count, the first event sets pending
+        for _ in range(2):
+            yield from pulse(event)
+            yield irqs[0].eq(1)
+            for _ in range(5):
+                yield
+            assert not (yield dut.irq)
+        yield from pulse(event)
+        yield
+        assert (yield dut.irq) == 0b01
+        assert (yield dut._pending.status) == 0b01
+        yield irqs[0].eq(0)
+        yield
+        assert not (yield dut.irq)
+        yield
+        # count restarted
+        yield from pulse(event)
+        yield irqs[0].eq(1)
+        for _ in range(5):
+            yield
+        assert not (yield dut.irq)
+        yield irqs[0].eq(0)
+        # line 1 without events, by timeout
+        yield irqs[1].eq(1)
+        cycles = 0
+        while not (yield dut.irq):
+            yield
+            cycles += 1
+        assert cycles == 11
+        assert (yield dut._pending.status) == 0b10
+
+    run_simulation(dut, testbench_irq_coalescer(),
+                   vcd_name=file_tmp_folder("test_irq_coalescer.vcd"))
+
+
+def test_irq_coalescer_defaults():
+    irq = Signal()
+    dut = irq_coalescer.IRQCoalescer([irq])
+
+    def testbench_irq_coalescer_defaults():
+        # without events and timeout the count is ignored
+        yield dut._count0.storage.eq(3)
+        yield
+        yield irq.eq(1)
+        yield
+        yield
+        assert (yield dut.irq)
+
+    run_simulation(dut, testbench_irq_coalescer_defaults())
+
+
+def test_event_strobe():
+    ev = EventManager()
+    ev.done = EventSourcePulse()
+    ev.error = EventSourceProcess()
+    ev.finalize()
+    dut = irq_coalescer.EventStrobe(ev)
+    dut.submodules.ev = ev
+    strobes = []
+
+    def testbench_event_strobe():
+        yield ev.enable.storage.eq(0b11)
+        for trigger in [ev.done.trigger] * 3 + [ev.error.trigger]:
+            yield trigger.eq(1)
+            yield
+            yield trigger.eq(0)
+            yield
+            yield
+        # disabled sources are not counted
+        yield ev.enable.storage.eq(0b10)
+        yield ev.done.trigger.eq(1)
+        yield
+        yield ev.done.trigger.eq(0)
+        for _ in range(3):
+            yield
+
+    @passive
+    def monitor():
+        while True:
+            strobes.append((yield dut.o))
+            yield
+
+    run_simulation(dut, [testbench_event_strobe(), monitor()])
+    # still pending, every done is counted, error on its falling edge
+    assert sum(strobes) == 4
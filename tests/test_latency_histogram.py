@@ -0,0 +1,155 @@
+import pytest
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.interconnect import axi
+from migen_axi.cores import latency_histogram
+from .common import file_tmp_folder
+
+
+@pytest.mark.parametrize(
+    "sub_bits, values", [
+        (0, [(0, 0), (1, 1), (2, 2), (3, 2), (4, 3), (255, 8), (256, 8)]),
+        (2, [(0, 0), (3, 3), (4, 4), (5, 5), (8, 8), (9, 8), (12, 10),
+             (255, 27), (256, 27)]),
+    ])
+def test_log_bin(sub_bits, values):
+    # saturate at the last bin
+    dut = latency_histogram._LogBin(9, sub_bits, (8 - sub_bits + 1) <<
+                                    sub_bits)
+
+    def testbench_log_bin():
+        for i, o in values:
+            yield dut.i.eq(i)
+            yield
+            assert (yield dut.o) == o
+
+    run_simulation(dut, testbench_log_bin())
+
+
+def test_latency_histogram():
+    bus = axi.Interface(id_width=6)
+    dut = latency_histogram.AXILatencyHistogram(bus, latency_width=8)
+    window = dut.window
+    n_bins = dut._n_bins.value.value
+    n_reads = 5
+
+    def testbench_latency_histogram():
+
+        def master():
+            yield dut._enable.storage.eq(1)
+            for i in range(n_reads):
+                yield from bus.write_ar(
+                    i % 2, 0x100 * i, 0, axi.burst_size(4), axi.Burst.incr)
+            yield from bus.write_aw(
+                0x3, 0x100, 0, axi.burst_size(4), axi.Burst.incr)
+            yield from bus.write_w(0x3, 0x11223344)
+
+        def slave():
+            for i in range(n_reads):
+                yield from bus.read_ar()
+            # out of order between IDs
+            yield from bus.write_r(1, 0x11, last=1)
+            yield from bus.write_r(1, 0x11, last=1)
+            for i in range(3):
+                for _ in range(8):
+                    yield
+                yield from bus.write_r(0, 0x11, last=1)
+            yield from bus.read_aw()
+            yield from bus.read_w()
+            yield from bus.write_b(0x3)
+
+        def readout():
+            yield bus.r.ready.eq(1)
+            yield bus.b.ready.eq(1)
+            for _ in range(100):
+                yield
+            yield dut._enable.storage.eq(0)
+            yield window.r.ready.eq(1)
+            yield from window.write_ar(
+                0x1, 0, n_bins - 1, axi.burst_size(4), axi.Burst.incr)
+            hist_r = []
+            while len(hist_r) < n_bins:
+                if (yield window.r.valid):
+                    hist_r.append((yield window.r.data))
+                yield
+            assert sum(hist_r) == n_reads
+            # later completions take longer
+            assert max(i for i, v in enumerate(hist_r) if v) > 8
+            yield from window.write_ar(
+                0x1, 4 * 2**bits_for(n_bins - 1), n_bins - 1,
+                axi.burst_size(4), axi.Burst.incr)
+            hist_w = []
+            while len(hist_w) < n_bins:
+                if (yield window.r.valid):
+                    hist_w.append((yield window.r.data))
+                yield
+            assert sum(hist_w) == 1
+            # clear
+            yield dut._clear.re.eq(1)
+            yield
+            yield dut._clear.re.eq(0)
+            for _ in range(n_bins + 1):
+                yield
+            yield from window.write_ar(
+                0x1, 0, n_bins - 1, axi.burst_size(4), axi.Burst.incr)
+            hist_r = []
+            while len(hist_r) < n_bins:
+                if (yield window.r.valid):
+                    hist_r.append((yield window.r.data))
+                yield
+            assert sum(hist_r) == 0
+
+        return [
+            master(), slave(), readout(),
+        ]
+
+    run_simulation(dut, testbench_latency_histogram(),
+                   vcd_name=file_tmp_folder("test_latency_histogram.vcd"))
+
+
+def test_latency_histogram_id_bits():
+    bus = axi.Interface()
+    dut = latency_histogram.AXILatencyHistogram(bus, latency_width=8,
+                                                id_bits=1)
+    window = dut.window
+    n_bins = dut._n_bins.value.value
+
+    def testbench_latency_histogram_id_bits():
+
+        def master():
+            yield dut._enable.storage.eq(1)
+            # 0x000 and 0x102 share a slot, 0x001 has one
+            for id_ in [0x000, 0x102, 0x001, 0x100]:
+                yield from bus.write_ar(
+                    id_, 0x100, 0, axi.burst_size(4), axi.Burst.incr)
+
+        def slave():
+            for i in range(3):
+                yield from bus.read_ar()
+            for id_ in [0x102, 0x001, 0x000]:
+                yield from bus.write_r(id_, 0x11, last=1)
+            # drained
+            yield from bus.read_ar()
+            yield from bus.write_r(0x100, 0x11, last=1)
+
+        def readout():
+            yield bus.r.ready.eq(1)
+            for _ in range(50):
+                yield
+            yield window.r.ready.eq(1)
+            yield from window.write_ar(
+                0x1, 0, n_bins - 1, axi.burst_size(4), axi.Burst.incr)
+            hist_r = []
+            while len(hist_r) < n_bins:
+                if (yield window.r.valid):
+                    hist_r.append((yield window.r.data))
+                yield
+            assert sum(hist_r) == 2
+
+        return [
+            master(), slave(), readout(),
+        ]
+
+    run_simulation(dut, testbench_latency_histogram_id_bits())
+    with pytest.raises(ValueError):
+        latency_histogram.AXILatencyHistogram(bus, id_bits=7)
@@ -0,0 +1,52 @@
+import pytest
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.cores import perf_events
+from migen_axi.cores.ps7 import ftmt_rec
+from .common import file_tmp_folder
+
+
+def test_perf_events():
+    stall, burst = Signal(), Signal()
+    ftmt = ftmt_rec()
+    dut = perf_events.PerfEvents(
+        [("stall", stall), ("burst", burst)], ftmt, triggers=["burst"])
+
+    def testbench_perf_events():
+        yield dut._enable.storage.eq(1)
+        yield stall.eq(1)
+        for _ in range(5):
+            yield
+        yield stall.eq(0)
+        yield burst.eq(1)
+        yield
+        yield burst.eq(0)
+        yield
+        assert (yield ftmt.f2p.debug) == 0b11
+        assert (yield ftmt.f2p.trig) == 0b1
+        # held until acknowledged
+        for _ in range(3):
+            yield
+        assert (yield ftmt.f2p.trig) == 0b1
+        yield ftmt.f2p.trigack.eq(0b1)
+        yield
+        yield ftmt.f2p.trigack.eq(0)
+        yield
+        assert (yield ftmt.f2p.trig) == 0
+        yield dut._enable.storage.eq(0)
+        yield stall.eq(1)
+        yield
+        yield stall.eq(0)
+        yield dut._snapshot.re.eq(1)
+        yield
+        yield dut._snapshot.re.eq(0)
+        yield
+        assert (yield dut._stall.status) == 5
+        assert (yield dut._burst.status) == 1
+
+    run_simulation(dut, testbench_perf_events(),
+                   vcd_name=file_tmp_folder("test_perf_events.vcd"))
+    with pytest.raises(ValueError):
+        perf_events.PerfEvents([("stall", stall)], ftmt, triggers=["burst"])
+    with pytest.raises(ValueError):
+        perf_events.PerfEvents([("snapshot", stall)])
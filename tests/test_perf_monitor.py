@@ -0,0 +1,73 @@
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.interconnect import axi
+from migen_axi.cores import perf_monitor
+from .common import file_tmp_folder
+
+
+def test_perf_monitor():
+    bus = axi.Interface()
+    dut = perf_monitor.AXIPerfMonitor(bus)
+
+    def testbench_perf_monitor():
+
+        def master():
+            yield dut._enable.storage.eq(1)
+            yield
+            yield from bus.write_ar(0x1, 0x100, 3, axi.burst_size(4),
+                                    axi.Burst.incr)
+            for _ in range(4):
+                yield from bus.read_r()
+            yield from bus.write_aw(0x2, 0x200, 0, axi.burst_size(4),
+                                    axi.Burst.incr)
+            yield from bus.write_w(0x2, 0x11223344)
+            yield from bus.read_b()
+            yield dut._enable.storage.eq(0)
+            yield dut._snapshot.re.eq(1)
+            yield
+            yield dut._snapshot.re.eq(0)
+            yield
+            assert (yield dut._ar_bursts.status) == 1
+            assert (yield dut._r_beats.status) == 4
+            assert (yield dut._aw_bursts.status) == 1
+            assert (yield dut._w_beats.status) == 1
+            assert (yield dut._b_resps.status) == 1
+            # slave waits before accepting
+            assert (yield dut._ar_stalls.status) >= 2
+            assert (yield dut._rd_outstanding.status) == 0
+            assert (yield dut._rd_outstanding_max.status) == 1
+            assert (yield dut._rd_lat_count.status) == 1
+            assert (yield dut._wr_lat_count.status) == 1
+            rd_lat_min = yield dut._rd_lat_min.status
+            assert rd_lat_min == (yield dut._rd_lat_max.status)
+            assert rd_lat_min == (yield dut._rd_lat_sum.status)
+            # 4 beats, 3 wait states
+            assert rd_lat_min >= 4 + 3
+            # clear
+            yield dut._clear.re.eq(1)
+            yield
+            yield dut._clear.re.eq(0)
+            yield dut._snapshot.re.eq(1)
+            yield
+            yield dut._snapshot.re.eq(0)
+            yield
+            assert (yield dut._cycles.status) == 0
+            assert (yield dut._r_beats.status) == 0
+
+        def slave():
+            for _ in range(4):
+                yield
+            yield from bus.read_ar()
+            for i in range(4):
+                yield
+                yield from bus.write_r(0x1, i, last=int(i == 3))
+            yield from bus.read_aw()
+            yield from bus.read_w()
+            yield from bus.write_b(0x2)
+
+        return [
+            master(), slave(),
+        ]
+
+    run_simulation(dut, testbench_perf_monitor(),
+                   vcd_name=file_tmp_folder("test_perf_monitor.vcd"))
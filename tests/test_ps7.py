@@ -1,6 +1,8 @@
+import time
 import pytest
+from migen import Instance
 from migen.sim import run_simulation
-from migen_axi.interconnect import Interface, wrshim
+from migen_axi.interconnect import Interface, interface_layout, wrshim
 from migen_axi.cores import ps7
 
 rec = Interface()
@@ -179,3 +181,51 @@ def test_connect_m_axi():
     assert len(ps7.connect_m_axi(rec)["o_RECAWADDR"]) == 32
     assert len(ps7.connect_m_axi(rec)["o_RECAWSIZE"]) == 2
     assert len(ps7.connect_m_axi(rec)["o_RECARSIZE"]) == 2
+
+
+@pytest.mark.parametrize("ps_m", [True, False])
+def test_port_widths(ps_m):
+    assert ps7.port_widths("rec", interface_layout(), ps_m) == tuple(
+        (name, len(sig))
+        for name, sig in ps7.connect_interface(rec, ps_m).items())
+
+
+def test_ps7_ports():
+    dut = ps7.PS7(ports=["m_axi_gp0", "s_axi_hp0"])
+    assert hasattr(dut, "s_axi_hp0_fifo")
+    assert not hasattr(dut, "s_axi_hp1")
+    assert not hasattr(dut, "enet0")
+    inst, = [s for s in dut.get_fragment().specials
+             if isinstance(s, Instance) and s.of == "PS7"]
+    items = {item.name: item.expr for item in inst.items}
+    assert items["SAXIHP0ARVALID"] is dut.s_axi_hp0.ar.valid
+    assert items["SAXIHP1ARVALID"].value == 0
+    assert len(items["EMIOGPIOI"]) == 64
+    assert "EMIOGPIOO" not in items
+    with pytest.raises(ValueError):
+        ps7.PS7(ports=["s_axi_hp4"])
+    # unused ports are tied off without records
+    ps7.port_names_cache.clear()
+    ps7.PS7(ports=[])
+    assert not {key[0] for key in ps7.port_names_cache} & set(ps7.PS7_PORTS)
+
+
+def test_ps7_elaboration(record_property):
+    ps7.PS7()
+    n_tables = len(ps7.port_names_cache)
+    start = time.perf_counter()
+    for _ in range(5):
+        ps7.PS7()
+    record_property("ps7_elaboration_s", (time.perf_counter() - start) / 5)
+    # name tables are built once
+    assert len(ps7.port_names_cache) == n_tables
+
+
+def test_ps7_fclks():
+    dut = ps7.PS7(ports=[], fclks=[1, 3])
+    assert dut.cd_fclk1.name == "fclk1"
+    assert not hasattr(dut, "cd_fclk2")
+    fragment = dut.get_fragment()
+    assert {cd.name for cd in fragment.clock_domains} >= {"fclk1", "fclk3"}
+    with pytest.raises(ValueError):
+        ps7.PS7(fclks=[0])
@@ -0,0 +1,101 @@
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.interconnect import axi
+from migen_axi.cores import ring_capture
+from migen_axi.sim import AXIMemory
+from .common import file_tmp_folder
+
+
+def test_ring_capture():
+    bus = axi.Interface()
+    dut = ring_capture.RingCapture(bus, burst=4)
+    mem = AXIMemory(bus, 256, base=0x1000, latency=2)
+    # 4 bursts of 16 bytes, at most 3 held
+    size = 64
+    n = 42
+    words = list(range(0x100, 0x100 + n))
+    received = []
+
+    def push():
+        for word in words:
+            yield dut.sink.data.eq(word)
+            yield dut.sink.stb.eq(1)
+            yield
+            while not (yield dut.sink.ack):
+                yield
+            yield dut.sink.stb.eq(0)
+
+    def consume():
+        for csr, value in [
+                (dut._base, 0x1000), (dut._size, size),
+                (dut._threshold, 32), (dut._timeout, 50),
+                (dut._enable, 1)]:
+            yield csr.storage.eq(value)
+        yield dut.ev.enable.storage.eq(0b11)
+        # ring full, sink stalled
+        while (yield dut._level.status) != size - 16:
+            yield
+        stalls = yield dut._stalls.status
+        for _ in range(20):
+            yield
+        assert (yield dut._level.status) == size - 16
+        assert (yield dut._stalls.status) > stalls
+        assert (yield dut.ev.threshold.pending)
+        assert (yield dut.ev.irq)
+        rd_ptr = 0
+        # the last 2 words never complete a burst
+        while len(received) < 40:
+            yield
+            wr_ptr = yield dut._wr_ptr.status
+            while rd_ptr != wr_ptr:
+                received.append(mem.read_word(0x1000 + rd_ptr))
+                rd_ptr = (rd_ptr + 4) % size
+            yield dut._rd_ptr.storage.eq(rd_ptr)
+            yield dut._rd_ptr.re.eq(1)
+            yield
+            yield dut._rd_ptr.re.eq(0)
+        assert received == words[:40]
+        assert not (yield dut.ev.threshold.pending)
+        # nothing available, no timeout
+        for _ in range(60):
+            yield
+        assert (yield dut._level.status) == 0
+        assert not (yield dut.ev.timeout.pending)
+
+    run_simulation(dut, [push(), consume()] + mem.generators(),
+                   vcd_name=file_tmp_folder("test_ring_capture.vcd"))
+
+
+def test_ring_capture_timeout():
+    bus = axi.Interface()
+    dut = ring_capture.RingCapture(bus, burst=4)
+    mem = AXIMemory(bus, 256, latency=2)
+
+    def testbench_ring_capture_timeout():
+        for csr, value in [
+                (dut._size, 128), (dut._threshold, 64), (dut._timeout, 20),
+                (dut._enable, 1)]:
+            yield csr.storage.eq(value)
+        yield dut.sink.stb.eq(1)
+        for i in range(4):
+            yield dut.sink.data.eq(i)
+            yield
+        yield dut.sink.stb.eq(0)
+        while (yield dut._wr_ptr.status) == 0:
+            yield
+        assert not (yield dut.ev.threshold.pending)
+        for _ in range(18):
+            yield
+            assert not (yield dut.ev.timeout.pending)
+        for _ in range(3):
+            yield
+        assert (yield dut.ev.timeout.pending)
+        assert mem.read_word(12) == 3
+        # disabled, restarts at 0
+        yield dut._enable.storage.eq(0)
+        yield
+        yield
+        assert (yield dut._wr_ptr.status) == 0
+
+    run_simulation(dut, [testbench_ring_capture_timeout()] +
+                   mem.generators())
@@ -0,0 +1,69 @@
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.interconnect import axi, axi_dma
+from migen_axi.sim import AXIMemory, Bandwidth, PS7Sim
+from .common import write_ack, file_tmp_folder
+
+
+def test_ps7_sim():
+    dut = Module()
+    dut.submodules.ps7 = ps7 = PS7Sim(ddr=4096, latency=4)
+    # gp0 looped back into the ddr
+    dut.submodules += axi.InterconnectPointToPoint(
+        ps7.m_axi_gp0, ps7.s_axi_gp0)
+    dut.submodules.writer = writer = axi_dma.Writer(
+        ps7.s_axi_hp0, fifo_depth=4)
+
+    def tx():
+        yield writer.sink.addr.eq(0x200)
+        for i in range(8):
+            yield writer.sink.data.eq(0x1111111100000000 * i + i)
+            yield from write_ack(writer.sink)
+        yield writer.sink.eop.eq(1)
+        yield from write_ack(writer.sink)
+        yield writer.sink.eop.eq(0)
+
+    def testbench_ps7_sim():
+        resp = yield from ps7.gp0.write(0x100, [1, 2, 3, 4])
+        assert resp == axi.Response.okay
+        data, resp = yield from ps7.gp0.read(0x100, 4)
+        assert data == [1, 2, 3, 4]
+        while ps7.memories["s_axi_hp0"].wr_bytes < 64:
+            yield
+        data, resp = yield from ps7.gp0.read(0x200, 16)
+        assert data == [i for i in range(8) for i in (i, 0x11111111 * i)]
+        # outside the ddr
+        data, resp = yield from ps7.gp0.read(0x1000)
+        assert resp == axi.Response.decerr
+        assert all(latency > 4 for latency in ps7.gp0.latencies)
+
+    run_simulation(dut, [tx(), testbench_ps7_sim()] + ps7.generators(),
+                   vcd_name=file_tmp_folder("test_ps7_sim.vcd"))
+    assert ps7.ddr[0x104] == 2
+
+
+def test_memory_bandwidth():
+    cycles = []
+    for bandwidth in [None, Bandwidth(1, burst=4)]:
+        bus = axi.Interface()
+        mem = AXIMemory(bus, 256, bandwidth=bandwidth)
+
+        def testbench_memory_bandwidth():
+            yield bus.r.ready.eq(1)
+            yield from bus.write_ar(0, 0, 15, axi.burst_size(4),
+                                    axi.Burst.incr)
+            n = 0
+            cycle = 0
+            while n < 16:
+                if (yield bus.r.valid):
+                    n += 1
+                yield
+                cycle += 1
+            cycles.append(cycle)
+            assert mem.rd_bytes == 64
+
+        run_simulation(Module(), [testbench_memory_bandwidth()] +
+                       mem.generators())
+    # 64 bytes at one byte per cycle, after the initial burst
+    assert cycles[0] < 20
+    assert cycles[1] >= 64 - 4 - 1
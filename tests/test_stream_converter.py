@@ -1,6 +1,9 @@
+import random
+import pytest
 from toolz.curried import *  # noqa
 from misoc.interconnect import stream
-from migen_axi.interconnect import axi, Reader
+from migen_axi.interconnect import axi, Reader, Gearbox
+from migen_axi.sim import AXIMemory
 from .common import write_ack, wait_stb, file_tmp_folder
 from migen.sim import run_simulation
 
@@ -144,3 +147,199 @@ def test_reader():
     run_simulation(
         dut, testbench_reader(),
         vcd_name=file_tmp_folder("test_reader.vcd"))
+
+
+def test_reader_gearbox():
+    i = axi.Interface()
+    dut = Reader(i, nbits_source=12, fifo_depth=4)
+    source, sink = dut.source, dut.sink
+    samples = [0x111 * (k + 1) for k in range(8)]
+    packed = sum(s << (k * 12) for k, s in enumerate(samples))
+    received = []
+
+    def testbench_reader_gearbox():
+
+        def push_addr():
+            yield sink.n.eq(3)
+            yield from request_addr(sink, 0x11223340, eop=True)
+
+        def pull_data():
+            # stalled until all words are read, then every other cycle
+            for _ in range(20):
+                yield
+            while True:
+                yield source.ack.eq(0)
+                yield
+                yield source.ack.eq(1)
+                yield from wait_stb(source)
+                received.append(((yield source.data), (yield source.eop)))
+                yield
+                if received[-1][1]:
+                    break
+            for _ in range(8):
+                yield
+                assert not (yield source.stb)
+
+        def ar_and_r_channel():
+            assert (yield from i.read_ar()).addr == 0x11223340
+            for k in range(4):
+                yield from i.write_r(0x55, (packed >> (32 * k)) & 0xffffffff,
+                                     last=int(k == 3))
+
+        return [
+            push_addr(), pull_data(), ar_and_r_channel(),
+        ]
+
+    run_simulation(
+        dut, testbench_reader_gearbox(),
+        vcd_name=file_tmp_folder("test_reader_gearbox.vcd"))
+    assert received == [(s, int(k == 7)) for k, s in enumerate(samples)]
+
+
+@pytest.mark.parametrize("nbits_source", [32, 12])
+@pytest.mark.parametrize("gap", [0, 30])
+def test_reader_requests(nbits_source, gap):
+    i = axi.Interface()
+    dut = Reader(i, nbits_source=nbits_source, fifo_depth=4)
+    mem = AXIMemory(i, bytes(range(256)), latency=2)
+    source, sink = dut.source, dut.sink
+    received = []
+
+    def expected(addr):
+        # 3 words, the 4th of the burst dropped
+        packed = int.from_bytes(mem.data[addr:addr + 12], "little")
+        n = 96 // nbits_source
+        return [((packed >> (nbits_source * k)) & (2**nbits_source - 1),
+                 int(k == n - 1)) for k in range(n)]
+
+    def push_addr():
+        yield sink.n.eq(3)
+        yield from request_addr(sink, 0x40, eop=True)
+        for _ in range(gap):
+            yield
+        yield from request_addr(sink, 0x80, eop=True)
+
+    def pull_data():
+        # stalled while the second request is taken
+        for _ in range(40):
+            yield
+        for _ in range(200):
+            yield source.ack.eq(0)
+            yield
+            yield source.ack.eq(1)
+            yield
+            if (yield source.stb):
+                received.append(((yield source.data), (yield source.eop)))
+
+    run_simulation(dut, [push_addr(), pull_data()] + mem.generators())
+    assert received == expected(0x40) + expected(0x80)
+
+
+@pytest.mark.parametrize("sink_width, source_width", [(12, 32), (24, 64)])
+def test_gearbox_pack(sink_width, source_width):
+    dut = Gearbox(sink_width, source_width)
+    n = 7
+    samples = [(0x5a5 * (k + 1)) & (2**sink_width - 1) for k in range(n)]
+    packed = sum(s << (k * sink_width) for k, s in enumerate(samples))
+    n_words = -(-n * sink_width // source_width)
+    words = []
+
+    def push():
+        for k, s in enumerate(samples):
+            yield from write_data(dut.sink, s, eop=int(k == n - 1))
+
+    def pull():
+        yield dut.source.ack.eq(1)
+        while True:
+            yield from wait_stb(dut.source)
+            words.append((yield dut.source.data))
+            eop = yield dut.source.eop
+            yield
+            if eop:
+                break
+        assert len(words) == n_words
+        assert sum(w << (k * source_width)
+                   for k, w in enumerate(words)) == packed
+
+    run_simulation(dut, [push(), pull()],
+                   vcd_name=file_tmp_folder("test_gearbox_pack.vcd"))
+
+
+@pytest.mark.parametrize("sink_width, source_width", [
+    (12, 32), (32, 12), (24, 64), (64, 24), (48, 32), (32, 48), (8, 32),
+    (32, 8)])
+def test_gearbox_packets(sink_width, source_width):
+    dut = Gearbox(sink_width, source_width)
+    rng = random.Random(sink_width * 100 + source_width)
+    packets = [[rng.getrandbits(sink_width) for _ in range(n)]
+               for n in (5, 2, 7)]
+    received = []
+
+    def expected(packet):
+        bits = sum(s << (k * sink_width) for k, s in enumerate(packet))
+        n_bits = len(packet) * sink_width
+        if sink_width < source_width:
+            n_words = -(-n_bits // source_width)
+        else:
+            n_words = n_bits // source_width
+        return [((bits >> (k * source_width)) & (2**source_width - 1),
+                 int(k == n_words - 1)) for k in range(n_words)]
+
+    def push():
+        # back to back, no gap between packets
+        for packet in packets:
+            for k, s in enumerate(packet):
+                yield from write_data(dut.sink, s,
+                                      eop=int(k == len(packet) - 1))
+
+    def pull():
+        yield dut.source.ack.eq(1)
+        eops = 0
+        while eops < len(packets):
+            yield from wait_stb(dut.source)
+            word = ((yield dut.source.data), (yield dut.source.eop))
+            received.append(word)
+            eops += word[1]
+            yield
+
+    run_simulation(dut, [push(), pull()])
+    assert received == [w for packet in packets for w in expected(packet)]
+
+
+def test_gearbox_unpack():
+    dut = Gearbox(32, 12)
+    samples = [0x123, 0x456, 0x789, 0xabc, 0xdef]
+    packed = sum(s << (k * 12) for k, s in enumerate(samples))
+
+    def push():
+        # 2 words, padding dropped
+        yield from write_data(dut.sink, packed & 0xffffffff)
+        yield from write_data(dut.sink, packed >> 32, eop=1)
+
+    def pull():
+        yield dut.source.ack.eq(1)
+        for k, s in enumerate(samples):
+            yield from wait_stb(dut.source)
+            assert (yield dut.source.data) == s
+            assert (yield dut.source.eop) == int(k == len(samples) - 1)
+            yield
+        for _ in range(4):
+            assert not (yield dut.source.stb)
+            yield
+
+    run_simulation(dut, [push(), pull()])
+
+
+def test_gearbox_throughput():
+    dut = Gearbox(12, 32)
+    accepted = []
+
+    def push():
+        yield dut.sink.stb.eq(1)
+        yield dut.source.ack.eq(1)
+        for _ in range(16):
+            yield
+            accepted.append((yield dut.sink.ack))
+
+    run_simulation(dut, push())
+    assert all(accepted)
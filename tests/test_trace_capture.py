@@ -0,0 +1,91 @@
+import pytest
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.interconnect import axi
+from migen_axi.cores import trace_capture
+from migen_axi.cores.trace_capture import Channel
+from migen_axi.sim import AXIMemory
+from .common import file_tmp_folder
+
+
+def decode(layout, value):
+    entry = {}
+    for name, width in layout:
+        entry[name] = value & (2**width - 1)
+        value >>= width
+    return entry
+
+
+@pytest.mark.parametrize("to_dram", [False, True])
+def test_trace_capture(to_dram):
+    bus = axi.Interface()
+    dram = axi.Interface(data_width=64) if to_dram else None
+    dut = trace_capture.AXITraceCapture(bus, depth=16, dram=dram,
+                                        fifo_depth=8)
+    layout = trace_capture.trace_layout(bus)
+    mem = AXIMemory(bus, 256)
+    generators = mem.generators()
+    if to_dram:
+        dram_mem = AXIMemory(dram, 1024, latency=2)
+        generators += dram_mem.generators()
+
+    def read_entry(index):
+        if to_dram:
+            # 72 bit entries padded to 2 words
+            return int.from_bytes(
+                dram_mem.data[0x100 + 16 * index:0x100 + 16 * (index + 1)],
+                "little")
+        yield dut._rd_index.storage.eq(index)
+        yield
+        yield
+        return (yield dut._rd_data.status)
+
+    def read(id_, addr):
+        yield from bus.write_ar(id_, addr, 0, axi.burst_size(4),
+                                axi.Burst.incr)
+        yield from bus.read_r()
+
+    def testbench_trace_capture():
+        yield dut._pre.storage.eq(2)
+        yield dut._post.storage.eq(2)
+        # first error response
+        yield dut._trig_channels.storage.eq(1 << Channel.r)
+        yield dut._trig_error.storage.eq(1)
+        if to_dram:
+            yield dut._dram_base.storage.eq(0x100)
+        yield dut._arm.re.eq(1)
+        yield
+        yield dut._arm.re.eq(0)
+        yield
+        assert not (yield dut._armed.status)
+        for i in range(4):
+            yield from read(i, 0x10 * i)
+        assert (yield dut._armed.status)
+        yield from read(4, 0x1000)
+        yield from read(5, 0x50)
+        yield from read(6, 0x60)
+        while not (yield dut._done.status):
+            yield
+        assert (yield dut._dropped.status) == 0
+        # 5 reads to the trigger, the next ar and r
+        assert (yield dut._count.status) == 2 * 5 + 2
+        trig_ptr = yield dut._trig_ptr.status
+        assert trig_ptr == 9
+        entry = decode(layout, (yield from read_entry(trig_ptr)))
+        assert entry["channel"] == Channel.r
+        assert entry["id"] == 4
+        assert entry["resp"] == axi.Response.decerr
+        entry = decode(layout, (yield from read_entry(trig_ptr + 1)))
+        assert entry["channel"] == Channel.ar
+        assert entry["id"] == 5
+        assert entry["addr"] == 0x50
+        entry = decode(layout, (yield from read_entry(0)))
+        assert entry["channel"] == Channel.ar
+        assert entry["addr"] == 0
+        last = decode(layout, (yield from read_entry(trig_ptr + 2)))
+        assert last["channel"] == Channel.r
+        assert last["resp"] == axi.Response.okay
+        assert last["timestamp"] > entry["timestamp"]
+
+    run_simulation(dut, [testbench_trace_capture()] + generators,
+                   vcd_name=file_tmp_folder("test_trace_capture.vcd"))
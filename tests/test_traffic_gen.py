@@ -0,0 +1,121 @@
+import pytest
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.interconnect import axi
+from migen_axi.cores import traffic_gen
+from migen_axi.sim import AXIMemory
+from .common import file_tmp_folder
+
+
+@pytest.mark.parametrize(
+    "pattern, write_ratio, period", [
+        (traffic_gen.Pattern.sequential, 0, 0),
+        (traffic_gen.Pattern.strided, 256, 0),
+        (traffic_gen.Pattern.random, 128, 5),
+    ])
+def test_traffic_gen(pattern, write_ratio, period):
+    bus = axi.Interface()
+    dut = traffic_gen.AXITrafficGen(bus, max_outstanding=4)
+    mem = AXIMemory(bus, 4096, latency=3)
+    count = 8
+
+    def testbench_traffic_gen():
+        for csr, value in [
+                (dut._pattern, pattern), (dut._mask, 0xfff),
+                (dut._stride, 0x40), (dut._seed, 0x1234),
+                (dut._write_ratio, write_ratio), (dut._len, 3),
+                (dut._period, period), (dut._count, count)]:
+            yield csr.storage.eq(value)
+        yield dut._start.re.eq(1)
+        yield
+        yield dut._start.re.eq(0)
+        yield
+        while (yield dut._busy.status):
+            yield
+        rd_bursts = yield dut._rd_bursts.status
+        wr_bursts = yield dut._wr_bursts.status
+        assert rd_bursts + wr_bursts == count
+        assert (yield dut._rd_beats.status) == 4 * rd_bursts
+        assert (yield dut._wr_beats.status) == 4 * wr_bursts
+        assert (yield dut._errors.status) == 0
+        if write_ratio == 0:
+            assert wr_bursts == 0
+        if write_ratio == 256:
+            assert rd_bursts == 0
+            # first word of every strided burst
+            for i in range(count):
+                assert mem.data[i * 0x40] == 0
+                assert mem.data[i * 0x40 + 4] == 1
+        cycles = yield dut._cycles.status
+        if period:
+            assert cycles >= period * (count - 1)
+        else:
+            # outstanding transactions overlap
+            assert cycles < count * (4 + 3)
+        for bursts, lat_sum in [
+                (rd_bursts, (yield dut._rd_lat_sum.status)),
+                (wr_bursts, (yield dut._wr_lat_sum.status))]:
+            if bursts:
+                assert lat_sum // bursts >= 4 + 3
+
+    run_simulation(dut, [testbench_traffic_gen()] + mem.generators(),
+                   vcd_name=file_tmp_folder("test_traffic_gen.vcd"))
+
+
+def test_traffic_gen_stop():
+    bus = axi.Interface()
+    dut = traffic_gen.AXITrafficGen(bus)
+
+    def testbench_traffic_gen_stop():
+        yield dut._count.storage.eq(0)
+        yield dut._start.re.eq(1)
+        yield
+        yield dut._start.re.eq(0)
+        while not (yield bus.ar.valid):
+            yield
+        yield dut._stop.re.eq(1)
+        yield
+        yield dut._stop.re.eq(0)
+        # the address is held until accepted
+        for _ in range(5):
+            yield
+            assert (yield bus.ar.valid)
+        yield bus.ar.ready.eq(1)
+        yield
+        yield bus.ar.ready.eq(0)
+        yield
+        yield from bus.write_r(0, 0, last=1)
+        for _ in range(5):
+            assert not (yield bus.ar.valid)
+            yield
+        assert not (yield dut._busy.status)
+        assert (yield dut._rd_bursts.status) == 1
+
+    run_simulation(dut, testbench_traffic_gen_stop())
+
+
+def test_traffic_gen_outstanding():
+    bus = axi.Interface()
+    dut = traffic_gen.AXITrafficGen(bus, max_outstanding=4)
+    mem = AXIMemory(bus, 4096, latency=20)
+    count = 12
+
+    def testbench_traffic_gen_outstanding():
+        # above max_outstanding, clamped
+        yield dut._outstanding.storage.eq(7)
+        yield dut._write_ratio.storage.eq(256)
+        yield dut._len.storage.eq(3)
+        yield dut._count.storage.eq(count)
+        yield dut._start.re.eq(1)
+        yield
+        yield dut._start.re.eq(0)
+        yield
+        for _ in range(500):
+            if not (yield dut._busy.status):
+                break
+            yield
+        assert (yield dut._wr_bursts.status) == count
+        assert mem.wr_bytes == count * 4 * 4
+
+    run_simulation(dut, [testbench_traffic_gen_outstanding()] +
+                   mem.generators())
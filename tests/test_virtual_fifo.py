@@ -0,0 +1,49 @@
+import random
+from migen import *  # noqa
+from migen.sim import run_simulation
+from migen_axi.interconnect import axi
+from migen_axi.cores import virtual_fifo
+from migen_axi.sim import AXIMemory
+from .common import file_tmp_folder
+
+
+def test_virtual_fifo():
+    bus = axi.Interface()
+    dut = virtual_fifo.VirtualFIFO(bus, burst=4, depth=8)
+    mem = AXIMemory(bus, 1024, base=0x1000, latency=2)
+    sink, source = dut.sink, dut.source
+    n = 200
+    rng = random.Random(37)
+    words = [rng.getrandbits(32) for _ in range(n)]
+    received = []
+
+    def push():
+        yield dut._base.storage.eq(0x1000)
+        yield dut._size.storage.eq(256)
+        yield
+        for word in words:
+            yield sink.data.eq(word)
+            yield sink.stb.eq(1)
+            yield
+            while not (yield sink.ack):
+                yield
+            yield sink.stb.eq(0)
+
+    def pull():
+        # stall long enough to spill into ddr
+        for _ in range(150):
+            yield
+        assert (yield dut._level.status) > 0
+        while len(received) < n:
+            yield source.ack.eq(rng.random() < 0.7)
+            yield
+            if (yield source.stb) and (yield source.ack):
+                received.append((yield source.data))
+        yield source.ack.eq(0)
+        assert received == words
+        assert (yield dut._level.status) == 0
+        # never more than the region
+        assert 0 < (yield dut._level_max.status) <= 256 // 4
+
+    run_simulation(dut, [push(), pull()] + mem.generators(),
+                   vcd_name=file_tmp_folder("test_virtual_fifo.vcd"))